@@ -0,0 +1,44 @@
+"""Add golf_pool_leaderboards precomputed ranking documents.
+
+Revision ID: 20260423_000068
+Revises: 20260422_000067
+Create Date: 2026-04-23
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20260423_000068"
+down_revision = "20260422_000067"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "golf_pool_leaderboards",
+        sa.Column(
+            "pool_id",
+            sa.Integer(),
+            sa.ForeignKey("golf_pools.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="1"),
+        sa.Column("format_version", sa.Integer(), nullable=False),
+        sa.Column("entry_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("leaderboard", sa.dialects.postgresql.JSONB(), nullable=False),
+        sa.Column("scored_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("golf_pool_leaderboards")
@@ -0,0 +1,42 @@
+"""Add sports_game_detail_docs materialized game-detail responses.
+
+Revision ID: 20260423_000069
+Revises: 20260423_000068
+Create Date: 2026-04-23
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20260423_000069"
+down_revision = "20260423_000068"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sports_game_detail_docs",
+        sa.Column(
+            "game_id",
+            sa.Integer(),
+            sa.ForeignKey("sports_games.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("format_version", sa.Integer(), nullable=False),
+        sa.Column("source_fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("payload", sa.dialects.postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "built_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sports_game_detail_docs")
@@ -0,0 +1,49 @@
+"""Add sports_game_flow_docs compiled consumer flow documents.
+
+Revision ID: 20260423_000070
+Revises: 20260423_000069
+Create Date: 2026-04-23
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20260423_000070"
+down_revision = "20260423_000069"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sports_game_flow_docs",
+        sa.Column(
+            "game_id",
+            sa.Integer(),
+            sa.ForeignKey("sports_games.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "flow_id",
+            sa.Integer(),
+            sa.ForeignKey("sports_game_stories.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("format_version", sa.Integer(), nullable=False),
+        sa.Column("source_fingerprint", sa.String(length=64), nullable=False),
+        sa.Column("content_hash", sa.String(length=64), nullable=False),
+        sa.Column("body", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "built_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sports_game_flow_docs")
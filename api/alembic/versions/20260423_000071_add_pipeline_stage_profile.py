@@ -0,0 +1,29 @@
+"""Add profile_json JSONB column to sports_game_pipeline_stages.
+
+Revision ID: 20260423_000071
+Revises: 20260423_000070
+Create Date: 2026-04-23
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+revision = "20260423_000071"
+down_revision = "20260423_000070"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "sports_game_pipeline_stages",
+        sa.Column("profile_json", JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("sports_game_pipeline_stages", "profile_json")
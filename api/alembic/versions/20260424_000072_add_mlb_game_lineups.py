@@ -0,0 +1,50 @@
+"""Add mlb_game_lineups: materialized batting order and starter per game.
+
+Filled by the scraper when MLB advanced stats are ingested for a final
+game (and by the ``backfill_mlb_game_lineups`` task), so consensus
+lineups no longer reconstruct every recent game from play-by-play.
+
+Revision ID: 20260424_000072
+Revises: 20260423_000071
+Create Date: 2026-04-24
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+from alembic import op
+
+revision = "20260424_000072"
+down_revision = "20260423_000071"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "mlb_game_lineups",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("game_id", sa.Integer(), sa.ForeignKey("sports_games.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("team_id", sa.Integer(), sa.ForeignKey("sports_teams.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("game_date", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("batters", JSONB(), server_default=sa.text("'[]'::jsonb"), nullable=False),
+        sa.Column("lineup_source", sa.String(20), nullable=False),
+        sa.Column("starter_external_ref", sa.String(100), nullable=True),
+        sa.Column("starter_name", sa.String(200), nullable=True),
+        sa.Column("starter_innings_pitched", sa.Float(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("game_id", "team_id", name="uq_mlb_game_lineups_game_team"),
+    )
+    op.create_index(
+        "idx_mlb_game_lineups_team_date",
+        "mlb_game_lineups",
+        ["team_id", sa.text("game_date DESC")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_mlb_game_lineups_team_date", table_name="mlb_game_lineups")
+    op.drop_table("mlb_game_lineups")
@@ -0,0 +1,43 @@
+"""Add partial indexes for set-based outcome recording and degradation checks.
+
+Revision ID: 20260424_000073
+Revises: 20260424_000072
+Create Date: 2026-04-24
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20260424_000073"
+down_revision = "20260424_000072"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Unresolved predictions joined against sports_games by the record task
+    op.create_index(
+        "ix_prediction_outcomes_pending",
+        "analytics_prediction_outcomes",
+        ["game_id"],
+        postgresql_where=sa.text("outcome_recorded_at IS NULL"),
+    )
+    # Resolved predictions per sport, ordered for the baseline/recent split;
+    # the included columns let the window aggregates run index-only
+    op.create_index(
+        "ix_prediction_outcomes_resolved",
+        "analytics_prediction_outcomes",
+        ["sport", "outcome_recorded_at", "id"],
+        postgresql_include=["brier_score", "correct_winner"],
+        postgresql_where=sa.text(
+            "outcome_recorded_at IS NOT NULL AND brier_score IS NOT NULL"
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_prediction_outcomes_resolved", table_name="analytics_prediction_outcomes")
+    op.drop_index("ix_prediction_outcomes_pending", table_name="analytics_prediction_outcomes")
@@ -0,0 +1,159 @@
+"""Stamp sports_games when the sources of a compiled flow document change.
+
+Revision ID: 20260424_000074
+Revises: 20260424_000073
+Create Date: 2026-04-24
+
+The consumer flow document embeds the flow's blocks, the game's plays,
+and both teams' names, abbreviations, and colors. Rather than deriving
+freshness from all of those on every read, triggers set
+sports_games.flow_sources_changed_at whenever one of them is written for
+a game that has a flow, so the read path is a single primary-key probe:
+
+1. trg_stamp_flow_sources_plays_{ins,upd,del} — statement-level AFTER
+   triggers on sports_game_plays; one UPDATE per statement over the
+   distinct game_ids in the transition table.
+
+2. trg_stamp_flow_sources_stories — AFTER INSERT OR UPDATE OR DELETE on
+   sports_game_stories.
+
+3. trg_stamp_flow_sources_teams — AFTER UPDATE on sports_teams, only
+   when a displayed column actually changed.
+
+Down: drops the triggers, their functions, and the column.
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20260424_000074"
+down_revision = "20260424_000073"
+branch_labels = None
+depends_on = None
+
+_PLAYS_FN = "fn_stamp_flow_sources_plays"
+_STORIES_FN = "fn_stamp_flow_sources_stories"
+_STORIES_TRIGGER = "trg_stamp_flow_sources_stories"
+_TEAMS_FN = "fn_stamp_flow_sources_teams"
+_TEAMS_TRIGGER = "trg_stamp_flow_sources_teams"
+_GAMES_TABLE = "sports_games"
+_PLAYS_TABLE = "sports_game_plays"
+_STORIES_TABLE = "sports_game_stories"
+_TEAMS_TABLE = "sports_teams"
+
+# Transition tables allow only one event per trigger.
+_PLAYS_TRIGGERS = {
+    "trg_stamp_flow_sources_plays_ins": ("INSERT", "NEW"),
+    "trg_stamp_flow_sources_plays_upd": ("UPDATE", "NEW"),
+    "trg_stamp_flow_sources_plays_del": ("DELETE", "OLD"),
+}
+_TEAM_DISPLAY_COLUMNS = (
+    "name",
+    "abbreviation",
+    "color_light_hex",
+    "color_dark_hex",
+    "color_secondary_light_hex",
+    "color_secondary_dark_hex",
+)
+
+
+def upgrade() -> None:
+    op.add_column(
+        _GAMES_TABLE,
+        sa.Column("flow_sources_changed_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+    # ------------------------------------------------------------------ #
+    # 1. Plays: one stamp per statement, only for games with a flow.      #
+    # ------------------------------------------------------------------ #
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {_PLAYS_FN}()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE {_GAMES_TABLE} g
+            SET flow_sources_changed_at = clock_timestamp()
+            WHERE g.id IN (SELECT DISTINCT game_id FROM changed_rows)
+              AND EXISTS (
+                  SELECT 1 FROM {_STORIES_TABLE} s WHERE s.game_id = g.id
+              );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    for trigger, (event, transition) in _PLAYS_TRIGGERS.items():
+        op.execute(f"""
+            CREATE TRIGGER {trigger}
+                AFTER {event} ON {_PLAYS_TABLE}
+                REFERENCING {transition} TABLE AS changed_rows
+                FOR EACH STATEMENT
+                EXECUTE FUNCTION {_PLAYS_FN}();
+        """)
+
+    # ------------------------------------------------------------------ #
+    # 2. Flows: any publish, rerun, or removal.                           #
+    # ------------------------------------------------------------------ #
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {_STORIES_FN}()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE {_GAMES_TABLE}
+            SET flow_sources_changed_at = clock_timestamp()
+            WHERE id = CASE WHEN TG_OP = 'DELETE' THEN OLD.game_id ELSE NEW.game_id END;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    op.execute(f"""
+        CREATE TRIGGER {_STORIES_TRIGGER}
+            AFTER INSERT OR UPDATE OR DELETE ON {_STORIES_TABLE}
+            FOR EACH ROW
+            EXECUTE FUNCTION {_STORIES_FN}();
+    """)
+
+    # ------------------------------------------------------------------ #
+    # 3. Teams: display fields embedded in the document.                  #
+    # ------------------------------------------------------------------ #
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION {_TEAMS_FN}()
+        RETURNS TRIGGER AS $$
+        BEGIN
+            UPDATE {_GAMES_TABLE} g
+            SET flow_sources_changed_at = clock_timestamp()
+            WHERE (g.home_team_id = NEW.id OR g.away_team_id = NEW.id)
+              AND EXISTS (
+                  SELECT 1 FROM {_STORIES_TABLE} s WHERE s.game_id = g.id
+              );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql;
+    """)
+
+    changed = " OR ".join(
+        f"OLD.{col} IS DISTINCT FROM NEW.{col}" for col in _TEAM_DISPLAY_COLUMNS
+    )
+    op.execute(f"""
+        CREATE TRIGGER {_TEAMS_TRIGGER}
+            AFTER UPDATE OF {", ".join(_TEAM_DISPLAY_COLUMNS)} ON {_TEAMS_TABLE}
+            FOR EACH ROW
+            WHEN ({changed})
+            EXECUTE FUNCTION {_TEAMS_FN}();
+    """)
+
+
+def downgrade() -> None:
+    op.execute(f"DROP TRIGGER IF EXISTS {_TEAMS_TRIGGER} ON {_TEAMS_TABLE}")
+    op.execute(f"DROP FUNCTION IF EXISTS {_TEAMS_FN}()")
+
+    op.execute(f"DROP TRIGGER IF EXISTS {_STORIES_TRIGGER} ON {_STORIES_TABLE}")
+    op.execute(f"DROP FUNCTION IF EXISTS {_STORIES_FN}()")
+
+    for trigger in _PLAYS_TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger} ON {_PLAYS_TABLE}")
+    op.execute(f"DROP FUNCTION IF EXISTS {_PLAYS_FN}()")
+
+    op.drop_column(_GAMES_TABLE, "flow_sources_changed_at")
@@ -0,0 +1,33 @@
+"""Drop idx_mlb_game_lineups_team_date.
+
+Consensus lineups now select the team's recent games from sports_games
+and left-join mlb_game_lineups on (game_id, team_id), which the unique
+constraint already covers. No query reads lineups by team and date.
+
+Revision ID: 20260424_000075
+Revises: 20260424_000074
+Create Date: 2026-04-24
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision = "20260424_000075"
+down_revision = "20260424_000074"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.drop_index("idx_mlb_game_lineups_team_date", table_name="mlb_game_lineups")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "idx_mlb_game_lineups_team_date",
+        "mlb_game_lineups",
+        ["team_id", sa.text("game_date DESC")],
+    )
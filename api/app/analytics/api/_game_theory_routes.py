@@ -7,7 +7,7 @@ from __future__ import annotations
 
 import logging
 from dataclasses import asdict
-from typing import Any
+from typing import Any, Literal
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field, model_validator
@@ -111,6 +111,12 @@ class NashRequest(BaseModel):
     row_labels: list[str] | None = Field(None, description="Row action labels")
     col_labels: list[str] | None = Field(None, description="Column action labels")
     max_iterations: int = Field(10_000, ge=100, le=100_000)
+    tolerance: float = Field(
+        1e-3, gt=0, le=0.1, description="Stop when exploitability < tolerance × payoff range",
+    )
+    method: Literal["auto", "lp", "fictitious_play"] = Field(
+        "auto", description="auto = exact LP for small/medium games, else fictitious play",
+    )
 
 
 class LineupNashRequest(BaseModel):
@@ -135,6 +141,8 @@ async def post_nash(req: NashRequest) -> dict[str, Any]:
         row_labels=req.row_labels,
         col_labels=req.col_labels,
         max_iterations=req.max_iterations,
+        tolerance=req.tolerance,
+        method=req.method,
     )
     return asdict(result)
 
@@ -216,6 +224,9 @@ class RegretMatchingRequest(BaseModel):
     row_labels: list[str] | None = None
     col_labels: list[str] | None = None
     iterations: int = Field(10_000, ge=100, le=100_000)
+    tolerance: float = Field(
+        1e-3, gt=0, le=0.1, description="Stop when exploitability < tolerance × payoff range",
+    )
 
 
 class MinimaxTreeAction(BaseModel):
@@ -278,5 +289,6 @@ async def post_regret_matching(req: RegretMatchingRequest) -> dict[str, Any]:
         row_labels=req.row_labels,
         col_labels=req.col_labels,
         iterations=req.iterations,
+        tolerance=req.tolerance,
     )
     return asdict(result)
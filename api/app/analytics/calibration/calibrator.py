@@ -2,15 +2,22 @@
 
 Trains on (raw_sim_wp, actual_outcome) pairs to produce a monotonic
 mapping from raw sim probability to historically-accurate probability.
+
+Metrics and batch calibration work on NumPy arrays: ``calibrate_many``
+maps a whole batch with one model call, and reliability bins are built
+in a single histogram pass rather than one scan per bin.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,32 +69,17 @@ class SimCalibrator:
                 f"Need at least 10 samples for calibration, got {len(sim_wps)}"
             )
 
-        y = [1.0 if o else 0.0 for o in actual_outcomes]
-
-        # Brier before calibration
-        brier_before = sum((p - a) ** 2 for p, a in zip(sim_wps, y)) / len(y)
+        raw = np.asarray(sim_wps, dtype=float)
+        y = np.asarray(actual_outcomes, dtype=bool).astype(float)
 
         # Fit isotonic regression
         self._model = IsotonicRegression(
             y_min=0.01, y_max=0.99, out_of_bounds="clip",
         )
-        self._model.fit(sim_wps, y)
+        self._model.fit(raw, y)
         self._trained = True
 
-        # Brier after calibration
-        calibrated = [self.calibrate(p) for p in sim_wps]
-        brier_after = sum((c - a) ** 2 for c, a in zip(calibrated, y)) / len(y)
-
-        # Reliability diagram bins
-        bins = _reliability_bins(sim_wps, calibrated, y)
-
-        return CalibrationMetrics(
-            brier_before=round(brier_before, 6),
-            brier_after=round(brier_after, 6),
-            brier_improvement=round(brier_before - brier_after, 6),
-            sample_count=len(sim_wps),
-            reliability_bins=bins,
-        )
+        return _calibration_metrics(raw, self.calibrate_many(raw), y)
 
     def calibrate(self, raw_wp: float) -> float:
         """Calibrate a single raw win probability.
@@ -107,6 +99,27 @@ class SimCalibrator:
         result = self._model.predict([raw_wp])[0]
         return float(max(0.01, min(0.99, result)))
 
+    def calibrate_many(self, raw_wps: Sequence[float] | np.ndarray) -> np.ndarray:
+        """Calibrate a batch of raw win probabilities with one model call.
+
+        Args:
+            raw_wps: Raw sim home win probabilities (0-1).
+
+        Returns:
+            Float array of calibrated probabilities, clipped to
+            [0.01, 0.99] like ``calibrate``.
+
+        Raises:
+            RuntimeError: If the calibrator has not been trained.
+        """
+        if not self._trained or self._model is None:
+            raise RuntimeError("Calibrator has not been trained. Call train() first.")
+
+        raw = np.asarray(raw_wps, dtype=float)
+        if raw.size == 0:
+            return np.empty(0)
+        return np.clip(self._model.predict(raw), 0.01, 0.99)
+
     def save(self, path: str | Path) -> None:
         """Save the trained model to disk."""
         import joblib
@@ -142,48 +155,60 @@ class SimCalibrator:
         if not self._trained:
             raise RuntimeError("Calibrator has not been trained.")
 
-        y = [1.0 if o else 0.0 for o in actual_outcomes]
-        brier_before = sum((p - a) ** 2 for p, a in zip(sim_wps, y)) / len(y)
+        raw = np.asarray(sim_wps, dtype=float)
+        y = np.asarray(actual_outcomes, dtype=bool).astype(float)
+        return _calibration_metrics(raw, self.calibrate_many(raw), y)
 
-        calibrated = [self.calibrate(p) for p in sim_wps]
-        brier_after = sum((c - a) ** 2 for c, a in zip(calibrated, y)) / len(y)
 
-        bins = _reliability_bins(sim_wps, calibrated, y)
-
-        return CalibrationMetrics(
-            brier_before=round(brier_before, 6),
-            brier_after=round(brier_after, 6),
-            brier_improvement=round(brier_before - brier_after, 6),
-            sample_count=len(sim_wps),
-            reliability_bins=bins,
-        )
+def _calibration_metrics(
+    raw: np.ndarray,
+    calibrated: np.ndarray,
+    y: np.ndarray,
+) -> CalibrationMetrics:
+    brier_before = float(np.mean((raw - y) ** 2))
+    brier_after = float(np.mean((calibrated - y) ** 2))
+    return CalibrationMetrics(
+        brier_before=round(brier_before, 6),
+        brier_after=round(brier_after, 6),
+        brier_improvement=round(brier_before - brier_after, 6),
+        sample_count=len(raw),
+        reliability_bins=_reliability_bins(raw, calibrated, y),
+    )
 
 
 def _reliability_bins(
-    raw_wps: list[float],
-    calibrated_wps: list[float],
-    actuals: list[float],
+    raw_wps: Sequence[float] | np.ndarray,
+    calibrated_wps: Sequence[float] | np.ndarray,
+    actuals: Sequence[float] | np.ndarray,
     n_bins: int = 10,
 ) -> list[dict[str, float]]:
-    """Build reliability diagram bins for evaluation."""
+    """Build reliability diagram bins for evaluation.
+
+    Bin ``i`` holds raw probabilities in ``[i/n_bins, (i+1)/n_bins)``;
+    values outside ``[0, 1)`` fall in no bin. One pass assigns every
+    prediction its bin and ``bincount`` sums each column per bin.
+    """
+    raw = np.asarray(raw_wps, dtype=float)
+    edges = np.arange(n_bins + 1) / n_bins
+    idx = np.searchsorted(edges, raw, side="right") - 1
+    in_range = (idx >= 0) & (idx < n_bins)
+    idx = idx[in_range]
+
+    counts = np.bincount(idx, minlength=n_bins)
+    sums = [
+        np.bincount(idx, weights=np.asarray(col, dtype=float)[in_range], minlength=n_bins)
+        for col in (raw, calibrated_wps, actuals)
+    ]
+
     bins: list[dict[str, float]] = []
-    for i in range(n_bins):
-        lo = i / n_bins
-        hi = (i + 1) / n_bins
-        indices = [
-            j for j, p in enumerate(raw_wps) if lo <= p < hi
-        ]
-        if not indices:
-            continue
-        avg_predicted = sum(raw_wps[j] for j in indices) / len(indices)
-        avg_calibrated = sum(calibrated_wps[j] for j in indices) / len(indices)
-        avg_actual = sum(actuals[j] for j in indices) / len(indices)
+    for i in np.flatnonzero(counts).tolist():
+        n = int(counts[i])
         bins.append({
-            "bin_start": round(lo, 2),
-            "bin_end": round(hi, 2),
-            "count": len(indices),
-            "avg_predicted": round(avg_predicted, 4),
-            "avg_calibrated": round(avg_calibrated, 4),
-            "avg_actual": round(avg_actual, 4),
+            "bin_start": round(float(edges[i]), 2),
+            "bin_end": round(float(edges[i + 1]), 2),
+            "count": n,
+            "avg_predicted": round(float(sums[0][i]) / n, 4),
+            "avg_calibrated": round(float(sums[1][i]) / n, 4),
+            "avg_actual": round(float(sums[2][i]) / n, 4),
         })
     return bins
@@ -372,11 +372,8 @@ class SimulationEngine:
                 "pitcher_profile": home_profile,
                 **base_extra,
             }
-            home_result = resolver.get_probabilities_with_meta(
-                self.sport, model_type, home_ctx, mode=mode,
-            )
-            away_result = resolver.get_probabilities_with_meta(
-                self.sport, model_type, away_ctx, mode=mode,
+            home_result, away_result = resolver.get_probabilities_batch_with_meta(
+                self.sport, model_type, [home_ctx, away_ctx], mode=mode,
             )
 
             prob_meta = home_result.pop("_meta", {})
@@ -6,7 +6,8 @@ Provides two complementary approaches:
    (e.g., base-running decisions, bullpen sequencing).
 2. **Regret matching (CFR-style)** — For simultaneous-move games
    (e.g., pitch selection, defensive shifts). Both players accumulate
-   regret and converge toward a Nash Equilibrium.
+   regret and converge toward a Nash Equilibrium; iteration stops once the
+   exploitability gap is small (see ``solvers``).
 
 Both consume probability data from the existing matchup engine and
 simulation system.
@@ -18,6 +19,7 @@ import logging
 import math
 from dataclasses import dataclass, field
 
+from .solvers import as_payoff_matrix, regret_matching_solve
 from .types import MinimaxResult
 
 logger = logging.getLogger(__name__)
@@ -184,6 +186,7 @@ def regret_matching(
     row_labels: list[str] | None = None,
     col_labels: list[str] | None = None,
     iterations: int = 10_000,
+    tolerance: float = 1e-3,
 ) -> MinimaxResult:
     """Compute a strategy via counterfactual regret minimization.
 
@@ -198,10 +201,13 @@ def regret_matching(
         payoff_matrix: M×N payoffs for the row player.
         row_labels: Action labels for the row player.
         col_labels: Action labels for the column player.
-        iterations: Number of rounds of regret matching.
+        iterations: Maximum rounds of regret matching.
+        tolerance: Stop once the averaged strategies' exploitability gap
+            is below ``tolerance`` times the payoff range.
 
     Returns:
-        MinimaxResult with the row player's mixed strategy.
+        MinimaxResult with the row player's mixed strategy, iterations
+        used and the final exploitability gap.
     """
     m = len(payoff_matrix)
     if m == 0:
@@ -210,65 +216,26 @@ def regret_matching(
     if n == 0:
         return MinimaxResult(optimal_action="", action_values={})
 
+    a = as_payoff_matrix(payoff_matrix)
     row_labels = row_labels or [f"action_{i}" for i in range(m)]
     col_labels = col_labels or [f"state_{j}" for j in range(n)]
 
-    # Both players track cumulative regret
-    row_cumulative_regret = [0.0] * m
-    col_cumulative_regret = [0.0] * n
-    row_cumulative_strategy = [0.0] * m
-
-    for _t in range(iterations):
-        # Current strategies from positive regrets
-        row_strategy = _regret_to_strategy(row_cumulative_regret)
-        col_strategy = _regret_to_strategy(col_cumulative_regret)
-
-        # Accumulate row player strategy for final average
-        for i in range(m):
-            row_cumulative_strategy[i] += row_strategy[i]
-
-        # Row player's regret: for each action i, compare payoff of playing i
-        # against the current column strategy vs the value of current row strategy
-        row_value = sum(
-            row_strategy[i] * col_strategy[j] * payoff_matrix[i][j]
-            for i in range(m) for j in range(n)
-        )
-        for i in range(m):
-            action_value = sum(col_strategy[j] * payoff_matrix[i][j] for j in range(n))
-            row_cumulative_regret[i] += action_value - row_value
-
-        # Column player's regret (minimizer — negate payoffs)
-        col_value = row_value  # same game value from column's perspective
-        for j in range(n):
-            action_value = sum(row_strategy[i] * payoff_matrix[i][j] for i in range(m))
-            # Column player wants to minimize, so regret is col_value - action_value
-            col_cumulative_regret[j] += col_value - action_value
-
-    # Normalize final strategy
-    total = sum(row_cumulative_strategy)
-    final_strategy = (
-        [c / total for c in row_cumulative_strategy] if total > 0 else [1.0 / m] * m
-    )
+    state = regret_matching_solve(a, iterations=iterations, tolerance=tolerance)
+    final_strategy = state.result.row_strategy
+
+    # Action values: expected payoff of each pure row action vs the column
+    # player's current regret-matching strategy
+    action_payoffs = a @ state.current_col_strategy
+    action_values = {row_labels[i]: round(float(action_payoffs[i]), 6) for i in range(m)}
+
+    # Regret table: regret of deviating to each pure action vs final strategy
+    regrets = a - final_strategy @ a
+    regret_table = {
+        row_labels[i]: {col_labels[j]: round(float(regrets[i, j]), 6) for j in range(n)}
+        for i in range(m)
+    }
 
-    # Compute action values: expected payoff of each pure row action vs final col strategy
-    final_col_strategy = _regret_to_strategy(col_cumulative_regret)
-    action_values = {}
-    for i in range(m):
-        avg_payoff = sum(final_col_strategy[j] * payoff_matrix[i][j] for j in range(n))
-        action_values[row_labels[i]] = round(avg_payoff, 6)
-
-    # Build regret table: regret of deviating to each pure action vs final strategy
-    column_values = [
-        sum(final_strategy[i] * payoff_matrix[i][j] for i in range(m))
-        for j in range(n)
-    ]
-    regret_table: dict[str, dict[str, float]] = {rl: {} for rl in row_labels}
-    for i in range(m):
-        for j in range(n):
-            regret = payoff_matrix[i][j] - column_values[j]
-            regret_table[row_labels[i]][col_labels[j]] = round(regret, 6)
-
-    strategy_dict = {row_labels[i]: round(final_strategy[i], 6) for i in range(m)}
+    strategy_dict = {row_labels[i]: round(float(final_strategy[i]), 6) for i in range(m)}
     optimal = max(strategy_dict, key=strategy_dict.get)  # type: ignore[arg-type]
 
     return MinimaxResult(
@@ -276,13 +243,6 @@ def regret_matching(
         action_values=action_values,
         regret_table=regret_table,
         strategy=strategy_dict,
+        iterations=state.result.iterations,
+        exploitability=round(state.result.exploitability, 9),
     )
-
-
-def _regret_to_strategy(cumulative_regret: list[float]) -> list[float]:
-    """Convert cumulative regrets to a probability distribution."""
-    positive = [max(r, 0.0) for r in cumulative_regret]
-    total = sum(positive)
-    if total > 0:
-        return [p / total for p in positive]
-    return [1.0 / len(cumulative_regret)] * len(cumulative_regret)
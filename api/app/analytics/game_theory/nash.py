@@ -1,9 +1,11 @@
 """Nash Equilibrium solver for two-player zero-sum games.
 
-Uses a fictitious play algorithm to approximate minimax strategies for
-two-player zero-sum payoff matrices. Designed for lineup optimization and
-pitch-selection strategy where the payoff matrix is derived from the matchup
-engine's probability distributions.
+Computes minimax strategies for two-player zero-sum payoff matrices —
+exactly by linear programming for small and medium games, or by
+fictitious play with exploitability-based early stopping (see
+``solvers``). Designed for lineup optimization and pitch-selection
+strategy where the payoff matrix is derived from the matchup engine's
+probability distributions.
 
 Typical use cases:
 - Optimal lineup construction (manager vs manager)
@@ -14,34 +16,46 @@ Typical use cases:
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
 
+from .solvers import LP_MAX_CELLS, as_payoff_matrix, fictitious_play, solve_lp
 from .types import NashEquilibrium
 
 logger = logging.getLogger(__name__)
 
+_METHODS = {"auto", "lp", "fictitious_play"}
+
 
 def solve_zero_sum(
     payoff_matrix: list[list[float]],
     row_labels: list[str] | None = None,
     col_labels: list[str] | None = None,
     max_iterations: int = 10_000,
+    tolerance: float = 1e-3,
+    method: str = "auto",
 ) -> NashEquilibrium:
     """Find the Nash Equilibrium of a two-player zero-sum game.
 
-    Uses the *fictitious play* algorithm which converges to the minimax
-    solution.  Row player is the maximizer; column player is the minimizer.
+    Row player is the maximizer; column player is the minimizer.
 
     Args:
         payoff_matrix: M×N matrix of payoffs for the row player.
             Must be rectangular with M > 0 and N > 0.
         row_labels: Optional names for row actions.
         col_labels: Optional names for column actions.
-        max_iterations: Convergence limit for fictitious play.
+        max_iterations: Iteration cap for fictitious play.
+        tolerance: Fictitious play stops once the exploitability gap is
+            below ``tolerance`` times the payoff range.
+        method: ``"lp"`` (exact linear program), ``"fictitious_play"``, or
+            ``"auto"`` — LP for games up to ``LP_MAX_CELLS`` cells,
+            fictitious play otherwise or if the LP is unavailable.
 
     Returns:
-        NashEquilibrium with mixed strategies and game value.
+        NashEquilibrium with mixed strategies, game value, iterations used
+        and the final exploitability gap.
     """
+    if method not in _METHODS:
+        raise ValueError(f"Unknown method {method!r}; expected one of {sorted(_METHODS)}")
+
     m = len(payoff_matrix)
     if m == 0:
         return NashEquilibrium(
@@ -54,56 +68,26 @@ def solve_zero_sum(
             row_strategy=[], col_strategy=[], game_value=0.0,
         )
 
-    # Validate rectangular matrix
-    for i, row in enumerate(payoff_matrix):
-        if len(row) != n:
-            raise ValueError(
-                f"Non-rectangular payoff matrix: row 0 has {n} columns but row {i} has {len(row)}"
-            )
+    a = as_payoff_matrix(payoff_matrix)
 
     row_labels = row_labels or [f"row_{i}" for i in range(m)]
     col_labels = col_labels or [f"col_{j}" for j in range(n)]
 
-    # Fictitious play: each player tracks cumulative opponent choices
-    # Start with uniform empirical counts for all actions
-    row_counts = [1.0] * m
-    col_counts = [1.0] * n
-
-    for _t in range(1, max_iterations + 1):
-        # Column player best-responds to row player's empirical strategy
-        col_payoffs = [0.0] * n
-        for j in range(n):
-            for i in range(m):
-                col_payoffs[j] += row_counts[i] * payoff_matrix[i][j]
-        best_col = _argmin(col_payoffs)
-        col_counts[best_col] += 1.0
-
-        # Row player best-responds to column player's empirical strategy
-        row_payoffs = [0.0] * m
-        for i in range(m):
-            for j in range(n):
-                row_payoffs[i] += col_counts[j] * payoff_matrix[i][j]
-        best_row = _argmax(row_payoffs)
-        row_counts[best_row] += 1.0
-
-    total_row = sum(row_counts)
-    total_col = sum(col_counts)
-    row_strategy = [c / total_row for c in row_counts]
-    col_strategy = [c / total_col for c in col_counts]
-
-    # Game value: expected payoff under equilibrium strategies
-    game_value = 0.0
-    for i in range(m):
-        for j in range(n):
-            game_value += row_strategy[i] * col_strategy[j] * payoff_matrix[i][j]
+    result = None
+    if method == "lp" or (method == "auto" and m * n <= LP_MAX_CELLS):
+        result = solve_lp(a)
+    if result is None:
+        result = fictitious_play(a, max_iterations=max_iterations, tolerance=tolerance)
 
     return NashEquilibrium(
-        row_strategy=[round(s, 6) for s in row_strategy],
-        col_strategy=[round(s, 6) for s in col_strategy],
-        game_value=round(game_value, 6),
+        row_strategy=[round(float(s), 6) for s in result.row_strategy],
+        col_strategy=[round(float(s), 6) for s in result.col_strategy],
+        game_value=round(result.game_value, 6),
         row_labels=row_labels,
         col_labels=col_labels,
-        iterations=max_iterations,
+        iterations=result.iterations,
+        exploitability=round(result.exploitability, 9),
+        method=result.method,
     )
 
 
@@ -155,23 +139,3 @@ def pitch_selection_nash(
     result.game_value = -result.game_value
 
     return result
-
-
-def _argmax(values: Sequence[float]) -> int:
-    best_idx = 0
-    best_val = values[0]
-    for i in range(1, len(values)):
-        if values[i] > best_val:
-            best_val = values[i]
-            best_idx = i
-    return best_idx
-
-
-def _argmin(values: Sequence[float]) -> int:
-    best_idx = 0
-    best_val = values[0]
-    for i in range(1, len(values)):
-        if values[i] < best_val:
-            best_val = values[i]
-            best_idx = i
-    return best_idx
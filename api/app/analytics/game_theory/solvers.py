@@ -0,0 +1,232 @@
+"""Matrix-game equilibrium solvers (NumPy).
+
+Shared engine behind :func:`nash.solve_zero_sum` and
+:func:`minimax.regret_matching`. All solvers work on an M×N payoff matrix
+for the row player (maximizer) and report how many iterations they used
+and the final *exploitability gap*::
+
+    gap = max_i (A y)_i - min_j (xᵀ A)_j
+
+— how much the better of the two players could gain by deviating to a
+best response. It is 0 exactly at equilibrium, so iterative solvers stop
+as soon as it falls below ``tolerance × (max(A) - min(A))`` instead of
+running a fixed iteration count.
+
+- :func:`solve_lp` — exact minimax strategies by linear programming
+  (scipy's HiGHS). Used for small and medium games.
+- :func:`fictitious_play` — each player best-responds to the other's
+  empirical mix. Cumulative payoff vectors are updated with one row/column
+  add per iteration, so an iteration costs O(M + N).
+- :func:`regret_matching_solve` — both players play in proportion to
+  positive cumulative regret (RM+, alternating updates, linearly weighted
+  averages); the averaged strategies converge.
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Iterative solvers compute the O(M·N) gap every this many iterations.
+GAP_CHECK_EVERY = 10
+
+# ``method="auto"`` solves games up to this many cells exactly by LP.
+LP_MAX_CELLS = 40_000
+
+
+@dataclass
+class SolverResult:
+    """Equilibrium strategies for a matrix game."""
+
+    row_strategy: np.ndarray
+    col_strategy: np.ndarray
+    game_value: float
+    iterations: int
+    exploitability: float
+    method: str
+
+
+def as_payoff_matrix(payoff_matrix: list[list[float]]) -> np.ndarray:
+    """Validate a non-empty rectangular matrix and return it as float64.
+
+    Raises:
+        ValueError: If rows have different lengths.
+    """
+    n = len(payoff_matrix[0])
+    for i, row in enumerate(payoff_matrix):
+        if len(row) != n:
+            raise ValueError(
+                f"Non-rectangular payoff matrix: row 0 has {n} columns but row {i} has {len(row)}"
+            )
+    return np.asarray(payoff_matrix, dtype=np.float64)
+
+
+def exploitability(a: np.ndarray, x: np.ndarray, y: np.ndarray) -> float:
+    """Exploitability gap of the strategy pair ``(x, y)`` (0 at equilibrium)."""
+    return float(np.max(a @ y) - np.min(x @ a))
+
+
+def _tolerance(a: np.ndarray, tolerance: float) -> float:
+    return tolerance * float(np.ptp(a))
+
+
+def fictitious_play(
+    a: np.ndarray,
+    max_iterations: int = 10_000,
+    tolerance: float = 1e-3,
+) -> SolverResult:
+    """Fictitious play from uniform counts, stopping on the gap.
+
+    Matches the classic loop exactly: the column player best-responds
+    first, ties go to the lowest index.
+    """
+    m, n = a.shape
+    row_counts = np.ones(m)
+    col_counts = np.ones(n)
+    # col_payoffs = row_counts @ a, row_payoffs = a @ col_counts, kept incrementally
+    col_payoffs = a.sum(axis=0)
+    row_payoffs = a.sum(axis=1)
+    threshold = _tolerance(a, tolerance)
+
+    iterations = 0
+    gap = float("inf")
+    for t in range(1, max_iterations + 1):
+        best_col = int(np.argmin(col_payoffs))
+        col_counts[best_col] += 1.0
+        row_payoffs += a[:, best_col]
+
+        best_row = int(np.argmax(row_payoffs))
+        row_counts[best_row] += 1.0
+        col_payoffs += a[best_row]
+
+        iterations = t
+        if t % GAP_CHECK_EVERY == 0:
+            gap = exploitability(a, row_counts / row_counts.sum(), col_counts / col_counts.sum())
+            if gap <= threshold:
+                break
+
+    x = row_counts / row_counts.sum()
+    y = col_counts / col_counts.sum()
+    gap = exploitability(a, x, y)
+    return SolverResult(x, y, float(x @ a @ y), iterations, gap, "fictitious_play")
+
+
+def _regret_strategy(regret: np.ndarray) -> np.ndarray:
+    """Play in proportion to (already non-negative) regret; uniform if none."""
+    total = regret.sum()
+    if total > 0:
+        return regret / total
+    return np.full(regret.shape, 1.0 / regret.size)
+
+
+@dataclass
+class RegretState:
+    """Final regret-matching state (current and averaged strategies)."""
+
+    result: SolverResult
+    current_col_strategy: np.ndarray
+
+
+def regret_matching_solve(
+    a: np.ndarray,
+    iterations: int = 10_000,
+    tolerance: float = 1e-3,
+) -> RegretState:
+    """Regret matching+ with alternating updates and linear averaging.
+
+    Each round the row player updates its regret against the column
+    player's current strategy, then the column player updates against the
+    row player's *new* strategy (alternation, as in CFR+). Cumulative
+    regret is floored at zero every round (RM+) and round ``t`` is weighted
+    by ``t`` in the average. Same fixed point as plain regret matching;
+    typical 2×2 to 8×8 games reach a 1e-3 gap within a few hundred rounds.
+    """
+    m, n = a.shape
+    row_regret = np.zeros(m)
+    col_regret = np.zeros(n)
+    row_sum = np.zeros(m)
+    col_sum = np.zeros(n)
+    threshold = _tolerance(a, tolerance)
+
+    used = 0
+    for t in range(1, iterations + 1):
+        y = _regret_strategy(col_regret)
+        row_action_values = a @ y
+        row_regret += row_action_values - float(_regret_strategy(row_regret) @ row_action_values)
+        np.maximum(row_regret, 0.0, out=row_regret)
+
+        x = _regret_strategy(row_regret)
+        col_action_values = x @ a
+        col_regret += float(col_action_values @ y) - col_action_values
+        np.maximum(col_regret, 0.0, out=col_regret)
+
+        row_sum += t * x
+        col_sum += t * y
+
+        used = t
+        if t % GAP_CHECK_EVERY == 0 and exploitability(
+            a, row_sum / row_sum.sum(), col_sum / col_sum.sum()
+        ) <= threshold:
+            break
+
+    x_avg = row_sum / row_sum.sum()
+    y_avg = col_sum / col_sum.sum()
+    result = SolverResult(
+        x_avg,
+        y_avg,
+        float(x_avg @ a @ y_avg),
+        used,
+        exploitability(a, x_avg, y_avg),
+        "regret_matching",
+    )
+    return RegretState(result=result, current_col_strategy=_regret_strategy(col_regret))
+
+
+def solve_lp(a: np.ndarray) -> SolverResult | None:
+    """Exact minimax strategies by linear programming.
+
+    Row LP: maximize v subject to ``Aᵀx ≥ v``, ``Σx = 1``, ``x ≥ 0``. The
+    column strategy is the dual of the ``Aᵀx ≥ v`` constraints.
+
+    Returns:
+        None when scipy is unavailable or the solver does not report
+        success; callers fall back to an iterative method.
+    """
+    try:
+        from scipy.optimize import linprog
+    except ImportError:
+        logger.debug("scipy not available — falling back to iterative solver")
+        return None
+
+    m, n = a.shape
+    c = np.zeros(m + 1)
+    c[-1] = -1.0
+    a_ub = np.hstack([-a.T, np.ones((n, 1))])
+    a_eq = np.concatenate([np.ones(m), [0.0]])[None, :]
+    bounds = [(0, None)] * m + [(None, None)]
+    res = linprog(
+        c,
+        A_ub=a_ub,
+        b_ub=np.zeros(n),
+        A_eq=a_eq,
+        b_eq=[1.0],
+        bounds=bounds,
+        method="highs",
+    )
+    if res.status != 0:
+        logger.warning("nash_lp_failed", extra={"status": res.status, "message": res.message})
+        return None
+
+    x = np.clip(res.x[:m], 0.0, None)
+    x /= x.sum()
+    y = np.clip(-res.ineqlin.marginals, 0.0, None)
+    if y.sum() <= 0:
+        return None
+    y /= y.sum()
+    return SolverResult(
+        x, y, float(res.x[-1]), int(res.nit), exploitability(a, x, y), "lp"
+    )
@@ -48,7 +48,11 @@ class NashEquilibrium:
     col_labels: list[str] = field(default_factory=list)
     """Labels for column player's actions."""
     iterations: int = 0
-    """Number of iterations used (for iterative solvers)."""
+    """Number of iterations used (LP solver iterations for ``method="lp"``)."""
+    exploitability: float = 0.0
+    """Final exploitability gap: best-response gain available to either player (0 = exact)."""
+    method: str = ""
+    """Solver that produced the result: ``lp`` or ``fictitious_play``."""
 
 
 @dataclass
@@ -94,3 +98,7 @@ class MinimaxResult:
     """Mixed strategy (probability over actions) after regret minimization."""
     depth: int = 0
     """Search depth used (for tree-based minimax)."""
+    iterations: int = 0
+    """Iterations used (for regret matching, which stops early on convergence)."""
+    exploitability: float = 0.0
+    """Final exploitability gap of the averaged strategies (for regret matching)."""
@@ -1,28 +1,93 @@
 """Inference model cache.
 
 Caches loaded ML model artifacts in memory to prevent repeated
-disk reads during inference. Models are keyed by their file path
-and loaded once per runtime.
+disk reads during inference. Models are keyed by their file path.
+
+The cache is bounded by a byte budget: each entry is charged its
+artifact size on disk, and the least recently used models are evicted
+once the total exceeds ``max_bytes``. Artifacts of at least
+``mmap_min_bytes`` are loaded with ``mmap_mode="r"`` so their NumPy
+arrays (tree ensembles, weight matrices) stay file-backed — the pages
+are shared between worker processes and reclaimable by the OS instead
+of being copied onto each worker's heap. Compressed artifacts cannot
+be mapped and are loaded normally.
 
 Usage::
 
-    cache = InferenceCache()
+    cache = get_inference_cache()
     model = cache.get_model("models/mlb/artifacts/mlb_pa_model_v1.pkl")
+    cache.stats().hit_rate
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Total artifact bytes kept in memory before LRU eviction kicks in.
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Artifacts at least this large are memory-mapped on load.
+DEFAULT_MMAP_MIN_BYTES = 16 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters for an ``InferenceCache``."""
+
+    hits: int
+    misses: int
+    evictions: int
+    loads: int
+    load_seconds: float
+    entries: int
+    bytes: int
+    max_bytes: int
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def avg_load_ms(self) -> float:
+        return self.load_seconds * 1000 / self.loads if self.loads else 0.0
 
-class InferenceCache:
-    """In-memory cache for loaded ML model artifacts."""
 
-    def __init__(self) -> None:
-        self._cache: dict[str, Any] = {}
+class InferenceCache:
+    """Byte-bounded LRU cache for loaded ML model artifacts.
+
+    Args:
+        max_bytes: Budget for the summed artifact sizes. The most
+            recently used model is always kept, even if it alone
+            exceeds the budget.
+        mmap_min_bytes: Artifacts at least this large are loaded
+            memory-mapped. ``None`` disables memory mapping.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        mmap_min_bytes: int | None = DEFAULT_MMAP_MIN_BYTES,
+    ) -> None:
+        self._cache: OrderedDict[str, Any] = OrderedDict()
+        self._sizes: dict[str, int] = {}
+        self._max_bytes = max_bytes
+        self._mmap_min_bytes = mmap_min_bytes
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._loads = 0
+        self._load_seconds = 0.0
 
     def get_model(self, path: str) -> Any:
         """Get a model from cache, loading from disk on first access.
@@ -37,9 +102,20 @@ class InferenceCache:
             FileNotFoundError: If the model file does not exist.
             RuntimeError: If the file cannot be loaded.
         """
-        if path in self._cache:
-            return self._cache[path]
-
+        with self._lock:
+            if path in self._cache:
+                self._hits += 1
+                self._cache.move_to_end(path)
+                return self._cache[path]
+            self._misses += 1
+
+            model, nbytes = self._load(path)
+            self._cache[path] = model
+            self._sizes[path] = nbytes
+            self._evict()
+            return model
+
+    def _load(self, path: str) -> tuple[Any, int]:
         from pathlib import Path as _Path
         p = _Path(path)
         if not p.exists():
@@ -53,13 +129,42 @@ class InferenceCache:
         verify_artifact(path)
 
         import joblib
+        nbytes = os.path.getsize(path)
+        mmap = self._mmap_min_bytes is not None and nbytes >= self._mmap_min_bytes
+        started = time.perf_counter()
         try:
-            model = joblib.load(path)
+            if mmap:
+                with warnings.catch_warnings():
+                    # Compressed artifacts can't be mapped; joblib loads them normally
+                    warnings.filterwarnings("ignore", message="mmap_mode .* not compatible")
+                    model = joblib.load(path, mmap_mode="r")
+            else:
+                model = joblib.load(path)
         except Exception as exc:
             raise RuntimeError(f"Failed to load model artifact {path}: {exc}") from exc
-        self._cache[path] = model
-        logger.info("model_cached", extra={"path": path})
-        return model
+        elapsed = time.perf_counter() - started
+        self._loads += 1
+        self._load_seconds += elapsed
+        logger.info(
+            "model_cached",
+            extra={
+                "path": path,
+                "bytes": nbytes,
+                "mmap": mmap,
+                "load_ms": round(elapsed * 1000, 1),
+            },
+        )
+        return model, nbytes
+
+    def _evict(self) -> None:
+        while len(self._cache) > 1 and self._total_bytes() > self._max_bytes:
+            path, _ = self._cache.popitem(last=False)
+            self._sizes.pop(path, None)
+            self._evictions += 1
+            logger.info("model_evicted", extra={"path": path})
+
+    def _total_bytes(self) -> int:
+        return sum(self._sizes.values())
 
     def is_cached(self, path: str) -> bool:
         """Check if a model is already cached."""
@@ -67,13 +172,42 @@ class InferenceCache:
 
     def invalidate(self, path: str) -> None:
         """Remove a model from the cache."""
-        self._cache.pop(path, None)
+        with self._lock:
+            self._cache.pop(path, None)
+            self._sizes.pop(path, None)
 
     def clear(self) -> None:
         """Clear all cached models."""
-        self._cache.clear()
+        with self._lock:
+            self._cache.clear()
+            self._sizes.clear()
+
+    def stats(self) -> CacheStats:
+        """Hit/miss, eviction and load-time counters since creation."""
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                loads=self._loads,
+                load_seconds=self._load_seconds,
+                entries=len(self._cache),
+                bytes=self._total_bytes(),
+                max_bytes=self._max_bytes,
+            )
 
     @property
     def size(self) -> int:
         """Number of models currently cached."""
         return len(self._cache)
+
+
+_shared_cache: InferenceCache | None = None
+
+
+def get_inference_cache() -> InferenceCache:
+    """Process-wide cache shared by every ``ModelInferenceEngine``."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = InferenceCache()
+    return _shared_cache
@@ -9,6 +9,7 @@ Usage::
     engine = ModelInferenceEngine()
     probs = engine.predict_proba("mlb", "plate_appearance", profiles)
     # -> {"strikeout": 0.21, "walk": 0.08, ...}
+    batch = engine.predict_proba_batch("mlb", "plate_appearance", [p1, p2])
 """
 
 from __future__ import annotations
@@ -19,7 +20,7 @@ from typing import Any
 from app.analytics.features.core.feature_builder import FeatureBuilder
 from app.analytics.models.core.model_registry import ModelRegistry
 
-from .inference_cache import InferenceCache
+from .inference_cache import InferenceCache, get_inference_cache
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +34,8 @@ class ModelInferenceEngine:
     Args:
         registry: Optional ``ModelRegistry`` instance. Creates one
             if not provided.
-        cache: Optional ``InferenceCache`` instance.
+        cache: Optional ``InferenceCache`` instance. Defaults to the
+            process-wide cache so engines share loaded artifacts.
     """
 
     def __init__(
@@ -42,7 +44,7 @@ class ModelInferenceEngine:
         cache: InferenceCache | None = None,
     ) -> None:
         self._registry = registry or ModelRegistry()
-        self._cache = cache or InferenceCache()
+        self._cache = cache if cache is not None else get_inference_cache()
         self._feature_builder = FeatureBuilder()
         # Track loaded model IDs for auto-reload detection
         self._loaded_model_ids: dict[str, str] = {}  # "sport:model_type" -> model_id
@@ -104,6 +106,42 @@ class ModelInferenceEngine:
         features = self._build_features(sport, model_type, profiles, config_name)
         return model.predict_proba(features)
 
+    def predict_proba_batch(
+        self,
+        sport: str,
+        model_type: str,
+        profiles_list: list[dict[str, Any]],
+        *,
+        config_name: str | None = None,
+        model_id: str | None = None,
+    ) -> list[dict[str, float]]:
+        """Generate probability distributions for many matchups at once.
+
+        Resolves the model once and scores every profile set in a
+        single model call instead of one call per matchup.
+
+        Args:
+            sport: Sport code.
+            model_type: Model type.
+            profiles_list: One entity profiles dict per matchup.
+            config_name: Optional feature config name.
+            model_id: Optional specific model ID to use instead
+                of the active model.
+
+        Returns:
+            One probability dict per entry of ``profiles_list``, in
+            order; empty dicts when no model is available.
+        """
+        model = self._get_model(sport, model_type, model_id=model_id)
+        if model is None:
+            return [{} for _ in profiles_list]
+
+        features_list = [
+            self._build_features(sport, model_type, profiles, config_name)
+            for profiles in profiles_list
+        ]
+        return model.predict_proba_batch(features_list)
+
     def predict_for_simulation(
         self,
         sport: str,
@@ -207,7 +245,7 @@ class ModelInferenceEngine:
             current_id = info["model_id"]
             path = info["path"]
 
-            # Auto-reload: if the active model changed, invalidate old cache
+            # Auto-reload: if the active model changed, drop the old artifact
             if not model_id:
                 prev_id = self._loaded_model_ids.get(cache_key)
                 if prev_id and prev_id != current_id:
@@ -215,7 +253,9 @@ class ModelInferenceEngine:
                         "model_switch_detected",
                         extra={"previous": prev_id, "current": current_id},
                     )
-                    self._cache.clear()
+                    prev_info = self._registry.get_model_info_by_id(sport, model_type, prev_id)
+                    if prev_info and prev_info.get("path"):
+                        self._cache.invalidate(prev_info["path"])
 
             try:
                 sklearn_model = self._cache.get_model(path)
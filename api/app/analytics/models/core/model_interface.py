@@ -74,6 +74,16 @@ class BaseModel(ABC):
             Dict mapping outcome labels to probabilities (sum to ~1.0).
         """
 
+    def predict_proba_batch(
+        self, features_list: list[dict[str, Any]],
+    ) -> list[dict[str, float]]:
+        """Probability distributions for many feature dicts.
+
+        The default calls ``predict_proba`` per row; wrappers around a
+        trained estimator override it to score all rows in one call.
+        """
+        return [self.predict_proba(features) for features in features_list]
+
     def get_info(self) -> dict[str, Any]:
         """Return metadata about this model."""
         return {
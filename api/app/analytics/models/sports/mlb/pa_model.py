@@ -82,21 +82,40 @@ class MLBPlateAppearanceModel(BaseModel):
         training) to build the feature vector in the correct order.
         Falls back to ``FEATURE_KEYS`` for built-in models.
         """
-        # Prefer the feature names stored on the model at training time
-        training_names = getattr(self._model, "_training_feature_names", None)
-        if training_names:
-            feature_vector = [float(features.get(k, 0.0)) for k in training_names]
-        else:
-            feature_vector = [features.get(k, 0.0) for k in FEATURE_KEYS]
-
         if hasattr(self._model, "predict_proba"):
-            proba = self._model.predict_proba([feature_vector])[0]
-            classes = list(self._model.classes_)
-            return {str(c): round(float(p), 4) for c, p in zip(classes, proba)}
+            return self._predict_rows_with_model([features])[0]
 
         # Fallback: model only has predict()
         return self._predict_rule_based(features)
 
+    def predict_proba_batch(
+        self, features_list: list[dict[str, Any]],
+    ) -> list[dict[str, float]]:
+        """Score every feature dict with a single estimator call."""
+        if not features_list:
+            return []
+        if self._model is not None and hasattr(self._model, "predict_proba"):
+            return self._predict_rows_with_model(features_list)
+        return [self.predict_proba(features) for features in features_list]
+
+    def _feature_vector(self, features: dict[str, Any]) -> list[Any]:
+        # Prefer the feature names stored on the model at training time
+        training_names = getattr(self._model, "_training_feature_names", None)
+        if training_names:
+            return [float(features.get(k, 0.0)) for k in training_names]
+        return [features.get(k, 0.0) for k in FEATURE_KEYS]
+
+    def _predict_rows_with_model(
+        self, features_list: list[dict[str, Any]],
+    ) -> list[dict[str, float]]:
+        rows = [self._feature_vector(features) for features in features_list]
+        proba = self._model.predict_proba(rows)
+        classes = [str(c) for c in self._model.classes_]
+        return [
+            {c: round(float(p), 4) for c, p in zip(classes, row)}
+            for row in proba
+        ]
+
     def _predict_rule_based(self, features: dict[str, Any]) -> dict[str, float]:
         """Apply rule-based adjustments to defaults based on features."""
         probs = dict(_DEFAULT_EVENT_PROBS)
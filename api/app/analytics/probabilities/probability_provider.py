@@ -188,6 +188,21 @@ class ProbabilityProvider(ABC):
             that sum to 1.0.
         """
 
+    def get_event_probabilities_batch(
+        self,
+        sport: str,
+        contexts: list[dict[str, Any]],
+    ) -> list[dict[str, float]]:
+        """Generate event probabilities for many contexts.
+
+        The default resolves each context in turn; providers backed by
+        a model override it to score all contexts in one call.
+
+        Returns:
+            One normalized probability dict per context, in order.
+        """
+        return [self.get_event_probabilities(sport, ctx) for ctx in contexts]
+
     @property
     def provider_name(self) -> str:
         """Human-readable provider name for metadata."""
@@ -284,7 +299,38 @@ class MLProvider(ProbabilityProvider):
             profiles=context,
             model_id=model_id,
         )
+        return self._finalize(sport, probs, model_id)
+
+    def get_event_probabilities_batch(
+        self,
+        sport: str,
+        contexts: list[dict[str, Any]],
+    ) -> list[dict[str, float]]:
+        """Score all contexts with one model call per distinct ``_model_id``."""
+        engine = self._get_engine()
+        by_model: dict[str | None, list[int]] = {}
+        for i, ctx in enumerate(contexts):
+            by_model.setdefault(ctx.get("_model_id"), []).append(i)
+
+        results: list[dict[str, float]] = [{} for _ in contexts]
+        for model_id, indices in by_model.items():
+            batch = engine.predict_proba_batch(
+                sport=sport,
+                model_type=self._model_type,
+                profiles_list=[contexts[i] for i in indices],
+                model_id=model_id,
+            )
+            for i, probs in zip(indices, batch, strict=True):
+                results[i] = self._finalize(sport, probs, model_id)
+        return results
 
+    def _finalize(
+        self,
+        sport: str,
+        probs: dict[str, float],
+        model_id: str | None,
+    ) -> dict[str, float]:
+        """Normalize raw model output and anchor MLB output to baseline."""
         if not probs:
             raise RuntimeError(
                 f"ML inference returned empty probabilities "
@@ -346,37 +392,54 @@ class EnsembleProvider(ProbabilityProvider):
         After this method returns, ``self.last_providers_used`` contains
         the list of provider names that contributed to the blend.
         """
+        return self.get_event_probabilities_batch(sport, [context])[0]
+
+    def get_event_probabilities_batch(
+        self,
+        sport: str,
+        contexts: list[dict[str, Any]],
+    ) -> list[dict[str, float]]:
+        """Blend every context, scoring the ML side in one batch call.
+
+        A provider that fails drops out of the blend for the whole
+        batch; ``self.last_providers_used`` lists the ones that succeeded.
+        """
         from app.analytics.ensemble.ensemble_config import get_ensemble_config
         from app.analytics.ensemble.ensemble_engine import EnsembleEngine
 
         config = get_ensemble_config(sport, self._model_type)
         provider_names = {p.name for p in config.providers}
 
-        predictions: dict[str, dict[str, float]] = {}
+        predictions: dict[str, list[dict[str, float]]] = {}
 
         if "rule_based" in provider_names:
             try:
-                predictions["rule_based"] = self._rule.get_event_probabilities(
-                    sport, context,
+                predictions["rule_based"] = self._rule.get_event_probabilities_batch(
+                    sport, contexts,
                 )
             except Exception as exc:
                 logger.warning("ensemble_rule_based_failed", extra={"error": str(exc)})
 
         if "ml" in provider_names:
             try:
-                predictions["ml"] = self._ml.get_event_probabilities(sport, context)
+                predictions["ml"] = self._ml.get_event_probabilities_batch(sport, contexts)
             except Exception as exc:
                 logger.warning("ensemble_ml_failed", extra={"error": str(exc)})
 
         self.last_providers_used = sorted(predictions.keys())
+        valid_events = MLB_PA_EVENTS if sport.lower() == "mlb" else None
 
         if not predictions:
             logger.warning("ensemble_all_providers_failed", extra={"sport": sport})
-            valid_events = MLB_PA_EVENTS if sport.lower() == "mlb" else None
-            return normalize_probabilities(_MLB_DEFAULTS, valid_events)
+            return [normalize_probabilities(_MLB_DEFAULTS, valid_events) for _ in contexts]
 
         engine = EnsembleEngine()
-        combined = engine.combine_from_config(predictions, config)
-
-        valid_events = MLB_PA_EVENTS if sport.lower() == "mlb" else None
-        return normalize_probabilities(combined, valid_events)
+        return [
+            normalize_probabilities(
+                engine.combine_from_config(
+                    {name: preds[i] for name, preds in predictions.items()}, config,
+                ),
+                valid_events,
+            )
+            for i in range(len(contexts))
+        ]
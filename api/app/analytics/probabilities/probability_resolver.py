@@ -141,11 +141,28 @@ class ProbabilityResolver:
             ``requested_mode``, ``executed_mode``, ``probability_source``,
             and ``model_info`` (when ML provider succeeds).
         """
+        return self.get_probabilities_batch_with_meta(
+            sport, model_type, [context], mode,
+        )[0]
+
+    def get_probabilities_batch_with_meta(
+        self,
+        sport: str,
+        model_type: str,
+        contexts: list[dict[str, Any]],
+        mode: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Like ``get_probabilities_with_meta`` for many contexts.
+
+        The provider scores every context in one batch (a single model
+        call for ML-backed modes). Each returned dict carries its own
+        copy of the shared ``_meta``.
+        """
         effective_mode = mode or self.mode
 
         try:
             provider = self.resolve_provider(sport, model_type, effective_mode)
-            probs = provider.get_event_probabilities(sport, context)
+            batch = provider.get_event_probabilities_batch(sport, contexts)
             meta: dict[str, Any] = {
                 "probability_source": provider.provider_name,
                 "model_type": model_type,
@@ -155,7 +172,7 @@ class ProbabilityResolver:
             # Attach model_info when ML provider was used
             if effective_mode in (MODE_ML, MODE_ENSEMBLE):
                 meta["model_info"] = self._get_model_info(sport, model_type)
-            return {**probs, "_meta": meta}
+            return [{**probs, "_meta": dict(meta)} for probs in batch]
 
         except Exception as exc:
             logger.error(
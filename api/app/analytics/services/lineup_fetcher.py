@@ -4,8 +4,9 @@ For scheduled/pregame games where PBP doesn't exist yet:
 
 - **Probable pitcher:** Fetched from the MLB Stats API schedule endpoint
   which publishes probable starters typically 1-2 days before game time.
-- **Batting order:** Uses the team's most recent actual lineup
-  reconstructed from their last completed game's PBP.  MLB teams
+- **Batting order:** Uses the team's most recent actual lineup,
+  read from ``mlb_game_lineups`` (materialized from each final game's
+  PBP) or reconstructed on the spot when missing.  MLB teams
   typically run similar lineups game to game, making this a reasonable
   proxy.
 - **Consensus lineup:** Analyses the last N games to find the most
@@ -101,31 +102,23 @@ async def fetch_recent_lineup(
         List of ``{"external_ref": str, "name": str}`` in batting order,
         or ``None`` if no recent PBP data found.
     """
-    from app.db.sports import SportsGame
-
-    # Find the team's most recent final game with PBP
-    stmt = (
-        select(SportsGame.id)
-        .where(
-            SportsGame.status.in_(["final", "archived"]),
-            (SportsGame.home_team_id == team_id) | (SportsGame.away_team_id == team_id),
-        )
-        .order_by(SportsGame.game_date.desc())
-        .limit(1)
+    from app.analytics.services.lineup_reconstruction import (
+        load_recent_lineups,
+        reconstruct_lineup_from_pbp,
     )
-    if before_game_id is not None:
-        stmt = stmt.where(SportsGame.id != before_game_id)
-
-    result = await db.execute(stmt)
-    recent_game_id = result.scalar_one_or_none()
 
-    if recent_game_id is None:
+    recent = await load_recent_lineups(
+        db, team_id, before_game_id=before_game_id, limit=1,
+    )
+    if not recent:
         return None
 
-    from app.analytics.services.lineup_reconstruction import (
-        reconstruct_lineup_from_pbp,
-    )
+    recent_game_id, stored = recent[0]
+    if stored is not None:
+        # A no-lineup marker has no batters: the game was already underivable
+        return stored.batters or None
 
+    # Not materialized yet — reconstruct from PBP
     lineup_data = await reconstruct_lineup_from_pbp(db, recent_game_id, team_id)
     if lineup_data is None:
         return None
@@ -147,7 +140,9 @@ async def fetch_consensus_lineup(
     their typical batting order positions.
 
     Algorithm:
-        1. Reconstruct lineups from the last ``num_games`` completed games.
+        1. Take the team's last ``num_games`` final games and read their
+           lineups from ``mlb_game_lineups``; games not materialized yet
+           are reconstructed from PBP, and no-lineup markers are skipped.
         2. Count per-player appearances across all lineups (frequency).
         3. Take the top 9 players by frequency as consensus starters.
         4. For each starter, find their most common batting order position
@@ -172,36 +167,28 @@ async def fetch_consensus_lineup(
     from collections import Counter, defaultdict
 
     from app.analytics.services.lineup_reconstruction import (
+        load_recent_lineups,
         reconstruct_lineup_from_pbp,
     )
-    from app.db.sports import SportsGame
-
-    # Find the last num_games completed games for this team
-    stmt = (
-        select(SportsGame.id)
-        .where(
-            SportsGame.status.in_(["final", "archived"]),
-            (SportsGame.home_team_id == team_id)
-            | (SportsGame.away_team_id == team_id),
-        )
-        .order_by(SportsGame.game_date.desc())
-        .limit(num_games)
-    )
-    if before_game_id is not None:
-        stmt = stmt.where(SportsGame.id != before_game_id)
 
-    result = await db.execute(stmt)
-    game_ids = result.scalars().all()
-
-    if not game_ids:
+    # The team's last num_games final games, each with its materialized
+    # lineup when there is one; only the gaps are reconstructed from PBP.
+    recent = await load_recent_lineups(
+        db, team_id, before_game_id=before_game_id, limit=num_games,
+    )
+    if not recent:
         return None
 
-    # Reconstruct each lineup
     all_lineups: list[list[dict[str, str]]] = []
-    for gid in game_ids:
-        lineup_data = await reconstruct_lineup_from_pbp(db, gid, team_id)
-        if lineup_data and lineup_data.get("batters"):
-            all_lineups.append(lineup_data["batters"])
+    for gid, stored in recent:
+        if stored is not None:
+            batters = stored.batters
+        else:
+            lineup_data = await reconstruct_lineup_from_pbp(db, gid, team_id)
+            batters = lineup_data["batters"] if lineup_data else None
+        if batters:
+            all_lineups.append(batters)
+    games_checked = len(recent)
 
     if len(all_lineups) < 3:
         logger.info(
@@ -209,7 +196,7 @@ async def fetch_consensus_lineup(
             extra={
                 "team_id": team_id,
                 "lineups_found": len(all_lineups),
-                "games_checked": len(game_ids),
+                "games_checked": games_checked,
             },
         )
         return await fetch_recent_lineup(db, team_id, before_game_id)
@@ -3,11 +3,18 @@
 For completed MLB games, the batting order can be inferred from PBP:
 the first 9 unique batters in play-index order form the starting lineup.
 The starting pitcher comes from ``MLBPitcherGameStats.is_starter``.
+
+The scraper materializes both into ``mlb_game_lineups`` when a game's
+advanced stats are ingested, using the same row-level functions
+(``lineup_from_plays``, ``lineup_from_boxscore_rows``,
+``starting_pitcher_from_rows``); ``load_recent_lineups`` and
+``load_game_lineup`` read them back.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
 from typing import Any
 
 from sqlalchemy import select
@@ -53,7 +60,39 @@ async def reconstruct_lineup_from_pbp(
         # Fallback: derive batters from boxscore data
         return await _lineup_from_boxscores(db, game_id, team_id)
 
-    # Walk plays in order, collecting unique batters by first appearance
+    batters = lineup_from_plays(plays)
+
+    if len(batters) < 3:
+        logger.info(
+            "lineup_reconstruction_incomplete_pbp",
+            extra={
+                "game_id": game_id,
+                "team_id": team_id,
+                "batters_found": len(batters),
+            },
+        )
+        # Try boxscore fallback
+        return await _lineup_from_boxscores(db, game_id, team_id)
+
+    if len(batters) < 9:
+        logger.info(
+            "lineup_reconstruction_partial",
+            extra={
+                "game_id": game_id,
+                "team_id": team_id,
+                "batters_found": len(batters),
+            },
+        )
+
+    return {"batters": batters}
+
+
+def lineup_from_plays(plays: Sequence[Any]) -> list[dict[str, str]]:
+    """First 9 unique batters with a completed plate appearance, in order.
+
+    ``plays`` are one team's ``SportsGamePlay`` rows sorted by
+    ``play_index``.
+    """
     seen: set[str] = set()
     batters: list[dict[str, str]] = []
 
@@ -89,29 +128,7 @@ async def reconstruct_lineup_from_pbp(
             if len(batters) >= 9:
                 break
 
-    if len(batters) < 3:
-        logger.info(
-            "lineup_reconstruction_incomplete_pbp",
-            extra={
-                "game_id": game_id,
-                "team_id": team_id,
-                "batters_found": len(batters),
-            },
-        )
-        # Try boxscore fallback
-        return await _lineup_from_boxscores(db, game_id, team_id)
-
-    if len(batters) < 9:
-        logger.info(
-            "lineup_reconstruction_partial",
-            extra={
-                "game_id": game_id,
-                "team_id": team_id,
-                "batters_found": len(batters),
-            },
-        )
-
-    return {"batters": batters}
+    return batters
 
 
 async def _lineup_from_boxscores(
@@ -144,26 +161,45 @@ async def _lineup_from_boxscores(
         )
         return None
 
-    # Filter to batters (have at-bats or plate appearances in stats)
-    batter_rows = []
-    for row in rows:
-        stats = row.stats or {}
-        ab = stats.get("atBats", stats.get("at_bats", 0)) or 0
-        pa = stats.get("plateAppearances", stats.get("plate_appearances", 0)) or 0
-        if ab > 0 or pa > 0:
-            batter_rows.append(row)
+    batters = lineup_from_boxscore_rows(rows)
 
-    if len(batter_rows) < 3:
+    if len(batters) < 3:
         logger.info(
             "lineup_boxscore_fallback_insufficient",
             extra={
                 "game_id": game_id,
                 "team_id": team_id,
-                "batters_found": len(batter_rows),
+                "batters_found": len(batters),
             },
         )
         return None
 
+    logger.info(
+        "lineup_boxscore_fallback_success",
+        extra={
+            "game_id": game_id,
+            "team_id": team_id,
+            "batters_found": len(batters),
+        },
+    )
+    return {"batters": batters}
+
+
+def lineup_from_boxscore_rows(rows: Sequence[Any]) -> list[dict[str, str]]:
+    """Up to 9 batters from one team's ``SportsPlayerBoxscore`` rows.
+
+    Batters are players with at-bats or plate appearances, ordered by
+    ``battingOrder`` when present, otherwise by at-bats descending.
+    """
+    # Filter to batters (have at-bats or plate appearances in stats)
+    batter_rows = []
+    for row in rows:
+        stats = row.stats or {}
+        ab = stats.get("atBats", stats.get("at_bats", 0)) or 0
+        pa = stats.get("plateAppearances", stats.get("plate_appearances", 0)) or 0
+        if ab > 0 or pa > 0:
+            batter_rows.append(row)
+
     # Sort by battingOrder if available, otherwise by at-bats descending
     def _sort_key(r):
         s = r.stats or {}
@@ -183,15 +219,7 @@ async def _lineup_from_boxscores(
         for row in batter_rows[:9]
     ]
 
-    logger.info(
-        "lineup_boxscore_fallback_success",
-        extra={
-            "game_id": game_id,
-            "team_id": team_id,
-            "batters_found": len(batters),
-        },
-    )
-    return {"batters": batters}
+    return batters
 
 
 async def get_starting_pitcher(
@@ -264,7 +292,29 @@ async def get_starting_pitcher(
     box_result = await db.execute(box_stmt)
     box_rows = box_result.scalars().all()
 
-    # Look for player with most innings pitched in boxscore stats
+    best_pitcher, best_ip = _top_boxscore_pitcher(box_rows)
+
+    if best_pitcher and best_ip > 0:
+        logger.info(
+            "starting_pitcher_boxscore_fallback",
+            extra={
+                "game_id": game_id,
+                "team_id": team_id,
+                "pitcher": best_pitcher.player_name,
+                "ip": best_ip,
+            },
+        )
+        return {
+            "external_ref": best_pitcher.player_external_ref,
+            "name": best_pitcher.player_name,
+            "avg_ip": best_ip,
+        }
+
+    return None
+
+
+def _top_boxscore_pitcher(box_rows: Sequence[Any]) -> tuple[Any, float]:
+    """Boxscore row with the most innings pitched, and those innings."""
     best_pitcher = None
     best_ip = 0.0
     for row in box_rows:
@@ -277,21 +327,92 @@ async def get_starting_pitcher(
         if ip > best_ip:
             best_ip = ip
             best_pitcher = row
+    return best_pitcher, best_ip
+
+
+def starting_pitcher_from_rows(
+    pitcher_rows: Sequence[Any],
+    box_rows: Sequence[Any],
+) -> dict[str, Any] | None:
+    """Same selection as :func:`get_starting_pitcher` over loaded rows.
 
+    ``pitcher_rows`` are one team's ``MLBPitcherGameStats`` for the game
+    and ``box_rows`` its ``SportsPlayerBoxscore`` rows.
+    """
+    starter = next((p for p in pitcher_rows if p.is_starter), None)
+    if starter is None and pitcher_rows:
+        starter = max(pitcher_rows, key=lambda p: p.innings_pitched or 0)
+    if starter is not None:
+        return {
+            "external_ref": starter.player_external_ref,
+            "name": starter.player_name,
+            "avg_ip": float(starter.innings_pitched or 0),
+        }
+
+    best_pitcher, best_ip = _top_boxscore_pitcher(box_rows)
     if best_pitcher and best_ip > 0:
-        logger.info(
-            "starting_pitcher_boxscore_fallback",
-            extra={
-                "game_id": game_id,
-                "team_id": team_id,
-                "pitcher": best_pitcher.player_name,
-                "ip": best_ip,
-            },
-        )
         return {
             "external_ref": best_pitcher.player_external_ref,
             "name": best_pitcher.player_name,
             "avg_ip": best_ip,
         }
-
     return None
+
+
+# ---------------------------------------------------------------------------
+# Materialized lineups (mlb_game_lineups)
+# ---------------------------------------------------------------------------
+
+
+async def load_recent_lineups(
+    db: AsyncSession,
+    team_id: int,
+    *,
+    before_game_id: int | None = None,
+    limit: int = 7,
+) -> list[tuple[int, Any | None]]:
+    """The team's last ``limit`` final games with their stored lineups.
+
+    Returns ``(game_id, MLBGameLineup | None)`` pairs, newest first. The
+    window is always the team's actual recent games: ``mlb_game_lineups``
+    is left-joined, so a game that was never materialized comes back with
+    ``None`` instead of letting an older stored game take its place.
+    """
+    from app.db.mlb_advanced import MLBGameLineup
+    from app.db.sports import SportsGame
+
+    stmt = (
+        select(SportsGame.id, MLBGameLineup)
+        .outerjoin(
+            MLBGameLineup,
+            (MLBGameLineup.game_id == SportsGame.id)
+            & (MLBGameLineup.team_id == team_id),
+        )
+        .where(
+            SportsGame.status.in_(["final", "archived"]),
+            (SportsGame.home_team_id == team_id) | (SportsGame.away_team_id == team_id),
+        )
+        .order_by(SportsGame.game_date.desc())
+        .limit(limit)
+    )
+    if before_game_id is not None:
+        stmt = stmt.where(SportsGame.id != before_game_id)
+    result = await db.execute(stmt)
+    return [(game_id, lineup) for game_id, lineup in result.all()]
+
+
+async def load_game_lineup(
+    db: AsyncSession,
+    game_id: int,
+    team_id: int,
+) -> Any | None:
+    """The materialized ``MLBGameLineup`` for one team in one game, if any."""
+    from app.db.mlb_advanced import MLBGameLineup
+
+    result = await db.execute(
+        select(MLBGameLineup).where(
+            MLBGameLineup.game_id == game_id,
+            MLBGameLineup.team_id == team_id,
+        )
+    )
+    return result.scalar_one_or_none()
@@ -88,6 +88,7 @@ async def build_lineup_weights(
     team_profile: dict[str, float] | None,
     *,
     rolling_window: int = 30,
+    profiles: dict[str, dict[str, float]] | None = None,
 ) -> dict[str, Any]:
     """Build per-batter weight arrays for lineup-aware simulation.
 
@@ -105,6 +106,10 @@ async def build_lineup_weights(
         team_profile: Fallback team-level profile if a batter has no
             individual data.
         rolling_window: Number of recent games for rolling profiles.
+        profiles: Batter profiles already loaded with
+            ``load_mlb_rolling_profiles``, keyed by external ref. When
+            given, no per-batter queries are made; refs missing from it
+            fall back to the team profile.
 
     Returns:
         Dict with ``starter_weights``, ``bullpen_weights``,
@@ -128,7 +133,11 @@ async def build_lineup_weights(
         name = slot.get("name", "")
 
         batter_metrics: dict[str, float] | None = None
-        if ext_ref:
+        if ext_ref and profiles is not None:
+            batter_metrics = profiles.get(ext_ref)
+            if batter_metrics:
+                batters_resolved += 1
+        elif ext_ref:
             batter_metrics = await get_player_rolling_profile(
                 ext_ref, team_id,
                 rolling_window=rolling_window,
@@ -8,9 +8,12 @@ yet have player-level simulation support.
 from __future__ import annotations
 
 import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.analytics.services.profile_service import (
@@ -59,20 +62,7 @@ async def get_player_rolling_profile(
     if len(rows) == 0:
         return None
 
-    from app.tasks._training_helpers import stats_to_metrics
-
-    game_dates = [gd for _, gd in rows]
-    weights = _season_weights(game_dates)
-
-    all_metrics: list[dict[str, float]] = []
-    for stats_row, _game_date in rows:
-        all_metrics.append(stats_to_metrics(stats_row))
-
-    player_profile: dict[str, float] = {}
-    for key in all_metrics[0]:
-        vw = [(m[key], w) for m, w in zip(all_metrics, weights) if key in m]
-        if vw:
-            player_profile[key] = round(_weighted_mean(vw), 4)
+    player_profile = _batter_profile_from_rows(rows)
 
     games_found = len(rows)
     if games_found < 5:
@@ -91,21 +81,49 @@ async def get_player_rolling_profile(
             )
             team_profile = team_profile_result.metrics if team_profile_result else None
             if team_profile is not None:
-                player_weight = games_found / 5
-                team_weight = 1.0 - player_weight
-                blended: dict[str, float] = {}
-                all_keys = set(player_profile) | set(team_profile)
-                for key in all_keys:
-                    p_val = player_profile.get(key, 0.0)
-                    t_val = team_profile.get(key, 0.0)
-                    blended[key] = round(
-                        p_val * player_weight + t_val * team_weight, 4
-                    )
-                return blended
+                return _blend_with_team(player_profile, games_found, team_profile)
+
+    return player_profile
+
+
+def _batter_profile_from_rows(rows: Sequence[tuple[Any, datetime]]) -> dict[str, float]:
+    """Recency-weighted batting profile from ``(stats_row, game_date)`` rows."""
+    from app.tasks._training_helpers import stats_to_metrics
+
+    game_dates = [gd for _, gd in rows]
+    weights = _season_weights(game_dates)
+
+    all_metrics: list[dict[str, float]] = []
+    for stats_row, _game_date in rows:
+        all_metrics.append(stats_to_metrics(stats_row))
 
+    player_profile: dict[str, float] = {}
+    for key in all_metrics[0]:
+        vw = [(m[key], w) for m, w in zip(all_metrics, weights) if key in m]
+        if vw:
+            player_profile[key] = round(_weighted_mean(vw), 4)
     return player_profile
 
 
+def _blend_with_team(
+    player_profile: dict[str, float],
+    games_found: int,
+    team_profile: dict[str, float],
+) -> dict[str, float]:
+    """Regress a low-sample (< 5 games) batter toward the team profile."""
+    player_weight = games_found / 5
+    team_weight = 1.0 - player_weight
+    blended: dict[str, float] = {}
+    all_keys = set(player_profile) | set(team_profile)
+    for key in all_keys:
+        p_val = player_profile.get(key, 0.0)
+        t_val = team_profile.get(key, 0.0)
+        blended[key] = round(
+            p_val * player_weight + t_val * team_weight, 4
+        )
+    return blended
+
+
 async def get_pitcher_rolling_profile(
     player_external_ref: str,
     team_id: int,
@@ -189,6 +207,13 @@ async def _pitcher_profile_from_statcast(
         logger.warning("pitcher_statcast_query_failed", exc_info=True)
         return None
 
+    return _statcast_profile_from_rows(rows)
+
+
+def _statcast_profile_from_rows(
+    rows: Sequence[tuple[Any, datetime]],
+) -> dict[str, float]:
+    """Recency-weighted pitcher profile from ``MLBPitcherGameStats`` rows."""
     game_dates = [gd for _, gd in rows]
     weights = _season_weights(game_dates)
 
@@ -260,6 +285,16 @@ async def _pitcher_profile_from_boxscore(
     result = await db.execute(stmt)
     rows = result.all()
 
+    return _boxscore_profile_from_rows(player_external_ref, rows)
+
+
+def _boxscore_profile_from_rows(
+    player_external_ref: str,
+    rows: Sequence[tuple[Any, datetime]],
+) -> dict[str, float] | None:
+    """Recency-weighted pitcher profile from boxscore rows, or ``None``
+    when fewer than 3 games have any batters faced.
+    """
     per_game_metrics: list[dict[str, float]] = []
     game_dates_for_weighting: list[datetime] = []
     for row, game_date in rows:
@@ -305,3 +340,161 @@ async def _pitcher_profile_from_boxscore(
         aggregated[key] = round(_weighted_mean(vw), 4)
 
     return aggregated
+
+
+# ---------------------------------------------------------------------------
+# Set-based loading for a whole slate
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class MLBProfileBatch:
+    """Rolling profiles for every batter and pitcher on a slate.
+
+    Values match ``get_player_rolling_profile`` and
+    ``get_pitcher_rolling_profile`` for the same window; refs without
+    enough data are absent.
+    """
+
+    batters: dict[str, dict[str, float]] = field(default_factory=dict)
+    pitchers: dict[str, dict[str, float]] = field(default_factory=dict)
+
+
+async def _recent_rows_by_player(
+    db: AsyncSession,
+    stats_model: Any,
+    refs: Sequence[str],
+    *,
+    rolling_window: int,
+    exclude_playoffs: bool,
+) -> dict[str, list[tuple[Any, datetime]]]:
+    """Each player's last ``rolling_window`` final games, newest first.
+
+    One windowed query for all ``refs``: rows are ranked per player by
+    game date and cut at the window, instead of one LIMIT query each.
+    """
+    from app.db.sports import SportsGame
+
+    rank = (
+        func.row_number()
+        .over(
+            partition_by=stats_model.player_external_ref,
+            order_by=SportsGame.game_date.desc(),
+        )
+        .label("rn")
+    )
+    ranked = (
+        select(stats_model.id, SportsGame.game_date, rank)
+        .join(SportsGame, SportsGame.id == stats_model.game_id)
+        .where(
+            stats_model.player_external_ref.in_(refs),
+            SportsGame.status == "final",
+        )
+    )
+    if exclude_playoffs:
+        ranked = ranked.where(SportsGame.season_type == "regular")
+    ranked_sq = ranked.subquery()
+
+    stmt = (
+        select(stats_model, ranked_sq.c.game_date)
+        .join(ranked_sq, ranked_sq.c.id == stats_model.id)
+        .where(ranked_sq.c.rn <= rolling_window)
+        .order_by(stats_model.player_external_ref, ranked_sq.c.rn)
+    )
+    result = await db.execute(stmt)
+
+    by_player: dict[str, list[tuple[Any, datetime]]] = {}
+    for stats_row, game_date in result.all():
+        by_player.setdefault(stats_row.player_external_ref, []).append(
+            (stats_row, game_date)
+        )
+    return by_player
+
+
+async def load_mlb_rolling_profiles(
+    db: AsyncSession,
+    *,
+    batters: dict[str, int],
+    pitchers: Sequence[str] = (),
+    rolling_window: int = 30,
+    exclude_playoffs: bool = False,
+) -> MLBProfileBatch:
+    """Build rolling profiles for many batters and pitchers at once.
+
+    Replaces a ``get_player_rolling_profile`` / ``get_pitcher_rolling_profile``
+    call per lineup slot with a handful of set-based queries: one for
+    all batter rows, one for Statcast pitcher rows, one for the boxscore
+    fallback of pitchers without enough Statcast games, and — only when
+    some batter has fewer than 5 games — one team lookup plus a team
+    profile per distinct team. Weighting happens in memory.
+
+    Args:
+        db: Async database session.
+        batters: Batter external ref -> team ID (for the low-sample
+            team blend).
+        pitchers: Pitcher external refs.
+        rolling_window: Number of recent games per player.
+        exclude_playoffs: Restrict to regular-season games.
+    """
+    from app.db.mlb_advanced import MLBPitcherGameStats, MLBPlayerAdvancedStats
+    from app.db.sports import SportsPlayerBoxscore, SportsTeam
+
+    batch = MLBProfileBatch()
+    window = {"rolling_window": rolling_window, "exclude_playoffs": exclude_playoffs}
+
+    if batters:
+        batter_rows = await _recent_rows_by_player(
+            db, MLBPlayerAdvancedStats, list(batters), **window,
+        )
+        sparse: dict[str, int] = {}
+        for ref, rows in batter_rows.items():
+            batch.batters[ref] = _batter_profile_from_rows(rows)
+            if len(rows) < 5:
+                sparse[ref] = len(rows)
+
+        if sparse:
+            team_ids = {batters[ref] for ref in sparse}
+            team_result = await db.execute(
+                select(SportsTeam).where(SportsTeam.id.in_(team_ids))
+            )
+            import app.analytics.services.profile_service as _ps
+
+            team_profiles: dict[int, dict[str, float]] = {}
+            for team in team_result.scalars().all():
+                team_profile_result = await _ps.get_team_rolling_profile(
+                    team.abbreviation, "mlb",
+                    exclude_playoffs=exclude_playoffs, db=db,
+                )
+                if team_profile_result is not None:
+                    team_profiles[team.id] = team_profile_result.metrics
+            for ref, games_found in sparse.items():
+                team_profile = team_profiles.get(batters[ref])
+                if team_profile is not None:
+                    batch.batters[ref] = _blend_with_team(
+                        batch.batters[ref], games_found, team_profile,
+                    )
+
+    pitcher_refs = list(dict.fromkeys(pitchers))
+    if pitcher_refs:
+        try:
+            statcast_rows = await _recent_rows_by_player(
+                db, MLBPitcherGameStats, pitcher_refs, **window,
+            )
+        except Exception:
+            logger.warning("pitcher_statcast_query_failed", exc_info=True)
+            statcast_rows = {}
+        for ref, rows in statcast_rows.items():
+            if len(rows) >= 3:
+                batch.pitchers[ref] = _statcast_profile_from_rows(rows)
+
+        missing = [ref for ref in pitcher_refs if ref not in batch.pitchers]
+        if missing:
+            boxscore_rows = await _recent_rows_by_player(
+                db, SportsPlayerBoxscore, missing, **window,
+            )
+            for ref in missing:
+                profile = _boxscore_profile_from_rows(ref, boxscore_rows.get(ref, []))
+                if profile is not None:
+                    batch.pitchers[ref] = profile
+
+    return batch
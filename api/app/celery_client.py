@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import time
 from functools import lru_cache
 
 from celery import Celery
+from celery.signals import before_task_publish
 
 from .config import settings
 
@@ -23,3 +25,12 @@ def get_celery_app() -> Celery:
     app.conf.task_always_eager = False
     app.conf.task_eager_propagates = True
     return app
+
+
+# Same dispatch_uid as the scraper's receiver: a process that imports both
+# producers connects the stamp once.
+@before_task_publish.connect(dispatch_uid="stamp_enqueue_time")
+def _stamp_enqueue_time(headers=None, **_kwargs) -> None:
+    """Stamp publish time so scraper workers can report per-lane queue latency."""
+    if headers is not None:
+        headers.setdefault("enqueued_at", time.time())
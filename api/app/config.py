@@ -56,6 +56,9 @@ class Settings(BaseSettings):
     rate_limit_window_seconds_keyed: int = Field(
         default=60, alias="RATE_LIMIT_WINDOW_SECONDS_KEYED"
     )
+    # Where RateLimitMiddleware keeps its GCRA state: "redis" (shared by
+    # every replica, local fallback while Redis is down) or "memory".
+    rate_limit_backend: str = Field(default="redis", alias="RATE_LIMIT_BACKEND")
     fairbet_odds_cache_enabled: bool = Field(
         default=True, alias="FAIRBET_ODDS_CACHE_ENABLED"
     )
@@ -136,6 +139,27 @@ class Settings(BaseSettings):
         default="gpt-4o-mini", alias="OPENAI_MODEL_CLASSIFICATION"
     )
     openai_model_summary: str = Field(default="gpt-4o", alias="OPENAI_MODEL_SUMMARY")
+    # Point at an OpenAI-compatible server (e.g. a local fake in tests)
+    openai_base_url: str | None = Field(default=None, alias="OPENAI_BASE_URL")
+    # RENDER_BLOCKS splits a game's blocks into batches of at most this many
+    # and renders them concurrently, with at most max_in_flight open requests.
+    render_blocks_batch_size: int = Field(default=4, alias="RENDER_BLOCKS_BATCH_SIZE")
+    render_blocks_max_in_flight: int = Field(
+        default=4, alias="RENDER_BLOCKS_MAX_IN_FLIGHT"
+    )
+    # Bulk flow generation runs this many game pipelines at once, each on
+    # its own DB session.
+    bulk_flow_max_concurrency: int = Field(default=4, alias="BULK_FLOW_MAX_CONCURRENCY")
+    # Historical replay simulates games in this many worker processes
+    # (0 = one per CPU; 1 = in the task process).
+    replay_workers: int = Field(default=0, alias="REPLAY_WORKERS")
+    # Training/backtest datasets are cached on local disk per (sport,
+    # model type, date range, rolling window). Empty dir = models/datasets;
+    # TTL 0 disables the cache.
+    training_dataset_cache_dir: str = Field(default="", alias="TRAINING_DATASET_CACHE_DIR")
+    training_dataset_cache_ttl_seconds: int = Field(
+        default=21600, alias="TRAINING_DATASET_CACHE_TTL_SECONDS"
+    )
 
     @model_validator(mode="after")
     def _default_empty_openai_models(self) -> Settings:
@@ -233,6 +257,10 @@ class Settings(BaseSettings):
             )
         if self.rate_limit_requests <= 0 or self.rate_limit_window_seconds <= 0:
             raise ValueError("Rate limit settings must be positive integers.")
+        if self.rate_limit_backend not in {"redis", "memory"}:
+            raise ValueError(
+                f"RATE_LIMIT_BACKEND must be 'redis' or 'memory', got {self.rate_limit_backend!r}"
+            )
         if self.fairbet_odds_cache_ttl_seconds <= 0:
             raise ValueError("FAIRBET_ODDS_CACHE_TTL_SECONDS must be positive.")
         if self.fairbet_odds_snapshot_ttl_seconds <= 0:
@@ -10,7 +10,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import text
@@ -249,6 +249,22 @@ class AnalyticsPredictionOutcome(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
+    __table_args__ = (
+        Index(
+            "ix_prediction_outcomes_pending",
+            "game_id",
+            postgresql_where=text("outcome_recorded_at IS NULL"),
+        ),
+        Index(
+            "ix_prediction_outcomes_resolved",
+            "sport",
+            "outcome_recorded_at",
+            "id",
+            postgresql_include=["brier_score", "correct_winner"],
+            postgresql_where=text("outcome_recorded_at IS NOT NULL AND brier_score IS NOT NULL"),
+        ),
+    )
+
 
 class AnalyticsExperimentSuite(Base):
     """Groups multiple training variants into a comparable experiment.
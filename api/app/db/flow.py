@@ -11,6 +11,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     UniqueConstraint,
     func,
@@ -143,3 +144,29 @@ class SportsGameFlow(Base):
     )
 
 
+class SportsGameFlowDocument(Base):
+    """Compiled consumer flow response, stored as pre-encoded JSON bytes.
+
+    ``content_hash`` is the SHA-256 of ``body`` and doubles as the strong
+    ETag. ``source_fingerprint`` identifies the flow row and the game's
+    ``flow_sources_changed_at`` stamp it was compiled from; a document
+    whose fingerprint no longer matches is recompiled.
+    """
+
+    __tablename__ = "sports_game_flow_docs"
+
+    game_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("sports_games.id", ondelete="CASCADE"), primary_key=True
+    )
+    flow_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("sports_game_stories.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    format_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    source_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    body: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
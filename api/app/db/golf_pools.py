@@ -7,6 +7,7 @@ References the golf domain tables for tournament and player data.
 from __future__ import annotations
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -168,6 +169,31 @@ class GolfPoolEntryScore(Base):
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
 
+# Shape of GolfPoolLeaderboard.leaderboard. Bump when the per-entry dict
+# changes; readers ignore documents written in another format.
+LEADERBOARD_DOC_FORMAT = 1
+
+
+class GolfPoolLeaderboard(Base):
+    """Precomputed ranking document, rewritten by pool scoring.
+
+    ``version`` increments on every rewrite so clients can tell whether
+    the standings moved since their last fetch.
+    """
+
+    __tablename__ = "golf_pool_leaderboards"
+
+    pool_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("golf_pools.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    format_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    entry_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    leaderboard = Column(JSONB, nullable=False)
+    scored_at = Column(DateTime(timezone=True))
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
 class GolfPoolScoreRun(Base):
     __tablename__ = "golf_pool_score_runs"
 
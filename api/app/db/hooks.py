@@ -5,21 +5,33 @@ attribute history) and after_commit to fire tasks only after the DB write is
 durable.  after_rollback clears the pending list so aborted transactions never
 dispatch tasks.
 
+Status changes flushed through the ORM also emit
+``pg_notify('game_score_update')`` inside the flushing transaction, so LISTEN
+consumers (the API realtime listener and the scraper's live-game index) see
+transitions even when no score changed. Core ``update()`` statements and raw
+SQL never populate ``session.dirty`` and emit nothing; consumers cover those
+with their periodic reconcile. The NOTIFY runs in a savepoint: a failure is
+logged and never aborts the caller's flush.
+
 Thread-safety: _pending uses threading.local so concurrent requests each
 maintain their own dispatch queue.
 """
 
 from __future__ import annotations
 
+import json
+import logging
 import threading
 
-from sqlalchemy import event, inspect
+from sqlalchemy import event, inspect, text
 from sqlalchemy.orm import Session
 
 from .sports import GameStatus, SportsGame
 from . import external_id_validators as _ext_validators  # noqa: F401 — registers JSONB validators
 from . import jsonb_validators as _jsonb_validators  # noqa: F401 — registers JSONB validators
 
+logger = logging.getLogger(__name__)
+
 _pending = threading.local()
 
 
@@ -45,6 +57,39 @@ def _track_final_transitions(session: Session, flush_context) -> None:
             _get_pending().append(obj.id)
 
 
+@event.listens_for(Session, "after_flush")
+def _notify_status_changes(session: Session, flush_context) -> None:
+    """Emit game_score_update NOTIFY for each game whose status changed.
+
+    The payload matches the scraper's score-update notification, so Postgres
+    collapses duplicates within one transaction. Delivery happens on commit.
+    """
+    game_ids = []
+    for obj in session.dirty:
+        if isinstance(obj, SportsGame) and inspect(obj).attrs.status.history.has_changes():
+            game_ids.append(obj.id)
+    if not game_ids:
+        return
+
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    # Connection savepoint rather than Session.begin_nested(): this runs mid-flush
+    # and must not open an ORM-level nested transaction.
+    try:
+        with connection.begin_nested():
+            for game_id in game_ids:
+                payload = json.dumps({"game_id": game_id, "event_type": "game_score_update"})
+                connection.execute(
+                    text("SELECT pg_notify('game_score_update', :p)"), {"p": payload}
+                )
+    except Exception as exc:
+        logger.warning(
+            "game_status_notify_failed",
+            extra={"game_ids": game_ids, "error": str(exc)},
+        )
+
+
 @event.listens_for(Session, "after_commit")
 def _dispatch_final_game_tasks(session: Session) -> None:
     """Enqueue flow generation for each game that went FINAL in this commit."""
@@ -58,8 +103,8 @@ def _dispatch_final_game_tasks(session: Session) -> None:
         celery.send_task(
             "trigger_flow_for_game",
             args=[game_id],
-            queue="sports-scraper",
-            routing_key="sports-scraper",
+            queue="sports-flow",
+            routing_key="sports-flow",
             countdown=300,  # 5-minute delay so PBP data settles before pipeline runs
             expires=3600,  # drop task if not consumed within 1 hour; sweep handles recovery
         )
@@ -342,3 +342,55 @@ class MLBPlayerFieldingStats(Base):
         Index("idx_fielding_player", "player_external_ref"),
         Index("idx_fielding_team", "team_id"),
     )
+
+
+class MLBGameLineup(Base):
+    """Materialized batting order and starting pitcher per team per game.
+
+    Derived from play-by-play (boxscore fallback) once a game is final,
+    so consensus lineups join each recent game's row by ``(game_id,
+    team_id)`` instead of re-walking its plays. ``batters`` holds up to 9
+    ``{"external_ref", "name"}`` dicts in batting order. A team whose
+    lineup could not be derived gets a marker row with
+    ``lineup_source = "none"`` and no batters, so the backfill does not
+    select the game again.
+    """
+
+    __tablename__ = "mlb_game_lineups"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    game_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("sports_games.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    team_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey("sports_teams.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    # Denormalized from sports_games
+    game_date: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    batters: Mapped[list[dict[str, Any]]] = mapped_column(
+        JSONB, server_default=text("'[]'::jsonb"), nullable=False
+    )
+    lineup_source: Mapped[str] = mapped_column(String(20), nullable=False)  # pbp | boxscore | none
+
+    starter_external_ref: Mapped[str | None] = mapped_column(String(100), nullable=True)
+    starter_name: Mapped[str | None] = mapped_column(String(200), nullable=True)
+    starter_innings_pitched: Mapped[float | None] = mapped_column(Float, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (
+        UniqueConstraint("game_id", "team_id", name="uq_mlb_game_lineups_game_team"),
+    )
@@ -137,6 +137,8 @@ class GamePipelineStage(Base):
         JSONB, nullable=True, server_default=text("'[]'::jsonb")
     )
     error_details: Mapped[str | None] = mapped_column(Text, nullable=True)
+    # Wall/DB/completion time and payload bytes (see services.pipeline.profiling)
+    profile_json: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
     started_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
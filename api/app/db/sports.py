@@ -233,6 +233,10 @@ class SportsGame(Base):
     last_advanced_stats_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Stamped by triggers when the flow, its plays, or team display fields change
+    flow_sources_changed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     external_ids: Mapped[dict[str, Any]] = mapped_column(
         JSONB, server_default=text("'{}'::jsonb"), nullable=False
     )
@@ -524,3 +528,23 @@ class SportsGamePlay(Base):
         Index("idx_game_plays_game", "game_id"),
         UniqueConstraint("game_id", "play_index", name="uq_game_play_index"),
     )
+
+
+class SportsGameDetailDocument(Base):
+    """Materialized ``GET /games/{id}`` response for games past FINAL.
+
+    ``source_fingerprint`` hashes the game's status and freshness stamps at
+    build time; a document whose fingerprint no longer matches is rebuilt.
+    """
+
+    __tablename__ = "sports_game_detail_docs"
+
+    game_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("sports_games.id", ondelete="CASCADE"), primary_key=True
+    )
+    format_version: Mapped[int] = mapped_column(Integer, nullable=False)
+    source_fingerprint: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
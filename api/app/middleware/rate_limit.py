@@ -1,4 +1,4 @@
-"""In-memory rate limiting middleware with per-path tiers.
+"""GCRA rate limiting middleware (Redis-backed by default) with per-path tiers.
 
 Provides three tiers:
 - **Admin**: Tighter limit for `/api/admin/` routes (default 20 req/min).
@@ -15,21 +15,32 @@ Provides three tiers:
   vulnerable to brute-force attacks (login, signup, forgot-password,
   magic-link, reset-password).
 
-All tiers use a sliding-window counter. The store is in-memory, suitable
-for single-instance deployments. For horizontal scaling, replace with a
-Redis-backed limiter (the per-key keying here is the prerequisite).
+All tiers use GCRA (``app.services.gcra_limiter``): one theoretical
+arrival time per bucket key. ``RATE_LIMIT_BACKEND`` picks where that
+state lives:
+
+- ``redis`` (default): ``RedisGCRA`` updates each key atomically in
+  Redis, so every API replica shares one budget per bucket. While Redis
+  is unreachable it falls back to an in-process store.
+- ``memory``: ``MemoryGCRA`` keeps the state in-process, so each replica
+  enforces the limits on its own. Intended for tests and single-process
+  development.
 """
 
 from __future__ import annotations
 
-import time
-from collections import defaultdict, deque
 from collections.abc import Callable
 
 from fastapi import Request
 from starlette.responses import JSONResponse
 
 from app.config import settings
+from app.services.gcra_limiter import (
+    MemoryGCRA,
+    RedisGCRA,
+    build_limiter,
+    hashed_key,
+)
 
 _EXEMPT_PREFIXES = ("/v1/sse",)
 
@@ -56,20 +67,39 @@ _ADMIN_PREFIX = "/api/admin/"
 
 
 class RateLimitMiddleware:
-    """Sliding-window rate limiter with auth-specific tightening."""
-
-    def __init__(self, app: Callable) -> None:
+    """GCRA rate limiter with auth-specific tightening.
+
+    Args:
+        app: Downstream ASGI app.
+        limiter: Optional limiter; built from ``RATE_LIMIT_BACKEND``
+            when omitted.
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        limiter: RedisGCRA | MemoryGCRA | None = None,
+    ) -> None:
         self.app = app
-        # Global rate limit buckets, keyed by client IP (requests without a key).
-        self._requests: dict[str, deque[float]] = defaultdict(deque)
-        # Global rate limit buckets, keyed by api_key (requests presenting one).
-        self._keyed_requests: dict[str, deque[float]] = defaultdict(deque)
-        # Auth-specific buckets (keyed by "ip:path_prefix").
-        self._auth_requests: dict[str, deque[float]] = defaultdict(deque)
-        # Admin-specific buckets (keyed by client IP).
-        self._admin_requests: dict[str, deque[float]] = defaultdict(deque)
-        # Onboarding-specific buckets (keyed by client IP).
-        self._onboarding_requests: dict[str, deque[float]] = defaultdict(deque)
+        # One store for every tier; bucket keys are namespaced per tier.
+        self._limiter = limiter or build_limiter(
+            settings.rate_limit_backend, settings.redis_url,
+        )
+
+    async def _reject(
+        self,
+        scope: dict,
+        receive: Callable,
+        send: Callable,
+        detail: str,
+        retry_after: str,
+    ) -> None:
+        response = JSONResponse(
+            {"detail": detail},
+            status_code=429,
+            headers={"Retry-After": retry_after},
+        )
+        await response(scope, receive, send)
 
     async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
         if scope["type"] != "http":
@@ -83,95 +113,73 @@ class RateLimitMiddleware:
 
         request = Request(scope, receive=receive)
         client_ip = request.client.host if request.client else "unknown"
-        now = time.time()
 
         # --- Auth-strict tier ---
         if any(path.startswith(p) for p in _AUTH_STRICT_PREFIXES):
-            bucket_key = f"{client_ip}:{path}"
-            auth_times = self._auth_requests[bucket_key]
-            while auth_times and auth_times[0] <= now - _AUTH_STRICT_WINDOW:
-                auth_times.popleft()
-
-            if len(auth_times) >= _AUTH_STRICT_LIMIT:
-                response = JSONResponse(
-                    {"detail": "Too many attempts. Please try again later."},
-                    status_code=429,
-                    headers={"Retry-After": str(_AUTH_STRICT_WINDOW)},
+            decision = await self._limiter.check(
+                f"auth:{client_ip}:{path}", _AUTH_STRICT_LIMIT, _AUTH_STRICT_WINDOW,
+            )
+            if not decision.allowed:
+                await self._reject(
+                    scope, receive, send,
+                    "Too many attempts. Please try again later.",
+                    decision.retry_after_header,
                 )
-                await response(scope, receive, send)
                 return
 
-            auth_times.append(now)
-
         # --- Onboarding-strict tier (public, prospect-facing forms) ---
         if any(path.startswith(p) for p in _ONBOARDING_STRICT_PREFIXES):
-            onboarding_times = self._onboarding_requests[client_ip]
-            while (
-                onboarding_times
-                and onboarding_times[0] <= now - _ONBOARDING_STRICT_WINDOW
-            ):
-                onboarding_times.popleft()
-
-            if len(onboarding_times) >= _ONBOARDING_STRICT_LIMIT:
-                response = JSONResponse(
-                    {"detail": "Too many submissions. Please try again later."},
-                    status_code=429,
-                    headers={"Retry-After": str(_ONBOARDING_STRICT_WINDOW)},
+            decision = await self._limiter.check(
+                f"onboarding:{client_ip}", _ONBOARDING_STRICT_LIMIT, _ONBOARDING_STRICT_WINDOW,
+            )
+            if not decision.allowed:
+                await self._reject(
+                    scope, receive, send,
+                    "Too many submissions. Please try again later.",
+                    decision.retry_after_header,
                 )
-                await response(scope, receive, send)
                 return
-
-            onboarding_times.append(now)
             await self.app(scope, receive, send)
             return
 
         # --- Admin tier (separate from global; does not fall through) ---
         if path.startswith(_ADMIN_PREFIX):
-            admin_limit = settings.admin_rate_limit_requests
-            admin_window = settings.admin_rate_limit_window_seconds
-
-            admin_times = self._admin_requests[client_ip]
-            while admin_times and admin_times[0] <= now - admin_window:
-                admin_times.popleft()
-
-            if len(admin_times) >= admin_limit:
-                response = JSONResponse(
-                    {"detail": "Rate limit exceeded"},
-                    status_code=429,
-                    headers={"Retry-After": str(admin_window)},
+            decision = await self._limiter.check(
+                f"admin:{client_ip}",
+                settings.admin_rate_limit_requests,
+                settings.admin_rate_limit_window_seconds,
+            )
+            if not decision.allowed:
+                await self._reject(
+                    scope, receive, send, "Rate limit exceeded", decision.retry_after_header,
                 )
-                await response(scope, receive, send)
                 return
-
-            admin_times.append(now)
             await self.app(scope, receive, send)
             return
 
         # --- Global tier (consumer + all other routes) ---
         # Requests with an X-API-Key get their own keyed bucket with a
         # higher budget; unkeyed requests fall back to per-IP. Lets a single
-        # CI key burst across many workers without per-IP throttling.
+        # CI key burst across many workers without per-IP throttling. The
+        # key itself is hashed so it never lands in Redis.
         api_key = request.headers.get("x-api-key")
         if api_key:
-            window = settings.rate_limit_window_seconds_keyed
-            limit = settings.rate_limit_requests_keyed
-            bucket = self._keyed_requests[api_key]
+            decision = await self._limiter.check(
+                f"key:{hashed_key(api_key)}",
+                settings.rate_limit_requests_keyed,
+                settings.rate_limit_window_seconds_keyed,
+            )
         else:
-            window = settings.rate_limit_window_seconds
-            limit = settings.rate_limit_requests
-            bucket = self._requests[client_ip]
-
-        while bucket and bucket[0] <= now - window:
-            bucket.popleft()
-
-        if len(bucket) >= limit:
-            response = JSONResponse(
-                {"detail": "Rate limit exceeded"},
-                status_code=429,
-                headers={"Retry-After": str(window)},
+            decision = await self._limiter.check(
+                f"ip:{client_ip}",
+                settings.rate_limit_requests,
+                settings.rate_limit_window_seconds,
+            )
+
+        if not decision.allowed:
+            await self._reject(
+                scope, receive, send, "Rate limit exceeded", decision.retry_after_header,
             )
-            await response(scope, receive, send)
             return
 
-        bucket.append(now)
         await self.app(scope, receive, send)
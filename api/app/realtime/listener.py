@@ -36,6 +36,13 @@ _PBP_MAX_GAMES = 500
 _PBP_BATCH_MAX = 50
 
 
+def listen_dsn() -> str:
+    """Plain asyncpg DSN for ``DATABASE_URL`` (LISTEN connections bypass SQLAlchemy)."""
+    from app.config import settings
+
+    return settings.database_url.replace("postgresql+asyncpg://", "postgresql://")
+
+
 class _LRUDict:
     """Bounded LRU map; evicts the oldest entry on overflow."""
 
@@ -76,12 +83,7 @@ class ListenNotifyListener:
 
     def _get_dsn(self) -> str:
         if self._dsn is None:
-            from app.config import settings
-
-            # SA async URL → plain asyncpg DSN
-            self._dsn = settings.database_url.replace(
-                "postgresql+asyncpg://", "postgresql://"
-            )
+            self._dsn = listen_dsn()
         return self._dsn
 
     def start(self) -> None:
@@ -34,14 +34,14 @@ async def trigger_odds_sync(
     mainline = celery.send_task(
         "sync_mainline_odds",
         args=[league],
-        queue="sports-scraper",
-        routing_key="sports-scraper",
+        queue="sports-odds",
+        routing_key="sports-odds",
     )
     props = celery.send_task(
         "sync_prop_odds",
         args=[league],
-        queue="sports-scraper",
-        routing_key="sports-scraper",
+        queue="sports-odds",
+        routing_key="sports-odds",
     )
     return OddsSyncResponse(
         status="dispatched",
@@ -8,6 +8,7 @@ These endpoints provide a complete control surface for the admin UI to:
 - Execute individual pipeline stages with full control
 - Re-run stages without deleting prior outputs (creates new runs)
 - View detailed status, logs, and outputs for each stage
+- See per-stage time and payload percentiles across recent runs
 
 SAFETY GUARANTEES
 =================
@@ -38,6 +39,8 @@ from .models import (
     ExecuteStageResponse,
     GamePipelineRunsResponse,
     GamePipelineSummary,
+    MetricPercentilesResponse,
+    PipelineProfileResponse,
     PipelineRunResponse,
     PipelineRunStatusEnum,
     PipelineRunSummary,
@@ -48,6 +51,7 @@ from .models import (
     StageComparisonResponse,
     StageLogsResponse,
     StageOutputResponse,
+    StageProfileSummaryResponse,
     StageStatusEnum,
     StageStatusResponse,
     StartPipelineRequest,
@@ -93,4 +97,7 @@ __all__ = [
     "BulkGenerateAsyncResponse",
     "BulkGenerateStatusResponse",
     "BackfillEmbeddedTweetsResponse",
+    "MetricPercentilesResponse",
+    "StageProfileSummaryResponse",
+    "PipelineProfileResponse",
 ]
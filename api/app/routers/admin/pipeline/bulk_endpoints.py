@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import uuid
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
@@ -146,6 +146,21 @@ async def get_bulk_generate_status(
             "errors": job.errors_json or [],
         }
 
+    # Throughput over the job's running time so far
+    elapsed_seconds = None
+    games_per_minute = None
+    if job.started_at is not None:
+        started = job.started_at
+        if started.tzinfo is None:
+            started = started.replace(tzinfo=UTC)
+        ended = job.finished_at or datetime.now(UTC)
+        if ended.tzinfo is None:
+            ended = ended.replace(tzinfo=UTC)
+        elapsed_seconds = max(0.0, (ended - started).total_seconds())
+        done = job.successful + job.failed
+        if elapsed_seconds > 0:
+            games_per_minute = round(done / elapsed_seconds * 60, 2)
+
     return BulkGenerateStatusResponse(
         job_id=str(job.job_uuid),
         state=state_map.get(job.status, "PENDING"),
@@ -154,5 +169,7 @@ async def get_bulk_generate_status(
         successful=job.successful,
         failed=job.failed,
         skipped=job.skipped,
+        elapsed_seconds=elapsed_seconds,
+        games_per_minute=games_per_minute,
         result=result_dict,
     )
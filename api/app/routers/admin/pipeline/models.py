@@ -362,6 +362,50 @@ class StageComparisonResponse(BaseModel):
     differences: dict[str, Any] = Field(description="Key differences between outputs")
 
 
+# =============================================================================
+# PROFILING MODELS
+# =============================================================================
+
+
+class MetricPercentilesResponse(BaseModel):
+    """Distribution of one profile metric across stage executions."""
+
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class StageProfileSummaryResponse(BaseModel):
+    """Aggregated profile for one pipeline stage."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    stage: str
+    runs: int = Field(description="Profiled executions in the window")
+    total_wall_ms: float
+    wall_share: float = Field(description="Fraction of all stages' wall time (0-1)")
+    metrics: dict[str, MetricPercentilesResponse] = Field(
+        description="wall_ms, db_ms, db_queries, completion_ms, completion_calls, "
+        "input_bytes, output_bytes"
+    )
+
+
+class PipelineProfileResponse(BaseModel):
+    """Per-stage profile percentiles over a time window."""
+
+    model_config = ConfigDict(alias_generator=to_camel, populate_by_name=True)
+
+    since: str
+    league: str | None = None
+    dominant_stage: str | None = Field(
+        default=None, description="Stage with the largest total wall time"
+    )
+    stages: list[StageProfileSummaryResponse] = Field(
+        description="Ordered by total wall time, largest first"
+    )
+
+
 # =============================================================================
 # BULK GENERATION MODELS
 # =============================================================================
@@ -412,11 +456,19 @@ class BulkGenerateStatusResponse(BaseModel):
 
     job_id: str = Field(description="Job identifier")
     state: str = Field(description="Job state: PENDING, PROGRESS, SUCCESS, FAILURE")
-    current: int = Field(description="Current game being processed (1-indexed)")
+    current: int = Field(description="Games finished so far (pipelines run concurrently)")
     total: int = Field(description="Total games to process")
     successful: int = Field(description="Number of games successfully processed")
     failed: int = Field(description="Number of games that failed")
     skipped: int = Field(description="Number of games skipped (already have flow)")
+    elapsed_seconds: float | None = Field(
+        default=None,
+        description="Seconds since the job started (to finish, once complete)",
+    )
+    games_per_minute: float | None = Field(
+        default=None,
+        description="Finished games per minute over the elapsed time",
+    )
     result: dict[str, Any] | None = Field(
         default=None,
         description="Final result when job completes",
@@ -1,10 +1,13 @@
 """Pipeline status and info endpoints.
 
-Get run status, list runs for a game, and get pipeline summary.
+Get run status, list runs for a game, get pipeline summary, and get
+per-stage profile percentiles.
 """
 
 from __future__ import annotations
 
+from dataclasses import asdict
+from datetime import timedelta
 from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -15,6 +18,8 @@ from ....db import AsyncSession, get_db
 from ....db.flow import SportsGameTimelineArtifact
 from ....db.pipeline import GamePipelineRun
 from ....db.sports import SportsGame, SportsGamePlay
+from ....services.pipeline.profiling import load_stage_profiles, summarize_stage_profiles
+from ....utils.datetime_utils import now_utc
 from .helpers import (
     build_run_response,
     build_run_summary,
@@ -23,7 +28,9 @@ from .helpers import (
 from .models import (
     GamePipelineRunsResponse,
     GamePipelineSummary,
+    PipelineProfileResponse,
     PipelineRunResponse,
+    StageProfileSummaryResponse,
 )
 
 router = APIRouter()
@@ -174,3 +181,29 @@ async def get_game_pipeline_summary(
         latest_run=latest_run,
         can_run_pipeline=game.status == "final" and has_pbp,
     )
+
+
+@router.get(
+    "/pipeline/profile",
+    response_model=PipelineProfileResponse,
+    summary="Get stage profile percentiles",
+    description=(
+        "Per-stage wall, DB and completion time and payload-size percentiles "
+        "over recent pipeline runs, ordered by total wall time."
+    ),
+)
+async def get_pipeline_profile(
+    days: int = Query(default=7, ge=1, le=90),
+    league: str | None = Query(default=None, description="Filter by league code"),
+    session: AsyncSession = Depends(get_db),
+) -> PipelineProfileResponse:
+    """Aggregate stored stage profiles into per-stage percentiles."""
+    since = now_utc() - timedelta(days=days)
+    rows = await load_stage_profiles(session, since, league)
+    summaries = summarize_stage_profiles(rows)
+    return PipelineProfileResponse(
+        since=since.isoformat(),
+        league=league.upper() if league else None,
+        dominant_stage=summaries[0].stage if summaries else None,
+        stages=[StageProfileSummaryResponse(**asdict(s)) for s in summaries],
+    )
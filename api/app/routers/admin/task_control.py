@@ -95,23 +95,23 @@ TASK_REGISTRY: dict[str, TaskRegistryEntry] = {
         # Polling
         TaskRegistryEntry(
             name="update_game_states",
-            queue="sports-scraper",
+            queue="sports-live",
             description="Update game state machine for all tracked games",
         ),
         TaskRegistryEntry(
             name="poll_live_pbp",
-            queue="sports-scraper",
+            queue="sports-live",
             description="Poll live play-by-play and boxscores",
         ),
         # Odds
         TaskRegistryEntry(
             name="sync_mainline_odds",
-            queue="sports-scraper",
+            queue="sports-odds",
             description="Sync mainline odds (spreads, totals, moneyline)",
         ),
         TaskRegistryEntry(
             name="sync_prop_odds",
-            queue="sports-scraper",
+            queue="sports-odds",
             description="Sync player/team prop odds for pregame events",
         ),
         # Social
@@ -138,27 +138,27 @@ TASK_REGISTRY: dict[str, TaskRegistryEntry] = {
         # Flows
         TaskRegistryEntry(
             name="run_scheduled_flow_generation",
-            queue="sports-scraper",
+            queue="sports-flow",
             description="Run flow generation for all leagues",
         ),
         TaskRegistryEntry(
             name="run_scheduled_nba_flow_generation",
-            queue="sports-scraper",
+            queue="sports-flow",
             description="Run flow generation for NBA games",
         ),
         TaskRegistryEntry(
             name="run_scheduled_nhl_flow_generation",
-            queue="sports-scraper",
+            queue="sports-flow",
             description="Run flow generation for NHL games",
         ),
         TaskRegistryEntry(
             name="run_scheduled_ncaab_flow_generation",
-            queue="sports-scraper",
+            queue="sports-flow",
             description="Run flow generation for NCAAB games (max 10)",
         ),
         TaskRegistryEntry(
             name="trigger_flow_for_game",
-            queue="sports-scraper",
+            queue="sports-flow",
             description="Trigger flow generation for a specific game",
         ),
         # Timelines
@@ -173,6 +173,11 @@ TASK_REGISTRY: dict[str, TaskRegistryEntry] = {
             queue="sports-scraper",
             description="Ingest Statcast-derived advanced stats for an MLB game",
         ),
+        TaskRegistryEntry(
+            name="backfill_mlb_game_lineups",
+            queue="sports-scraper",
+            description="Materialize batting orders/starters for final MLB games missing from mlb_game_lineups (args: [limit])",
+        ),
         # Utility
         TaskRegistryEntry(
             name="clear_scraper_cache",
@@ -182,17 +187,17 @@ TASK_REGISTRY: dict[str, TaskRegistryEntry] = {
         # Live orchestrator + odds
         TaskRegistryEntry(
             name="live_orchestrator_tick",
-            queue="sports-scraper",
+            queue="sports-live",
             description="Run one live orchestrator tick (dispatches per-game polling tasks)",
         ),
         TaskRegistryEntry(
             name="poll_live_odds_mainline",
-            queue="sports-scraper",
+            queue="sports-odds",
             description="Poll live mainline odds for a league (args: [league_code, [game_ids]])",
         ),
         TaskRegistryEntry(
             name="poll_live_odds_props",
-            queue="sports-scraper",
+            queue="sports-odds",
             description="Poll live prop odds for a league (args: [league_code, [game_ids]])",
         ),
         # Analytics (runs on api-worker via default celery queue)
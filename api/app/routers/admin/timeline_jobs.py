@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import exists, select
 
@@ -15,13 +17,16 @@ from ...db.sports import (
     SportsTeam,
 )
 from ...services.timeline_generator import (
+    TIMELINE_BATCH_SIZE,
     TimelineGenerationError,
     generate_timeline_artifact,
+    generate_timeline_artifacts,
 )
 from .timeline_models import (
     BatchGenerationRequest,
     ExistingTimelineGame,
     ExistingTimelinesResponse,
+    GameTimelinesRequest,
     MissingTimelineGame,
     MissingTimelinesResponse,
     RegenerateBatchRequest,
@@ -30,9 +35,51 @@ from .timeline_models import (
     TimelineGenerationResponse,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter()
 
 
+async def _generate_in_batches(
+    session: AsyncSession,
+    game_ids: list[int],
+    timeline_version: str,
+    generated_by: str = "api",
+    generation_reason: str | None = None,
+) -> tuple[int, list[int]]:
+    """Generate timelines chunk by chunk, committing after each chunk.
+
+    A chunk whose write fails is rolled back and all of its games are
+    reported as failed; the remaining chunks still run.
+
+    Returns:
+        ``(successful_count, failed_game_ids)``
+    """
+    successful = 0
+    failed_ids: list[int] = []
+    for offset in range(0, len(game_ids), TIMELINE_BATCH_SIZE):
+        chunk = game_ids[offset:offset + TIMELINE_BATCH_SIZE]
+        try:
+            result = await generate_timeline_artifacts(
+                session,
+                chunk,
+                timeline_version=timeline_version,
+                generated_by=generated_by,
+                generation_reason=generation_reason,
+            )
+            await session.commit()
+        except Exception as exc:
+            await session.rollback()
+            failed_ids.extend(chunk)
+            logger.error(f"Failed to generate timelines for games {chunk}: {exc}")
+            continue
+        successful += len(result.artifacts)
+        for game_id, error in result.failures.items():
+            failed_ids.append(game_id)
+            logger.error(f"Failed to generate timeline for game {game_id}: {error}")
+    return successful, failed_ids
+
+
 @router.post("/timelines/generate/{game_id}", response_model=TimelineGenerationResponse)
 async def generate_timeline_for_game(
     game_id: int,
@@ -104,6 +151,35 @@ async def generate_timeline_for_game(
         ) from exc
 
 
+@router.post("/timelines/generate-games", response_model=SyncBatchGenerationResponse)
+async def generate_timelines_for_games(
+    request: GameTimelinesRequest,
+    session: AsyncSession = Depends(get_db),
+) -> SyncBatchGenerationResponse:
+    """
+    Generate or regenerate timelines for an explicit list of games.
+
+    Used by the scraper's scheduled timeline jobs, which send game IDs in
+    chunks instead of one request per game. Existing artifacts for the
+    same version are overwritten.
+    """
+    game_ids = list(dict.fromkeys(request.game_ids))
+    successful, failed_ids = await _generate_in_batches(
+        session,
+        game_ids,
+        timeline_version=request.timeline_version,
+        generation_reason=request.generation_reason,
+    )
+
+    return SyncBatchGenerationResponse(
+        games_processed=len(game_ids),
+        games_successful=successful,
+        games_failed=len(failed_ids),
+        failed_game_ids=failed_ids,
+        message=f"Generated {successful}/{len(game_ids)} timelines",
+    )
+
+
 @router.get("/timelines/missing", response_model=MissingTimelinesResponse)
 async def list_missing_timelines(
     league_code: str = Query(..., description="League code (NBA, NHL, NCAAB)"),
@@ -207,8 +283,8 @@ async def generate_timelines_batch(
     """
     Generate timelines for all games missing them (synchronous).
 
-    This endpoint generates timelines directly in the API. It processes
-    games one by one and returns results when complete.
+    This endpoint generates timelines directly in the API, a chunk of
+    games per query round, and returns results when complete.
 
     Note: For large batches, this may take several minutes.
     """
@@ -257,35 +333,14 @@ async def generate_timelines_batch(
             message="No games found needing timeline generation",
         )
 
-    # Generate timelines for each game
-    import logging
-
-    logger = logging.getLogger(__name__)
-
-    successful = 0
-    failed = 0
-    failed_ids: list[int] = []
-
-    for game_id in game_ids:
-        try:
-            await generate_timeline_artifact(
-                session,
-                game_id,
-                timeline_version="v1",
-            )
-            await session.commit()
-            successful += 1
-            logger.info(f"Generated timeline for game {game_id}")
-        except Exception as exc:
-            await session.rollback()
-            failed += 1
-            failed_ids.append(game_id)
-            logger.error(f"Failed to generate timeline for game {game_id}: {exc}")
+    successful, failed_ids = await _generate_in_batches(
+        session, game_ids, timeline_version="v1"
+    )
 
     return SyncBatchGenerationResponse(
         games_processed=len(game_ids),
         games_successful=successful,
-        games_failed=failed,
+        games_failed=len(failed_ids),
         failed_game_ids=failed_ids,
         message=f"Generated {successful}/{len(game_ids)} timelines",
     )
@@ -387,13 +442,10 @@ async def regenerate_timelines_batch(
     If game_ids is provided, only those games are regenerated.
     Otherwise, all games with existing timelines in the date range are regenerated.
     """
-    import logging
     from datetime import timedelta
 
     from ...utils.datetime_utils import now_utc
 
-    logger = logging.getLogger(__name__)
-
     # Verify league exists
     league_result = await session.execute(
         select(SportsLeague).where(SportsLeague.code == request.league_code)
@@ -436,33 +488,18 @@ async def regenerate_timelines_batch(
             message="No games found for regeneration",
         )
 
-    # Regenerate timelines for each game
-    successful = 0
-    failed = 0
-    failed_ids: list[int] = []
-
-    for game_id in game_ids:
-        try:
-            await generate_timeline_artifact(
-                session,
-                game_id,
-                timeline_version="v1",
-                generated_by="admin_regenerate",
-                generation_reason="manual_regeneration",
-            )
-            await session.commit()
-            successful += 1
-            logger.info(f"Regenerated timeline for game {game_id}")
-        except Exception as exc:
-            await session.rollback()
-            failed += 1
-            failed_ids.append(game_id)
-            logger.error(f"Failed to regenerate timeline for game {game_id}: {exc}")
+    successful, failed_ids = await _generate_in_batches(
+        session,
+        game_ids,
+        timeline_version="v1",
+        generated_by="admin_regenerate",
+        generation_reason="manual_regeneration",
+    )
 
     return SyncBatchGenerationResponse(
         games_processed=len(game_ids),
         games_successful=successful,
-        games_failed=failed,
+        games_failed=len(failed_ids),
         failed_game_ids=failed_ids,
         message=f"Regenerated {successful}/{len(game_ids)} timelines",
     )
@@ -84,6 +84,20 @@ class SyncBatchGenerationResponse(BaseModel):
     message: str
 
 
+class GameTimelinesRequest(BaseModel):
+    """Request to generate timelines for an explicit list of games."""
+
+    game_ids: list[int] = Field(
+        ..., min_length=1, max_length=500, description="Game IDs to generate timelines for"
+    )
+    timeline_version: str = Field(
+        default="v1", description="Timeline version identifier"
+    )
+    generation_reason: str | None = Field(
+        default=None, description="Recorded on the artifacts (e.g. missing, pbp_updated)"
+    )
+
+
 class RegenerateBatchRequest(BaseModel):
     """Request to regenerate timelines for specific games or all games with existing timelines."""
 
@@ -23,6 +23,8 @@ from app.db.golf_pools import (
     GolfPoolEntryPick,
     GolfPoolEntryScore,
     GolfPoolEntryScorePlayer,
+    GolfPoolLeaderboard,
+    LEADERBOARD_DOC_FORMAT,
 )
 
 from app.services.entitlement import EntitlementService
@@ -460,71 +462,91 @@ async def get_entries_by_email(
     return {"entries": entries_data, "count": len(entries_data)}
 
 
-@router.get("/pools/{pool_id}/leaderboard")
-async def get_pool_leaderboard(
-    pool_id: int,
-    db: AsyncSession = Depends(get_db),
-) -> dict[str, Any]:
-    """Get the materialized leaderboard for a pool."""
-    await get_pool_or_404(pool_id, db)
+def _serialize_score_player(sp: GolfPoolEntryScorePlayer) -> dict[str, Any]:
+    return {
+        "dg_id": sp.dg_id,
+        "player_name": sp.player_name_snapshot,
+        "pick_slot": sp.pick_slot,
+        "bucket_number": sp.bucket_number,
+        "status": sp.status_snapshot,
+        "position": sp.position_snapshot,
+        "total_score": sp.total_score_snapshot,
+        "thru": sp.thru_snapshot,
+        "r1": sp.r1,
+        "r2": sp.r2,
+        "r3": sp.r3,
+        "r4": sp.r4,
+        "made_cut": sp.made_cut_snapshot,
+        "counts_toward_total": sp.counts_toward_total,
+        "is_dropped": sp.is_dropped,
+    }
 
+
+async def _query_pool_leaderboard(pool_id: int, db: AsyncSession) -> list[dict[str, Any]]:
+    """Build the leaderboard from the materialized score tables in one query."""
     stmt = (
-        select(GolfPoolEntryScore, GolfPoolEntry.email, GolfPoolEntry.entry_name)
+        select(GolfPoolEntryScore, GolfPoolEntry.email, GolfPoolEntry.entry_name, GolfPoolEntryScorePlayer)
         .join(GolfPoolEntry, GolfPoolEntry.id == GolfPoolEntryScore.entry_id)
+        .outerjoin(
+            GolfPoolEntryScorePlayer,
+            (GolfPoolEntryScorePlayer.entry_id == GolfPoolEntryScore.entry_id)
+            & (GolfPoolEntryScorePlayer.pool_id == pool_id),
+        )
         .where(GolfPoolEntryScore.pool_id == pool_id)
         .order_by(
             GolfPoolEntryScore.rank.asc().nullslast(),
             GolfPoolEntryScore.aggregate_score.asc().nullslast(),
+            GolfPoolEntryScore.entry_id,
+            GolfPoolEntryScorePlayer.pick_slot,
         )
     )
     result = await db.execute(stmt)
-    rows = result.all()
 
-    leaderboard = []
-    for score, email, entry_name in rows:
-        player_result = await db.execute(
-            select(GolfPoolEntryScorePlayer).where(
-                GolfPoolEntryScorePlayer.entry_id == score.entry_id,
-                GolfPoolEntryScorePlayer.pool_id == pool_id,
-            ).order_by(GolfPoolEntryScorePlayer.pick_slot)
-        )
-        players = player_result.scalars().all()
+    leaderboard: list[dict[str, Any]] = []
+    for score, email, entry_name, sp in result.all():
+        if not leaderboard or leaderboard[-1]["entry_id"] != score.entry_id:
+            leaderboard.append({
+                "entry_id": score.entry_id,
+                "email": email,
+                "entry_name": entry_name,
+                "aggregate_score": score.aggregate_score,
+                "qualified_golfers_count": score.qualified_golfers_count,
+                "counted_golfers_count": score.counted_golfers_count,
+                "qualification_status": score.qualification_status,
+                "is_complete": score.is_complete,
+                "rank": score.rank,
+                "is_tied": score.is_tied,
+                "last_scored_at": score.last_scored_at.isoformat() if score.last_scored_at else None,
+                "picks": [],
+            })
+        if sp is not None:
+            leaderboard[-1]["picks"].append(_serialize_score_player(sp))
+    return leaderboard
 
-        leaderboard.append({
-            "entry_id": score.entry_id,
-            "email": email,
-            "entry_name": entry_name,
-            "aggregate_score": score.aggregate_score,
-            "qualified_golfers_count": score.qualified_golfers_count,
-            "counted_golfers_count": score.counted_golfers_count,
-            "qualification_status": score.qualification_status,
-            "is_complete": score.is_complete,
-            "rank": score.rank,
-            "is_tied": score.is_tied,
-            "last_scored_at": score.last_scored_at.isoformat() if score.last_scored_at else None,
-            "picks": [
-                {
-                    "dg_id": sp.dg_id,
-                    "player_name": sp.player_name_snapshot,
-                    "pick_slot": sp.pick_slot,
-                    "bucket_number": sp.bucket_number,
-                    "status": sp.status_snapshot,
-                    "position": sp.position_snapshot,
-                    "total_score": sp.total_score_snapshot,
-                    "thru": sp.thru_snapshot,
-                    "r1": sp.r1,
-                    "r2": sp.r2,
-                    "r3": sp.r3,
-                    "r4": sp.r4,
-                    "made_cut": sp.made_cut_snapshot,
-                    "counts_toward_total": sp.counts_toward_total,
-                    "is_dropped": sp.is_dropped,
-                }
-                for sp in players
-            ],
-        })
 
-    return {"pool_id": pool_id, "leaderboard": leaderboard, "count": len(leaderboard)}
+@router.get("/pools/{pool_id}/leaderboard")
+async def get_pool_leaderboard(
+    pool_id: int,
+    db: AsyncSession = Depends(get_db),
+) -> dict[str, Any]:
+    """Get the materialized leaderboard for a pool.
+
+    Serves the precomputed document written by pool scoring when one exists
+    in the current format; otherwise builds it from the score tables.
+    """
+    await get_pool_or_404(pool_id, db)
+
+    doc = await db.get(GolfPoolLeaderboard, pool_id)
+    if doc is not None and doc.format_version == LEADERBOARD_DOC_FORMAT:
+        return {
+            "pool_id": pool_id,
+            "leaderboard": doc.leaderboard,
+            "count": doc.entry_count,
+            "version": doc.version,
+        }
+
+    leaderboard = await _query_pool_leaderboard(pool_id, db)
+    return {"pool_id": pool_id, "leaderboard": leaderboard, "count": len(leaderboard), "version": None}
 
 
 @router.get("/pools/{pool_id}/entries/{entry_id}")
@@ -580,25 +602,6 @@ async def get_entry_detail(
             "rank": score.rank,
             "is_tied": score.is_tied,
             "last_scored_at": score.last_scored_at.isoformat() if score.last_scored_at else None,
-            "players": [
-                {
-                    "dg_id": sp.dg_id,
-                    "player_name": sp.player_name_snapshot,
-                    "pick_slot": sp.pick_slot,
-                    "bucket_number": sp.bucket_number,
-                    "status": sp.status_snapshot,
-                    "position": sp.position_snapshot,
-                    "total_score": sp.total_score_snapshot,
-                    "thru": sp.thru_snapshot,
-                    "r1": sp.r1,
-                    "r2": sp.r2,
-                    "r3": sp.r3,
-                    "r4": sp.r4,
-                    "made_cut": sp.made_cut_snapshot,
-                    "counts_toward_total": sp.counts_toward_total,
-                    "is_dropped": sp.is_dropped,
-                }
-                for sp in score_players
-            ],
+            "players": [_serialize_score_player(sp) for sp in score_players],
         }
     return data
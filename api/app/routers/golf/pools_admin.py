@@ -24,6 +24,7 @@ from app.db.golf_pools import (
     GolfPoolEntryPick,
     GolfPoolEntryScore,
     GolfPoolEntryScorePlayer,
+    GolfPoolLeaderboard,
 )
 
 from app.dependencies.roles import require_admin
@@ -346,6 +347,11 @@ async def delete_entry(
     await db.execute(
         delete(GolfPoolEntryPick).where(GolfPoolEntryPick.entry_id == entry_id)
     )
+    # The precomputed leaderboard still lists this entry; drop it so reads
+    # fall back to the score tables until the next scoring run rewrites it.
+    await db.execute(
+        delete(GolfPoolLeaderboard).where(GolfPoolLeaderboard.pool_id == pool_id)
+    )
     await db.delete(entry)
 
     return {
@@ -129,11 +129,13 @@ async def get_model_odds_mlb(
     # 3. Load calibrator
     calibrator = _get_calibrator("mlb")
 
+    raw_wps = [pred.predicted_home_wp for pred in predictions]
+    calibrated_wps = calibrator.calibrate_many(raw_wps).tolist() if calibrator else raw_wps
+
     # 4. Compute model odds for each game
     games_output: list[dict] = []
-    for pred in predictions:
+    for pred, calibrated_wp in zip(predictions, calibrated_wps, strict=True):
         raw_wp = pred.predicted_home_wp
-        calibrated_wp = calibrator.calibrate(raw_wp) if calibrator else raw_wp
 
         # Match market entries to home/away sides
         market_entries = market_by_game.get(pred.game_id, [])
@@ -5,11 +5,11 @@ from __future__ import annotations
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
 from sqlalchemy import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import load_only, raiseload, selectinload
 
 from ...db import AsyncSession, get_db
-from ...db.flow import SportsGameFlow
 from ...db.mlb_advanced import (
     MLBGameAdvancedStats,
     MLBPitcherGameStats,
@@ -33,6 +33,7 @@ from ...db.nhl_advanced import (
     NHLGoalieAdvancedStats,
     NHLSkaterAdvancedStats,
 )
+from ...db.odds import SportsGameOdds
 from ...db.social import TeamSocialPost
 from ...db.sports import (
     SportsGame,
@@ -44,6 +45,7 @@ from ...game_metadata.nuggets import generate_nugget
 from ...game_metadata.scoring import excitement_score, quality_score
 from ...game_metadata.services import RatingsService, StandingsService
 from ...services.derived_metrics import compute_derived_metrics
+from ...services.game_detail_docs import probe_game, store_detail_doc
 from ...services.game_status import compute_status_flags
 from ...services.odds_table import build_odds_table
 from ...services.period_labels import period_label, time_label
@@ -150,20 +152,93 @@ async def get_game_preview_score(
     return preview
 
 
-@router.get("/games/{game_id}", response_model=GameDetailResponse)
-async def get_game(game_id: int, session: AsyncSession = Depends(get_db)) -> GameDetailResponse:
-    result = await session.execute(
-        select(SportsGame)
-        .options(
-            selectinload(SportsGame.league),
-            selectinload(SportsGame.home_team),
-            selectinload(SportsGame.away_team),
-            selectinload(SportsGame.team_boxscores).selectinload(SportsTeamBoxscore.team),
-            selectinload(SportsGame.player_boxscores).selectinload(SportsPlayerBoxscore.team),
-            selectinload(SportsGame.odds),
-            selectinload(SportsGame.social_posts).selectinload(TeamSocialPost.team),
-            selectinload(SportsGame.plays).selectinload(SportsGamePlay.team),
-            selectinload(SportsGame.timeline_artifacts),
+# Columns each shared section actually serializes; the rest (created_at,
+# source keys, player refs, ...) stay in the database.
+_PLAY_COLUMNS = (
+    SportsGamePlay.play_index,
+    SportsGamePlay.quarter,
+    SportsGamePlay.game_clock,
+    SportsGamePlay.play_type,
+    SportsGamePlay.team_id,
+    SportsGamePlay.player_name,
+    SportsGamePlay.description,
+    SportsGamePlay.home_score,
+    SportsGamePlay.away_score,
+    SportsGamePlay.raw_data,  # team_abbreviation fallback when team_id is unset
+)
+_ODDS_COLUMNS = (
+    SportsGameOdds.book,
+    SportsGameOdds.market_type,
+    SportsGameOdds.market_category,
+    SportsGameOdds.player_name,
+    SportsGameOdds.description,
+    SportsGameOdds.side,
+    SportsGameOdds.line,
+    SportsGameOdds.price,
+    SportsGameOdds.is_closing_line,
+    SportsGameOdds.observed_at,
+    SportsGameOdds.raw_payload,
+)
+_SOCIAL_POST_COLUMNS = (
+    TeamSocialPost.team_id,
+    TeamSocialPost.post_url,
+    TeamSocialPost.posted_at,
+    TeamSocialPost.tweet_text,
+    TeamSocialPost.has_video,
+    TeamSocialPost.media_type,
+    TeamSocialPost.image_url,
+    TeamSocialPost.video_url,
+    TeamSocialPost.source_handle,
+    TeamSocialPost.game_phase,
+)
+_TEAM_BOXSCORE_COLUMNS = (
+    SportsTeamBoxscore.team_id,
+    SportsTeamBoxscore.is_home,
+    SportsTeamBoxscore.stats,
+    SportsTeamBoxscore.source,
+    SportsTeamBoxscore.updated_at,
+)
+_PLAYER_BOXSCORE_COLUMNS = (
+    SportsPlayerBoxscore.team_id,
+    SportsPlayerBoxscore.player_name,
+    SportsPlayerBoxscore.stats,
+    SportsPlayerBoxscore.source,
+    SportsPlayerBoxscore.updated_at,
+)
+
+
+def _detail_load_options(league_code: str | None) -> list:
+    """Eager-load plan for ``get_game``: shared sections plus this sport's extras.
+
+    Shared sections load only the columns the response serializes.
+    Advanced-stat relationships are only loaded for the sport that renders
+    them; every other relationship raises instead of lazy-loading, so a
+    section the sport does not render can never cost a query.
+    """
+    options = [
+        selectinload(SportsGame.league),
+        selectinload(SportsGame.home_team),
+        selectinload(SportsGame.away_team),
+        selectinload(SportsGame.team_boxscores).options(
+            load_only(*_TEAM_BOXSCORE_COLUMNS),
+            selectinload(SportsTeamBoxscore.team),
+        ),
+        selectinload(SportsGame.player_boxscores).options(
+            load_only(*_PLAYER_BOXSCORE_COLUMNS),
+            selectinload(SportsPlayerBoxscore.team),
+        ),
+        selectinload(SportsGame.odds).load_only(*_ODDS_COLUMNS),
+        selectinload(SportsGame.social_posts).options(
+            load_only(*_SOCIAL_POST_COLUMNS),
+            selectinload(TeamSocialPost.team),
+        ),
+        selectinload(SportsGame.plays).options(
+            load_only(*_PLAY_COLUMNS),
+            selectinload(SportsGamePlay.team),
+        ),
+    ]
+    if league_code == "MLB":
+        options += [
             selectinload(SportsGame.advanced_stats).selectinload(MLBGameAdvancedStats.team),
             selectinload(SportsGame.player_advanced_stats).selectinload(
                 MLBPlayerAdvancedStats.team
@@ -174,12 +249,18 @@ async def get_game(game_id: int, session: AsyncSession = Depends(get_db)) -> Gam
             selectinload(SportsGame.fielding_stats).selectinload(
                 MLBPlayerFieldingStats.team
             ),
+        ]
+    elif league_code == "NBA":
+        options += [
             selectinload(SportsGame.nba_advanced_stats).selectinload(
                 NBAGameAdvancedStats.team
             ),
             selectinload(SportsGame.nba_player_advanced_stats).selectinload(
                 NBAPlayerAdvancedStats.team
             ),
+        ]
+    elif league_code == "NHL":
+        options += [
             selectinload(SportsGame.nhl_advanced_stats).selectinload(
                 NHLGameAdvancedStats.team
             ),
@@ -189,19 +270,41 @@ async def get_game(game_id: int, session: AsyncSession = Depends(get_db)) -> Gam
             selectinload(SportsGame.nhl_goalie_advanced_stats).selectinload(
                 NHLGoalieAdvancedStats.team
             ),
+        ]
+    elif league_code == "NFL":
+        options += [
             selectinload(SportsGame.nfl_advanced_stats).selectinload(
                 NFLGameAdvancedStats.team
             ),
             selectinload(SportsGame.nfl_player_advanced_stats).selectinload(
                 NFLPlayerAdvancedStats.team
             ),
+        ]
+    elif league_code == "NCAAB":
+        options += [
             selectinload(SportsGame.ncaab_advanced_stats).selectinload(
                 NCAABGameAdvancedStats.team
             ),
             selectinload(SportsGame.ncaab_player_advanced_stats).selectinload(
                 NCAABPlayerAdvancedStats.team
             ),
-        )
+        ]
+    options.append(raiseload("*"))
+    return options
+
+
+@router.get("/games/{game_id}", response_model=GameDetailResponse)
+async def get_game(game_id: int, session: AsyncSession = Depends(get_db)) -> GameDetailResponse:
+    probe = await probe_game(session, game_id)
+    if probe is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    if probe.document is not None:
+        # Settled game with an up-to-date materialized response.
+        return JSONResponse(content=probe.document, headers={"X-Cache": "HIT"})
+
+    result = await session.execute(
+        select(SportsGame)
+        .options(*_detail_load_options(probe.league_code))
         .where(SportsGame.id == game_id)
     )
     game = result.scalar_one_or_none()
@@ -294,16 +397,7 @@ async def get_game(game_id: int, session: AsyncSession = Depends(get_db)) -> Gam
     else:
         grouped_plays = None
 
-    # Check if game has a flow in SportsGameFlow table
-    flow_check = await session.execute(
-        select(SportsGameFlow.id)
-        .where(
-            SportsGameFlow.game_id == game_id,
-            SportsGameFlow.moments_json.isnot(None),
-        )
-        .limit(1)
-    )
-    has_flow = flow_check.scalar() is not None
+    has_flow = probe.has_flow
 
     matchup_colors = get_matchup_colors(
         game.home_team.color_light_hex if game.home_team else None,
@@ -445,7 +539,7 @@ async def get_game(game_id: int, session: AsyncSession = Depends(get_db)) -> Gam
         if home_abbr_val and away_abbr_val:
             enrich_play_entries(plays_entries, league_code, home_abbr_val, away_abbr_val)
 
-    return GameDetailResponse(
+    response = GameDetailResponse(
         game=meta,
         team_stats=team_stats,
         player_stats=player_stats,
@@ -476,3 +570,10 @@ async def get_game(game_id: int, session: AsyncSession = Depends(get_db)) -> Gam
         odds_table=odds_table,
         stat_annotations=stat_annotations,
     )
+
+    if probe.materializable:
+        # Store the wire shape (camelCase aliases) so hits skip the response model.
+        await store_detail_doc(
+            session, game_id, probe.fingerprint, response.model_dump(by_alias=True, mode="json")
+        )
+    return response
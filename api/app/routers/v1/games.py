@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
@@ -24,68 +24,102 @@ from app.routers.sports.schemas import (
     GameFlowPlay,
 )
 from app.routers.sports.schemas.common import _score_obj
+from app.services.flow_docs import (
+    CompiledFlow,
+    compile_flow,
+    etag_matches,
+    load_published_flow,
+    probe_flow_doc,
+    store_flow_doc,
+)
 from app.services.team_colors import get_matchup_colors
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Compiled flows are immutable per ETag; clients may store them but must
+# revalidate, which costs one probe query and an empty 304.
+_FLOW_CACHE_CONTROL = "no-cache"
+
 
 @router.get(
     "/games/{game_id}/flow",
     summary="Get game flow (consumer)",
+    response_model=ConsumerGameFlowResponse | FlowStatusResponse,
     responses={
         200: {
             "description": (
                 "Flow data when available, or status object (RECAP_PENDING / "
-                "PREGAME / IN_PROGRESS / POSTPONED / CANCELED) when not."
+                "PREGAME / IN_PROGRESS / POSTPONED / CANCELED) when not. "
+                "Flow data carries a strong ETag."
             ),
         },
+        304: {"description": "Flow unchanged since the ETag in If-None-Match"},
         404: {"description": "Game not found"},
     },
 )
 async def get_game_flow(
     game_id: int,
     session: AsyncSession = Depends(get_db),
-) -> ConsumerGameFlowResponse | FlowStatusResponse:
+    if_none_match: str | None = Header(None),
+) -> Response | FlowStatusResponse:
     """Retrieve the consumer-safe Game Flow for a game.
 
+    Published flows are served from their compiled document: one
+    primary-key probe, then either 304 (``If-None-Match`` matches the
+    ETag) or the stored bytes. The document is recompiled on the first
+    read after the flow, its plays, or either team's display fields
+    change.
+
     Returns:
-        ConsumerGameFlowResponse when flow data is available.
+        Pre-encoded ConsumerGameFlowResponse when flow data is available.
         FlowStatusResponse when the game exists but flow is not yet ready.
 
     Raises:
         HTTPException 404: Game not found.
     """
-    flow_result = await session.execute(
-        select(SportsGameFlow).where(
-            SportsGameFlow.game_id == game_id,
-            SportsGameFlow.story_version == FLOW_VERSION,
-            SportsGameFlow.blocks_json.isnot(None),
+    probe = await probe_flow_doc(session, game_id, FLOW_VERSION)
+    if probe is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Game {game_id} not found",
         )
-    )
-    flow_record = flow_result.scalar_one_or_none()
 
-    if not flow_record:
-        game_result = await session.execute(
-            select(SportsGame).where(SportsGame.id == game_id)
-        )
-        game_row = game_result.scalar_one_or_none()
-        if not game_row:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Game {game_id} not found",
-            )
-        if game_row.status == GameStatus.final.value:
-            return FlowStatusResponse(
-                gameId=game_id,
-                status="RECAP_PENDING",
-                etaMinutes=_compute_eta_minutes(game_row),
+    compiled = probe.document
+    if compiled is None:
+        flow_record = await load_published_flow(session, game_id, FLOW_VERSION)
+        if flow_record is None:
+            game_row = await session.get(SportsGame, game_id)
+            if game_row.status == GameStatus.final.value:
+                return FlowStatusResponse(
+                    gameId=game_id,
+                    status="RECAP_PENDING",
+                    etaMinutes=_compute_eta_minutes(game_row),
+                )
+            flow_status = _GAME_STATUS_TO_FLOW_STATUS.get(
+                game_row.status, game_row.status.upper()
             )
-        flow_status = _GAME_STATUS_TO_FLOW_STATUS.get(
-            game_row.status, game_row.status.upper()
+            return FlowStatusResponse(gameId=game_id, status=flow_status)
+
+        compiled = compile_flow(
+            await _build_consumer_flow(session, game_id, flow_record)
         )
-        return FlowStatusResponse(gameId=game_id, status=flow_status)
+        await store_flow_doc(session, game_id, flow_record.id, probe, compiled)
+    return _compiled_response(compiled, if_none_match)
+
+
+def _compiled_response(compiled: CompiledFlow, if_none_match: str | None) -> Response:
+    headers = {"ETag": compiled.etag, "Cache-Control": _FLOW_CACHE_CONTROL}
+    if etag_matches(if_none_match, compiled.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(
+        content=compiled.body, media_type="application/json", headers=headers
+    )
+
 
+async def _build_consumer_flow(
+    session: AsyncSession, game_id: int, flow_record: SportsGameFlow
+) -> ConsumerGameFlowResponse:
     game_result = await session.execute(
         select(SportsGame)
         .options(
@@ -0,0 +1,190 @@
+"""Compiled consumer flow documents with strong ETags.
+
+A published flow only changes when the pipeline reruns, so the consumer
+response for ``GET /api/v1/games/{id}/flow`` is serialized once into JSON
+bytes and stored in ``sports_game_flow_docs``. The SHA-256 of those bytes
+is the document's strong ETag: identical content always yields the same
+tag, so clients and intermediaries can revalidate with ``If-None-Match``
+and skip the body entirely.
+
+Reads are one primary-key probe: the game row joined to its stored
+document. Freshness is stamped on write instead of being derived on
+read. Database triggers set ``sports_games.flow_sources_changed_at``
+whenever anything the document embeds changes for a game that has a
+flow: the flow row itself, its plays, or the display fields of either
+team. The document is served only when it was compiled from the same
+flow, story version, stamp, and format; otherwise the published flow is
+loaded and the document recompiled. The stamp is read before the
+compile, so a write that lands mid-compile still moves it and the next
+read recompiles.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime
+
+from pydantic import BaseModel
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.flow import SportsGameFlow, SportsGameFlowDocument
+from ..db.sports import SportsGame
+
+logger = logging.getLogger(__name__)
+
+# Bump when ConsumerGameFlowResponse changes shape; older documents are recompiled.
+FLOW_DOC_FORMAT = 1
+
+
+@dataclass(frozen=True)
+class CompiledFlow:
+    """Pre-encoded response body and its strong ETag."""
+
+    body: bytes
+    content_hash: str
+
+    @property
+    def etag(self) -> str:
+        return f'"{self.content_hash}"'
+
+
+@dataclass(frozen=True)
+class FlowDocProbe:
+    """The game's flow-source stamp and its compiled document, if current."""
+
+    story_version: str
+    sources_changed_at: datetime | None
+    document: CompiledFlow | None
+
+    def fingerprint(self, flow_id: int) -> str:
+        """Fingerprint of a document compiled from ``flow_id`` now."""
+        return _fingerprint(flow_id, self.story_version, self.sources_changed_at)
+
+
+def _fingerprint(flow_id: int, story_version: str, stamp: datetime | None) -> str:
+    raw = json.dumps(
+        [FLOW_DOC_FORMAT, flow_id, story_version, stamp.isoformat() if stamp else None],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+def compile_flow(response: BaseModel) -> CompiledFlow:
+    """Serialize a consumer flow response exactly as FastAPI would."""
+    body = response.model_dump_json(by_alias=True).encode()
+    return CompiledFlow(body=body, content_hash=hashlib.sha256(body).hexdigest())
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Evaluate ``If-None-Match`` against ``etag`` (RFC 9110 weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+async def probe_flow_doc(
+    session: AsyncSession, game_id: int, story_version: str
+) -> FlowDocProbe | None:
+    """Read the game's stamp and stored document by primary key.
+
+    Returns None when the game does not exist. ``document`` is None when
+    nothing current is stored; the caller then loads the published flow
+    with :func:`load_published_flow` and compiles it.
+    """
+    stmt = (
+        select(
+            SportsGame.flow_sources_changed_at,
+            SportsGameFlowDocument.flow_id,
+            SportsGameFlowDocument.format_version,
+            SportsGameFlowDocument.source_fingerprint,
+            SportsGameFlowDocument.content_hash,
+            SportsGameFlowDocument.body,
+        )
+        .outerjoin(
+            SportsGameFlowDocument,
+            SportsGameFlowDocument.game_id == SportsGame.id,
+        )
+        .where(SportsGame.id == game_id)
+    )
+    row = (await session.execute(stmt)).first()
+    if row is None:
+        return None
+
+    stamp, flow_id, doc_format, doc_fingerprint, content_hash, body = row
+    probe = FlowDocProbe(story_version=story_version, sources_changed_at=stamp, document=None)
+    if (
+        body is not None
+        and doc_format == FLOW_DOC_FORMAT
+        and doc_fingerprint == probe.fingerprint(flow_id)
+    ):
+        document = CompiledFlow(body=bytes(body), content_hash=content_hash)
+        return FlowDocProbe(story_version, stamp, document)
+    return probe
+
+
+async def load_published_flow(
+    session: AsyncSession, game_id: int, story_version: str
+) -> SportsGameFlow | None:
+    """The game's published flow for ``story_version``, if any."""
+    result = await session.execute(
+        select(SportsGameFlow).where(
+            SportsGameFlow.game_id == game_id,
+            SportsGameFlow.story_version == story_version,
+            SportsGameFlow.blocks_json.isnot(None),
+        )
+    )
+    return result.scalar_one_or_none()
+
+
+async def store_flow_doc(
+    session: AsyncSession,
+    game_id: int,
+    flow_id: int,
+    probe: FlowDocProbe,
+    compiled: CompiledFlow,
+) -> None:
+    """Upsert the compiled document. Failures are logged, never raised.
+
+    Runs in a savepoint so a failed write cannot abort the request's
+    transaction.
+    """
+    stmt = pg_insert(SportsGameFlowDocument).values(
+        game_id=game_id,
+        flow_id=flow_id,
+        format_version=FLOW_DOC_FORMAT,
+        source_fingerprint=probe.fingerprint(flow_id),
+        content_hash=compiled.content_hash,
+        body=compiled.body,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["game_id"],
+        set_={
+            "flow_id": stmt.excluded.flow_id,
+            "format_version": stmt.excluded.format_version,
+            "source_fingerprint": stmt.excluded.source_fingerprint,
+            "content_hash": stmt.excluded.content_hash,
+            "body": stmt.excluded.body,
+            "built_at": func.now(),
+        },
+    )
+    try:
+        async with session.begin_nested():
+            await session.execute(stmt)
+    except Exception as exc:
+        logger.warning(
+            "flow_doc_store_failed",
+            extra={"game_id": game_id, "error": str(exc)},
+        )
@@ -0,0 +1,169 @@
+"""Materialized game-detail documents for games past FINAL.
+
+Final games are the bulk of ``GET /games/{id}`` traffic and their data has
+settled, so the full response is stored once in ``sports_game_detail_docs``
+and served as-is on later reads.
+
+A single probe query reads the game's status, league, freshness stamps,
+flow existence, and any stored document. The stamps are hashed into a
+fingerprint; the document is served only when it was built from the same
+fingerprint and format. Late writes (closing odds, postgame social, flow
+generation moving the game to ``recap_ready``) bump a stamp or the status,
+so the next read rebuilds instead of serving stale data. Social posts are
+mapped to games after collection stamps ``last_social_at``, so the newest
+``updated_at`` among the game's posts is part of the fingerprint too.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import exists, func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.flow import SportsGameFlow
+from ..db.social import TeamSocialPost
+from ..db.sports import SportsGame, SportsGameDetailDocument, SportsLeague
+
+logger = logging.getLogger(__name__)
+
+# Bump when GameDetailResponse changes shape; older documents are rebuilt.
+DETAIL_DOC_FORMAT = 1
+
+# Statuses whose detail response is materialized.
+MATERIALIZED_STATUSES = frozenset(
+    {"final", "recap_pending", "recap_ready", "recap_failed", "archived"}
+)
+
+_STAMP_COLUMNS = (
+    SportsGame.updated_at,
+    SportsGame.last_scraped_at,
+    SportsGame.last_ingested_at,
+    SportsGame.last_pbp_at,
+    SportsGame.last_boxscore_at,
+    SportsGame.last_social_at,
+    SportsGame.last_odds_at,
+    SportsGame.last_advanced_stats_at,
+)
+
+
+@dataclass(frozen=True)
+class GameDetailProbe:
+    """What ``get_game`` needs to know before loading the game graph."""
+
+    league_code: str | None
+    status: str
+    has_flow: bool
+    fingerprint: str
+    document: dict[str, Any] | None
+
+    @property
+    def materializable(self) -> bool:
+        return self.status in MATERIALIZED_STATUSES
+
+
+def _fingerprint(status: str, has_flow: bool, stamps: tuple[Any, ...]) -> str:
+    raw = json.dumps(
+        [DETAIL_DOC_FORMAT, status, has_flow, [s.isoformat() if s else None for s in stamps]],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(raw.encode()).hexdigest()[:32]
+
+
+async def probe_game(session: AsyncSession, game_id: int) -> GameDetailProbe | None:
+    """Read status, stamps, and any stored document in one query.
+
+    Returns None when the game does not exist.
+    """
+    has_flow = (
+        exists()
+        .where(
+            SportsGameFlow.game_id == SportsGame.id,
+            SportsGameFlow.moments_json.isnot(None),
+        )
+        .label("has_flow")
+    )
+    social_stamp = (
+        select(func.max(TeamSocialPost.updated_at))
+        .where(TeamSocialPost.game_id == SportsGame.id)
+        .correlate(SportsGame)
+        .scalar_subquery()
+        .label("social_posts_updated_at")
+    )
+    stmt = (
+        select(
+            SportsGame.status,
+            SportsLeague.code,
+            has_flow,
+            SportsGameDetailDocument.format_version,
+            SportsGameDetailDocument.source_fingerprint,
+            SportsGameDetailDocument.payload,
+            *_STAMP_COLUMNS,
+            social_stamp,
+        )
+        .outerjoin(SportsLeague, SportsLeague.id == SportsGame.league_id)
+        .outerjoin(SportsGameDetailDocument, SportsGameDetailDocument.game_id == SportsGame.id)
+        .where(SportsGame.id == game_id)
+    )
+    row = (await session.execute(stmt)).first()
+    if row is None:
+        return None
+
+    status, league_code, flow, doc_format, doc_fingerprint, payload = row[:6]
+    fingerprint = _fingerprint(status, bool(flow), tuple(row[6:]))
+    document = None
+    if (
+        status in MATERIALIZED_STATUSES
+        and payload is not None
+        and doc_format == DETAIL_DOC_FORMAT
+        and doc_fingerprint == fingerprint
+    ):
+        document = payload
+    return GameDetailProbe(
+        league_code=league_code,
+        status=status,
+        has_flow=bool(flow),
+        fingerprint=fingerprint,
+        document=document,
+    )
+
+
+async def store_detail_doc(
+    session: AsyncSession,
+    game_id: int,
+    fingerprint: str,
+    payload: dict[str, Any],
+) -> None:
+    """Upsert the materialized document. Failures are logged, never raised.
+
+    Runs in a savepoint so a failed write cannot abort the request's
+    transaction.
+    """
+    stmt = pg_insert(SportsGameDetailDocument).values(
+        game_id=game_id,
+        format_version=DETAIL_DOC_FORMAT,
+        source_fingerprint=fingerprint,
+        payload=payload,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["game_id"],
+        set_={
+            "format_version": stmt.excluded.format_version,
+            "source_fingerprint": stmt.excluded.source_fingerprint,
+            "payload": stmt.excluded.payload,
+            "built_at": func.now(),
+        },
+    )
+    try:
+        async with session.begin_nested():
+            await session.execute(stmt)
+    except Exception as exc:
+        logger.warning(
+            "game_detail_doc_store_failed",
+            extra={"game_id": game_id, "error": str(exc)},
+        )
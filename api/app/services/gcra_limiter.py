@@ -0,0 +1,186 @@
+"""Generic cell rate algorithm (GCRA) rate limiter.
+
+A limit of ``limit`` requests per ``window`` seconds is an emission
+interval ``T = window / limit``. Each key stores a single number, its
+*theoretical arrival time* (TAT): the time at which the key's bucket
+would be empty again. A request at ``now`` is allowed when
+
+    max(TAT, now) + T - window <= now
+
+and then advances the TAT to ``max(TAT, now) + T``. A fresh key can
+therefore burst ``limit`` requests, after which it refills one request
+every ``T`` seconds. Denied requests do not advance the TAT, and the
+retry delay is exact rather than a full window.
+
+``RedisGCRA`` keeps the TAT in Redis and updates it with one Lua script
+call, so every API replica shares the same budget and the clock is the
+Redis server's. ``LocalGCRA`` is the in-process equivalent, used when
+``RATE_LIMIT_BACKEND=memory`` and as the fallback while Redis is
+unreachable (guarded by a circuit breaker, like the FairBet cache).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from app.services.circuit_breaker_registry import registry as _cb_registry
+
+logger = logging.getLogger(__name__)
+
+_BREAKER_NAME = "rate_limit_redis"
+_KEY_PREFIX = "ratelimit:gcra"
+_REDIS_CIRCUIT_SECONDS = 15.0
+# Redis socket timeouts — a slow Redis must not stall every request.
+_REDIS_TIMEOUT_SECONDS = 0.25
+# LocalGCRA drops expired keys after this many checks.
+_PRUNE_EVERY = 4096
+# Slack for float accumulation: ``limit`` emissions of ``window / limit``
+# can land a hair past ``window`` and would deny the last burst request.
+_EPSILON_SECONDS = 1e-6
+
+_cb_registry.register(_BREAKER_NAME)
+
+# KEYS[1] = bucket key; ARGV = emission interval (ms), window (ms).
+# Returns {allowed (0/1), retry_after_ms}. Times are microsecond-precise
+# milliseconds from the Redis server clock.
+_GCRA_SCRIPT = """
+redis.replicate_commands()
+local emission = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + tonumber(t[2]) / 1000
+local tat = tonumber(redis.call('GET', KEYS[1]))
+if tat == nil or tat < now then
+  tat = now
+end
+local new_tat = tat + emission
+local allow_at = new_tat - window
+if allow_at - now > 0.001 then
+  return {0, math.ceil(allow_at - now)}
+end
+redis.call('SET', KEYS[1], string.format('%.3f', new_tat), 'PX', math.ceil(new_tat - now))
+return {1, 0}
+"""
+
+
+@dataclass(frozen=True)
+class RateLimitDecision:
+    """Outcome of one rate-limit check."""
+
+    allowed: bool
+    retry_after: float = 0.0
+
+    @property
+    def retry_after_header(self) -> str:
+        """``Retry-After`` value: whole seconds, at least 1."""
+        return str(max(1, math.ceil(self.retry_after)))
+
+
+def hashed_key(value: str) -> str:
+    """Stable short digest for secrets (API keys) used in bucket keys."""
+    return hashlib.sha256(value.encode()).hexdigest()[:16]
+
+
+class LocalGCRA:
+    """In-process GCRA store: one float per active key."""
+
+    def __init__(self) -> None:
+        self._tat: dict[str, float] = {}
+        self._checks = 0
+
+    def check(self, key: str, limit: int, window: float, now: float | None = None) -> RateLimitDecision:
+        if now is None:
+            now = time.monotonic()
+        self._checks += 1
+        if self._checks % _PRUNE_EVERY == 0:
+            self._prune(now)
+
+        emission = window / limit
+        tat = max(self._tat.get(key, now), now)
+        new_tat = tat + emission
+        allow_at = new_tat - window
+        if allow_at - now > _EPSILON_SECONDS:
+            return RateLimitDecision(False, allow_at - now)
+        self._tat[key] = new_tat
+        return RateLimitDecision(True)
+
+    def _prune(self, now: float) -> None:
+        expired = [k for k, tat in self._tat.items() if tat <= now]
+        for k in expired:
+            del self._tat[k]
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+class RedisGCRA:
+    """GCRA backed by Redis, with ``LocalGCRA`` as the outage fallback.
+
+    Args:
+        redis_url: Connection URL. The client is created lazily so
+            importing the middleware never touches the network.
+        fallback: Store used while Redis is unreachable.
+    """
+
+    def __init__(self, redis_url: str, fallback: LocalGCRA | None = None) -> None:
+        self._redis_url = redis_url
+        self._fallback = fallback or LocalGCRA()
+        self._script: Any = None
+        self._error_until = 0.0
+        self._tripped = False
+
+    def _get_script(self) -> Any:
+        if self._script is None:
+            import redis.asyncio as aioredis
+
+            client = aioredis.from_url(
+                self._redis_url,
+                socket_connect_timeout=_REDIS_TIMEOUT_SECONDS,
+                socket_timeout=_REDIS_TIMEOUT_SECONDS,
+            )
+            self._script = client.register_script(_GCRA_SCRIPT)
+        return self._script
+
+    async def check(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        if time.monotonic() < self._error_until:
+            return self._fallback.check(key, limit, window)
+
+        emission_ms = window * 1000 / limit
+        try:
+            allowed, retry_ms = await self._get_script()(
+                keys=[f"{_KEY_PREFIX}:{key}"],
+                args=[emission_ms, window * 1000],
+            )
+        except Exception as exc:
+            self._error_until = time.monotonic() + _REDIS_CIRCUIT_SECONDS
+            self._tripped = True
+            _cb_registry.record_trip(_BREAKER_NAME, "redis_error")
+            logger.warning("rate_limit_redis_error", extra={"error": str(exc)})
+            return self._fallback.check(key, limit, window)
+
+        if self._tripped:
+            self._tripped = False
+            _cb_registry.record_reset(_BREAKER_NAME)
+        return RateLimitDecision(bool(allowed), int(retry_ms) / 1000)
+
+
+class MemoryGCRA:
+    """Async facade over ``LocalGCRA`` for single-process deployments."""
+
+    def __init__(self) -> None:
+        self._local = LocalGCRA()
+
+    async def check(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        return self._local.check(key, limit, window)
+
+
+def build_limiter(backend: str, redis_url: str) -> RedisGCRA | MemoryGCRA:
+    """Limiter for ``RATE_LIMIT_BACKEND`` (``"redis"`` or ``"memory"``)."""
+    if backend == "memory":
+        return MemoryGCRA()
+    return RedisGCRA(redis_url)
@@ -8,38 +8,100 @@ from __future__ import annotations
 
 import json
 import logging
+from typing import Any
 
-from openai import OpenAI
+from openai import AsyncOpenAI, OpenAI
 
 from ..config import get_settings
 
 logger = logging.getLogger(__name__)
 
+SYSTEM_PROMPT = (
+    "You are a sports narrative writer. Generate engaging, accurate summaries "
+    "of game moments. Always respond with valid JSON."
+)
+RESPONSE_FORMAT = {"type": "json_object"}
+
 
 class OpenAIClient:
     """OpenAI client for game flow generation.
 
     This client provides a simple .generate(prompt) interface
-    for narrative rendering.
+    for narrative rendering, plus a native async .agenerate(prompt)
+    with identical request and retry semantics.
     """
 
-    def __init__(self, api_key: str | None = None, model: str = "gpt-4o-mini"):
+    def __init__(
+        self,
+        api_key: str | None = None,
+        model: str = "gpt-4o-mini",
+        base_url: str | None = None,
+    ):
         """Initialize OpenAI client.
 
         Args:
             api_key: OpenAI API key (if None, uses settings)
             model: Model to use for generation
+            base_url: API base URL (if None, uses settings, then the SDK default)
         """
         settings = get_settings()
         self.api_key = api_key or settings.openai_api_key
         self.model = model
+        self.base_url = base_url or settings.openai_base_url
 
         if not self.api_key:
             raise ValueError("OpenAI API key not configured")
 
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = OpenAI(api_key=self.api_key, base_url=self.base_url)
+        self._async_client: AsyncOpenAI | None = None
         logger.info(f"OpenAI client initialized with model: {self.model}")
 
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Lazily created async SDK client sharing this client's config."""
+        if self._async_client is None:
+            self._async_client = AsyncOpenAI(api_key=self.api_key, base_url=self.base_url)
+        return self._async_client
+
+    def request_params(
+        self, prompt: str, temperature: float, max_tokens: int
+    ) -> dict[str, Any]:
+        """Exact chat-completion parameters sent for a prompt.
+
+        Also the input to the content-addressed response cache key, so
+        anything that changes the request changes the key.
+        """
+        return {
+            "model": self.model,
+            "messages": [
+                {"role": "system", "content": SYSTEM_PROMPT},
+                {"role": "user", "content": prompt},
+            ],
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": RESPONSE_FORMAT,
+        }
+
+    @staticmethod
+    def _checked_content(response: Any) -> str:
+        content = response.choices[0].message.content
+        if not content:
+            raise ValueError("OpenAI returned empty response")
+
+        # Log response length for debugging truncation issues
+        logger.debug(f"OpenAI response length: {len(content)} chars")
+
+        # Validate it's valid JSON
+        try:
+            json.loads(content)
+        except json.JSONDecodeError:
+            # Log the problematic content for debugging
+            logger.warning(
+                f"Malformed JSON content (first 100 chars): {content[:100]!r}"
+            )
+            raise
+        return content
+
     def generate(
         self,
         prompt: str,
@@ -61,44 +123,55 @@ class OpenAIClient:
         Raises:
             Exception: If generation fails after all retries
         """
+        params = self.request_params(prompt, temperature, max_tokens)
         last_error = None
 
         for attempt in range(max_retries):
             try:
-                response = self.client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a sports narrative writer. Generate engaging, accurate summaries of game moments. Always respond with valid JSON.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=temperature,
-                    max_tokens=max_tokens,
-                    response_format={"type": "json_object"},
+                content = self._checked_content(
+                    self.client.chat.completions.create(**params)
                 )
+                if attempt > 0:
+                    logger.info(f"OpenAI generation succeeded on attempt {attempt + 1}")
+                return content
 
-                content = response.choices[0].message.content
-                if not content:
-                    raise ValueError("OpenAI returned empty response")
+            except json.JSONDecodeError as e:
+                last_error = e
+                logger.warning(
+                    f"OpenAI returned malformed JSON (attempt {attempt + 1}/{max_retries}): {e}"
+                )
+                # Continue to retry
 
-                # Log response length for debugging truncation issues
-                logger.debug(f"OpenAI response length: {len(content)} chars")
+            except Exception as e:
+                last_error = e
+                logger.error(
+                    f"OpenAI generation failed (attempt {attempt + 1}/{max_retries}): {e}"
+                )
+                # For non-JSON errors, also retry (could be transient API issues)
 
-                # Validate it's valid JSON
-                try:
-                    json.loads(content)
-                except json.JSONDecodeError:
-                    # Log the problematic content for debugging
-                    logger.warning(
-                        f"Malformed JSON content (first 100 chars): {content[:100]!r}"
-                    )
-                    raise
+        logger.error(
+            f"OpenAI generation failed after {max_retries} attempts: {last_error}"
+        )
+        raise last_error or Exception("OpenAI generation failed")
 
+    async def agenerate(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        max_retries: int = 3,
+    ) -> str:
+        """Async counterpart of :meth:`generate`; no worker thread is used."""
+        params = self.request_params(prompt, temperature, max_tokens)
+        last_error = None
+
+        for attempt in range(max_retries):
+            try:
+                content = self._checked_content(
+                    await self.async_client.chat.completions.create(**params)
+                )
                 if attempt > 0:
                     logger.info(f"OpenAI generation succeeded on attempt {attempt + 1}")
-
                 return content
 
             except json.JSONDecodeError as e:
@@ -106,14 +179,12 @@ class OpenAIClient:
                 logger.warning(
                     f"OpenAI returned malformed JSON (attempt {attempt + 1}/{max_retries}): {e}"
                 )
-                # Continue to retry
 
             except Exception as e:
                 last_error = e
                 logger.error(
                     f"OpenAI generation failed (attempt {attempt + 1}/{max_retries}): {e}"
                 )
-                # For non-JSON errors, also retry (could be transient API issues)
 
         logger.error(
             f"OpenAI generation failed after {max_retries} attempts: {last_error}"
@@ -6,6 +6,7 @@ The PipelineExecutor is responsible for:
 3. Managing stage transitions and auto-chaining
 4. Accumulating outputs between stages
 5. Tracking status and logs
+6. Profiling each stage (wall/DB/completion time, payload bytes)
 
 Key behaviors:
 - Admin/manual triggers always disable auto-chain
@@ -28,6 +29,7 @@ from ...db.sports import SportsGame, SportsPlayerBoxscore
 from ...utils.datetime_utils import now_utc
 from .metrics import increment_published, record_stage_duration
 from .models import PipelineStage, StageInput, StageOutput, StageResult
+from .profiling import payload_bytes, profile_stage
 from .stages import (
     execute_analyze_drama,
     execute_finalize_moments,
@@ -364,39 +366,32 @@ class PipelineExecutor:
         stage_record.started_at = now_utc()
         await self.session.flush()
 
-        # Build stage input
-        game_context = await self._get_game_context(run.game_id)
-        accumulated = await self._accumulate_outputs(run, stage)
+        # Build stage input and run the stage, profiling both
+        with profile_stage() as profile:
+            game_context = await self._get_game_context(run.game_id)
+            accumulated = await self._accumulate_outputs(run, stage)
+            profile.input_bytes = payload_bytes(accumulated)
+
+            stage_input = StageInput(
+                game_id=run.game_id,
+                run_id=run_id,
+                previous_output=accumulated if accumulated else None,
+                game_context=game_context,
+            )
 
-        stage_input = StageInput(
-            game_id=run.game_id,
-            run_id=run_id,
-            previous_output=accumulated if accumulated else None,
-            game_context=game_context,
-        )
+            output: StageOutput | None = None
+            error: Exception | None = None
+            try:
+                output = await self._dispatch_stage(stage, stage_input, run)
+            except Exception as e:
+                error = e
+
+        profile.output_bytes = payload_bytes(output.data) if output else 0
+        stage_record.profile_json = profile.as_dict()
 
         try:
-            # Execute the stage
-            if stage == PipelineStage.NORMALIZE_PBP:
-                output = await execute_normalize_pbp(self.session, stage_input, run_id)
-            elif stage == PipelineStage.GENERATE_MOMENTS:
-                output = await execute_generate_moments(stage_input)
-            elif stage == PipelineStage.VALIDATE_MOMENTS:
-                output = await execute_validate_moments(stage_input)
-            elif stage == PipelineStage.ANALYZE_DRAMA:
-                output = await execute_analyze_drama(stage_input)
-            elif stage == PipelineStage.GROUP_BLOCKS:
-                output = await execute_group_blocks(stage_input)
-            elif stage == PipelineStage.RENDER_BLOCKS:
-                output = await execute_render_blocks(stage_input)
-            elif stage == PipelineStage.VALIDATE_BLOCKS:
-                output = await execute_validate_blocks(self.session, stage_input)
-            elif stage == PipelineStage.FINALIZE_MOMENTS:
-                output = await execute_finalize_moments(
-                    self.session, stage_input, str(run.run_uuid)
-                )
-            else:
-                raise PipelineExecutionError(f"Unknown stage: {stage.value}")
+            if error is not None:
+                raise error
 
             # Update stage record with success
             stage_record.status = "success"
@@ -429,6 +424,7 @@ class PipelineExecutor:
                     "run_id": run_id,
                     "stage": stage.value,
                     "duration_seconds": duration,
+                    **profile.as_dict(),
                 },
             )
 
@@ -471,6 +467,33 @@ class PipelineExecutor:
                 duration_seconds=duration,
             )
 
+    async def _dispatch_stage(
+        self,
+        stage: PipelineStage,
+        stage_input: StageInput,
+        run: GamePipelineRun,
+    ) -> StageOutput:
+        """Run the implementation for ``stage``."""
+        if stage == PipelineStage.NORMALIZE_PBP:
+            return await execute_normalize_pbp(self.session, stage_input, run.id)
+        if stage == PipelineStage.GENERATE_MOMENTS:
+            return await execute_generate_moments(stage_input)
+        if stage == PipelineStage.VALIDATE_MOMENTS:
+            return await execute_validate_moments(stage_input)
+        if stage == PipelineStage.ANALYZE_DRAMA:
+            return await execute_analyze_drama(stage_input)
+        if stage == PipelineStage.GROUP_BLOCKS:
+            return await execute_group_blocks(stage_input)
+        if stage == PipelineStage.RENDER_BLOCKS:
+            return await execute_render_blocks(stage_input, self.session)
+        if stage == PipelineStage.VALIDATE_BLOCKS:
+            return await execute_validate_blocks(self.session, stage_input)
+        if stage == PipelineStage.FINALIZE_MOMENTS:
+            return await execute_finalize_moments(
+                self.session, stage_input, str(run.run_uuid)
+            )
+        raise PipelineExecutionError(f"Unknown stage: {stage.value}")
+
     async def execute_next_stage(self, run_id: int) -> StageResult | None:
         """Execute the next pending stage in the pipeline.
 
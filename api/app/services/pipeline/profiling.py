@@ -0,0 +1,275 @@
+"""Per-stage pipeline profiling.
+
+Every stage execution is wrapped in :func:`profile_stage`, which records:
+
+- wall time for the stage body
+- DB time and statement count — SQLAlchemy cursor events on any engine,
+  attributed to whichever stage is active in the current context
+- external completion time and call count — OpenAI requests time
+  themselves through :func:`completion_timer`; concurrent requests each
+  add their own duration, so this can exceed wall time
+- payload sizes — the accumulated input handed to the stage and the
+  output it persisted, as compact JSON bytes
+
+The profile is stored on the stage record (``profile_json``), and
+:func:`summarize_stage_profiles` turns a window of them into per-stage
+percentiles for the admin endpoint and ``scripts/pipeline_profile_report.py``.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event, select
+from sqlalchemy.engine import Engine
+
+from ...db.pipeline import GamePipelineRun, GamePipelineStage
+from ...db.sports import SportsGame, SportsLeague
+
+if TYPE_CHECKING:
+    from ...db import AsyncSession
+
+PROFILE_METRICS = (
+    "wall_ms",
+    "db_ms",
+    "db_queries",
+    "completion_ms",
+    "completion_calls",
+    "input_bytes",
+    "output_bytes",
+)
+
+
+@dataclass
+class StageProfile:
+    """Where one stage execution spent its time and bytes."""
+
+    wall_ms: float = 0.0
+    db_ms: float = 0.0
+    db_queries: int = 0
+    completion_ms: float = 0.0
+    completion_calls: int = 0
+    input_bytes: int = 0
+    output_bytes: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def add_db(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.db_ms += elapsed_ms
+            self.db_queries += 1
+
+    def add_completion(self, elapsed_ms: float) -> None:
+        with self._lock:
+            self.completion_ms += elapsed_ms
+            self.completion_calls += 1
+
+    def as_dict(self) -> dict[str, float | int]:
+        data = {metric: getattr(self, metric) for metric in PROFILE_METRICS}
+        for key in ("wall_ms", "db_ms", "completion_ms"):
+            data[key] = round(data[key], 3)
+        return data
+
+
+_active: ContextVar[StageProfile | None] = ContextVar("pipeline_stage_profile", default=None)
+
+
+def payload_bytes(data: Any) -> int:
+    """Size of ``data`` as compact JSON, as the JSONB columns will hold it."""
+    if data is None:
+        return 0
+    return len(json.dumps(data, default=str, separators=(",", ":")).encode())
+
+
+@contextmanager
+def profile_stage() -> Iterator[StageProfile]:
+    """Attribute DB and completion time in this context to a new profile."""
+    profile = StageProfile()
+    token = _active.set(profile)
+    started = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.wall_ms = (time.perf_counter() - started) * 1000
+        _active.reset(token)
+
+
+@contextmanager
+def completion_timer() -> Iterator[None]:
+    """Time one external completion request against the active stage, if any."""
+    profile = _active.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add_completion((time.perf_counter() - started) * 1000)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+    if _active.get() is not None and context is not None:
+        context._stage_profile_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+    profile = _active.get()
+    started = getattr(context, "_stage_profile_started", None)
+    if profile is not None and started is not None:
+        profile.add_db((time.perf_counter() - started) * 1000)
+
+
+# =============================================================================
+# Aggregation
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class MetricPercentiles:
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+@dataclass(frozen=True)
+class StageProfileSummary:
+    """Percentiles of every profile metric for one stage."""
+
+    stage: str
+    runs: int
+    total_wall_ms: float
+    wall_share: float
+    metrics: dict[str, MetricPercentiles]
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    """Linear-interpolated percentile of an ascending list (q in 0..100)."""
+    if len(ordered) == 1:
+        return ordered[0]
+    rank = (len(ordered) - 1) * q / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize_stage_profiles(
+    rows: Iterable[tuple[str, dict[str, Any]]],
+) -> list[StageProfileSummary]:
+    """Aggregate ``(stage, profile_json)`` rows into per-stage percentiles.
+
+    Returns:
+        One summary per stage, ordered by total wall time descending, so
+        the first entry is the stage that dominates the pipeline.
+    """
+    by_stage: dict[str, dict[str, list[float]]] = {}
+    for stage, profile in rows:
+        values = by_stage.setdefault(stage, {m: [] for m in PROFILE_METRICS})
+        for metric in PROFILE_METRICS:
+            values[metric].append(float(profile.get(metric) or 0))
+
+    grand_total = sum(sum(v["wall_ms"]) for v in by_stage.values())
+    summaries = []
+    for stage, values in by_stage.items():
+        metrics = {}
+        for metric, samples in values.items():
+            ordered = sorted(samples)
+            metrics[metric] = MetricPercentiles(
+                p50=round(_percentile(ordered, 50), 3),
+                p90=round(_percentile(ordered, 90), 3),
+                p99=round(_percentile(ordered, 99), 3),
+                max=round(ordered[-1], 3),
+            )
+        total_wall = sum(values["wall_ms"])
+        summaries.append(
+            StageProfileSummary(
+                stage=stage,
+                runs=len(values["wall_ms"]),
+                total_wall_ms=round(total_wall, 3),
+                wall_share=round(total_wall / grand_total, 4) if grand_total else 0.0,
+                metrics=metrics,
+            )
+        )
+    summaries.sort(key=lambda s: s.total_wall_ms, reverse=True)
+    return summaries
+
+
+async def load_stage_profiles(
+    session: AsyncSession,
+    since: datetime,
+    league: str | None = None,
+) -> list[tuple[str, dict[str, Any]]]:
+    """``(stage, profile_json)`` for profiled stage executions started since ``since``."""
+    query = select(GamePipelineStage.stage, GamePipelineStage.profile_json).where(
+        GamePipelineStage.profile_json.isnot(None),
+        GamePipelineStage.started_at >= since,
+    )
+    if league:
+        query = (
+            query.join(GamePipelineRun, GamePipelineRun.id == GamePipelineStage.run_id)
+            .join(SportsGame, SportsGame.id == GamePipelineRun.game_id)
+            .join(SportsLeague, SportsLeague.id == SportsGame.league_id)
+            .where(SportsLeague.code == league.upper())
+        )
+    result = await session.execute(query)
+    return [(stage, profile) for stage, profile in result.all()]
+
+
+def _fmt_ms(value: float) -> str:
+    return f"{value / 1000:.2f}s" if value >= 1000 else f"{value:.0f}ms"
+
+
+def _fmt_bytes(value: float) -> str:
+    if value < 1024:
+        return f"{value:.0f}B"
+    if value < 1024 * 1024:
+        return f"{value / 1024:.1f}KB"
+    return f"{value / (1024 * 1024):.1f}MB"
+
+
+def format_profile_report(summaries: list[StageProfileSummary]) -> str:
+    """Render summaries as a fixed-width table plus a dominant-stage verdict."""
+    if not summaries:
+        return "No profiled stage executions in the window."
+
+    header = (
+        f"{'stage':<18} {'runs':>5} {'share':>6} {'wall p50':>9} {'wall p90':>9} "
+        f"{'wall p99':>9} {'db p50':>8} {'llm p50':>8} {'in p50':>8} {'out p50':>8}"
+    )
+    lines = [header, "-" * len(header)]
+    for s in summaries:
+        m = s.metrics
+        lines.append(
+            f"{s.stage:<18} {s.runs:>5} {s.wall_share:>6.1%} "
+            f"{_fmt_ms(m['wall_ms'].p50):>9} {_fmt_ms(m['wall_ms'].p90):>9} "
+            f"{_fmt_ms(m['wall_ms'].p99):>9} {_fmt_ms(m['db_ms'].p50):>8} "
+            f"{_fmt_ms(m['completion_ms'].p50):>8} {_fmt_bytes(m['input_bytes'].p50):>8} "
+            f"{_fmt_bytes(m['output_bytes'].p50):>8}"
+        )
+
+    top = summaries[0]
+    wall = top.metrics["wall_ms"].p50
+    db = top.metrics["db_ms"].p50
+    llm = top.metrics["completion_ms"].p50
+    parts = {
+        "external completions": llm,
+        "database time": db,
+        "in-process compute": max(0.0, wall - db - llm),
+    }
+    cause = max(parts, key=parts.get)
+    lines.append("")
+    lines.append(
+        f"Dominant stage: {top.stage} ({top.wall_share:.1%} of total wall time, "
+        f"p50 {_fmt_ms(wall)}; mostly {cause})"
+    )
+    return "\n".join(lines)
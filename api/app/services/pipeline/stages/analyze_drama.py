@@ -26,6 +26,7 @@ from typing import Any
 
 from ...openai_client import get_openai_client
 from ..models import StageInput, StageOutput
+from ..profiling import completion_timer
 
 logger = logging.getLogger(__name__)
 
@@ -253,12 +254,13 @@ async def execute_analyze_drama(stage_input: StageInput) -> StageOutput:
 
         output.add_log(f"Calling OpenAI for drama analysis (~{len(prompt.split())} words)")
 
-        response_text = await asyncio.to_thread(
-            openai_client.generate,
-            prompt=prompt,
-            temperature=0.3,  # Low temp for consistency
-            max_tokens=200,  # Response is compact JSON
-        )
+        with completion_timer():
+            response_text = await asyncio.to_thread(
+                openai_client.generate,
+                prompt=prompt,
+                temperature=0.3,  # Low temp for consistency
+                max_tokens=200,  # Response is compact JSON
+            )
 
         drama_result = _parse_ai_response(response_text)
         output.add_log(
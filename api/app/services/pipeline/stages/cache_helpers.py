@@ -1,16 +1,22 @@
 """OpenAI response caching for narrative generation.
 
-This module provides caching functionality to avoid redundant OpenAI calls
-for the same moment batches.
+This module provides caching functionality to avoid redundant OpenAI calls.
+Responses are content-addressed: the key is a hash of the full request
+(model, messages, sampling parameters), so an identical request is never
+paid for twice and any change to the prompt or its inputs misses.
 """
 
 from __future__ import annotations
 
 import hashlib
+import json
 import logging
+from collections.abc import Iterable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ....db.cache import OpenAIResponseCache
 
@@ -20,72 +26,90 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def get_batch_cache_key(moment_indices: list[int]) -> str:
-    """Generate a cache key for a batch of moments.
+@dataclass(frozen=True)
+class CacheEntry:
+    """A freshly generated response waiting to be cached."""
+
+    key: str
+    prompt: str
+    response_data: Any
+    model: str
+
+
+def get_prompt_cache_key(request_params: dict[str, Any]) -> str:
+    """Generate a content-addressed cache key for an OpenAI request.
 
     Args:
-        moment_indices: List of moment indices in the batch
+        request_params: The exact chat-completion parameters
+            (see ``OpenAIClient.request_params``)
 
     Returns:
-        SHA256 hash of the sorted indices (first 16 chars)
+        SHA256 hex digest of the canonical JSON encoding (64 chars)
     """
-    key_str = ",".join(str(i) for i in sorted(moment_indices))
-    return hashlib.sha256(key_str.encode()).hexdigest()[:16]
+    canonical = json.dumps(request_params, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
 
 
-async def get_cached_response(
+async def get_cached_responses(
     session: AsyncSession,
     game_id: int,
-    batch_key: str,
-) -> dict[str, Any] | None:
-    """Check cache for an existing OpenAI response.
+    keys: Iterable[str],
+) -> dict[str, dict[str, Any]]:
+    """Look up cached OpenAI responses for several keys in one query.
 
     Args:
         session: Database session
         game_id: Game ID
-        batch_key: Cache key for the batch
+        keys: Content-addressed cache keys
 
     Returns:
-        Cached response data or None if not found
+        Mapping of key -> cached response data for every hit
     """
+    keys = list(keys)
+    if not keys:
+        return {}
     result = await session.execute(
-        select(OpenAIResponseCache).where(
+        select(OpenAIResponseCache.batch_key, OpenAIResponseCache.response_json).where(
             OpenAIResponseCache.game_id == game_id,
-            OpenAIResponseCache.batch_key == batch_key,
+            OpenAIResponseCache.batch_key.in_(keys),
         )
     )
-    cached = result.scalar_one_or_none()
-    if cached:
-        logger.info(f"Cache HIT for game {game_id} batch {batch_key}")
-        return cached.response_json
-    return None
+    hits = {key: response for key, response in result.all()}
+    if hits:
+        logger.info(f"Cache HIT for game {game_id}: {len(hits)}/{len(keys)} requests")
+    return hits
 
 
-async def store_cached_response(
+async def store_cached_responses(
     session: AsyncSession,
     game_id: int,
-    batch_key: str,
-    prompt_preview: str,
-    response_data: dict[str, Any],
-    model: str,
+    entries: list[CacheEntry],
 ) -> None:
-    """Store an OpenAI response in the cache.
+    """Store OpenAI responses in the cache.
+
+    Keys already present (e.g. written by a concurrent run) are left as-is:
+    equal keys mean equal requests.
 
     Args:
         session: Database session
         game_id: Game ID
-        batch_key: Cache key for the batch
-        prompt_preview: Truncated prompt for debugging
-        response_data: The parsed response from OpenAI
-        model: Model name used
+        entries: Generated responses to cache
     """
-    cache_entry = OpenAIResponseCache(
-        game_id=game_id,
-        batch_key=batch_key,
-        prompt_preview=prompt_preview[:2000] if prompt_preview else None,
-        response_json=response_data,
-        model=model,
+    if not entries:
+        return
+    stmt = pg_insert(OpenAIResponseCache).values(
+        [
+            {
+                "game_id": game_id,
+                "batch_key": entry.key,
+                "prompt_preview": entry.prompt[:2000] if entry.prompt else None,
+                "response_json": entry.response_data,
+                "model": entry.model,
+            }
+            for entry in entries
+        ]
+    )
+    await session.execute(
+        stmt.on_conflict_do_nothing(index_elements=["game_id", "batch_key"])
     )
-    session.add(cache_entry)
-    await session.flush()
-    logger.info(f"Cache STORED for game {game_id} batch {batch_key}")
+    logger.info(f"Cache STORED for game {game_id}: {len(entries)} responses")
@@ -314,7 +314,7 @@ async def execute_finalize_moments(
                 "is_template_fallback": _is_fallback,
                 "regen_attempt": _regen_attempt,
             },
-            queue="sports-scraper",
+            queue="sports-flow",
         )
     except Exception:
         logger.warning("grade_flow_task_dispatch_failed", exc_info=True, extra={"flow_id": flow_id})
@@ -5,9 +5,15 @@ Each block gets 1-5 sentences (~65 words) describing that stretch of play.
 
 TWO-PASS RENDERING
 ==================
-1. Initial render: Per-block narrative generation with role-aware prompting
+1. Initial render: Per-block narrative generation with role-aware prompting.
+   Blocks are split into batches (RENDER_BLOCKS_BATCH_SIZE) that are sent
+   concurrently, at most RENDER_BLOCKS_MAX_IN_FLIGHT at a time. Every batch
+   prompt carries the same game-level tone signals computed from all blocks.
 2. Game-level flow pass: Single call that sees all blocks and smooths transitions
 
+Responses are cached by a hash of the full request (see render_engine), so a
+rerun over identical inputs costs no OpenAI calls and any input change misses.
+
 RENDERING RULES
 ===============
 The prompt REQUIRES:
@@ -44,14 +50,21 @@ Post-generation validation ensures:
 
 from __future__ import annotations
 
-import asyncio
 import json
 import logging
-from typing import Any
+import math
+from typing import TYPE_CHECKING, Any
 
+from ....config import get_settings
 from ...openai_client import get_openai_client
 from ..models import StageInput, StageOutput
 from .regen_context import RegenFailureContext
+from .render_engine import (
+    RenderRequest,
+    RenderStats,
+    run_render_requests,
+    store_render_responses,
+)
 from .render_helpers import (
     check_overtime_mention,
     detect_overtime_info,
@@ -60,15 +73,38 @@ from .render_helpers import (
 from .render_prompts import build_block_prompt, build_game_flow_pass_prompt
 from .render_validation import cleanup_pbp_artifacts, validate_block_narrative
 
+if TYPE_CHECKING:
+    from ....db import AsyncSession
+
 logger = logging.getLogger(__name__)
 
 
+def _block_batches(blocks: list[dict[str, Any]], batch_size: int) -> list[list[int]]:
+    """Split block indices into evenly sized batches of at most ``batch_size``."""
+    indices = [b["block_index"] for b in blocks]
+    if batch_size <= 0 or len(indices) <= batch_size:
+        return [indices]
+    batch_count = math.ceil(len(indices) / batch_size)
+    base, extra = divmod(len(indices), batch_count)
+    batches: list[list[int]] = []
+    start = 0
+    for n in range(batch_count):
+        size = base + (1 if n < extra else 0)
+        batches.append(indices[start:start + size])
+        start += size
+    return batches
+
+
 async def _apply_game_level_flow_pass(
     blocks: list[dict[str, Any]],
     game_context: dict[str, str],
     openai_client: Any,
     output: StageOutput,
     regen_context: RegenFailureContext | None = None,
+    *,
+    stats: RenderStats | None = None,
+    session: AsyncSession | None = None,
+    game_id: int | None = None,
 ) -> list[dict[str, Any]]:
     """Apply game-level flow pass to smooth transitions across blocks.
 
@@ -81,6 +117,9 @@ async def _apply_game_level_flow_pass(
         openai_client: OpenAI client instance
         output: StageOutput for logging
         regen_context: Optional quality-gate failure context for regen runs.
+        stats: Accumulates OpenAI calls and cache hits for this pass
+        session: Optional session for the response cache
+        game_id: Game ID the response cache is scoped to
 
     Returns:
         Blocks with smoothed narratives (or original if pass fails)
@@ -93,25 +132,27 @@ async def _apply_game_level_flow_pass(
 
     prompt = build_game_flow_pass_prompt(blocks, game_context, regen_context=regen_context)
 
+    # Low temperature for consistency, ~100 tokens per block
+    request = RenderRequest(prompt=prompt, temperature=0.2, max_tokens=100 * len(blocks))
     try:
-        # Low temperature for consistency, ~100 tokens per block
-        max_tokens = 100 * len(blocks)
-
-        response_json = await asyncio.to_thread(
-            openai_client.generate,
-            prompt=prompt,
-            temperature=0.2,  # Low for consistency
-            max_tokens=max_tokens,
+        (response_data,), pass_stats = await run_render_requests(
+            openai_client, [request], max_in_flight=1, session=session, game_id=game_id
         )
-        response_data = json.loads(response_json)
-
-    except json.JSONDecodeError as e:
-        output.add_log(f"Flow pass returned invalid JSON, using originals: {e}", level="warning")
-        return blocks
-
     except Exception as e:
         output.add_log(f"Flow pass failed, using originals: {e}", level="warning")
         return blocks
+    if stats is not None:
+        stats.openai_calls += pass_stats.openai_calls
+        stats.cache_hits += pass_stats.cache_hits
+
+    if isinstance(response_data, json.JSONDecodeError):
+        output.add_log(
+            f"Flow pass returned invalid JSON, using originals: {response_data}", level="warning"
+        )
+        return blocks
+    if isinstance(response_data, BaseException):
+        output.add_log(f"Flow pass failed, using originals: {response_data}", level="warning")
+        return blocks
 
     # Extract revised narratives
     block_items = response_data.get("blocks", [])
@@ -126,6 +167,9 @@ async def _apply_game_level_flow_pass(
         )
         return blocks
 
+    # Usable response: cache it so an identical pass is not re-requested
+    await store_render_responses(session, game_id, pass_stats.fresh)
+
     # Build lookup by block index
     narrative_lookup: dict[int, str] = {}
     for item in block_items:
@@ -148,7 +192,10 @@ async def _apply_game_level_flow_pass(
     return blocks
 
 
-async def execute_render_blocks(stage_input: StageInput) -> StageOutput:
+async def execute_render_blocks(
+    stage_input: StageInput,
+    session: AsyncSession | None = None,
+) -> StageOutput:
     """Execute the RENDER_BLOCKS stage.
 
     Generates narrative text for each block using OpenAI.
@@ -156,6 +203,7 @@ async def execute_render_blocks(stage_input: StageInput) -> StageOutput:
 
     Args:
         stage_input: Input containing previous_output with grouped blocks
+        session: Optional session; enables the OpenAI response cache
 
     Returns:
         StageOutput with blocks enriched with narratives
@@ -218,35 +266,56 @@ async def execute_render_blocks(stage_input: StageInput) -> StageOutput:
     if is_blowout:
         output.add_log("Processing blowout game with compressed narratives")
 
-    # Build prompt and call OpenAI; inject typed regen context into data layer.
-    prompt = build_block_prompt(blocks, game_context, pbp_events, regen_context=regen_context)
-
-    try:
-        # Estimate tokens: ~200 per block for 2-4 sentences
-        max_tokens = 200 * len(blocks)
-
-        response_json = await asyncio.to_thread(
-            openai_client.generate,
-            prompt=prompt,
+    # Build one prompt per batch and call OpenAI concurrently; inject typed
+    # regen context into the data layer.
+    settings = get_settings()
+    batches = _block_batches(blocks, settings.render_blocks_batch_size)
+    requests = [
+        RenderRequest(
+            prompt=build_block_prompt(
+                blocks,
+                game_context,
+                pbp_events,
+                regen_context=regen_context,
+                render_indices=set(batch) if len(batches) > 1 else None,
+            ),
             temperature=0.5,  # Higher for more natural prose variation
-            max_tokens=max_tokens,
+            max_tokens=200 * len(batch),  # ~200 per block for 2-4 sentences
         )
-        response_data = json.loads(response_json)
-
-    except json.JSONDecodeError as e:
-        # Fail fast
-        raise ValueError(f"OpenAI returned invalid JSON: {e}") from e
+        for batch in batches
+    ]
+    output.add_log(f"Rendering {len(blocks)} blocks in {len(batches)} batch(es)")
 
+    try:
+        results, stats = await run_render_requests(
+            openai_client,
+            requests,
+            max_in_flight=settings.render_blocks_max_in_flight,
+            session=session,
+            game_id=game_id,
+        )
     except Exception as e:
         # Fail fast
         raise ValueError(f"OpenAI call failed: {e}") from e
 
-    # Extract narratives from response
-    block_items = response_data.get("blocks", [])
-    if not block_items and isinstance(response_data, list):
-        block_items = response_data
-
-    output.add_log(f"Got {len(block_items)} narratives from OpenAI")
+    block_items: list[dict[str, Any]] = []
+    for response_data in results:
+        # Fail fast
+        if isinstance(response_data, json.JSONDecodeError):
+            raise ValueError(f"OpenAI returned invalid JSON: {response_data}") from response_data
+        if isinstance(response_data, BaseException):
+            raise ValueError(f"OpenAI call failed: {response_data}") from response_data
+
+        # Extract narratives from response
+        items = response_data.get("blocks", []) if isinstance(response_data, dict) else []
+        if not items and isinstance(response_data, list):
+            items = response_data
+        block_items.extend(items)
+
+    output.add_log(
+        f"Got {len(block_items)} narratives from OpenAI "
+        f"({stats.openai_calls} calls, {stats.cache_hits} cached)"
+    )
 
     # Build lookup by block index
     narrative_lookup: dict[int, str] = {}
@@ -298,6 +367,10 @@ async def execute_render_blocks(stage_input: StageInput) -> StageOutput:
 
     output.add_log(f"Total word count: {total_words}")
 
+    # Every block validated: only now cache the render responses, so a
+    # failing response is re-requested on retry rather than replayed.
+    await store_render_responses(session, game_id, stats.fresh)
+
     if all_warnings:
         output.add_log(f"Warnings: {len(all_warnings)}", level="warning")
         for w in all_warnings[:5]:
@@ -306,7 +379,14 @@ async def execute_render_blocks(stage_input: StageInput) -> StageOutput:
     # Game-level flow pass: smooth transitions across all blocks
     # This is a second OpenAI call that sees all blocks at once
     blocks = await _apply_game_level_flow_pass(
-        blocks, game_context, openai_client, output, regen_context=regen_context
+        blocks,
+        game_context,
+        openai_client,
+        output,
+        regen_context=regen_context,
+        stats=stats,
+        session=session,
+        game_id=game_id,
     )
 
     # Post-flow-pass: Ensure OT mentions weren't lost during flow pass
@@ -338,7 +418,8 @@ async def execute_render_blocks(stage_input: StageInput) -> StageOutput:
         "blocks": blocks,
         "block_count": len(blocks),
         "total_words": total_words,
-        "openai_calls": 2,  # Initial render + flow pass
+        "openai_calls": stats.openai_calls,  # Render batches + flow pass, cache hits excluded
+        "openai_cache_hits": stats.cache_hits,
         "errors": all_errors,
         "warnings": all_warnings,
         # Pass through
@@ -0,0 +1,163 @@
+"""Concurrent OpenAI request engine for RENDER_BLOCKS.
+
+Independent render requests (one per block batch) are sent concurrently
+on the event loop, with at most ``max_in_flight`` requests open at once.
+Clients exposing ``agenerate`` are awaited natively; plain ``generate``
+clients (test doubles, older callers) run in a worker thread.
+
+When a session is supplied, responses are content-addressed in
+``openai_response_cache``: all keys are looked up in one query before any
+request is sent. New responses are only returned (``RenderStats.fresh``);
+the caller stores them with :func:`store_render_responses` once they pass
+its validation, so a response that fails the stage is requested again on
+retry instead of being replayed from the cache. The store is one
+statement in a savepoint, so the shared session is never used
+concurrently and a failed cache write cannot abort the pipeline's
+transaction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from ...openai_client import RESPONSE_FORMAT, SYSTEM_PROMPT
+from ..profiling import completion_timer
+from .cache_helpers import (
+    CacheEntry,
+    get_cached_responses,
+    get_prompt_cache_key,
+    store_cached_responses,
+)
+
+if TYPE_CHECKING:
+    from ....db import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class RenderRequest:
+    """One chat-completion request."""
+
+    prompt: str
+    temperature: float
+    max_tokens: int
+
+
+@dataclass
+class RenderStats:
+    """What a batch of requests cost."""
+
+    openai_calls: int = 0
+    cache_hits: int = 0
+    # Responses fetched from OpenAI, not cached yet (see store_render_responses)
+    fresh: list[CacheEntry] = field(default_factory=list)
+
+
+def request_params(client: Any, request: RenderRequest) -> dict[str, Any]:
+    """The parameters ``client`` sends for ``request``, used as the cache key input."""
+    if hasattr(client, "request_params"):
+        return client.request_params(request.prompt, request.temperature, request.max_tokens)
+    return {
+        "model": getattr(client, "model", None),
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": request.prompt},
+        ],
+        "temperature": request.temperature,
+        "max_tokens": request.max_tokens,
+        "response_format": RESPONSE_FORMAT,
+    }
+
+
+async def _generate(client: Any, request: RenderRequest) -> str:
+    kwargs = {
+        "prompt": request.prompt,
+        "temperature": request.temperature,
+        "max_tokens": request.max_tokens,
+    }
+    with completion_timer():
+        if hasattr(client, "agenerate"):
+            return await client.agenerate(**kwargs)
+        return await asyncio.to_thread(client.generate, **kwargs)
+
+
+async def run_render_requests(
+    client: Any,
+    requests: list[RenderRequest],
+    *,
+    max_in_flight: int,
+    session: AsyncSession | None = None,
+    game_id: int | None = None,
+) -> tuple[list[Any], RenderStats]:
+    """Resolve ``requests`` from cache or OpenAI, concurrently.
+
+    Nothing is written to the cache here: responses fetched from OpenAI
+    come back in ``stats.fresh`` for :func:`store_render_responses`.
+
+    Returns:
+        One entry per request, in order: the parsed JSON response, or the
+        exception that request raised (``json.JSONDecodeError`` for
+        malformed output). Callers decide which failures are fatal.
+    """
+    stats = RenderStats()
+    keys = [get_prompt_cache_key(request_params(client, r)) for r in requests]
+    use_cache = session is not None and game_id is not None
+
+    cached: dict[str, Any] = {}
+    if use_cache:
+        cached = await get_cached_responses(session, game_id, set(keys))
+
+    semaphore = asyncio.Semaphore(max(1, max_in_flight))
+
+    async def _resolve(key: str, request: RenderRequest) -> Any:
+        if key in cached:
+            stats.cache_hits += 1
+            return cached[key]
+        async with semaphore:
+            stats.openai_calls += 1
+            raw = await _generate(client, request)
+        return json.loads(raw)
+
+    # Identical requests within one call are sent once.
+    unique: dict[str, RenderRequest] = dict(zip(keys, requests, strict=True))
+    resolved = await asyncio.gather(
+        *(_resolve(key, request) for key, request in unique.items()),
+        return_exceptions=True,
+    )
+    by_key = dict(zip(unique, resolved, strict=True))
+
+    if use_cache:
+        model = getattr(client, "model", None) or "unknown"
+        stats.fresh = [
+            CacheEntry(key=key, prompt=unique[key].prompt, response_data=result, model=model)
+            for key, result in by_key.items()
+            if key not in cached and not isinstance(result, BaseException)
+        ]
+
+    return [by_key[key] for key in keys], stats
+
+
+async def store_render_responses(
+    session: AsyncSession | None,
+    game_id: int | None,
+    entries: list[CacheEntry],
+) -> None:
+    """Cache responses the caller has validated, in a savepoint.
+
+    A failed write is logged and swallowed.
+    """
+    if session is None or game_id is None or not entries:
+        return
+    try:
+        async with session.begin_nested():
+            await store_cached_responses(session, game_id, entries)
+    except Exception as exc:
+        logger.warning(
+            "render_cache_store_failed",
+            extra={"game_id": game_id, "error": str(exc)},
+        )
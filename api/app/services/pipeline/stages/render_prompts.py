@@ -7,6 +7,7 @@ Pure computational helpers are in render_prompt_helpers.py.
 from __future__ import annotations
 
 import re
+from collections.abc import Collection
 from typing import TYPE_CHECKING, Any
 
 from .regen_context import RegenFailureContext
@@ -155,6 +156,7 @@ def build_block_prompt(
     game_context: dict[str, str],
     pbp_events: list[dict[str, Any]],
     regen_context: RegenFailureContext | None = None,
+    render_indices: Collection[int] | None = None,
 ) -> str:
     """Build the prompt for generating block narratives.
 
@@ -164,6 +166,9 @@ def build_block_prompt(
         pbp_events: PBP events for play descriptions
         regen_context: Optional quality-gate failure breakdown for regen runs.
             Injected into the volatile/data layer only; identity layer unchanged.
+        render_indices: When set, only these block indices are listed for
+            rendering. Game-level tone signals (close game, comeback,
+            sustained lead, overtime) are still computed from all blocks.
 
     Returns:
         Prompt string for OpenAI
@@ -415,6 +420,8 @@ def build_block_prompt(
 
     for block in blocks:
         block_idx = block["block_index"]
+        if render_indices is not None and block_idx not in render_indices:
+            continue
         role = block["role"]
         score_before = block["score_before"]
         score_after = block["score_after"]
@@ -34,6 +34,7 @@ from pathlib import Path
 from typing import Any
 
 from ....db import AsyncSession
+from ....utils.phrase_matcher import PhraseMatcher
 from ..metrics import increment_fallback, increment_regen
 from ..models import StageInput, StageOutput
 from .block_types import (
@@ -148,6 +149,7 @@ def _load_generic_phrases() -> tuple[list[str], float]:
 
 # Loaded once at module import; mutations require a process restart.
 _GENERIC_PHRASES, _DENSITY_THRESHOLD = _load_generic_phrases()
+_GENERIC_PHRASE_MATCHER = PhraseMatcher(_GENERIC_PHRASES)
 
 
 def _check_generic_phrase_density(
@@ -174,8 +176,7 @@ def _check_generic_phrase_density(
         if not narrative:
             continue
 
-        lower = narrative.lower()
-        matched = [p for p in _GENERIC_PHRASES if p in lower]
+        matched = _GENERIC_PHRASE_MATCHER.matched(narrative)
         if not matched:
             continue
 
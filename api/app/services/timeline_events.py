@@ -83,9 +83,9 @@ def build_pbp_events(
         )
         synthetic_ts = quarter_start + timedelta(seconds=real_elapsed)
 
-        # Extract team abbreviation from relationship
-        team_abbrev = None
-        if hasattr(play, "team") and play.team:
+        # Projected rows carry the abbreviation; ORM plays go through the relationship
+        team_abbrev = getattr(play, "team_abbreviation", None)
+        if team_abbrev is None and getattr(play, "team", None):
             team_abbrev = play.team.abbreviation
 
         event_payload = {
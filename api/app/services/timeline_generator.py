@@ -10,6 +10,12 @@ Builds PBP, social, and odds events for game timelines:
 
 Social and odds data are optional — the pipeline works with PBP alone.
 
+``generate_timeline_artifact`` builds one game from ORM rows.
+``generate_timeline_artifacts`` builds many: it loads only the columns
+the event builders read, fetches plays, posts and odds for a whole chunk
+of games per query round, and writes the chunk's artifacts with a single
+multi-row upsert.
+
 Related modules:
 - timeline_types.py: Constants, data classes, exceptions
 - timeline_phases.py: Phase utilities and timing calculations
@@ -24,17 +30,20 @@ See docs/TIMELINE_ASSEMBLY.md for the assembly contract.
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from collections import defaultdict
+from collections.abc import Sequence
+from datetime import datetime, timedelta
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 
 from ..db import AsyncSession
 from ..db.flow import SportsGameTimelineArtifact
 from ..db.odds import SportsGameOdds
 from ..db.social import TeamSocialPost
-from ..db.sports import SportsGame, SportsGamePlay
+from ..db.sports import GameStatus, SportsGame, SportsGamePlay, SportsLeague, SportsTeam
 from ..utils.datetime_utils import now_utc
 from .odds_events import build_odds_events
 from .social_events import build_social_events
@@ -45,12 +54,18 @@ from .timeline_types import (
     SOCIAL_POSTGAME_WINDOW_SECONDS,
     SOCIAL_PREGAME_WINDOW_SECONDS,
     TimelineArtifactPayload,
+    TimelineBatchResult,
     TimelineGenerationError,
 )
 from .timeline_validation import TimelineValidationError, validate_and_log
 
 logger = logging.getLogger(__name__)
 
+# Games per query round / artifact upsert in generate_timeline_artifacts
+TIMELINE_BATCH_SIZE = 100
+
+_SOCIAL_PHASES = ("pregame", "in_game")
+
 
 async def generate_timeline_artifact(
     session: AsyncSession,
@@ -105,26 +120,15 @@ async def generate_timeline_artifact(
             raise TimelineGenerationError("Missing play-by-play data", status_code=422)
 
         game_start = game.game_date
-        game_end = nba_game_end(game_start, plays)
-        has_overtime = any((play.quarter or 0) > 4 for play in plays)
-
-        # Compute phase boundaries for social event assignment
-        phase_boundaries = compute_phase_boundaries(game_start, has_overtime)
+        social_window_start, social_window_end = _social_window(game_start, plays)
 
         # Use TeamSocialPost (mapped, pregame/in_game only) — postgame never affects flows
-        social_window_start = game_start - timedelta(
-            seconds=SOCIAL_PREGAME_WINDOW_SECONDS
-        )
-        social_window_end = game_end + timedelta(
-            seconds=SOCIAL_POSTGAME_WINDOW_SECONDS
-        )
-
         posts_result = await session.execute(
             select(TeamSocialPost)
             .where(
                 TeamSocialPost.game_id == game_id,
                 TeamSocialPost.mapping_status == "mapped",
-                TeamSocialPost.game_phase.in_(["pregame", "in_game"]),
+                TeamSocialPost.game_phase.in_(_SOCIAL_PHASES),
                 TeamSocialPost.posted_at >= social_window_start,
                 TeamSocialPost.posted_at <= social_window_end,
             )
@@ -142,109 +146,17 @@ async def generate_timeline_artifact(
             },
         )
 
-        # Build PBP events
-        logger.info(
-            "timeline_artifact_phase_started",
-            extra={"game_id": game_id, "phase": "build_pbp_events"},
-        )
-        pbp_events = build_pbp_events(plays, game_start)
-        if not pbp_events:
-            raise TimelineGenerationError("Missing play-by-play data", status_code=422)
-        logger.info(
-            "timeline_artifact_phase_completed",
-            extra={
-                "game_id": game_id,
-                "phase": "build_pbp_events",
-                "events": len(pbp_events),
-            },
-        )
-
-        # Build social events with heuristic role classification
-        logger.info(
-            "timeline_artifact_phase_started",
-            extra={"game_id": game_id, "phase": "build_social_events"},
-        )
-        social_events = build_social_events(
-            posts,
-            phase_boundaries,
-            game_start=game_start,
-            league_code=league_code,
-            has_overtime=has_overtime,
-        )
-        logger.info(
-            "timeline_artifact_phase_completed",
-            extra={
-                "game_id": game_id,
-                "phase": "build_social_events",
-                "social_events": len(social_events),
-                "social_posts": len(posts),
-            },
-        )
-
-        # Build odds events
-        logger.info(
-            "timeline_artifact_phase_started",
-            extra={"game_id": game_id, "phase": "build_odds_events"},
-        )
         odds_result = await session.execute(
             select(SportsGameOdds)
             .where(SportsGameOdds.game_id == game_id)
             .order_by(SportsGameOdds.observed_at)
         )
         odds_rows = list(odds_result.scalars().all())
-        odds_events = build_odds_events(odds_rows, game_start, phase_boundaries)
 
-        timeline = merge_timeline_events(pbp_events, social_events, odds_events)
-        logger.info(
-            "timeline_artifact_phase_completed",
-            extra={
-                "game_id": game_id,
-                "phase": "build_odds_events",
-                "timeline_events": len(timeline),
-                "odds_rows": len(odds_rows),
-                "odds_events": len(odds_events),
-            },
+        timeline, game_analysis, summary_json, odds_event_count = _build_timeline(
+            game_id, league_code, game_start, plays, posts, odds_rows
         )
 
-        # Build summary and analysis metadata
-        game_analysis: dict[str, Any] = {"key_moments": [], "game_flow": {}}
-        summary_json: dict[str, Any] = {
-            "ai_generated": False,
-            "summary_text": "",
-            "highlights": [],
-        }
-
-        # Validation
-        logger.info(
-            "timeline_artifact_phase_started",
-            extra={"game_id": game_id, "phase": "validation"},
-        )
-        try:
-            validation_report = validate_and_log(timeline, summary_json, game_id)
-            logger.info(
-                "timeline_artifact_phase_completed",
-                extra={
-                    "game_id": game_id,
-                    "phase": "validation",
-                    "verdict": validation_report.verdict,
-                    "critical_passed": validation_report.critical_passed,
-                    "warnings": validation_report.warnings_count,
-                },
-            )
-        except TimelineValidationError as exc:
-            logger.error(
-                "timeline_artifact_validation_blocked",
-                extra={
-                    "game_id": game_id,
-                    "phase": "validation",
-                    "report": exc.report.to_dict(),
-                },
-            )
-            raise TimelineGenerationError(
-                f"Timeline validation failed: {exc}",
-                status_code=422,
-            ) from exc
-
         # Persist artifact
         logger.info(
             "timeline_artifact_phase_started",
@@ -295,7 +207,7 @@ async def generate_timeline_artifact(
                 "timeline_version": timeline_version,
                 "timeline_events": len(timeline),
                 "social_posts": len(posts),
-                "odds_events": len(odds_events),
+                "odds_events": odds_event_count,
                 "plays": len(plays),
             },
         )
@@ -315,3 +227,346 @@ async def generate_timeline_artifact(
             extra={"game_id": game_id, "timeline_version": timeline_version},
         )
         raise
+
+
+async def generate_timeline_artifacts(
+    session: AsyncSession,
+    game_ids: Sequence[int],
+    timeline_version: str = DEFAULT_TIMELINE_VERSION,
+    generated_by: str = "api",
+    generation_reason: str | None = None,
+    batch_size: int = TIMELINE_BATCH_SIZE,
+) -> TimelineBatchResult:
+    """
+    Generate and persist timeline artifacts for many games.
+
+    Produces the same artifacts as ``generate_timeline_artifact``, but
+    each chunk of ``batch_size`` games costs four projected reads
+    (games, plays, posts, odds) and one artifact upsert instead of five
+    ORM round trips per game.
+
+    Games that can't be built (missing, not final, no PBP, failed
+    validation) are reported in ``failures`` and don't stop the batch;
+    database errors propagate. The caller commits.
+    """
+    result = TimelineBatchResult()
+    unique_ids = list(dict.fromkeys(game_ids))
+    for offset in range(0, len(unique_ids), batch_size):
+        chunk = unique_ids[offset:offset + batch_size]
+        await _generate_chunk(
+            session, chunk, result, timeline_version, generated_by, generation_reason
+        )
+
+    logger.info(
+        "timeline_artifact_batch_generated",
+        extra={
+            "timeline_version": timeline_version,
+            "games": len(unique_ids),
+            "generated": len(result.artifacts),
+            "failed": len(result.failures),
+        },
+    )
+    return result
+
+
+async def _generate_chunk(
+    session: AsyncSession,
+    game_ids: list[int],
+    result: TimelineBatchResult,
+    timeline_version: str,
+    generated_by: str,
+    generation_reason: str | None,
+) -> None:
+    games_result = await session.execute(
+        select(
+            SportsGame.id,
+            SportsGame.game_date,
+            SportsGame.status,
+            SportsLeague.code.label("league_code"),
+        )
+        .outerjoin(SportsLeague, SportsGame.league_id == SportsLeague.id)
+        .where(SportsGame.id.in_(game_ids))
+    )
+    games = {row.id: row for row in games_result}
+
+    final_ids = []
+    for game_id in game_ids:
+        game = games.get(game_id)
+        if game is None:
+            result.failures[game_id] = "Game not found"
+        elif game.status != GameStatus.final.value:
+            result.failures[game_id] = "Game is not final"
+        else:
+            final_ids.append(game_id)
+    if not final_ids:
+        return
+
+    plays = await _grouped_rows(
+        session,
+        select(
+            SportsGamePlay.game_id,
+            SportsGamePlay.play_index,
+            SportsGamePlay.quarter,
+            SportsGamePlay.game_clock,
+            SportsGamePlay.description,
+            SportsGamePlay.play_type,
+            SportsGamePlay.player_name,
+            SportsGamePlay.home_score,
+            SportsGamePlay.away_score,
+            SportsTeam.abbreviation.label("team_abbreviation"),
+        )
+        .outerjoin(SportsTeam, SportsGamePlay.team_id == SportsTeam.id)
+        .where(SportsGamePlay.game_id.in_(final_ids))
+        .order_by(SportsGamePlay.game_id, SportsGamePlay.play_index),
+    )
+    posts = await _grouped_rows(
+        session,
+        select(
+            TeamSocialPost.game_id,
+            TeamSocialPost.id,
+            TeamSocialPost.posted_at,
+            TeamSocialPost.tweet_text,
+            TeamSocialPost.source_handle,
+            TeamSocialPost.media_type,
+        )
+        .where(
+            TeamSocialPost.game_id.in_(final_ids),
+            TeamSocialPost.mapping_status == "mapped",
+            TeamSocialPost.game_phase.in_(_SOCIAL_PHASES),
+        )
+        .order_by(TeamSocialPost.posted_at),
+    )
+    odds = await _grouped_rows(
+        session,
+        select(
+            SportsGameOdds.game_id,
+            SportsGameOdds.book,
+            SportsGameOdds.market_type,
+            SportsGameOdds.side,
+            SportsGameOdds.line,
+            SportsGameOdds.price,
+            SportsGameOdds.is_closing_line,
+            SportsGameOdds.observed_at,
+        )
+        .where(SportsGameOdds.game_id.in_(final_ids))
+        .order_by(SportsGameOdds.observed_at),
+    )
+
+    generated_at = now_utc()
+    built: list[TimelineArtifactPayload] = []
+    for game_id in final_ids:
+        game = games[game_id]
+        league_code = game.league_code or "UNK"
+        game_plays = plays.get(game_id, [])
+        try:
+            if not game_plays:
+                raise TimelineGenerationError("Missing play-by-play data", status_code=422)
+            window_start, window_end = _social_window(game.game_date, game_plays)
+            game_posts = [
+                post for post in posts.get(game_id, [])
+                if window_start <= post.posted_at <= window_end
+            ]
+            timeline, game_analysis, summary_json, _ = _build_timeline(
+                game_id,
+                league_code,
+                game.game_date,
+                game_plays,
+                game_posts,
+                odds.get(game_id, []),
+            )
+        except TimelineGenerationError as exc:
+            result.failures[game_id] = str(exc)
+            continue
+        built.append(
+            TimelineArtifactPayload(
+                game_id=game_id,
+                sport=league_code,
+                timeline_version=timeline_version,
+                generated_at=generated_at,
+                timeline=timeline,
+                summary=summary_json,
+                game_analysis=game_analysis,
+            )
+        )
+
+    if built:
+        await _store_artifacts(session, built, generated_by, generation_reason)
+        result.artifacts.extend(built)
+
+
+async def _grouped_rows(session: AsyncSession, stmt: Any) -> dict[int, list[Any]]:
+    """Run a projected query and group its rows by ``game_id``, keeping order."""
+    grouped: dict[int, list[Any]] = defaultdict(list)
+    for row in await session.execute(stmt):
+        grouped[row.game_id].append(row)
+    return grouped
+
+
+async def _store_artifacts(
+    session: AsyncSession,
+    artifacts: list[TimelineArtifactPayload],
+    generated_by: str,
+    generation_reason: str | None,
+) -> None:
+    """Upsert a chunk of artifacts with one multi-row statement."""
+    stmt = pg_insert(SportsGameTimelineArtifact).values(
+        [
+            {
+                "game_id": artifact.game_id,
+                "sport": artifact.sport,
+                "timeline_version": artifact.timeline_version,
+                "generated_at": artifact.generated_at,
+                "timeline_json": artifact.timeline,
+                "game_analysis_json": artifact.game_analysis,
+                "summary_json": artifact.summary,
+                "generated_by": generated_by,
+                "generation_reason": generation_reason,
+            }
+            for artifact in artifacts
+        ]
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_game_timeline_artifact_version",
+        set_={
+            "generated_at": stmt.excluded.generated_at,
+            "timeline_json": stmt.excluded.timeline_json,
+            "game_analysis_json": stmt.excluded.game_analysis_json,
+            "summary_json": stmt.excluded.summary_json,
+            "generated_by": stmt.excluded.generated_by,
+            "generation_reason": stmt.excluded.generation_reason,
+            "updated_at": func.now(),
+        },
+    )
+    await session.execute(stmt)
+
+
+def _social_window(game_start: datetime, plays: Sequence[Any]) -> tuple[datetime, datetime]:
+    """Posted-at window for social posts, widened past the computed game end."""
+    game_end = nba_game_end(game_start, plays)
+    return (
+        game_start - timedelta(seconds=SOCIAL_PREGAME_WINDOW_SECONDS),
+        game_end + timedelta(seconds=SOCIAL_POSTGAME_WINDOW_SECONDS),
+    )
+
+
+def _build_timeline(
+    game_id: int,
+    league_code: str,
+    game_start: datetime,
+    plays: Sequence[Any],
+    posts: Sequence[Any],
+    odds_rows: Sequence[Any],
+) -> tuple[list[dict[str, Any]], dict[str, Any], dict[str, Any], int]:
+    """Build, merge and validate one game's timeline.
+
+    Accepts ORM instances or projected rows exposing the same attributes.
+
+    Returns:
+        ``(timeline, game_analysis, summary_json, odds_event_count)``
+
+    Raises:
+        TimelineGenerationError: No PBP events, or validation failed.
+    """
+    has_overtime = any((play.quarter or 0) > 4 for play in plays)
+
+    # Compute phase boundaries for social event assignment
+    phase_boundaries = compute_phase_boundaries(game_start, has_overtime)
+
+    # Build PBP events
+    logger.info(
+        "timeline_artifact_phase_started",
+        extra={"game_id": game_id, "phase": "build_pbp_events"},
+    )
+    pbp_events = build_pbp_events(plays, game_start)
+    if not pbp_events:
+        raise TimelineGenerationError("Missing play-by-play data", status_code=422)
+    logger.info(
+        "timeline_artifact_phase_completed",
+        extra={
+            "game_id": game_id,
+            "phase": "build_pbp_events",
+            "events": len(pbp_events),
+        },
+    )
+
+    # Build social events with heuristic role classification
+    logger.info(
+        "timeline_artifact_phase_started",
+        extra={"game_id": game_id, "phase": "build_social_events"},
+    )
+    social_events = build_social_events(
+        posts,
+        phase_boundaries,
+        game_start=game_start,
+        league_code=league_code,
+        has_overtime=has_overtime,
+    )
+    logger.info(
+        "timeline_artifact_phase_completed",
+        extra={
+            "game_id": game_id,
+            "phase": "build_social_events",
+            "social_events": len(social_events),
+            "social_posts": len(posts),
+        },
+    )
+
+    # Build odds events
+    logger.info(
+        "timeline_artifact_phase_started",
+        extra={"game_id": game_id, "phase": "build_odds_events"},
+    )
+    odds_events = build_odds_events(odds_rows, game_start, phase_boundaries)
+
+    timeline = merge_timeline_events(pbp_events, social_events, odds_events)
+    logger.info(
+        "timeline_artifact_phase_completed",
+        extra={
+            "game_id": game_id,
+            "phase": "build_odds_events",
+            "timeline_events": len(timeline),
+            "odds_rows": len(odds_rows),
+            "odds_events": len(odds_events),
+        },
+    )
+
+    # Build summary and analysis metadata
+    game_analysis: dict[str, Any] = {"key_moments": [], "game_flow": {}}
+    summary_json: dict[str, Any] = {
+        "ai_generated": False,
+        "summary_text": "",
+        "highlights": [],
+    }
+
+    # Validation
+    logger.info(
+        "timeline_artifact_phase_started",
+        extra={"game_id": game_id, "phase": "validation"},
+    )
+    try:
+        validation_report = validate_and_log(timeline, summary_json, game_id)
+        logger.info(
+            "timeline_artifact_phase_completed",
+            extra={
+                "game_id": game_id,
+                "phase": "validation",
+                "verdict": validation_report.verdict,
+                "critical_passed": validation_report.critical_passed,
+                "warnings": validation_report.warnings_count,
+            },
+        )
+    except TimelineValidationError as exc:
+        logger.error(
+            "timeline_artifact_validation_blocked",
+            extra={
+                "game_id": game_id,
+                "phase": "validation",
+                "report": exc.report.to_dict(),
+            },
+        )
+        raise TimelineGenerationError(
+            f"Timeline validation failed: {exc}",
+            status_code=422,
+        ) from exc
+
+    return timeline, game_analysis, summary_json, len(odds_events)
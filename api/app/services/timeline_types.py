@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
@@ -133,6 +133,14 @@ class TimelineArtifactPayload:
     game_analysis: dict[str, Any]
 
 
+@dataclass
+class TimelineBatchResult:
+    """Outcome of a batched timeline generation run."""
+
+    artifacts: list[TimelineArtifactPayload] = field(default_factory=list)
+    failures: dict[int, str] = field(default_factory=dict)
+
+
 class TimelineGenerationError(Exception):
     """Raised when timeline generation fails."""
 
@@ -14,6 +14,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
+    from app.analytics.services.mlb_player_profiles import MLBProfileBatch
+
 logger = logging.getLogger(__name__)
 
 
@@ -280,54 +282,48 @@ async def try_build_ncaab_rotation_weights(
 # ---------------------------------------------------------------------------
 
 
-async def try_build_lineup_weights(
-    db: AsyncSession,
-    game,
-    game_context: dict,
-    home_profile: dict | None,
-    away_profile: dict | None,
-    rolling_window: int,
-) -> dict | None:
-    """Attempt to build per-batter lineup weights for an MLB game.
+async def resolve_lineup_inputs(db: AsyncSession, game) -> dict | None:
+    """Find both batting orders and starting pitchers for an MLB game.
 
     For final games: reconstructs batting order from PBP.
     For scheduled/pregame games: uses consensus lineup + rotation prediction.
 
-    Returns a dict with lineup metadata if weights were built successfully,
-    or ``None`` if the caller should fall back to team-level.
+    Returns ``{"home_batters", "away_batters", "home_sp_info",
+    "away_sp_info"}``, or ``None`` when either lineup is missing or has
+    fewer than 3 batters.
     """
     from app.analytics.services.lineup_fetcher import (
         fetch_consensus_lineup,
         get_team_external_ref,
     )
-    from app.analytics.services.mlb_rotation_service import (
-        predict_probable_starter,
-    )
     from app.analytics.services.lineup_reconstruction import (
         get_starting_pitcher,
+        load_game_lineup,
         reconstruct_lineup_from_pbp,
     )
-    from app.analytics.services.lineup_weights import (
-        build_lineup_weights,
-        pitching_metrics_from_profile,
-        regress_pitcher_profile,
+    from app.analytics.services.mlb_rotation_service import (
+        predict_probable_starter,
     )
-    from app.analytics.services.profile_service import get_pitcher_rolling_profile
-
-    fallback_pitcher = {
-        "strikeout_rate": 0.22, "walk_rate": 0.08,
-        "contact_suppression": 0.0, "power_suppression": 0.0,
-    }
 
     is_final = game.status in ("final", "archived")
+    stored: dict = {}
 
     # --- Get lineups ---
     if is_final:
-        home_lineup_data = await reconstruct_lineup_from_pbp(
-            db, game.id, game.home_team_id,
+        # Prefer the materialized lineup; reconstruct only when missing
+        for team_id in (game.home_team_id, game.away_team_id):
+            row = await load_game_lineup(db, game.id, team_id)
+            if row is not None and row.batters:
+                stored[team_id] = row
+        home_lineup_data = (
+            {"batters": stored[game.home_team_id].batters}
+            if game.home_team_id in stored
+            else await reconstruct_lineup_from_pbp(db, game.id, game.home_team_id)
         )
-        away_lineup_data = await reconstruct_lineup_from_pbp(
-            db, game.id, game.away_team_id,
+        away_lineup_data = (
+            {"batters": stored[game.away_team_id].batters}
+            if game.away_team_id in stored
+            else await reconstruct_lineup_from_pbp(db, game.id, game.away_team_id)
         )
     else:
         home_lineup_batters = await fetch_consensus_lineup(
@@ -370,8 +366,12 @@ async def try_build_lineup_weights(
     home_sp_info: dict | None = None
 
     if is_final:
-        away_sp_info = await get_starting_pitcher(db, game.id, game.away_team_id)
-        home_sp_info = await get_starting_pitcher(db, game.id, game.home_team_id)
+        away_sp_info = _stored_starter(stored.get(game.away_team_id)) or (
+            await get_starting_pitcher(db, game.id, game.away_team_id)
+        )
+        home_sp_info = _stored_starter(stored.get(game.home_team_id)) or (
+            await get_starting_pitcher(db, game.id, game.home_team_id)
+        )
     else:
         from app.utils.datetime_utils import to_et_date
         game_date = to_et_date(game.game_date) if game.game_date else None
@@ -396,16 +396,142 @@ async def try_build_lineup_weights(
             "away_sp_name": (away_sp_info or {}).get("name"),
         },
     )
+    return {
+        "home_batters": home_batters,
+        "away_batters": away_batters,
+        "home_sp_info": home_sp_info,
+        "away_sp_info": away_sp_info,
+    }
+
+
+def _stored_starter(row) -> dict | None:
+    """Starter info from a materialized ``MLBGameLineup`` row."""
+    if row is None or not row.starter_external_ref:
+        return None
+    return {
+        "external_ref": row.starter_external_ref,
+        "name": row.starter_name,
+        "avg_ip": float(row.starter_innings_pitched or 0),
+    }
+
+
+def _profile_refs(games_inputs: list[tuple]) -> tuple[dict[str, int], list[str]]:
+    """Batter ref -> team ID and pitcher refs across ``(game, inputs)`` pairs."""
+    batters: dict[str, int] = {}
+    pitchers: list[str] = []
+    for game, inputs in games_inputs:
+        for side, team_id in (("home", game.home_team_id), ("away", game.away_team_id)):
+            for slot in inputs[f"{side}_batters"]:
+                if slot.get("external_ref"):
+                    batters[slot["external_ref"]] = team_id
+            sp_info = inputs[f"{side}_sp_info"]
+            if sp_info:
+                pitchers.append(sp_info["external_ref"])
+    return batters, pitchers
+
+
+async def prefetch_mlb_lineups(
+    db: AsyncSession,
+    games,
+    rolling_window: int,
+) -> tuple[dict[int, dict], MLBProfileBatch]:
+    """Resolve lineups for a slate and load every player profile at once.
+
+    Returns lineup inputs by game ID (games without usable lineups are
+    absent) and one ``MLBProfileBatch`` covering all their batters and
+    starters, to pass to ``try_build_lineup_weights``.
+    """
+    from app.analytics.services.mlb_player_profiles import load_mlb_rolling_profiles
+
+    inputs_by_game: dict[int, dict] = {}
+    for game in games:
+        try:
+            inputs = await resolve_lineup_inputs(db, game)
+        except Exception as exc:
+            logger.warning(
+                "lineup_weight_build_exception",
+                extra={
+                    "game_id": game.id, "sport": "mlb",
+                    "error": str(exc), "error_type": type(exc).__name__,
+                },
+            )
+            await db.rollback()
+            continue
+        if inputs is not None:
+            inputs_by_game[game.id] = inputs
+
+    batters, pitchers = _profile_refs(
+        [(g, inputs_by_game[g.id]) for g in games if g.id in inputs_by_game]
+    )
+    profiles = await load_mlb_rolling_profiles(
+        db, batters=batters, pitchers=pitchers, rolling_window=rolling_window,
+    )
+    logger.info(
+        "batch_sim_lineup_profiles_loaded",
+        extra={
+            "games": len(inputs_by_game),
+            "batters": len(batters),
+            "pitchers": len(set(pitchers)),
+            "batters_resolved": len(profiles.batters),
+            "pitchers_resolved": len(profiles.pitchers),
+        },
+    )
+    return inputs_by_game, profiles
+
+
+async def try_build_lineup_weights(
+    db: AsyncSession,
+    game,
+    game_context: dict,
+    home_profile: dict | None,
+    away_profile: dict | None,
+    rolling_window: int,
+    *,
+    inputs: dict | None = None,
+    profiles: MLBProfileBatch | None = None,
+) -> dict | None:
+    """Attempt to build per-batter lineup weights for an MLB game.
+
+    ``inputs`` and ``profiles`` come from ``prefetch_mlb_lineups`` when
+    a whole slate is simulated; otherwise the lineups are resolved here
+    and this game's batter and pitcher profiles are loaded in one batch.
+
+    Returns a dict with lineup metadata if weights were built successfully,
+    or ``None`` if the caller should fall back to team-level.
+    """
+    from app.analytics.services.lineup_weights import (
+        build_lineup_weights,
+        pitching_metrics_from_profile,
+        regress_pitcher_profile,
+    )
+    from app.analytics.services.mlb_player_profiles import load_mlb_rolling_profiles
+
+    fallback_pitcher = {
+        "strikeout_rate": 0.22, "walk_rate": 0.08,
+        "contact_suppression": 0.0, "power_suppression": 0.0,
+    }
+
+    if inputs is None:
+        inputs = await resolve_lineup_inputs(db, game)
+        if inputs is None:
+            return None
+    if profiles is None:
+        batters, pitchers = _profile_refs([(game, inputs)])
+        profiles = await load_mlb_rolling_profiles(
+            db, batters=batters, pitchers=pitchers, rolling_window=rolling_window,
+        )
+
+    home_batters = inputs["home_batters"]
+    away_batters = inputs["away_batters"]
+    home_sp_info = inputs["home_sp_info"]
+    away_sp_info = inputs["away_sp_info"]
 
     # --- Get pitcher profiles ---
     away_sp_profile = fallback_pitcher
     home_sp_profile = fallback_pitcher
 
     if away_sp_info:
-        raw = await get_pitcher_rolling_profile(
-            away_sp_info["external_ref"], game.away_team_id,
-            rolling_window=rolling_window, db=db,
-        )
+        raw = profiles.pitchers.get(away_sp_info["external_ref"])
         if raw:
             away_sp_profile = regress_pitcher_profile(raw, away_sp_info.get("avg_ip"))
         else:
@@ -415,10 +541,7 @@ async def try_build_lineup_weights(
             )
 
     if home_sp_info:
-        raw = await get_pitcher_rolling_profile(
-            home_sp_info["external_ref"], game.home_team_id,
-            rolling_window=rolling_window, db=db,
-        )
+        raw = profiles.pitchers.get(home_sp_info["external_ref"])
         if raw:
             home_sp_profile = regress_pitcher_profile(raw, home_sp_info.get("avg_ip"))
         else:
@@ -438,6 +561,7 @@ async def try_build_lineup_weights(
         opposing_bullpen_profile=away_team_bullpen,
         team_profile=home_profile,
         rolling_window=rolling_window,
+        profiles=profiles.batters,
     )
     away_weights = await build_lineup_weights(
         db, away_batters, game.away_team_id,
@@ -445,6 +569,7 @@ async def try_build_lineup_weights(
         opposing_bullpen_profile=home_team_bullpen,
         team_profile=away_profile,
         rolling_window=rolling_window,
+        profiles=profiles.batters,
     )
 
     game_context["home_lineup_weights"] = home_weights["starter_weights"]
@@ -0,0 +1,281 @@
+"""On-disk cache of materialized training datasets.
+
+Experiment suites dispatch one training job per variant, and most
+variants share the same sport, model type, date range and rolling
+window. Building those records means scanning the full stats history,
+so the first job to ask for a slice stores the records here and every
+later training or backtest job for the same slice reads them back
+instead of querying the database.
+
+A dataset is a directory of NumPy ``.npy`` columns, one per leaf of
+the (nested) record dicts — ``("home_profile", "metrics", "k_rate")``,
+``("home_win",)`` and so on — plus a ``uint8`` state column that
+records whether each row has the key, a value, ``None`` or an empty
+dict. Each column keeps its own dtype (all-int columns are ``i8``);
+in a mixed int/float column the state marks which rows were ints, so
+records round-trip exactly, types included.
+
+Reading memory-maps each column and converts it straight to Python
+values, so no intermediate array copy is made, but every job still
+holds its own decoded records; what the cache saves is the database
+scan, not memory. Writers build the directory under a temporary name
+and rename it into place, and a per-key file lock makes concurrent
+jobs wait for the first load instead of repeating it.
+
+Entries expire after ``TRAINING_DATASET_CACHE_TTL_SECONDS`` so newly
+ingested games reach open-ended date ranges; ``0`` disables the cache.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from app.config import settings
+from app.tasks._training_data import load_training_data_from_db
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# Bump when the loaders change the record layout so stale entries are ignored.
+_FORMAT_VERSION = 2
+
+_DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / "models" / "datasets"
+
+# Per-row column states; _INT is a value stored in an f8 column that was an int
+_ABSENT, _VALUE, _NONE, _EMPTY, _INT = 0, 1, 2, 3, 4
+
+
+class _UnsupportedRecords(Exception):
+    """Records hold a value the columnar format can't represent."""
+
+
+def cache_dir() -> Path:
+    """Directory holding cached datasets (``TRAINING_DATASET_CACHE_DIR``)."""
+    configured = settings.training_dataset_cache_dir
+    return Path(configured) if configured else _DEFAULT_CACHE_DIR
+
+
+def dataset_key(
+    *,
+    sport: str,
+    model_type: str,
+    date_start: str | None,
+    date_end: str | None,
+    rolling_window: int,
+) -> str:
+    """Stable cache key for one set of loading parameters."""
+    params = json.dumps(
+        [_FORMAT_VERSION, sport.lower(), model_type, date_start, date_end, rolling_window],
+    )
+    digest = hashlib.sha256(params.encode()).hexdigest()[:20]
+    return f"{sport.lower()}_{model_type}_{digest}"
+
+
+async def load_training_records(
+    *,
+    sport: str,
+    model_type: str,
+    date_start: str | None,
+    date_end: str | None,
+    rolling_window: int = 30,
+    db: AsyncSession | None = None,
+) -> list[dict]:
+    """``load_training_data_from_db`` through the on-disk dataset cache.
+
+    Same arguments and result as the loader; a cache hit skips the
+    database entirely.
+    """
+    ttl = settings.training_dataset_cache_ttl_seconds
+
+    async def load() -> list[dict]:
+        return await load_training_data_from_db(
+            sport=sport,
+            model_type=model_type,
+            date_start=date_start,
+            date_end=date_end,
+            rolling_window=rolling_window,
+            db=db,
+        )
+
+    if ttl <= 0:
+        return await load()
+
+    key = dataset_key(
+        sport=sport,
+        model_type=model_type,
+        date_start=date_start,
+        date_end=date_end,
+        rolling_window=rolling_window,
+    )
+    root = cache_dir()
+    root.mkdir(parents=True, exist_ok=True)
+    path = root / key
+
+    with open(root / f"{key}.lock", "w") as lock:
+        await asyncio.to_thread(fcntl.flock, lock, fcntl.LOCK_EX)
+        try:
+            records = _read_fresh(path, ttl)
+            if records is not None:
+                logger.info(
+                    "training_dataset_cache_hit",
+                    extra={"key": key, "records": len(records)},
+                )
+                return records
+
+            records = await load()
+            try:
+                write_dataset(path, records)
+            except _UnsupportedRecords as exc:
+                logger.warning(
+                    "training_dataset_not_cached", extra={"key": key, "reason": str(exc)},
+                )
+            else:
+                logger.info(
+                    "training_dataset_cached", extra={"key": key, "records": len(records)},
+                )
+            return records
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+
+def _read_fresh(path: Path, ttl: int) -> list[dict] | None:
+    manifest = path / "manifest.json"
+    try:
+        if time.time() - manifest.stat().st_mtime > ttl:
+            return None
+        return read_dataset(path)
+    except (OSError, ValueError, KeyError) as exc:
+        if path.exists():
+            logger.warning(
+                "training_dataset_cache_unreadable", extra={"path": str(path), "error": str(exc)},
+            )
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Columnar encoding
+# ---------------------------------------------------------------------------
+
+
+def _leaves(record: dict, prefix: tuple = ()) -> list[tuple[tuple, Any]]:
+    """Flatten a record to ``(path, value)`` pairs; empty dicts are leaves."""
+    leaves: list[tuple[tuple, Any]] = []
+    for key, value in record.items():
+        if not isinstance(key, str):
+            raise _UnsupportedRecords(f"non-string key {key!r}")
+        path = (*prefix, key)
+        if isinstance(value, dict) and value:
+            leaves.extend(_leaves(value, path))
+        else:
+            leaves.append((path, value))
+    return leaves
+
+
+def _column_dtype(values: list) -> str:
+    kinds = {type(v) for v in values}
+    if not kinds or kinds == {bool}:
+        return "b1"
+    if kinds == {int}:
+        return "i8"
+    if kinds <= {int, float}:
+        return "f8"
+    if kinds == {str}:
+        return "U"
+    raise _UnsupportedRecords(f"unsupported value types {sorted(k.__name__ for k in kinds)}")
+
+
+def write_dataset(path: Path, records: list[dict]) -> None:
+    """Store ``records`` as memory-mappable columns at ``path``.
+
+    Raises:
+        _UnsupportedRecords: A value isn't a bool, int (within int64),
+            float, str, ``None`` or dict; nothing is written.
+    """
+    n = len(records)
+    states: dict[tuple, np.ndarray] = {}
+    values: dict[tuple, list] = {}
+    for row, record in enumerate(records):
+        for leaf, value in _leaves(record):
+            if leaf not in states:
+                states[leaf] = np.zeros(n, dtype=np.uint8)
+                values[leaf] = [None] * n
+            if value is None:
+                states[leaf][row] = _NONE
+            elif value == {}:
+                states[leaf][row] = _EMPTY
+            else:
+                states[leaf][row] = _VALUE
+                values[leaf][row] = value
+
+    columns = []
+    arrays = []
+    for leaf, state in states.items():
+        present = [v for v, s in zip(values[leaf], state, strict=True) if s == _VALUE]
+        dtype = _column_dtype(present)
+        fill = "" if dtype == "U" else 0
+        try:
+            data = np.array(
+                [v if s == _VALUE else fill for v, s in zip(values[leaf], state, strict=True)],
+                dtype=dtype,
+            )
+        except OverflowError as exc:
+            raise _UnsupportedRecords(f"{'.'.join(leaf)}: {exc}") from exc
+        if dtype == "f8":
+            for row, value in enumerate(values[leaf]):
+                if state[row] == _VALUE and type(value) is int:
+                    state[row] = _INT
+        columns.append({"path": list(leaf), "dtype": dtype})
+        arrays.append((state, data))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(tempfile.mkdtemp(dir=path.parent, prefix=f".{path.name}."))
+    try:
+        for i, (state, data) in enumerate(arrays):
+            np.save(tmp / f"c{i}.state.npy", state)
+            np.save(tmp / f"c{i}.npy", data)
+        # The manifest is written last: its presence marks a complete dataset
+        (tmp / "manifest.json").write_text(json.dumps({"rows": n, "columns": columns}))
+        if path.exists():
+            shutil.rmtree(path)
+        os.rename(tmp, path)
+    except BaseException:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+
+
+def read_dataset(path: Path) -> list[dict]:
+    """Rebuild the records stored by ``write_dataset``."""
+    manifest = json.loads((path / "manifest.json").read_text())
+    records: list[dict] = [{} for _ in range(manifest["rows"])]
+    for i, column in enumerate(manifest["columns"]):
+        leaf = tuple(column["path"])
+        parents, name = leaf[:-1], leaf[-1]
+        states = np.load(path / f"c{i}.state.npy", mmap_mode="r").tolist()
+        data = np.load(path / f"c{i}.npy", mmap_mode="r").tolist()
+        for row, s in enumerate(states):
+            if s == _ABSENT:
+                continue
+            target = records[row]
+            for part in parents:
+                target = target.setdefault(part, {})
+            if s == _VALUE:
+                target[name] = data[row]
+            elif s == _INT:
+                target[name] = int(data[row])
+            else:
+                target[name] = None if s == _NONE else {}
+    return records
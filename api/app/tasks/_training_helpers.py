@@ -50,6 +50,56 @@ def build_rolling_profile(
     return aggregated
 
 
+def build_point_in_time_profiles(
+    team_games: list[tuple[str, object]],
+    before_dates: list[str],
+    *,
+    window: int,
+    min_games: int = 5,
+) -> dict[str, dict | None]:
+    """``build_rolling_profile`` for many cutoffs in one chronological sweep.
+
+    Each game's stats are converted once and kept in a sliding window
+    while the sweep walks ``team_games`` forward, instead of rescanning
+    and reconverting the whole history per cutoff. Profiles are
+    identical to calling ``build_rolling_profile`` per date.
+
+    Args:
+        team_games: Chronologically sorted list of (date_str, MLBGameAdvancedStats).
+        before_dates: Cutoffs to build profiles for (any order).
+        window: Maximum number of prior games per profile.
+        min_games: Minimum prior games required; the cutoff maps to
+            ``None`` if insufficient.
+
+    Returns:
+        Mapping of each cutoff to its profile (or ``None``).
+    """
+    from collections import deque
+
+    profiles: dict[str, dict | None] = {}
+    recent: deque[dict] = deque(maxlen=window)
+    prior_count = 0
+    idx = 0
+    for before_date in sorted(set(before_dates)):
+        while idx < len(team_games) and team_games[idx][0] < before_date:
+            recent.append(stats_to_metrics(team_games[idx][1]))
+            prior_count += 1
+            idx += 1
+
+        if prior_count < min_games:
+            profiles[before_date] = None
+            continue
+
+        aggregated: dict[str, float] = {}
+        for key in recent[0]:
+            values = [m[key] for m in recent if key in m]
+            if values:
+                aggregated[key] = round(sum(values) / len(values), 4)
+        profiles[before_date] = aggregated
+
+    return profiles
+
+
 # ---------------------------------------------------------------------------
 # Stats → metrics conversion
 # ---------------------------------------------------------------------------
@@ -31,6 +31,7 @@ from app.tasks._batch_sim_helpers import (
     serialize_lineup_meta,
 )
 from app.tasks._batch_sim_weights import (
+    prefetch_mlb_lineups,
     try_build_lineup_weights,
     try_build_nba_rotation_weights,
     try_build_ncaab_rotation_weights,
@@ -297,6 +298,22 @@ async def _execute_batch_sim(
     engine = SimulationEngine(sport)
     sim_results = []
 
+    # MLB: resolve every lineup first so all player profiles on the slate
+    # load in one set-based pass instead of a few queries per batter.
+    mlb_lineups: dict[int, dict] = {}
+    mlb_profiles = None
+    if sport_lower == "mlb":
+        try:
+            async with sf() as lineup_db:
+                mlb_lineups, mlb_profiles = await prefetch_mlb_lineups(
+                    lineup_db, upcoming_games, rolling_window,
+                )
+        except Exception as exc:
+            logger.warning(
+                "lineup_profile_prefetch_failed",
+                extra={"error": str(exc), "error_type": type(exc).__name__},
+            )
+
     for game in upcoming_games:
         home_team = teams.get(game.home_team_id)
         away_team = teams.get(game.away_team_id)
@@ -354,10 +371,17 @@ async def _execute_batch_sim(
                         lineup_db, game, game_context,
                         home_profile, away_profile, rolling_window,
                     )
-                else:
+                elif mlb_profiles is None:
+                    lineup_meta = await try_build_lineup_weights(
+                        lineup_db, game, game_context,
+                        home_profile, away_profile, rolling_window,
+                    )
+                    lineup_mode = lineup_meta is not None
+                elif game.id in mlb_lineups:
                     lineup_meta = await try_build_lineup_weights(
                         lineup_db, game, game_context,
                         home_profile, away_profile, rolling_window,
+                        inputs=mlb_lineups[game.id], profiles=mlb_profiles,
                     )
                     lineup_mode = lineup_meta is not None
         except Exception as exc:
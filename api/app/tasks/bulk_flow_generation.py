@@ -3,18 +3,24 @@
 This task runs in the api-worker container and processes bulk game flow
 generation requests asynchronously. Job state is persisted in the
 database for consistency and survives worker restarts.
+
+Eligible games are selected with one query, then their pipelines run
+concurrently (``BULK_FLOW_MAX_CONCURRENCY`` at a time), each on its own
+session. Progress and throughput are written to the job row as games
+finish.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, exists, select
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import selectinload
 
 from ..celery_app import celery_app
 from ..config import settings
@@ -36,6 +42,207 @@ from ..services.pipeline import PipelineExecutor
 
 logger = logging.getLogger(__name__)
 
+# Job-row progress is committed at most this often while games complete.
+_PROGRESS_INTERVAL_SECONDS = 2.0
+
+
+@dataclass
+class _Progress:
+    """Running tally for one job, written back to the job row."""
+
+    total: int
+    started: float = field(default_factory=time.monotonic)
+    done: int = 0
+    successful: int = 0
+    failed: int = 0
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+    def games_per_minute(self) -> float:
+        elapsed = time.monotonic() - self.started
+        return self.done / elapsed * 60 if elapsed > 0 else 0.0
+
+
+def _eligible_games_query(job: BulkFlowGenerationJob) -> Select:
+    """IDs of final games in the job's window that have PBP, oldest first.
+
+    One query: PBP presence is an EXISTS semi-join and ``max_games`` is a
+    SQL LIMIT, instead of a count query per candidate game.
+    """
+    query = (
+        select(SportsGame.id)
+        .join(SportsLeague)
+        .where(
+            and_(
+                SportsGame.game_date >= job.start_date,
+                SportsGame.game_date <= job.end_date,
+                SportsGame.status == "final",
+                exists().where(SportsGamePlay.game_id == SportsGame.id),
+            )
+        )
+        .order_by(SportsGame.game_date, SportsGame.id)
+    )
+
+    # Filter by leagues if specified
+    if job.leagues:
+        query = query.where(SportsLeague.code.in_(job.leagues))
+
+    # Exclude games that already have flows (unless force regenerate)
+    if not job.force_regenerate:
+        existing_flow_game_ids = select(SportsGameFlow.game_id).where(
+            SportsGameFlow.moments_json.isnot(None)
+        )
+        query = query.where(SportsGame.id.notin_(existing_flow_game_ids))
+
+    if job.max_games is not None and job.max_games > 0:
+        query = query.limit(job.max_games)
+
+    return query
+
+
+async def _generate_one(
+    session_factory: async_sessionmaker[AsyncSession],
+    semaphore: asyncio.Semaphore,
+    game_id: int,
+) -> tuple[int, str | None]:
+    """Run the full pipeline for one game on its own session.
+
+    Returns:
+        ``(game_id, error)`` — ``error`` is None on success
+    """
+    async with semaphore, session_factory() as session:
+        try:
+            executor = PipelineExecutor(session)
+            await executor.run_full_pipeline(game_id=game_id, triggered_by="bulk_celery")
+            await session.commit()
+            return game_id, None
+        except Exception as e:
+            await session.rollback()
+            return game_id, str(e)
+
+
+def _write_progress(job: BulkFlowGenerationJob, progress: _Progress) -> None:
+    job.current_game = progress.done
+    job.successful = progress.successful
+    job.failed = progress.failed
+    job.errors_json = list(progress.errors)
+
+
+async def _generate_games(
+    session: AsyncSession,
+    session_factory: async_sessionmaker[AsyncSession],
+    job: BulkFlowGenerationJob,
+    game_ids: list[int],
+    max_concurrency: int,
+) -> _Progress:
+    """Run pipelines for ``game_ids`` with at most ``max_concurrency`` at once.
+
+    ``session`` owns the job row and is only touched from this coroutine;
+    each pipeline gets its own session so games never share a transaction.
+    """
+    progress = _Progress(total=len(game_ids))
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    tasks = [
+        asyncio.create_task(_generate_one(session_factory, semaphore, game_id))
+        for game_id in game_ids
+    ]
+    last_write = progress.started
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            game_id, error = await next_done
+            progress.done += 1
+            if error is None:
+                progress.successful += 1
+            else:
+                progress.failed += 1
+                progress.errors.append({"game_id": game_id, "error": error})
+                logger.warning(f"Job {job.id}: Failed game {game_id}: {error}")
+
+            now = time.monotonic()
+            if now - last_write >= _PROGRESS_INTERVAL_SECONDS or progress.done == progress.total:
+                last_write = now
+                _write_progress(job, progress)
+                await session.commit()
+                logger.info(
+                    "bulk_flow_progress",
+                    extra={
+                        "job_id": job.id,
+                        "done": progress.done,
+                        "total": progress.total,
+                        "failed": progress.failed,
+                        "games_per_minute": round(progress.games_per_minute(), 1),
+                    },
+                )
+    finally:
+        for task in tasks:
+            task.cancel()
+    return progress
+
+
+async def _run_job(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_id: int,
+    max_concurrency: int,
+) -> None:
+    async with session_factory() as session:
+        # Load the job record
+        job_result = await session.execute(
+            select(BulkFlowGenerationJob).where(BulkFlowGenerationJob.id == job_id)
+        )
+        job = job_result.scalar_one_or_none()
+        if not job:
+            logger.error(f"Bulk job {job_id} not found")
+            return
+
+        # Mark job as running
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        await session.commit()
+
+        logger.info(f"Starting bulk flow generation job {job_id}")
+
+        try:
+            result = await session.execute(_eligible_games_query(job))
+            game_ids = list(result.scalars().all())
+
+            job.total_games = len(game_ids)
+            await session.commit()
+
+            logger.info(
+                f"Job {job_id}: Found {len(game_ids)} games with PBP, "
+                f"running {max_concurrency} at a time"
+            )
+
+            progress = await _generate_games(
+                session, session_factory, job, game_ids, max_concurrency
+            )
+
+            # Mark job as completed
+            _write_progress(job, progress)
+            job.status = "completed"
+            job.finished_at = datetime.utcnow()
+            await session.commit()
+
+            logger.info(
+                f"Job {job_id} completed: "
+                f"{job.successful} successful, {job.failed} failed, "
+                f"{job.skipped} skipped "
+                f"({progress.games_per_minute():.1f} games/min)"
+            )
+
+        except Exception as e:
+            # Mark job as failed on unexpected error
+            logger.exception(f"Job {job_id} failed with unexpected error: {e}")
+            await session.rollback()
+            job_result = await session.execute(
+                select(BulkFlowGenerationJob).where(BulkFlowGenerationJob.id == job_id)
+            )
+            job = job_result.scalar_one_or_none()
+            if job:
+                job.status = "failed"
+                job.finished_at = datetime.utcnow()
+                job.errors_json = [{"error": str(e)}]
+                await session.commit()
+
 
 async def _run_bulk_generation_async(job_id: int) -> None:
     """Async implementation of bulk game flow generation.
@@ -44,11 +251,20 @@ async def _run_bulk_generation_async(job_id: int) -> None:
     the "Future attached to a different loop" error that occurs when reusing
     an engine created in a different context (e.g., module import time).
 
+    Games run ``BULK_FLOW_MAX_CONCURRENCY`` at a time, so the pool is sized
+    for that many pipeline sessions plus the one holding the job row.
+
     Args:
         job_id: Database ID of the BulkFlowGenerationJob record
     """
+    max_concurrency = max(1, settings.bulk_flow_max_concurrency)
     # Create fresh engine bound to this event loop
-    engine = create_async_engine(settings.database_url, echo=False, future=True)
+    engine = create_async_engine(
+        settings.database_url,
+        echo=False,
+        future=True,
+        pool_size=max_concurrency + 1,
+    )
     session_factory = async_sessionmaker(
         engine,
         class_=AsyncSession,
@@ -58,148 +274,7 @@ async def _run_bulk_generation_async(job_id: int) -> None:
     )
 
     try:
-        async with session_factory() as session:
-            # Load the job record
-            job_result = await session.execute(
-                select(BulkFlowGenerationJob).where(
-                    BulkFlowGenerationJob.id == job_id
-                )
-            )
-            job = job_result.scalar_one_or_none()
-            if not job:
-                logger.error(f"Bulk job {job_id} not found")
-                return
-
-            # Mark job as running
-            job.status = "running"
-            job.started_at = datetime.utcnow()
-            await session.commit()
-
-            logger.info(f"Starting bulk flow generation job {job_id}")
-
-            try:
-                # Query games in the date range for specified leagues
-                query = (
-                    select(SportsGame)
-                    .join(SportsLeague)
-                    .options(
-                        selectinload(SportsGame.home_team),
-                        selectinload(SportsGame.away_team),
-                    )
-                    .where(
-                        and_(
-                            SportsGame.game_date >= job.start_date,
-                            SportsGame.game_date <= job.end_date,
-                            SportsGame.status == "final",
-                        )
-                    )
-                    .order_by(SportsGame.game_date)
-                )
-
-                # Filter by leagues if specified
-                if job.leagues:
-                    query = query.where(SportsLeague.code.in_(job.leagues))
-
-                # Exclude games that already have flows (unless force regenerate)
-                if not job.force_regenerate:
-                    existing_flow_game_ids = (
-                        select(SportsGameFlow.game_id).where(
-                            SportsGameFlow.moments_json.isnot(None)
-                        )
-                    )
-                    query = query.where(
-                        SportsGame.id.notin_(existing_flow_game_ids)
-                    )
-
-                result = await session.execute(query)
-                games = result.scalars().all()
-
-                # Filter to games that have PBP data
-                games_with_pbp = []
-                for game in games:
-                    pbp_count = await session.execute(
-                        select(func.count(SportsGamePlay.id)).where(
-                            SportsGamePlay.game_id == game.id
-                        )
-                    )
-                    if (pbp_count.scalar() or 0) > 0:
-                        games_with_pbp.append(game)
-
-                # Apply max_games limit if specified
-                if job.max_games is not None and job.max_games > 0:
-                    games_with_pbp = games_with_pbp[: job.max_games]
-                    logger.info(
-                        f"Job {job_id}: Limited to {job.max_games} games (max_games)"
-                    )
-
-                job.total_games = len(games_with_pbp)
-                await session.commit()
-
-                logger.info(f"Job {job_id}: Found {len(games_with_pbp)} games with PBP")
-
-                errors_list: list[dict[str, Any]] = []
-
-                for i, game in enumerate(games_with_pbp):
-                    job.current_game = i + 1
-                    await session.commit()
-
-                    # Run the full pipeline
-                    try:
-                        executor = PipelineExecutor(session)
-                        await executor.run_full_pipeline(
-                            game_id=game.id,
-                            triggered_by="bulk_celery",
-                        )
-                        await session.commit()
-                        job.successful += 1
-                        await session.commit()
-                        logger.info(
-                            f"Job {job_id}: Generated game flow for game {game.id}"
-                        )
-                    except Exception as e:
-                        await session.rollback()
-                        # Re-fetch job after rollback
-                        job_result = await session.execute(
-                            select(BulkFlowGenerationJob).where(
-                                BulkFlowGenerationJob.id == job_id
-                            )
-                        )
-                        job = job_result.scalar_one()
-                        job.failed += 1
-                        errors_list.append({"game_id": game.id, "error": str(e)})
-                        await session.commit()
-                        logger.warning(f"Job {job_id}: Failed game {game.id}: {e}")
-
-                    # Small delay to avoid overwhelming the system
-                    await asyncio.sleep(0.2)
-
-                # Mark job as completed
-                job.status = "completed"
-                job.finished_at = datetime.utcnow()
-                job.errors_json = errors_list
-                await session.commit()
-
-                logger.info(
-                    f"Job {job_id} completed: "
-                    f"{job.successful} successful, {job.failed} failed, "
-                    f"{job.skipped} skipped"
-                )
-
-            except Exception as e:
-                # Mark job as failed on unexpected error
-                logger.exception(f"Job {job_id} failed with unexpected error: {e}")
-                await session.rollback()
-                job_result = await session.execute(
-                    select(BulkFlowGenerationJob).where(
-                        BulkFlowGenerationJob.id == job_id
-                    )
-                )
-                job = job_result.scalar_one_or_none()
-                if job:
-                    job.status = "failed"
-                    job.finished_at = datetime.utcnow()
-                    job.errors_json = [{"error": str(e)}]
-                    await session.commit()
+        await _run_job(session_factory, job_id, max_concurrency)
     finally:
         # Clean up the engine to avoid connection leaks
         await engine.dispose()
@@ -7,6 +7,7 @@ historical replay, and ranks the results.
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import itertools
 import logging
 import traceback
@@ -18,6 +19,13 @@ from app.tasks._task_infra import _complete_job_run, _start_job_run, _task_db
 
 logger = logging.getLogger(__name__)
 
+# Training job statuses that are not yet final.
+_ACTIVE_JOB_STATUSES = ("pending", "queued", "running")
+# Safety-net status sweep while waiting on completion notifications, and
+# the polling interval when LISTEN is unavailable.
+_FALLBACK_SWEEP_SECONDS = 60.0
+_POLL_SECONDS = 10.0
+
 
 @celery_app.task(
     name="run_experiment_suite",
@@ -133,8 +141,8 @@ async def _run_suite(suite_id: int, celery_task_id: str | None = None) -> dict:
                 extra={"suite_id": suite_id, "count": len(variant_jobs)},
             )
 
-            # Poll until all variants are done — progress updated in DB inline
-            completed, failed = await _poll_variant_completion(
+            # Wait until all variants are done — progress updated in DB inline
+            completed, failed = await _await_variant_completion(
                 sf, suite_id, variant_jobs,
             )
 
@@ -274,83 +282,142 @@ async def _dispatch_variant_training(
     return variant.id, job_id, celery_task_id
 
 
-async def _poll_variant_completion(
+async def _await_variant_completion(
     sf: Any,
     suite_id: int,
     variant_jobs: list[tuple[int, int, str]],
     *,
-    poll_interval: float = 10.0,
+    fallback_interval: float = _FALLBACK_SWEEP_SECONDS,
 ) -> tuple[int, int]:
-    """Poll training jobs until all variants are complete.
+    """Wait for the variants' training jobs to finish.
+
+    Training jobs ``NOTIFY`` on ``TRAINING_DONE_CHANNEL`` when they
+    commit a terminal status; each notification for one of this suite's
+    jobs wakes the coordinator, which settles every finished job with
+    one bulk status query. The same sweep also runs every
+    ``fallback_interval`` seconds (``_POLL_SECONDS`` if LISTEN isn't
+    available) so a lost notification only delays the suite.
 
-    Checks job status in DB every poll_interval seconds.
     Returns (completed_count, failed_count).
     """
+    pending = {job_id: variant_id for variant_id, job_id, _ in variant_jobs}
+    counts = {"completed": 0, "failed": 0}
+    wake = asyncio.Event()
+
+    def on_notify(conn: Any, pid: int, channel: str, payload: str) -> None:
+        if payload.isdigit() and int(payload) in pending:
+            wake.set()
+
+    conn = await _listen_for_training_jobs(on_notify)
+    interval = fallback_interval if conn is not None else _POLL_SECONDS
+    try:
+        while pending:
+            wake.clear()
+            await _settle_finished_jobs(sf, suite_id, pending, counts)
+            logger.info(
+                "experiment_progress",
+                extra={"suite_id": suite_id, "pending": len(pending), **counts},
+            )
+            if not pending:
+                break
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(wake.wait(), timeout=interval)
+    finally:
+        if conn is not None:
+            try:
+                await conn.close()
+            except Exception:
+                logger.debug("experiment_listen_close_failed", exc_info=True)
+
+    return counts["completed"], counts["failed"]
+
+
+async def _listen_for_training_jobs(callback: Any) -> Any:
+    """Open a LISTEN connection for training completions, or ``None``."""
+    import asyncpg
+
+    from app.realtime.listener import listen_dsn
+    from app.tasks.training_tasks import TRAINING_DONE_CHANNEL
+
+    try:
+        conn = await asyncpg.connect(listen_dsn())
+        await conn.add_listener(TRAINING_DONE_CHANNEL, callback)
+    except Exception as exc:
+        logger.warning("experiment_listen_unavailable", extra={"error": str(exc)})
+        return None
+    return conn
+
+
+async def _settle_finished_jobs(
+    sf: Any,
+    suite_id: int,
+    pending: dict[int, int],
+    counts: dict[str, int],
+) -> None:
+    """Copy terminal job statuses onto their variants with bulk queries.
+
+    Finished jobs are removed from ``pending`` (job_id -> variant_id)
+    and tallied into ``counts``.
+    """
+    from sqlalchemy import select
+
     from app.db.analytics import (
         AnalyticsExperimentSuite,
         AnalyticsExperimentVariant,
         AnalyticsTrainingJob,
     )
 
-    pending = {job_id: variant_id for variant_id, job_id, _ in variant_jobs}
-    completed = 0
-    failed = 0
-
-    while pending:
-        await asyncio.sleep(poll_interval)
-
-        async with sf() as db:
-            for job_id, variant_id in list(pending.items()):
-                job = await db.get(AnalyticsTrainingJob, job_id)
-
-                if job is None:
-                    # Job row deleted or corrupted — mark variant failed, remove from pending
-                    v = await db.get(AnalyticsExperimentVariant, variant_id)
-                    if v and v.status not in ("completed", "failed"):
-                        v.status = "failed"
-                        v.error_message = f"Training job {job_id} not found"
-                        v.completed_at = datetime.now(UTC)
-                        failed += 1
-                    del pending[job_id]
-                    continue
-
-                if job.status in ("pending", "queued", "running"):
-                    continue
-
-                # Job finished — update variant
-                v = await db.get(AnalyticsExperimentVariant, variant_id)
-                if v and v.status not in ("completed", "failed"):
-                    if job.status == "completed":
-                        v.status = "completed"
-                        v.model_id = job.model_id
-                        v.training_metrics = job.metrics
-                        completed += 1
-                    else:
-                        v.status = "failed"
-                        v.error_message = (job.error_message or "unknown")[:500]
-                        failed += 1
-                    v.completed_at = datetime.now(UTC)
-
-                del pending[job_id]
-
-            # Update suite progress
-            s = await db.get(AnalyticsExperimentSuite, suite_id)
-            if s:
-                s.completed_variants = completed
-                s.failed_variants = failed
-            await db.commit()
-
-        logger.info(
-            "experiment_poll",
-            extra={
-                "suite_id": suite_id,
-                "completed": completed,
-                "failed": failed,
-                "pending": len(pending),
-            },
+    async with sf() as db:
+        rows = await db.execute(
+            select(
+                AnalyticsTrainingJob.id,
+                AnalyticsTrainingJob.status,
+                AnalyticsTrainingJob.model_id,
+                AnalyticsTrainingJob.metrics,
+                AnalyticsTrainingJob.error_message,
+            ).where(AnalyticsTrainingJob.id.in_(list(pending)))
         )
-
-    return completed, failed
+        jobs = {row.id: row for row in rows}
+        finished = {
+            job_id: jobs.get(job_id)
+            for job_id in pending
+            if job_id not in jobs or jobs[job_id].status not in _ACTIVE_JOB_STATUSES
+        }
+        if not finished:
+            return
+
+        variant_rows = await db.execute(
+            select(AnalyticsExperimentVariant).where(
+                AnalyticsExperimentVariant.id.in_([pending[j] for j in finished])
+            )
+        )
+        variants = {v.id: v for v in variant_rows.scalars()}
+        now = datetime.now(UTC)
+        for job_id, job in finished.items():
+            v = variants.get(pending.pop(job_id))
+            if v is None or v.status in ("completed", "failed"):
+                continue
+            if job is None:
+                # Job row deleted or corrupted
+                v.status = "failed"
+                v.error_message = f"Training job {job_id} not found"
+                counts["failed"] += 1
+            elif job.status == "completed":
+                v.status = "completed"
+                v.model_id = job.model_id
+                v.training_metrics = job.metrics
+                counts["completed"] += 1
+            else:
+                v.status = "failed"
+                v.error_message = (job.error_message or "unknown")[:500]
+                counts["failed"] += 1
+            v.completed_at = now
+
+        s = await db.get(AnalyticsExperimentSuite, suite_id)
+        if s:
+            s.completed_variants = counts["completed"]
+            s.failed_variants = counts["failed"]
+        await db.commit()
 
 
 async def _build_leaderboard(
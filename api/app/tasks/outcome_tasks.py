@@ -2,13 +2,17 @@
 
 Records actual game outcomes against stored predictions, and detects
 model accuracy degradation by comparing recent vs baseline Brier scores.
+
+Both run set-based: outcomes are resolved with one ``UPDATE ... FROM
+sports_games`` and the degradation windows are SQL aggregates, so only
+counts and summary numbers reach the worker however long the
+prediction history grows.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from datetime import UTC, datetime
 
 from app.celery_app import celery_app
 from app.tasks._task_infra import _complete_job_run, _start_job_run, _task_db
@@ -42,71 +46,46 @@ def record_completed_outcomes(self) -> dict:
 
 
 async def _run_record_outcomes() -> dict:
-    """Match pending predictions against finalized games."""
-    from sqlalchemy import select
+    """Resolve every pending prediction whose game is final in one UPDATE."""
+    from sqlalchemy import Float, Numeric, case, cast, func, select, update
 
-    from app.db.analytics import AnalyticsPredictionOutcome
+    from app.db.analytics import AnalyticsPredictionOutcome as Outcome
     from app.db.sports import SportsGame
 
-    recorded = 0
-    skipped = 0
+    home_win = SportsGame.home_score > SportsGame.away_score
+    miss = Outcome.predicted_home_wp - case((home_win, 1.0), else_=0.0)
+    resolve = (
+        update(Outcome)
+        .where(
+            Outcome.game_id == SportsGame.id,
+            Outcome.outcome_recorded_at.is_(None),
+            # Only record for games that have reached final (or archived)
+            SportsGame.status.in_(("final", "archived")),
+            SportsGame.home_score.isnot(None),
+            SportsGame.away_score.isnot(None),
+        )
+        .values(
+            actual_home_score=SportsGame.home_score,
+            actual_away_score=SportsGame.away_score,
+            home_win_actual=home_win,
+            correct_winner=(Outcome.predicted_home_wp > 0.5) == home_win,
+            # Brier score: (predicted_probability - actual_outcome)^2
+            brier_score=cast(func.round(cast(miss * miss, Numeric), 6), Float),
+            outcome_recorded_at=func.now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
 
     async with _task_db() as sf:
         run_id = await _start_job_run(sf, "analytics_record_outcomes")
 
         async with sf() as db:
-            # Find predictions that have not been resolved yet
-            stmt = (
-                select(AnalyticsPredictionOutcome)
-                .where(AnalyticsPredictionOutcome.outcome_recorded_at.is_(None))
-                .order_by(AnalyticsPredictionOutcome.id)
-                .limit(500)
+            recorded = (await db.execute(resolve)).rowcount
+            skipped = await db.scalar(
+                select(func.count())
+                .select_from(Outcome)
+                .where(Outcome.outcome_recorded_at.is_(None))
             )
-            result = await db.execute(stmt)
-            pending = list(result.scalars().all())
-
-            if not pending:
-                return {"recorded": 0, "skipped": 0, "pending": 0}
-
-            # Batch-load the referenced games
-            game_ids = list({p.game_id for p in pending})
-            games_stmt = select(SportsGame).where(SportsGame.id.in_(game_ids))
-            games_result = await db.execute(games_stmt)
-            games_by_id: dict[int, SportsGame] = {
-                g.id: g for g in games_result.scalars().all()
-            }
-
-            for pred in pending:
-                game = games_by_id.get(pred.game_id)
-                if game is None:
-                    skipped += 1
-                    continue
-
-                # Only record for games that have reached final (or archived)
-                if game.status not in ("final", "archived"):
-                    skipped += 1
-                    continue
-
-                if game.home_score is None or game.away_score is None:
-                    skipped += 1
-                    continue
-
-                home_win_actual = game.home_score > game.away_score
-                predicted_home_win = pred.predicted_home_wp > 0.5
-                correct = predicted_home_win == home_win_actual
-
-                # Brier score: (predicted_probability - actual_outcome)^2
-                actual_indicator = 1.0 if home_win_actual else 0.0
-                brier = (pred.predicted_home_wp - actual_indicator) ** 2
-
-                pred.actual_home_score = game.home_score
-                pred.actual_away_score = game.away_score
-                pred.home_win_actual = home_win_actual
-                pred.correct_winner = correct
-                pred.brier_score = round(brier, 6)
-                pred.outcome_recorded_at = datetime.now(UTC)
-                recorded += 1
-
             await db.commit()
 
         await _complete_job_run(
@@ -118,7 +97,7 @@ async def _run_record_outcomes() -> dict:
         "record_completed_outcomes_done",
         extra={"recorded": recorded, "skipped": skipped},
     )
-    return {"recorded": recorded, "skipped": skipped, "pending": len(pending)}
+    return {"recorded": recorded, "skipped": skipped, "pending": recorded + skipped}
 
 
 # ---------------------------------------------------------------------------
@@ -141,11 +120,45 @@ def check_model_degradation(self, sport: str = "mlb") -> dict:
         loop.close()
 
 
+def _degradation_windows_stmt(sport: str):
+    """Mean Brier and accuracy for the baseline and recent halves of a sport.
+
+    Resolved predictions are ranked by ``outcome_recorded_at``; the older
+    ``n // 2`` form the baseline and the rest the recent window. Returns
+    at most two rows ``(recent, n, brier, accuracy)``.
+    """
+    from sqlalchemy import Float, case, cast, func, select
+
+    from app.db.analytics import AnalyticsPredictionOutcome as Outcome
+
+    rank = func.row_number().over(order_by=(Outcome.outcome_recorded_at, Outcome.id))
+    ranked = (
+        select(
+            Outcome.brier_score,
+            Outcome.correct_winner,
+            # rn > n // 2, i.e. past the midpoint
+            (rank * 2 > func.count().over()).label("recent"),
+        )
+        .where(
+            Outcome.outcome_recorded_at.isnot(None),
+            Outcome.sport == sport,
+            Outcome.brier_score.isnot(None),
+        )
+        .subquery()
+    )
+    return select(
+        ranked.c.recent,
+        func.count().label("n"),
+        func.avg(ranked.c.brier_score).label("brier"),
+        cast(
+            func.avg(case((ranked.c.correct_winner.is_(True), 1.0), else_=0.0)), Float
+        ).label("accuracy"),
+    ).group_by(ranked.c.recent)
+
+
 async def _run_degradation_check(sport: str) -> dict:
     """Compute rolling windows and detect Brier score degradation."""
-    from sqlalchemy import select
-
-    from app.db.analytics import AnalyticsDegradationAlert, AnalyticsPredictionOutcome
+    from app.db.analytics import AnalyticsDegradationAlert
 
     async with _task_db() as sf:
         run_id = await _start_job_run(
@@ -154,38 +167,27 @@ async def _run_degradation_check(sport: str) -> dict:
         )
 
         async with sf() as db:
-            stmt = (
-                select(AnalyticsPredictionOutcome)
-                .where(
-                    AnalyticsPredictionOutcome.outcome_recorded_at.isnot(None),
-                    AnalyticsPredictionOutcome.sport == sport,
-                    AnalyticsPredictionOutcome.brier_score.isnot(None),
-                )
-                .order_by(AnalyticsPredictionOutcome.outcome_recorded_at.asc())
-            )
-            result = await db.execute(stmt)
-            outcomes = list(result.scalars().all())
+            windows = {
+                row.recent: row
+                for row in await db.execute(_degradation_windows_stmt(sport))
+            }
+            baseline = windows.get(False)
+            recent = windows.get(True)
+            total = sum(w.n for w in windows.values())
 
-            if len(outcomes) < _MIN_WINDOW_SIZE * 2:
+            if total < _MIN_WINDOW_SIZE * 2:
                 await _complete_job_run(
                     sf, run_id, "success",
-                    summary_data={"sport": sport, "status": "insufficient_data", "total": len(outcomes)},
+                    summary_data={"sport": sport, "status": "insufficient_data", "total": total},
                 )
                 return {
                     "status": "insufficient_data",
-                    "total": len(outcomes),
+                    "total": total,
                     "required": _MIN_WINDOW_SIZE * 2,
                 }
 
-            # Split into baseline (first half) and recent (second half)
-            midpoint = len(outcomes) // 2
-            baseline = outcomes[:midpoint]
-            recent = outcomes[midpoint:]
-
-            baseline_brier = sum(o.brier_score for o in baseline) / len(baseline)
-            recent_brier = sum(o.brier_score for o in recent) / len(recent)
-            baseline_acc = sum(1 for o in baseline if o.correct_winner) / len(baseline)
-            recent_acc = sum(1 for o in recent if o.correct_winner) / len(recent)
+            baseline_brier, baseline_acc = baseline.brier, baseline.accuracy
+            recent_brier, recent_acc = recent.brier, recent.accuracy
 
             delta_brier = recent_brier - baseline_brier
             delta_acc = recent_acc - baseline_acc
@@ -204,7 +206,7 @@ async def _run_degradation_check(sport: str) -> dict:
                     f"Brier score rose from {baseline_brier:.4f} to {recent_brier:.4f} "
                     f"(+{delta_brier:.4f}). "
                     f"Accuracy dropped from {baseline_acc:.1%} to {recent_acc:.1%}. "
-                    f"Based on {len(baseline)} baseline vs {len(recent)} recent predictions."
+                    f"Based on {baseline.n} baseline vs {recent.n} recent predictions."
                 )
                 alert = AnalyticsDegradationAlert(
                     sport=sport,
@@ -213,8 +215,8 @@ async def _run_degradation_check(sport: str) -> dict:
                     recent_brier=round(recent_brier, 6),
                     baseline_accuracy=round(baseline_acc, 4),
                     recent_accuracy=round(recent_acc, 4),
-                    baseline_count=len(baseline),
-                    recent_count=len(recent),
+                    baseline_count=baseline.n,
+                    recent_count=recent.n,
                     delta_brier=round(delta_brier, 6),
                     delta_accuracy=round(delta_acc, 4),
                     severity=severity,
@@ -252,6 +254,6 @@ async def _run_degradation_check(sport: str) -> dict:
         "baseline_accuracy": round(baseline_acc, 4),
         "recent_accuracy": round(recent_acc, 4),
         "severity": severity,
-        "baseline_count": len(baseline),
-        "recent_count": len(recent),
+        "baseline_count": baseline.n,
+        "recent_count": recent.n,
     }
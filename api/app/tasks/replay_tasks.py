@@ -7,20 +7,27 @@ accuracy against known outcomes.
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
+import os
 import traceback
 from collections import defaultdict
+from collections.abc import AsyncIterator
 from datetime import UTC, date, datetime
 
 from app.utils.datetime_utils import end_of_et_day_utc, start_of_et_day_utc
 from typing import Any
 
 from app.celery_app import celery_app
+from app.config import settings
 from app.tasks._task_infra import _complete_job_run, _start_job_run, _task_db
-from app.tasks._training_helpers import build_rolling_profile
+from app.tasks._training_helpers import build_point_in_time_profiles
 
 logger = logging.getLogger(__name__)
 
+# Replayed games are appended to the job row in batches of this size.
+_PROGRESS_EVERY = 25
+
 
 @celery_app.task(name="replay_historical_games", bind=True, max_retries=0)
 def replay_historical_games(self, job_id: int) -> dict:
@@ -92,7 +99,6 @@ async def _execute_replay(sf: Any, job: Any) -> dict:
     """Run replay simulations on completed historical games."""
     from sqlalchemy import select
 
-    from app.analytics.core.simulation_engine import SimulationEngine
     from app.db.mlb_advanced import MLBGameAdvancedStats
     from app.db.sports import SportsGame, SportsLeague, SportsTeam
 
@@ -179,119 +185,227 @@ async def _execute_replay(sf: Any, job: Any) -> dict:
         for tid in team_history:
             team_history[tid].sort(key=lambda x: x[0])
 
-    # Run replay simulations
-    engine = SimulationEngine(sport)
     rolling_window = job.rolling_window or 30
     iterations = job.iterations or 5000
     probability_mode = job.probability_mode or "ml"
 
-    replay_results = []
-    correct_winners = 0
-    brier_scores = []
-    score_errors = []
+    # Point-in-time profiles (strictly before each game), one sweep per team
+    cutoffs: dict[int, list[str]] = defaultdict(list)
+    for game in games:
+        cutoffs[game.home_team_id].append(str(game.game_date))
+        cutoffs[game.away_team_id].append(str(game.game_date))
+    profiles = {
+        tid: build_point_in_time_profiles(
+            team_history.get(tid, []), dates, window=rolling_window, min_games=3,
+        )
+        for tid, dates in cutoffs.items()
+    }
 
+    # Games replayed by an earlier, interrupted run of this job are kept
+    done = {r["game_id"]: r for r in (job.results or []) if "game_id" in r}
+
+    tasks: list[tuple[int, dict]] = []
     for game in games:
+        if game.id in done:
+            continue
         home_team = teams.get(game.home_team_id)
         away_team = teams.get(game.away_team_id)
-        home_name = home_team.name if home_team else f"Team {game.home_team_id}"
-        away_name = away_team.name if away_team else f"Team {game.away_team_id}"
-        game_date_str = str(game.game_date)
-
-        # Point-in-time profiles (strictly before game)
-        home_profile = build_rolling_profile(
-            team_history.get(game.home_team_id, []),
-            before_date=game_date_str,
-            window=rolling_window,
-            min_games=3,
-        )
-        away_profile = build_rolling_profile(
-            team_history.get(game.away_team_id, []),
-            before_date=game_date_str,
-            window=rolling_window,
-            min_games=3,
-        )
-
         game_context: dict = {
-            "home_team": home_name,
-            "away_team": away_name,
+            "home_team": home_team.name if home_team else f"Team {game.home_team_id}",
+            "away_team": away_team.name if away_team else f"Team {game.away_team_id}",
             "probability_mode": probability_mode,
         }
+        home_profile = profiles[game.home_team_id][str(game.game_date)]
+        away_profile = profiles[game.away_team_id][str(game.game_date)]
         if home_profile and away_profile:
             game_context["profiles"] = {
                 "home_profile": {"metrics": home_profile},
                 "away_profile": {"metrics": away_profile},
             }
+        tasks.append((game.id, game_context))
 
-        try:
-            sim = engine.run_simulation(
-                game_context=game_context,
-                iterations=iterations,
+    if done:
+        logger.info(
+            "replay_resuming",
+            extra={"job_id": job.id, "already_done": len(done), "remaining": len(tasks)},
+        )
+
+    games_by_id = {g.id: g for g in games}
+    contexts = dict(tasks)
+    new_results: dict[int, dict] = {}
+    pending: list[dict] = []
+
+    async def flush() -> None:
+        if pending:
+            await _append_results(sf, job.id, pending)
+            pending.clear()
+
+    async for game_id, sim in _simulate_all(sport, tasks, iterations):
+        entry = _replay_entry(games_by_id[game_id], contexts[game_id], sim)
+        new_results[game_id] = entry
+        pending.append(entry)
+        if len(pending) >= _PROGRESS_EVERY:
+            await flush()
+    await flush()
+
+    replay_results = [
+        done.get(g.id) or new_results[g.id]
+        for g in games
+        if g.id in done or g.id in new_results
+    ]
+    return {
+        "game_count": len(replay_results),
+        "results": replay_results,
+        "metrics": _replay_metrics(replay_results),
+    }
+
+
+_worker_engine: Any = None
+
+
+def _simulate_game(
+    sport: str, game_id: int, game_context: dict, iterations: int,
+) -> tuple[int, dict]:
+    """Simulate one game; runs in a pool worker (or inline).
+
+    The engine is cached per process so each worker loads the sport
+    simulator and models once. Seeding with the game id makes a replay
+    reproducible regardless of worker count or completion order.
+    """
+    global _worker_engine
+    from app.analytics.core.simulation_engine import SimulationEngine
+
+    if _worker_engine is None or _worker_engine.sport != sport.lower():
+        _worker_engine = SimulationEngine(sport)
+    try:
+        sim = _worker_engine.run_simulation(
+            game_context=game_context, iterations=iterations, seed=game_id,
+        )
+    except Exception as exc:
+        return game_id, {"error": str(exc)}
+    return game_id, sim
+
+
+async def _simulate_all(
+    sport: str, tasks: list[tuple[int, dict]], iterations: int,
+) -> AsyncIterator[tuple[int, dict]]:
+    """Yield ``(game_id, simulation)`` as games finish.
+
+    Games fan out to a pool of ``REPLAY_WORKERS`` processes (one per CPU
+    by default); with a single worker they run in this process. The pool
+    is billiard's, not ``concurrent.futures``: replays run inside Celery
+    prefork children, which are daemonic, and only billiard lets those
+    start worker processes.
+    """
+    workers = min(settings.replay_workers or os.cpu_count() or 1, len(tasks))
+    if workers <= 1:
+        for game_id, game_context in tasks:
+            yield _simulate_game(sport, game_id, game_context, iterations)
+            await asyncio.sleep(0)
+        return
+
+    from billiard.pool import Pool
+
+    loop = asyncio.get_running_loop()
+    done: asyncio.Queue[tuple[int, dict]] = asyncio.Queue()
+
+    def _finished(result: tuple[int, dict]) -> None:
+        # Runs on the pool's result thread
+        loop.call_soon_threadsafe(done.put_nowait, result)
+
+    def _failed(game_id: int, exc: Any) -> None:
+        # billiard reports task errors as an ExceptionInfo wrapper
+        _finished((game_id, {"error": str(getattr(exc, "exception", exc))}))
+
+    with Pool(processes=workers) as pool:
+        for game_id, game_context in tasks:
+            pool.apply_async(
+                _simulate_game,
+                (sport, game_id, game_context, iterations),
+                callback=_finished,
+                error_callback=functools.partial(_failed, game_id),
             )
-        except Exception as exc:
-            replay_results.append({
-                "game_id": game.id,
-                "game_date": game_date_str[:10],
-                "home_team": home_name,
-                "away_team": away_name,
-                "error": str(exc),
-            })
-            continue
+        for _ in tasks:
+            yield await done.get()
 
-        predicted_home_wp = sim.get("home_win_probability", 0.5)
-        predicted_away_wp = sim.get("away_win_probability", 0.5)
-        pred_home_score = sim.get("average_home_score")
-        pred_away_score = sim.get("average_away_score")
-
-        # Compare to actuals
-        actual_home_win = (game.home_score or 0) > (game.away_score or 0)
-        predicted_home_win = predicted_home_wp > 0.5
-        is_correct = predicted_home_win == actual_home_win
-
-        if is_correct:
-            correct_winners += 1
-
-        # Brier score
-        brier = (predicted_home_wp - (1.0 if actual_home_win else 0.0)) ** 2
-        brier_scores.append(brier)
-
-        # Score error
-        if pred_home_score is not None and game.home_score is not None:
-            home_err = abs(pred_home_score - game.home_score)
-            away_err = abs((pred_away_score or 0) - (game.away_score or 0))
-            score_errors.append((home_err + away_err) / 2)
-
-        replay_results.append({
-            "game_id": game.id,
-            "game_date": game_date_str[:10],
-            "home_team": home_name,
-            "away_team": away_name,
-            "predicted_home_wp": round(predicted_home_wp, 4),
-            "predicted_away_wp": round(predicted_away_wp, 4),
-            "predicted_home_score": round(pred_home_score, 2) if pred_home_score else None,
-            "predicted_away_score": round(pred_away_score, 2) if pred_away_score else None,
-            "actual_home_score": game.home_score,
-            "actual_away_score": game.away_score,
-            "actual_home_win": actual_home_win,
-            "correct_winner": is_correct,
-            "brier_score": round(brier, 6),
-        })
-
-    game_count = len(replay_results)
-    valid_count = len([r for r in replay_results if "error" not in r])
 
+def _replay_entry(game: Any, game_context: dict, sim: dict) -> dict:
+    """Compare one simulation against the game's final score."""
+    entry: dict[str, Any] = {
+        "game_id": game.id,
+        "game_date": str(game.game_date)[:10],
+        "home_team": game_context["home_team"],
+        "away_team": game_context["away_team"],
+    }
+    if "error" in sim:
+        entry["error"] = sim["error"]
+        return entry
+
+    predicted_home_wp = sim.get("home_win_probability", 0.5)
+    predicted_away_wp = sim.get("away_win_probability", 0.5)
+    pred_home_score = sim.get("average_home_score")
+    pred_away_score = sim.get("average_away_score")
+
+    actual_home_win = (game.home_score or 0) > (game.away_score or 0)
+    brier = (predicted_home_wp - (1.0 if actual_home_win else 0.0)) ** 2
+
+    entry.update({
+        "predicted_home_wp": round(predicted_home_wp, 4),
+        "predicted_away_wp": round(predicted_away_wp, 4),
+        "predicted_home_score": round(pred_home_score, 2) if pred_home_score else None,
+        "predicted_away_score": round(pred_away_score, 2) if pred_away_score else None,
+        "actual_home_score": game.home_score,
+        "actual_away_score": game.away_score,
+        "actual_home_win": actual_home_win,
+        "correct_winner": (predicted_home_wp > 0.5) == actual_home_win,
+        "brier_score": round(brier, 6),
+    })
+    return entry
+
+
+def _replay_metrics(results: list[dict]) -> dict[str, Any]:
+    """Aggregate accuracy metrics over replay entries.
+
+    Computed from the stored entries so a resumed job's metrics cover
+    games replayed by earlier runs too.
+    """
+    valid = [r for r in results if "error" not in r]
     metrics: dict[str, Any] = {
-        "game_count": game_count,
-        "valid_count": valid_count,
+        "game_count": len(results),
+        "valid_count": len(valid),
     }
-    if valid_count > 0:
-        metrics["winner_accuracy"] = round(correct_winners / valid_count, 4)
-    if brier_scores:
-        metrics["avg_brier_score"] = round(sum(brier_scores) / len(brier_scores), 6)
+    if not valid:
+        return metrics
+
+    correct = sum(1 for r in valid if r["correct_winner"])
+    metrics["winner_accuracy"] = round(correct / len(valid), 4)
+    metrics["avg_brier_score"] = round(
+        sum(r["brier_score"] for r in valid) / len(valid), 6,
+    )
+    score_errors = [
+        (
+            abs(r["predicted_home_score"] - r["actual_home_score"])
+            + abs((r["predicted_away_score"] or 0) - (r["actual_away_score"] or 0))
+        ) / 2
+        for r in valid
+        if r["predicted_home_score"] is not None and r["actual_home_score"] is not None
+    ]
     if score_errors:
         metrics["avg_score_mae"] = round(sum(score_errors) / len(score_errors), 4)
+    return metrics
 
-    return {
-        "game_count": game_count,
-        "results": replay_results,
-        "metrics": metrics,
-    }
+
+async def _append_results(sf: Any, job_id: int, batch: list[dict]) -> None:
+    """Append replayed games to the job row so progress survives a crash."""
+    from sqlalchemy import bindparam, text
+    from sqlalchemy.dialects.postgresql import JSONB
+
+    stmt = text(
+        "UPDATE analytics_replay_jobs "
+        "SET results = coalesce(results, '[]'::jsonb) || :batch, "
+        "game_count = coalesce(game_count, 0) + :n "
+        "WHERE id = :job_id"
+    ).bindparams(bindparam("batch", type_=JSONB))
+    async with sf() as db:
+        await db.execute(stmt, {"batch": list(batch), "n": len(batch), "job_id": job_id})
+        await db.commit()
@@ -17,6 +17,28 @@ from app.tasks._task_infra import _complete_job_run, _start_job_run, _task_db
 
 logger = logging.getLogger(__name__)
 
+# Training jobs NOTIFY this channel (payload: job id) when they commit a
+# terminal status; experiment suites LISTEN instead of polling.
+TRAINING_DONE_CHANNEL = "analytics_training_done"
+
+
+async def _notify_training_done(db, job_id: int) -> None:
+    """Queue the completion NOTIFY; Postgres delivers it on commit.
+
+    Runs in a savepoint so a failed notify rolls back on its own and the
+    job's status update still commits.
+    """
+    from sqlalchemy import text
+
+    try:
+        async with db.begin_nested():
+            await db.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": TRAINING_DONE_CHANNEL, "payload": str(job_id)},
+            )
+    except Exception:
+        logger.warning("training_done_notify_failed", extra={"job_id": job_id}, exc_info=True)
+
 
 @celery_app.task(name="train_analytics_model", bind=True, max_retries=0)
 def train_analytics_model(self, job_id: int) -> dict:
@@ -82,6 +104,7 @@ async def _run_training(job_id: int, celery_task_id: str | None = None) -> dict:
                     job.status = "failed"
                     job.error_message = f"{type(exc).__name__}: {exc}\n{traceback.format_exc()}"
                     job.completed_at = datetime.now(UTC)
+                    await _notify_training_done(db, job_id)
                     await db.commit()
             await _complete_job_run(sf, run_id, "error", str(exc)[:500])
             return {"error": str(exc), "job_id": job_id}
@@ -103,6 +126,7 @@ async def _run_training(job_id: int, celery_task_id: str | None = None) -> dict:
                     job.feature_names = result.get("feature_names")
                     job.feature_importance = result.get("feature_importance")
                 job.completed_at = datetime.now(UTC)
+                await _notify_training_done(db, job_id)
                 await db.commit()
 
         summary = {
@@ -172,9 +196,9 @@ async def _execute_training(
         feature_config=config_dict,
     )
 
-    # Load training data from DB using the task's session factory
+    # Load training data (dataset cache, else the DB via the task's session)
     async with sf() as db:
-        records = await _load_training_data_from_db(
+        records = await _load_training_records(
             sport=sport,
             model_type=model_type,
             date_start=date_start,
@@ -317,7 +341,7 @@ async def _execute_backtest(
 
     # 2. Load games with rolling profiles (same as training data loader)
     async with sf() as db:
-        records = await _load_training_data_from_db(
+        records = await _load_training_records(
             sport=sport,
             model_type=model_type,
             date_start=date_start,
@@ -440,8 +464,8 @@ async def _execute_backtest(
 # on Celery task orchestration.
 # ---------------------------------------------------------------------------
 
-from app.tasks._training_data import (  # noqa: E402
-    load_training_data_from_db as _load_training_data_from_db,
+from app.tasks._training_dataset_cache import (  # noqa: E402
+    load_training_records as _load_training_records,
 )
 from app.tasks._training_helpers import (  # noqa: E402
     get_sklearn_model as _get_sklearn_model,
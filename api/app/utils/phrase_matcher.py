@@ -0,0 +1,149 @@
+"""Multi-phrase matcher that scales with the phrase list.
+
+Narrative grading and block validation both check text against phrase
+lists (generic filler, forbidden LLM artifacts). Testing each phrase with
+its own substring scan costs phrases × text length per block, but each
+check runs in C, so for short lists it is the fastest option. Past
+``SCAN_MAX_PHRASES`` a ``PhraseMatcher`` compiles an Aho-Corasick
+automaton instead and finds every occurrence of every phrase in one
+left-to-right pass, so per-text cost no longer grows with the list.
+
+Matching is case-insensitive substring matching — the same semantics as
+``phrase in text.lower()`` — including overlapping occurrences.
+
+Shared by the API validator and the scraper grader (which imports
+``app.utils`` the same way it does ``app.utils.datetime_utils``).
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from collections.abc import Iterable, Iterator
+from typing import NamedTuple
+
+
+class PhraseMatch(NamedTuple):
+    """One occurrence: ``text.lower()[start:end] == phrase``."""
+
+    start: int
+    end: int
+    phrase: str
+
+
+# Up to this many phrases, per-phrase substring checks beat the automaton's
+# per-character Python loop (crossover is ~150 phrases on 80-word blocks;
+# see scraper/scripts/bench_phrase_matcher.py).
+SCAN_MAX_PHRASES = 128
+
+
+class PhraseMatcher:
+    """Matcher over a fixed, lowercased phrase list.
+
+    Short lists are matched with substring scans. Longer lists use an
+    Aho-Corasick automaton stored as a DFA: every state's transition dict
+    already includes the failure-link fallbacks, so the scan does exactly
+    one dict lookup per character. Both strategies return identical results.
+    """
+
+    __slots__ = ("phrases", "_delta", "_out")
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        # Deduplicated, lowercased, original order preserved for reporting.
+        self.phrases: tuple[str, ...] = tuple(
+            dict.fromkeys(p.lower() for p in phrases if p)
+        )
+        self._delta: list | None = None
+        self._out: list[tuple[int, ...]] = []
+        if len(self.phrases) > SCAN_MAX_PHRASES:
+            self._compile()
+
+    @property
+    def uses_automaton(self) -> bool:
+        return self._delta is not None
+
+    def _compile(self) -> None:
+        goto: list[dict[str, int]] = [{}]
+        out: list[tuple[int, ...]] = [()]
+        for pid, phrase in enumerate(self.phrases):
+            state = 0
+            for ch in phrase:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto.append({})
+                    out.append(())
+                    goto[state][ch] = nxt
+                state = nxt
+            out[state] += (pid,)
+
+        # Breadth-first: a state's failure target is always shallower, so its
+        # DFA row and outputs are complete before the state itself is reached.
+        fail = [0] * len(goto)
+        delta: list[dict[str, int]] = [dict(goto[0])] + [{}] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            if state:
+                row = dict(delta[fail[state]])
+                row.update(goto[state])
+                delta[state] = row
+            for ch, child in goto[state].items():
+                fail[child] = delta[fail[state]].get(ch, 0) if state else 0
+                out[child] += out[fail[child]]
+                queue.append(child)
+
+        self._delta = [row.get for row in delta]
+        self._out = out
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def finditer(self, text: str) -> Iterator[PhraseMatch]:
+        """Yield every phrase occurrence in ``text``, ordered by end position.
+
+        Occurrences ending at the same position come longest first.
+        """
+        delta = self._delta
+        if delta is None:
+            yield from self._scan(text.lower())
+            return
+        out = self._out
+        phrases = self.phrases
+        state = 0
+        for i, ch in enumerate(text.lower()):
+            state = delta[state](ch, 0)
+            if out[state]:
+                end = i + 1
+                for pid in out[state]:
+                    phrase = phrases[pid]
+                    yield PhraseMatch(end - len(phrase), end, phrase)
+
+    def _scan(self, lower: str) -> list[PhraseMatch]:
+        found: list[PhraseMatch] = []
+        for phrase in self.phrases:
+            n = len(phrase)
+            start = lower.find(phrase)
+            while start != -1:
+                found.append(PhraseMatch(start, start + n, phrase))
+                start = lower.find(phrase, start + 1)
+        found.sort(key=lambda m: (m.end, m.start))
+        return found
+
+    def find_all(self, text: str) -> list[PhraseMatch]:
+        """All occurrences in ``text`` (see :meth:`finditer`)."""
+        return list(self.finditer(text))
+
+    def counts(self, text: str) -> dict[str, int]:
+        """Occurrence count per matched phrase, in phrase-list order."""
+        found = Counter(m.phrase for m in self.finditer(text))
+        return {p: found[p] for p in self.phrases if p in found}
+
+    def matched(self, text: str) -> list[str]:
+        """Distinct phrases present in ``text``, in phrase-list order.
+
+        Equivalent to ``[p for p in phrases if p in text.lower()]``.
+        """
+        if self._delta is None:
+            lower = text.lower()
+            return [p for p in self.phrases if p in lower]
+        return list(self.counts(text))
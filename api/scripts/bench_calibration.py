@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Benchmark SimCalibrator on a large batch of sim win probabilities.
+
+Trains an isotonic calibrator on synthetic (biased) sim probabilities,
+then times evaluating ``--n`` predictions two ways:
+
+  scalar  the previous path: ``calibrate`` per probability, generator
+          Brier sums and one scan of the predictions per reliability bin
+  array   ``calibrate_many`` + vectorized metrics + single-pass binning
+
+The scalar path is timed on ``--scalar-sample`` predictions and
+extrapolated to ``--n`` (a full 1M run takes minutes). Exits 1 if the
+two paths disagree on the sample.
+
+Usage:
+    python -m scripts.bench_calibration
+    python -m scripts.bench_calibration --n 1000000 --scalar-sample 20000
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from app.analytics.calibration.calibrator import SimCalibrator
+
+
+def _dataset(n: int, rng: np.random.Generator) -> tuple[np.ndarray, np.ndarray]:
+    true_p = rng.uniform(0.25, 0.75, n)
+    sim_p = np.clip(true_p + 0.06, 0.01, 0.99)
+    return sim_p, rng.random(n) < true_p
+
+
+def _scalar_evaluate(cal: SimCalibrator, sim_wps: list[float], outcomes: list[bool]) -> dict:
+    y = [1.0 if o else 0.0 for o in outcomes]
+    brier_before = sum((p - a) ** 2 for p, a in zip(sim_wps, y, strict=True)) / len(y)
+    calibrated = [cal.calibrate(p) for p in sim_wps]
+    brier_after = sum((c - a) ** 2 for c, a in zip(calibrated, y, strict=True)) / len(y)
+    bins = []
+    for i in range(10):
+        lo, hi = i / 10, (i + 1) / 10
+        idx = [j for j, p in enumerate(sim_wps) if lo <= p < hi]
+        if idx:
+            bins.append((i, len(idx), sum(calibrated[j] for j in idx) / len(idx)))
+    return {"brier_before": brier_before, "brier_after": brier_after, "bins": bins}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Calibration benchmark")
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--scalar-sample", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    train_p, train_y = _dataset(5_000, rng)
+    cal = SimCalibrator()
+    cal.train(train_p, train_y)
+
+    sim_p, outcomes = _dataset(args.n, rng)
+
+    started = time.perf_counter()
+    metrics = cal.evaluate(sim_p, outcomes)
+    array_seconds = time.perf_counter() - started
+
+    sample = min(args.scalar_sample, args.n)
+    sample_p, sample_y = sim_p[:sample].tolist(), outcomes[:sample].tolist()
+    started = time.perf_counter()
+    scalar = _scalar_evaluate(cal, sample_p, sample_y)
+    scalar_seconds = (time.perf_counter() - started) * args.n / sample
+
+    print(f"{args.n} predictions (scalar path timed on {sample}, extrapolated)")
+    print(f"{'path':>8} {'seconds':>10} {'us/pred':>9}")
+    for name, seconds in (("scalar", scalar_seconds), ("array", array_seconds)):
+        print(f"{name:>8} {seconds:>10.3f} {seconds / args.n * 1e6:>9.3f}")
+    print(f"speedup: {scalar_seconds / array_seconds:.0f}x")
+    print(
+        f"brier before {metrics.brier_before:.6f} after {metrics.brier_after:.6f}, "
+        f"{len(metrics.reliability_bins)} bins"
+    )
+
+    check = cal.evaluate(sample_p, sample_y)
+    agree = (
+        abs(check.brier_before - scalar["brier_before"]) < 1e-6
+        and abs(check.brier_after - scalar["brier_after"]) < 1e-6
+        and [(round(b["bin_start"] * 10), b["count"]) for b in check.reliability_bins]
+        == [(i, count) for i, count, _ in scalar["bins"]]
+    )
+    if not agree:
+        print("MISMATCH: array and scalar paths disagree on the sample")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Benchmark RateLimitMiddleware overhead per request under many distinct keys.
+
+Drives the middleware directly (no HTTP server, no-op downstream app)
+with requests spread round-robin over ``--keys`` client IPs, and reports
+the per-request cost and the memory retained by the limiter state for:
+
+  deque   the previous store: a deque of timestamps per key
+  memory  GCRA, one float per key in process (RATE_LIMIT_BACKEND=memory)
+  redis   GCRA in Redis via the Lua script (only with --redis-url)
+
+The limit is set high enough that nothing is rejected, so every request
+takes the allow path and records state. Exits 1 if the backends disagree
+on how many requests were allowed.
+
+Usage:
+    python -m scripts.bench_rate_limit
+    python -m scripts.bench_rate_limit --keys 100000 --requests 300000
+    python -m scripts.bench_rate_limit --redis-url redis://localhost:6379/15
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from collections import defaultdict, deque
+
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.services.gcra_limiter import MemoryGCRA, RateLimitDecision, RedisGCRA
+
+
+class _DequeLimiter:
+    """The pre-GCRA sliding-window log, behind the limiter interface."""
+
+    def __init__(self) -> None:
+        self._buckets: dict[str, deque[float]] = defaultdict(deque)
+
+    async def check(self, key: str, limit: int, window: float) -> RateLimitDecision:
+        now = time.time()
+        bucket = self._buckets[key]
+        while bucket and bucket[0] <= now - window:
+            bucket.popleft()
+        if len(bucket) >= limit:
+            return RateLimitDecision(False, window)
+        bucket.append(now)
+        return RateLimitDecision(True)
+
+
+async def _noop_app(scope, receive, send) -> None:
+    return None
+
+
+async def _receive() -> dict:
+    return {"type": "http.request", "body": b""}
+
+
+def _scopes(n_keys: int) -> list[dict]:
+    return [
+        {
+            "type": "http",
+            "path": "/api/v1/games",
+            "query_string": b"",
+            "headers": [],
+            "server": ("localhost", 8000),
+            "client": (f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", 40000),
+        }
+        for i in range(n_keys)
+    ]
+
+
+async def _drive(limiter, scopes: list[dict], n_requests: int) -> tuple[float, int]:
+    middleware = RateLimitMiddleware(_noop_app, limiter=limiter)
+    rejected = 0
+
+    async def send(message: dict) -> None:
+        nonlocal rejected
+        if message["type"] == "http.response.start" and message["status"] == 429:
+            rejected += 1
+
+    started = time.perf_counter()
+    for i in range(n_requests):
+        await middleware(scopes[i % len(scopes)], _receive, send)
+    return time.perf_counter() - started, n_requests - rejected
+
+
+def _retained_bytes(factory, scopes: list[dict], n_requests: int) -> int:
+    """Bytes still allocated after the run — the limiter's per-key state.
+
+    A separate pass, so tracing overhead doesn't distort the timings.
+    """
+    tracemalloc.start()
+    limiter = factory()
+    before = tracemalloc.get_traced_memory()[0]
+    asyncio.run(_drive(limiter, scopes, n_requests))
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Rate-limit middleware benchmark")
+    parser.add_argument("--keys", type=int, default=20_000)
+    parser.add_argument("--requests", type=int, default=100_000)
+    parser.add_argument("--redis-url", default=None)
+    args = parser.parse_args()
+
+    from app.config import settings
+
+    # Never reject: every request takes the allow path and stores state
+    settings.rate_limit_requests = args.requests
+    scopes = _scopes(args.keys)
+
+    backends = [("deque", _DequeLimiter), ("memory", MemoryGCRA)]
+    if args.redis_url:
+        backends.append(("redis", lambda: RedisGCRA(args.redis_url)))
+
+    print(f"{args.requests} requests over {args.keys} keys")
+    print(f"{'backend':>8} {'us/req':>9} {'allowed':>9} {'retained':>12}")
+    allowed_counts = set()
+    for name, factory in backends:
+        elapsed, allowed = asyncio.run(_drive(factory(), scopes, args.requests))
+        allowed_counts.add(allowed)
+        # Redis state lives in the server, not this process
+        retained = (
+            f"{_retained_bytes(factory, scopes, args.requests) / 1024:.0f}KB"
+            if name != "redis" else "-"
+        )
+        print(f"{name:>8} {elapsed / args.requests * 1e6:>9.2f} {allowed:>9} {retained:>12}")
+
+    if len(allowed_counts) > 1:
+        print("MISMATCH: backends allowed different request counts")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark timeline artifact generation throughput in games per second.
+
+Picks up to ``--games`` final games with play-by-play for ``--league``
+and builds their timelines two ways against the configured database:
+
+  serial   ``generate_timeline_artifact`` once per game (full ORM rows,
+           five round trips per game)
+  batched  ``generate_timeline_artifacts`` over ``--batch-size`` chunks
+           (projected columns, four reads + one bulk upsert per chunk)
+
+Everything runs inside a transaction that is rolled back, so existing
+artifacts are untouched. Also prints how long regenerating every
+eligible game in the league would take at the measured batched rate.
+Exits 1 if the two paths produce different timelines.
+
+Usage:
+    python -m scripts.bench_timelines
+    python -m scripts.bench_timelines --league NCAAB --games 1000 --batch-size 200
+"""
+
+import argparse
+import asyncio
+import logging
+import sys
+import time
+
+from sqlalchemy import exists, func, select
+
+from app.db import get_async_session
+from app.db.sports import GameStatus, SportsGame, SportsGamePlay, SportsLeague
+from app.services.timeline_generator import (
+    TIMELINE_BATCH_SIZE,
+    TimelineGenerationError,
+    generate_timeline_artifact,
+    generate_timeline_artifacts,
+)
+
+_BENCH_VERSION = "bench"
+
+
+def _eligible(league: str):
+    return (
+        select(SportsGame.id)
+        .join(SportsLeague, SportsGame.league_id == SportsLeague.id)
+        .where(
+            SportsLeague.code == league,
+            SportsGame.status == GameStatus.final.value,
+            exists().where(SportsGamePlay.game_id == SportsGame.id),
+        )
+    )
+
+
+async def _run(league: str, n_games: int, batch_size: int) -> int:
+    async with get_async_session() as session:
+        total = await session.scalar(select(func.count()).select_from(_eligible(league).subquery()))
+        game_ids = list(
+            (await session.execute(
+                _eligible(league).order_by(SportsGame.game_date.desc()).limit(n_games)
+            )).scalars()
+        )
+        if not game_ids:
+            print(f"No final {league} games with play-by-play")
+            return 1
+
+        serial: dict[int, list] = {}
+        started = time.perf_counter()
+        for game_id in game_ids:
+            try:
+                artifact = await generate_timeline_artifact(
+                    session, game_id, timeline_version=_BENCH_VERSION
+                )
+            except TimelineGenerationError:
+                continue
+            serial[game_id] = artifact.timeline
+        serial_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        result = await generate_timeline_artifacts(
+            session, game_ids, timeline_version=_BENCH_VERSION, batch_size=batch_size
+        )
+        await session.flush()
+        batched_seconds = time.perf_counter() - started
+        batched = {a.game_id: a.timeline for a in result.artifacts}
+
+        await session.rollback()
+
+    n = len(game_ids)
+    print(f"{league}: {n} games (batch size {batch_size})")
+    print(f"{'path':>8} {'seconds':>10} {'games/s':>9}")
+    for name, seconds in (("serial", serial_seconds), ("batched", batched_seconds)):
+        print(f"{name:>8} {seconds:>10.2f} {n / seconds:>9.1f}")
+    print(f"speedup: {serial_seconds / batched_seconds:.1f}x")
+    rate = n / batched_seconds
+    print(f"regenerating all {total} eligible games: ~{total / rate / 60:.1f} min batched")
+
+    if serial != batched:
+        differing = sorted(set(serial) ^ set(batched)) or [
+            g for g in serial if serial[g] != batched[g]
+        ]
+        print(f"MISMATCH: serial and batched timelines differ for games {differing[:10]}")
+        return 1
+    return 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Timeline generation throughput benchmark")
+    parser.add_argument("--league", default="NBA")
+    parser.add_argument("--games", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=TIMELINE_BATCH_SIZE)
+    args = parser.parse_args()
+
+    # Per-game phase logging would dominate the measurement
+    logging.getLogger("app").setLevel(logging.WARNING)
+    sys.exit(asyncio.run(_run(args.league.upper(), args.games, args.batch_size)))
+
+
+if __name__ == "__main__":
+    main()
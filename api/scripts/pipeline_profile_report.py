@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Report where narrative pipeline time and payload bytes go, per stage.
+
+Reads the profiles recorded on each stage execution and prints wall, DB
+and completion-time percentiles plus accumulated input/output sizes,
+ordered by total wall time, ending with the stage that dominates.
+
+Usage:
+    python -m scripts.pipeline_profile_report [--days N] [--league NBA] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+from dataclasses import asdict
+from datetime import timedelta
+
+from app.db import get_async_session
+from app.services.pipeline.profiling import (
+    format_profile_report,
+    load_stage_profiles,
+    summarize_stage_profiles,
+)
+from app.utils.datetime_utils import now_utc
+
+
+async def main(days: int, league: str | None, as_json: bool) -> None:
+    since = now_utc() - timedelta(days=days)
+    async with get_async_session() as session:
+        rows = await load_stage_profiles(session, since, league)
+    summaries = summarize_stage_profiles(rows)
+
+    if as_json:
+        print(json.dumps([asdict(s) for s in summaries], indent=2))
+        return
+
+    scope = f"{league.upper()} " if league else ""
+    print(f"{scope}pipeline stage profile since {since:%Y-%m-%d %H:%M} UTC\n")
+    print(format_profile_report(summaries))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Per-stage pipeline profile report")
+    parser.add_argument("--days", type=int, default=7, help="Look-back window in days")
+    parser.add_argument("--league", default=None, help="Only games in this league")
+    parser.add_argument("--json", action="store_true", help="Emit summaries as JSON")
+    args = parser.parse_args()
+    asyncio.run(main(args.days, args.league, args.json))
@@ -0,0 +1,234 @@
+"""Tests for the bulk flow generation task and its status endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.db import get_db
+from app.routers.admin.pipeline.bulk_endpoints import router
+from app.tasks import bulk_flow_generation as bulk
+
+
+def _job(**overrides):
+    defaults = dict(
+        id=7,
+        status="pending",
+        start_date=datetime(2026, 1, 1, tzinfo=UTC),
+        end_date=datetime(2026, 1, 31, tzinfo=UTC),
+        leagues=["NBA"],
+        force_regenerate=False,
+        max_games=None,
+        total_games=0,
+        current_game=0,
+        successful=0,
+        failed=0,
+        skipped=0,
+        errors_json=[],
+        started_at=None,
+        finished_at=None,
+    )
+    defaults.update(overrides)
+    return SimpleNamespace(**defaults)
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect())).lower()
+
+
+class _FakeSessions:
+    """async_sessionmaker stand-in that records every session it opens."""
+
+    def __init__(self, first_results: list | None = None) -> None:
+        self.sessions: list[MagicMock] = []
+        self.first_results = first_results
+
+    def __call__(self):
+        session = MagicMock()
+        if self.first_results is not None and not self.sessions:
+            session.execute = AsyncMock(side_effect=self.first_results)
+        session.commit = AsyncMock()
+        session.rollback = AsyncMock()
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=False)
+        self.sessions.append(session)
+        return session
+
+
+class _FakeExecutor:
+    """PipelineExecutor stand-in that tracks how many pipelines overlap."""
+
+    in_flight = 0
+    peak = 0
+    sessions: set[int] = set()
+    fail_games: set[int] = set()
+
+    def __init__(self, session) -> None:
+        self.session = session
+
+    async def run_full_pipeline(self, game_id: int, triggered_by: str):
+        cls = type(self)
+        cls.sessions.add(id(self.session))
+        cls.in_flight += 1
+        cls.peak = max(cls.peak, cls.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if game_id in cls.fail_games:
+                raise RuntimeError(f"boom {game_id}")
+        finally:
+            cls.in_flight -= 1
+
+
+@pytest.fixture
+def fake_executor():
+    _FakeExecutor.in_flight = 0
+    _FakeExecutor.peak = 0
+    _FakeExecutor.sessions = set()
+    _FakeExecutor.fail_games = set()
+    with patch.object(bulk, "PipelineExecutor", _FakeExecutor):
+        yield _FakeExecutor
+
+
+class TestEligibleGamesQuery:
+    def test_single_query_with_pbp_semi_join(self) -> None:
+        sql = _sql(bulk._eligible_games_query(_job()))
+
+        assert "exists" in sql
+        assert "count(" not in sql
+        assert "sports_game_stories" in sql
+        assert "limit" not in sql
+
+    def test_max_games_is_a_sql_limit(self) -> None:
+        query = bulk._eligible_games_query(_job(max_games=25))
+        compiled = query.compile(dialect=postgresql.dialect())
+
+        assert "limit" in str(compiled).lower()
+        assert 25 in compiled.params.values()
+
+    def test_force_regenerate_keeps_existing_flows(self) -> None:
+        sql = _sql(bulk._eligible_games_query(_job(force_regenerate=True, leagues=[])))
+
+        assert "sports_game_stories" not in sql
+        assert "sports_leagues.code" not in sql
+
+
+class TestGenerateGames:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [1, 3])
+    async def test_concurrency_is_bounded(self, fake_executor, limit) -> None:
+        factory = _FakeSessions()
+        main = factory()
+        job = _job()
+
+        progress = await bulk._generate_games(main, factory, job, list(range(8)), limit)
+
+        assert fake_executor.peak == limit
+        assert progress.successful == 8
+        assert job.current_game == 8
+        assert job.successful == 8
+
+    @pytest.mark.asyncio
+    async def test_each_game_gets_its_own_session(self, fake_executor) -> None:
+        factory = _FakeSessions()
+        main = factory()
+
+        await bulk._generate_games(main, factory, _job(), [1, 2, 3], 3)
+
+        assert len(fake_executor.sessions) == 3
+        assert id(main) not in fake_executor.sessions
+        for session in factory.sessions[1:]:
+            session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded_and_do_not_stop_the_job(self, fake_executor) -> None:
+        fake_executor.fail_games = {2}
+        factory = _FakeSessions()
+        main = factory()
+        job = _job()
+
+        progress = await bulk._generate_games(main, factory, job, [1, 2, 3], 2)
+
+        assert (progress.successful, progress.failed) == (2, 1)
+        assert job.errors_json == [{"game_id": 2, "error": "boom 2"}]
+        failed_session = next(s for s in factory.sessions[1:] if s.rollback.await_count)
+        failed_session.commit.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_progress_writes_are_throttled(self, fake_executor, monkeypatch) -> None:
+        monkeypatch.setattr(bulk, "_PROGRESS_INTERVAL_SECONDS", 3600)
+        factory = _FakeSessions()
+        main = factory()
+
+        await bulk._generate_games(main, factory, _job(), list(range(5)), 5)
+
+        # Only the final completion writes the job row
+        main.commit.assert_awaited_once()
+
+
+class TestRunJob:
+    @pytest.mark.asyncio
+    async def test_completes_job(self, fake_executor) -> None:
+        job = _job()
+        load = MagicMock()
+        load.scalar_one_or_none.return_value = job
+        ids = MagicMock()
+        ids.scalars.return_value.all.return_value = [11, 12]
+        factory = _FakeSessions(first_results=[load, ids])
+
+        await bulk._run_job(factory, job.id, max_concurrency=2)
+
+        assert job.status == "completed"
+        assert job.total_games == 2
+        assert job.successful == 2
+        assert job.finished_at is not None
+
+
+def _make_client(job) -> TestClient:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = job
+    mock_db = AsyncMock()
+    mock_db.execute = AsyncMock(return_value=result)
+
+    async def _get_db():
+        yield mock_db
+
+    app = FastAPI()
+    app.dependency_overrides[get_db] = _get_db
+    app.include_router(router)
+    return TestClient(app)
+
+
+class TestStatusThroughput:
+    def test_reports_games_per_minute(self) -> None:
+        started = datetime(2026, 1, 1, 12, 0, tzinfo=UTC)
+        job = _job(
+            job_uuid="8c1d7c9e-5f1e-4e0e-9a63-0d3f4f1b2a10",
+            status="completed",
+            total_games=30,
+            current_game=30,
+            successful=28,
+            failed=2,
+            started_at=started,
+            finished_at=started + timedelta(minutes=2),
+        )
+
+        resp = _make_client(job).get(f"/pipeline/bulk-generate-status/{job.job_uuid}")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["elapsedSeconds"] == 120.0
+        assert data["gamesPerMinute"] == 15.0
+
+    def test_pending_job_has_no_throughput(self) -> None:
+        job = _job(job_uuid="8c1d7c9e-5f1e-4e0e-9a63-0d3f4f1b2a10")
+
+        data = _make_client(job).get(f"/pipeline/bulk-generate-status/{job.job_uuid}").json()
+
+        assert data["gamesPerMinute"] is None
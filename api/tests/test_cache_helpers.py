@@ -1,184 +1,113 @@
 """Tests for cache_helpers module."""
 
 import hashlib
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 
-class TestGetBatchCacheKey:
-    """Tests for get_batch_cache_key function."""
+class TestGetPromptCacheKey:
+    """Tests for get_prompt_cache_key function."""
 
-    def test_generates_hash(self):
-        """Generates a valid hash string."""
-        from app.services.pipeline.stages.cache_helpers import get_batch_cache_key
+    PARAMS = {
+        "model": "gpt-4o",
+        "messages": [{"role": "user", "content": "Render blocks 0-3"}],
+        "temperature": 0.5,
+        "max_tokens": 800,
+    }
 
-        result = get_batch_cache_key([1, 2, 3])
-        assert isinstance(result, str)
-        assert len(result) == 16
+    def test_full_sha256_of_canonical_json(self):
+        """Key is the SHA256 of the sorted, compact JSON encoding."""
+        from app.services.pipeline.stages.cache_helpers import get_prompt_cache_key
 
-    def test_consistent_for_same_input(self):
-        """Same input produces same hash."""
-        from app.services.pipeline.stages.cache_helpers import get_batch_cache_key
+        canonical = json.dumps(self.PARAMS, sort_keys=True, separators=(",", ":"))
+        assert get_prompt_cache_key(self.PARAMS) == hashlib.sha256(canonical.encode()).hexdigest()
+        assert len(get_prompt_cache_key(self.PARAMS)) == 64
 
-        result1 = get_batch_cache_key([1, 2, 3])
-        result2 = get_batch_cache_key([1, 2, 3])
-        assert result1 == result2
+    def test_key_order_independent(self):
+        """Dict ordering does not change the key."""
+        from app.services.pipeline.stages.cache_helpers import get_prompt_cache_key
 
-    def test_different_for_different_input(self):
-        """Different input produces different hash."""
-        from app.services.pipeline.stages.cache_helpers import get_batch_cache_key
+        reordered = dict(reversed(list(self.PARAMS.items())))
+        assert get_prompt_cache_key(reordered) == get_prompt_cache_key(self.PARAMS)
 
-        result1 = get_batch_cache_key([1, 2, 3])
-        result2 = get_batch_cache_key([1, 2, 4])
-        assert result1 != result2
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("model", "gpt-4o-mini"),
+            ("messages", [{"role": "user", "content": "Render blocks 0-3 (regen)"}]),
+            ("temperature", 0.2),
+            ("max_tokens", 400),
+        ],
+    )
+    def test_any_request_change_changes_key(self, field, value):
+        """Prompt, model, and sampling parameters all feed the key."""
+        from app.services.pipeline.stages.cache_helpers import get_prompt_cache_key
 
-    def test_order_independent(self):
-        """Order of indices doesn't matter (sorted internally)."""
-        from app.services.pipeline.stages.cache_helpers import get_batch_cache_key
+        changed = {**self.PARAMS, field: value}
+        assert get_prompt_cache_key(changed) != get_prompt_cache_key(self.PARAMS)
 
-        result1 = get_batch_cache_key([3, 1, 2])
-        result2 = get_batch_cache_key([1, 2, 3])
-        assert result1 == result2
 
-    def test_empty_list(self):
-        """Empty list produces a valid hash."""
-        from app.services.pipeline.stages.cache_helpers import get_batch_cache_key
-
-        result = get_batch_cache_key([])
-        assert isinstance(result, str)
-        assert len(result) == 16
-
-    def test_single_element(self):
-        """Single element produces valid hash."""
-        from app.services.pipeline.stages.cache_helpers import get_batch_cache_key
-
-        result = get_batch_cache_key([42])
-        assert isinstance(result, str)
-        assert len(result) == 16
-
-    def test_large_indices(self):
-        """Large indices work correctly."""
-        from app.services.pipeline.stages.cache_helpers import get_batch_cache_key
-
-        result = get_batch_cache_key([1000000, 2000000, 3000000])
-        assert isinstance(result, str)
-        assert len(result) == 16
-
-    def test_matches_expected_hash(self):
-        """Verify hash matches expected algorithm."""
-        from app.services.pipeline.stages.cache_helpers import get_batch_cache_key
-
-        # Manually compute expected hash
-        key_str = "1,2,3"
-        expected = hashlib.sha256(key_str.encode()).hexdigest()[:16]
-
-        result = get_batch_cache_key([1, 2, 3])
-        assert result == expected
-
-
-class TestGetCachedResponse:
-    """Tests for get_cached_response function."""
+class TestGetCachedResponses:
+    """Tests for get_cached_responses function."""
 
     @pytest.mark.asyncio
-    async def test_returns_cached_data_on_hit(self):
-        """Returns cached response when found."""
-        from app.services.pipeline.stages.cache_helpers import get_cached_response
-
-        # Create mock cache entry
-        cached_entry = MagicMock()
-        cached_entry.response_json = {"narratives": ["test narrative"]}
+    async def test_returns_hits_by_key(self):
+        """Returns a key -> response mapping from one query."""
+        from app.services.pipeline.stages.cache_helpers import get_cached_responses
 
-        # Create mock session
         mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = cached_entry
-
+        mock_result.all.return_value = [("k1", {"blocks": []})]
         mock_session = AsyncMock()
         mock_session.execute.return_value = mock_result
 
-        result = await get_cached_response(mock_session, game_id=123, batch_key="abc123")
+        result = await get_cached_responses(mock_session, game_id=123, keys=["k1", "k2"])
 
-        assert result == {"narratives": ["test narrative"]}
+        assert result == {"k1": {"blocks": []}}
         mock_session.execute.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_returns_none_on_miss(self):
-        """Returns None when cache miss."""
-        from app.services.pipeline.stages.cache_helpers import get_cached_response
-
-        # Create mock session with no result
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
+    async def test_no_keys_skips_query(self):
+        """No keys means no database round trip."""
+        from app.services.pipeline.stages.cache_helpers import get_cached_responses
 
         mock_session = AsyncMock()
-        mock_session.execute.return_value = mock_result
+        assert await get_cached_responses(mock_session, game_id=123, keys=[]) == {}
+        mock_session.execute.assert_not_called()
 
-        result = await get_cached_response(mock_session, game_id=123, batch_key="abc123")
 
-        assert result is None
-
-
-class TestStoreCachedResponse:
-    """Tests for store_cached_response function."""
+class TestStoreCachedResponses:
+    """Tests for store_cached_responses function."""
 
     @pytest.mark.asyncio
-    async def test_stores_cache_entry(self):
-        """Stores cache entry in database."""
-        from app.services.pipeline.stages.cache_helpers import store_cached_response
-
-        mock_session = AsyncMock()
+    async def test_single_insert_ignoring_existing_keys(self):
+        """All entries go out in one INSERT ... ON CONFLICT DO NOTHING."""
+        from sqlalchemy.dialects import postgresql
 
-        await store_cached_response(
-            mock_session,
-            game_id=123,
-            batch_key="abc123",
-            prompt_preview="Test prompt",
-            response_data={"narratives": ["test"]},
-            model="gpt-4",
-        )
+        from app.services.pipeline.stages.cache_helpers import CacheEntry, store_cached_responses
 
-        mock_session.add.assert_called_once()
-        mock_session.flush.assert_called_once()
+        mock_session = AsyncMock()
+        entries = [
+            CacheEntry(key="k1", prompt="x" * 5000, response_data={"blocks": []}, model="gpt-4o"),
+            CacheEntry(key="k2", prompt="", response_data={"blocks": []}, model="gpt-4o"),
+        ]
 
-    @pytest.mark.asyncio
-    async def test_truncates_long_prompt(self):
-        """Truncates prompt preview to 2000 chars."""
-        from app.services.pipeline.stages.cache_helpers import store_cached_response
+        await store_cached_responses(mock_session, game_id=123, entries=entries)
 
-        mock_session = AsyncMock()
-        long_prompt = "x" * 5000
-
-        await store_cached_response(
-            mock_session,
-            game_id=123,
-            batch_key="abc123",
-            prompt_preview=long_prompt,
-            response_data={"narratives": ["test"]},
-            model="gpt-4",
-        )
-
-        # Verify add was called
-        mock_session.add.assert_called_once()
-        # Get the cache entry that was added
-        cache_entry = mock_session.add.call_args[0][0]
-        assert len(cache_entry.prompt_preview) == 2000
+        mock_session.execute.assert_called_once()
+        stmt = mock_session.execute.call_args[0][0]
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (game_id, batch_key) DO NOTHING" in sql
+        params = stmt.compile(dialect=postgresql.dialect()).params
+        assert len(params["prompt_preview_m0"]) == 2000
+        assert params["prompt_preview_m1"] is None
 
     @pytest.mark.asyncio
-    async def test_handles_none_prompt(self):
-        """Handles None prompt preview."""
-        from app.services.pipeline.stages.cache_helpers import store_cached_response
+    async def test_empty_is_noop(self):
+        """Nothing to store means no statement."""
+        from app.services.pipeline.stages.cache_helpers import store_cached_responses
 
         mock_session = AsyncMock()
-
-        await store_cached_response(
-            mock_session,
-            game_id=123,
-            batch_key="abc123",
-            prompt_preview=None,
-            response_data={"narratives": ["test"]},
-            model="gpt-4",
-        )
-
-        mock_session.add.assert_called_once()
-        cache_entry = mock_session.add.call_args[0][0]
-        assert cache_entry.prompt_preview is None
+        await store_cached_responses(mock_session, game_id=123, entries=[])
+        mock_session.execute.assert_not_called()
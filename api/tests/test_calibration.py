@@ -11,7 +11,7 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from app.analytics.calibration.calibrator import SimCalibrator
+from app.analytics.calibration.calibrator import SimCalibrator, _reliability_bins
 from app.analytics.calibration.dataset import (
     CalibrationRow,
     _devig_closing_lines,
@@ -152,6 +152,80 @@ class TestSimCalibrator:
             assert "count" in b
             assert b["count"] > 0
 
+    def test_calibrate_many_matches_calibrate(self):
+        sim_wps, actuals = self._make_dataset(n=200, bias=0.1)
+        cal = SimCalibrator()
+        cal.train(sim_wps, actuals)
+        probes = [0.0, 0.05, 0.3, 0.42, 0.5, 0.61, 0.8, 1.0]
+
+        batch = cal.calibrate_many(probes)
+
+        assert batch.tolist() == [cal.calibrate(p) for p in probes]
+
+    def test_calibrate_many_empty_and_untrained(self):
+        cal = SimCalibrator()
+        with pytest.raises(RuntimeError, match="not been trained"):
+            cal.calibrate_many([0.5])
+
+        sim_wps, actuals = self._make_dataset()
+        cal.train(sim_wps, actuals)
+        assert cal.calibrate_many([]).size == 0
+
+    def test_metrics_match_scalar_formulas(self):
+        sim_wps, actuals = self._make_dataset(n=150, bias=0.05)
+        cal = SimCalibrator()
+        cal.train(sim_wps, actuals)
+
+        metrics = cal.evaluate(sim_wps, actuals)
+
+        y = [1.0 if a else 0.0 for a in actuals]
+        calibrated = [cal.calibrate(p) for p in sim_wps]
+        brier_before = sum((p - a) ** 2 for p, a in zip(sim_wps, y, strict=True)) / len(y)
+        brier_after = sum((c - a) ** 2 for c, a in zip(calibrated, y, strict=True)) / len(y)
+        assert metrics.brier_before == pytest.approx(brier_before, abs=1e-6)
+        assert metrics.brier_after == pytest.approx(brier_after, abs=1e-6)
+        assert metrics.sample_count == 150
+
+
+def _loop_reliability_bins(raw, calibrated, actuals, n_bins=10):
+    """Reference: one scan of the predictions per bin."""
+    bins = []
+    for i in range(n_bins):
+        lo, hi = i / n_bins, (i + 1) / n_bins
+        idx = [j for j, p in enumerate(raw) if lo <= p < hi]
+        if not idx:
+            continue
+        bins.append({
+            "bin_start": round(lo, 2),
+            "bin_end": round(hi, 2),
+            "count": len(idx),
+            "avg_predicted": round(sum(raw[j] for j in idx) / len(idx), 4),
+            "avg_calibrated": round(sum(calibrated[j] for j in idx) / len(idx), 4),
+            "avg_actual": round(sum(actuals[j] for j in idx) / len(idx), 4),
+        })
+    return bins
+
+
+class TestReliabilityBins:
+    def test_matches_per_bin_scan(self):
+        import random
+
+        rng = random.Random(7)
+        # Exact bin edges, 1.0 and out-of-range values included
+        raw = [rng.random() for _ in range(500)] + [0.0, 0.1, 0.3, 0.7, 0.9, 1.0, -0.1, 1.2]
+        calibrated = [min(0.99, max(0.01, p * 0.9 + 0.05)) for p in raw]
+        actuals = [1.0 if rng.random() < 0.5 else 0.0 for _ in raw]
+
+        assert _reliability_bins(raw, calibrated, actuals) == _loop_reliability_bins(
+            raw, calibrated, actuals,
+        )
+
+    def test_empty_bins_are_omitted(self):
+        bins = _reliability_bins([0.55, 0.56], [0.5, 0.5], [1.0, 0.0], n_bins=4)
+
+        assert [(b["bin_start"], b["count"]) for b in bins] == [(0.5, 2)]
+        assert isinstance(bins[0]["count"], int)
+
 
 # ---------------------------------------------------------------------------
 # Dataset builder helper tests
@@ -1,9 +1,12 @@
 """Tests for consensus lineup prediction in lineup_fetcher."""
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
-from app.analytics.services.lineup_fetcher import fetch_consensus_lineup
+from app.analytics.services.lineup_fetcher import fetch_consensus_lineup, fetch_recent_lineup
+from app.analytics.services.lineup_reconstruction import load_recent_lineups
 
 
 def _make_lineup(*names):
@@ -17,11 +20,26 @@ _RECONSTRUCT_PATH = (
     "app.analytics.services.lineup_reconstruction.reconstruct_lineup_from_pbp"
 )
 _RECENT_PATH = "app.analytics.services.lineup_fetcher.fetch_recent_lineup"
+_STORED_PATH = "app.analytics.services.lineup_reconstruction.load_recent_lineups"
 
 
 class TestFetchConsensusLineup:
     """Tests for fetch_consensus_lineup."""
 
+    @pytest.fixture(autouse=True)
+    def no_materialized_lineups(self):
+        """Reconstruction-path tests run as if mlb_game_lineups were empty.
+
+        Each test puts its recent game ids on ``db.execute``; they come
+        back from ``load_recent_lineups`` with no stored lineup.
+        """
+        async def unmaterialized(db, team_id, *, before_game_id=None, limit=7):
+            result = await db.execute(None)
+            return [(gid, None) for gid in result.scalars().all()[:limit]]
+
+        with patch(_STORED_PATH, side_effect=unmaterialized):
+            yield
+
     @pytest.mark.asyncio
     async def test_returns_none_when_no_games(self):
         db = AsyncMock()
@@ -160,3 +178,94 @@ class TestFetchConsensusLineup:
         assert len(result) == 9
         assert result[0]["external_ref"] == "A"
         assert result[1]["external_ref"] == "B"
+
+
+def _stored(*names):
+    return MagicMock(batters=_make_lineup(*names))
+
+
+class TestMaterializedLineups:
+    """Recent games come from sports_games; stored lineups fill them in."""
+
+    @pytest.mark.asyncio
+    async def test_full_window_needs_no_reconstruction(self):
+        db = AsyncMock()
+        recent = [(100 + i, _stored(*"ABCDEFGHI")) for i in range(5)]
+
+        with (
+            patch(_STORED_PATH, new_callable=AsyncMock, return_value=recent) as mock_stored,
+            patch(_RECONSTRUCT_PATH, new_callable=AsyncMock) as mock_reconstruct,
+        ):
+            result = await fetch_consensus_lineup(db, team_id=1, before_game_id=99, num_games=5)
+
+        assert [b["external_ref"] for b in result] == list("ABCDEFGHI")
+        mock_stored.assert_awaited_once_with(db, 1, before_game_id=99, limit=5)
+        mock_reconstruct.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_only_missing_games_are_reconstructed(self):
+        db = AsyncMock()
+        recent = [
+            (104, _stored(*"ABCDEFGHI")),
+            (103, None),
+            (102, _stored(*"ABCDEFGHI")),
+            (101, None),
+        ]
+
+        with (
+            patch(_STORED_PATH, new_callable=AsyncMock, return_value=recent),
+            patch(
+                _RECONSTRUCT_PATH,
+                new_callable=AsyncMock,
+                return_value={"batters": _make_lineup(*"ABCDEFGHI")},
+            ) as mock_reconstruct,
+        ):
+            result = await fetch_consensus_lineup(db, team_id=1, num_games=4)
+
+        assert len(result) == 9
+        assert [c.args[1] for c in mock_reconstruct.await_args_list] == [103, 101]
+
+    @pytest.mark.asyncio
+    async def test_recent_lineup_reconstructs_unmaterialized_latest_game(self):
+        """An older stored lineup never stands in for the newest game."""
+        db = AsyncMock()
+
+        with (
+            patch(_STORED_PATH, new_callable=AsyncMock, return_value=[(105, None)]),
+            patch(
+                _RECONSTRUCT_PATH,
+                new_callable=AsyncMock,
+                return_value={"batters": _make_lineup(*"JKLMNOPQR")},
+            ) as mock_reconstruct,
+        ):
+            result = await fetch_recent_lineup(db, team_id=1)
+
+        assert [b["external_ref"] for b in result] == list("JKLMNOPQR")
+        mock_reconstruct.assert_awaited_once_with(db, 105, 1)
+
+    @pytest.mark.asyncio
+    async def test_no_lineup_marker_is_not_reconstructed(self):
+        db = AsyncMock()
+        marker = MagicMock(batters=[])
+
+        with (
+            patch(_STORED_PATH, new_callable=AsyncMock, return_value=[(105, marker)]),
+            patch(_RECONSTRUCT_PATH, new_callable=AsyncMock) as mock_reconstruct,
+        ):
+            result = await fetch_recent_lineup(db, team_id=1)
+
+        assert result is None
+        mock_reconstruct.assert_not_awaited()
+
+    def test_window_is_recent_final_games_left_joined(self):
+        db = AsyncMock()
+        db.execute.return_value.all = MagicMock(return_value=[])
+
+        asyncio.run(load_recent_lineups(db, 7, before_game_id=99, limit=5))
+
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "FROM sports_games LEFT OUTER JOIN mlb_game_lineups" in sql
+        assert "mlb_game_lineups.team_id = %(team_id_1)s" in sql
+        assert "sports_games.status IN" in sql
+        assert "sports_games.id != %(id_2)s" in sql
+        assert sql.endswith("LIMIT %(param_1)s")
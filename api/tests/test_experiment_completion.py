@@ -0,0 +1,209 @@
+"""Tests for event-driven experiment suite completion tracking."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.tasks import experiment_tasks
+from app.tasks.training_tasks import TRAINING_DONE_CHANNEL, _notify_training_done
+
+
+class _FakeConn:
+    def __init__(self) -> None:
+        self.callback = None
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_settle(monkeypatch) -> dict:
+    """Jobs listed in ``state["done"]`` settle on the next sweep."""
+    state: dict = {"done": set(), "sweeps": 0}
+
+    async def settle(sf, suite_id, pending, counts):
+        state["sweeps"] += 1
+        for job_id in [j for j in pending if j in state["done"]]:
+            del pending[job_id]
+            counts["completed"] += 1
+
+    monkeypatch.setattr(experiment_tasks, "_settle_finished_jobs", settle)
+    return state
+
+
+class TestAwaitVariantCompletion:
+    def test_notification_wakes_coordinator(self, monkeypatch, fake_settle) -> None:
+        conn = _FakeConn()
+
+        async def listen(callback):
+            conn.callback = callback
+            return conn
+
+        monkeypatch.setattr(experiment_tasks, "_listen_for_training_jobs", listen)
+
+        async def run():
+            task = asyncio.create_task(experiment_tasks._await_variant_completion(
+                None, 1, [(10, 100, "t1"), (11, 101, "t2")], fallback_interval=30,
+            ))
+            await asyncio.sleep(0.01)
+            fake_settle["done"].add(100)
+            conn.callback(None, 0, TRAINING_DONE_CHANNEL, "100")
+            await asyncio.sleep(0.01)
+            fake_settle["done"].add(101)
+            conn.callback(None, 0, TRAINING_DONE_CHANNEL, "101")
+            return await task
+
+        started = time.monotonic()
+        assert asyncio.run(run()) == (2, 0)
+        assert time.monotonic() - started < 5
+        assert fake_settle["sweeps"] == 3
+        assert conn.closed
+
+    def test_other_jobs_do_not_wake(self, monkeypatch, fake_settle) -> None:
+        conn = _FakeConn()
+
+        async def listen(callback):
+            conn.callback = callback
+            return conn
+
+        monkeypatch.setattr(experiment_tasks, "_listen_for_training_jobs", listen)
+
+        async def run():
+            task = asyncio.create_task(experiment_tasks._await_variant_completion(
+                None, 1, [(10, 100, "t1")], fallback_interval=0.2,
+            ))
+            await asyncio.sleep(0.01)
+            conn.callback(None, 0, TRAINING_DONE_CHANNEL, "999")
+            conn.callback(None, 0, TRAINING_DONE_CHANNEL, "not-a-job")
+            await asyncio.sleep(0.05)
+            sweeps_after_noise = fake_settle["sweeps"]
+            fake_settle["done"].add(100)
+            result = await task
+            return sweeps_after_noise, result
+
+        sweeps_after_noise, result = asyncio.run(run())
+
+        assert sweeps_after_noise == 1
+        assert result == (1, 0)
+
+    def test_falls_back_to_polling_without_listen(self, monkeypatch, fake_settle) -> None:
+        async def no_listen(callback):
+            return None
+
+        monkeypatch.setattr(experiment_tasks, "_listen_for_training_jobs", no_listen)
+        monkeypatch.setattr(experiment_tasks, "_POLL_SECONDS", 0.01)
+
+        async def run():
+            task = asyncio.create_task(experiment_tasks._await_variant_completion(
+                None, 1, [(10, 100, "t1")], fallback_interval=30,
+            ))
+            await asyncio.sleep(0.05)
+            fake_settle["done"].add(100)
+            return await task
+
+        assert asyncio.run(run()) == (1, 0)
+        assert fake_settle["sweeps"] > 2
+
+
+def _result(rows=None, scalars=None) -> MagicMock:
+    result = MagicMock()
+    result.__iter__.return_value = iter(rows or [])
+    result.scalars.return_value = scalars or []
+    return result
+
+
+class TestSettleFinishedJobs:
+    def test_bulk_settles_finished_variants(self) -> None:
+        jobs = [
+            SimpleNamespace(id=100, status="completed", model_id="m1", metrics={"accuracy": 0.6}, error_message=None),
+            SimpleNamespace(id=101, status="failed", model_id=None, metrics=None, error_message="boom"),
+            SimpleNamespace(id=102, status="running", model_id=None, metrics=None, error_message=None),
+        ]
+        variants = [
+            SimpleNamespace(id=v, status="running", model_id=None, training_metrics=None,
+                            error_message=None, completed_at=None)
+            for v in (10, 11, 13)
+        ]
+        suite = SimpleNamespace(completed_variants=0, failed_variants=0)
+        session = AsyncMock()
+        session.execute.side_effect = [_result(rows=jobs), _result(scalars=variants)]
+        session.get.return_value = suite
+        sf = MagicMock()
+        sf.return_value.__aenter__.return_value = session
+        pending = {100: 10, 101: 11, 102: 12, 103: 13}
+        counts = {"completed": 0, "failed": 0}
+
+        asyncio.run(experiment_tasks._settle_finished_jobs(sf, 1, pending, counts))
+
+        assert pending == {102: 12}
+        assert counts == {"completed": 1, "failed": 2}
+        assert session.execute.await_count == 2
+        assert (variants[0].status, variants[0].model_id) == ("completed", "m1")
+        assert variants[1].error_message == "boom"
+        assert variants[2].error_message == "Training job 103 not found"
+        assert (suite.completed_variants, suite.failed_variants) == (1, 2)
+        session.commit.assert_awaited_once()
+
+    def test_no_finished_jobs_skips_writes(self) -> None:
+        running = SimpleNamespace(id=100, status="running")
+        session = AsyncMock()
+        session.execute.return_value = _result(rows=[running])
+        sf = MagicMock()
+        sf.return_value.__aenter__.return_value = session
+        pending = {100: 10}
+
+        asyncio.run(experiment_tasks._settle_finished_jobs(sf, 1, pending, {"completed": 0, "failed": 0}))
+
+        assert pending == {100: 10}
+        session.commit.assert_not_awaited()
+
+
+def _savepoint_db() -> AsyncMock:
+    db = AsyncMock()
+    db.begin_nested = MagicMock()
+    db.begin_nested.return_value.__aenter__ = AsyncMock()
+    db.begin_nested.return_value.__aexit__ = AsyncMock(return_value=False)
+    return db
+
+
+class TestNotifyTrainingDone:
+    def test_notify_uses_channel_and_job_id(self) -> None:
+        db = _savepoint_db()
+
+        asyncio.run(_notify_training_done(db, 42))
+
+        stmt, params = db.execute.call_args.args
+        assert "pg_notify" in str(stmt)
+        assert params == {"channel": TRAINING_DONE_CHANNEL, "payload": "42"}
+        db.begin_nested.assert_called_once()
+
+    def test_notify_failure_is_swallowed(self) -> None:
+        db = _savepoint_db()
+        db.execute.side_effect = RuntimeError("db gone")
+
+        asyncio.run(_notify_training_done(db, 42))
+
+        # The savepoint saw the failure, so only the notify is rolled back
+        exc_type = db.begin_nested.return_value.__aexit__.await_args.args[0]
+        assert exc_type is RuntimeError
+
+
+class TestListenForTrainingJobs:
+    def test_connects_with_listener_dsn(self, monkeypatch) -> None:
+        conn = AsyncMock()
+        connect = AsyncMock(return_value=conn)
+        monkeypatch.setattr("asyncpg.connect", connect)
+        monkeypatch.setattr("app.realtime.listener.listen_dsn", lambda: "postgresql://u@h/db")
+        callback = MagicMock()
+
+        result = asyncio.run(experiment_tasks._listen_for_training_jobs(callback))
+
+        assert result is conn
+        connect.assert_awaited_once_with("postgresql://u@h/db")
+        conn.add_listener.assert_awaited_once_with(TRAINING_DONE_CHANNEL, callback)
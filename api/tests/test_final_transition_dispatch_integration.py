@@ -1,7 +1,7 @@
 """Integration test: FINAL status transition → exactly one task enqueued.
 
 Exercises the full hook chain (after_flush + after_commit) in sequence and
-asserts that trigger_flow_for_game is dispatched to the sports-scraper queue
+asserts that trigger_flow_for_game is dispatched to the sports-flow queue
 exactly once per game_id on a FINAL transition.
 """
 
@@ -78,7 +78,7 @@ class TestFinalTransitionDispatch:
         name, kwargs = mock_celery.send_task.call_args.args[0], mock_celery.send_task.call_args.kwargs
         assert name == "trigger_flow_for_game"
         assert kwargs["args"] == [101]
-        assert kwargs["queue"] == "sports-scraper"
+        assert kwargs["queue"] == "sports-flow"
 
     def test_no_task_for_non_final_transition(self):
         """Scheduled→live must NOT dispatch a flow task."""
@@ -0,0 +1,278 @@
+"""Tests for materialized game-detail documents and the per-sport load plan."""
+
+from __future__ import annotations
+
+import re
+from datetime import UTC, date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from sqlalchemy import create_engine, event, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from app.db import Base
+from app.db.sports import SportsGame
+from app.routers.sports import game_detail
+from app.services import game_detail_docs
+from app.services.game_detail_docs import (
+    DETAIL_DOC_FORMAT,
+    _fingerprint,
+    probe_game,
+    store_detail_doc,
+)
+
+STAMPS = tuple(datetime(2026, 4, 10, 3, i, tzinfo=UTC) for i in range(9))
+
+
+def _session_returning(row):
+    session = AsyncMock()
+    session.execute.return_value = MagicMock(first=MagicMock(return_value=row))
+    return session
+
+
+def _row(status="final", *, doc_format=DETAIL_DOC_FORMAT, fingerprint=None, payload=None, has_flow=True, stamps=STAMPS):
+    return (status, "NBA", has_flow, doc_format, fingerprint, payload, *stamps)
+
+
+class TestProbeGame:
+    @pytest.mark.asyncio
+    async def test_missing_game(self):
+        assert await probe_game(_session_returning(None), 1) is None
+
+    @pytest.mark.asyncio
+    async def test_serves_matching_document(self):
+        fp = _fingerprint("final", True, STAMPS)
+        probe = await probe_game(_session_returning(_row(fingerprint=fp, payload={"game": {}})), 1)
+        assert probe.document == {"game": {}}
+        assert probe.league_code == "NBA"
+        assert probe.has_flow is True
+
+    @pytest.mark.asyncio
+    async def test_stale_fingerprint_is_rebuilt(self):
+        fp = _fingerprint("final", True, STAMPS)
+        later = (*STAMPS[:-1], datetime(2026, 4, 11, tzinfo=UTC))
+        probe = await probe_game(_session_returning(_row(fingerprint=fp, payload={}, stamps=later)), 1)
+        assert probe.document is None
+        assert probe.materializable
+
+    @pytest.mark.asyncio
+    async def test_probe_reads_newest_social_post(self):
+        session = _session_returning(None)
+        await probe_game(session, 1)
+        sql = str(session.execute.await_args.args[0])
+        assert "max(team_social_posts.updated_at)" in sql
+        assert "team_social_posts.game_id = sports_games.id" in sql
+
+    @pytest.mark.asyncio
+    async def test_flow_and_status_change_fingerprint(self):
+        base = _fingerprint("final", False, STAMPS)
+        assert _fingerprint("final", True, STAMPS) != base
+        assert _fingerprint("recap_ready", False, STAMPS) != base
+
+    @pytest.mark.asyncio
+    async def test_old_format_ignored(self):
+        fp = _fingerprint("final", True, STAMPS)
+        probe = await probe_game(_session_returning(_row(doc_format=DETAIL_DOC_FORMAT - 1, fingerprint=fp, payload={})), 1)
+        assert probe.document is None
+
+    @pytest.mark.asyncio
+    async def test_live_game_not_materialized(self):
+        fp = _fingerprint("live", True, STAMPS)
+        probe = await probe_game(_session_returning(_row("live", fingerprint=fp, payload={})), 1)
+        assert probe.document is None
+        assert not probe.materializable
+
+
+class TestStoreDetailDoc:
+    @pytest.mark.asyncio
+    async def test_failure_is_swallowed(self):
+        session = MagicMock()
+        session.begin_nested.return_value.__aenter__ = AsyncMock()
+        session.begin_nested.return_value.__aexit__ = AsyncMock(return_value=False)
+        session.execute = AsyncMock(side_effect=RuntimeError("relation does not exist"))
+        await store_detail_doc(session, 1, "fp", {"game": {}})
+        session.execute.assert_awaited_once()
+
+
+class TestGetGame:
+    @pytest.mark.asyncio
+    async def test_hit_skips_orm_load(self, monkeypatch):
+        probe = game_detail_docs.GameDetailProbe("NBA", "final", True, "fp", {"game": {"id": 1}})
+        monkeypatch.setattr(game_detail, "probe_game", AsyncMock(return_value=probe))
+        session = AsyncMock()
+
+        response = await game_detail.get_game(1, session)
+
+        assert isinstance(response, JSONResponse)
+        assert response.headers["X-Cache"] == "HIT"
+        session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_game_404(self, monkeypatch):
+        monkeypatch.setattr(game_detail, "probe_game", AsyncMock(return_value=None))
+        with pytest.raises(HTTPException) as exc:
+            await game_detail.get_game(1, AsyncMock())
+        assert exc.value.status_code == 404
+
+
+class TestDetailLoadOptions:
+    def _paths(self, league_code):
+        return {str(opt.path) for opt in game_detail._detail_load_options(league_code)}
+
+    def test_shared_sections_for_every_sport(self):
+        base = len(game_detail._detail_load_options(None))
+        assert base == 9
+        assert len(game_detail._detail_load_options("NBA")) == base + 2
+        assert len(game_detail._detail_load_options("MLB")) == base + 4
+        assert len(game_detail._detail_load_options("NHL")) == base + 3
+
+    def test_only_own_sport_advanced_stats(self):
+        nba = " ".join(self._paths("NBA"))
+        assert "nba_advanced_stats" in nba
+        assert "nhl_" not in nba
+        assert "pitcher_game_stats" not in nba
+        assert "timeline_artifacts" not in nba
+
+
+# ---------------------------------------------------------------------------
+# Statements emitted by the load plan (SQLite stand-in for Postgres)
+# ---------------------------------------------------------------------------
+
+
+@compiles(JSONB, "sqlite")
+def _jsonb_on_sqlite(type_, compiler, **kw):
+    return "JSON"
+
+
+_SHARED_TABLES = {
+    "sports_games",
+    "sports_leagues",
+    "sports_teams",
+    "sports_team_boxscores",
+    "sports_player_boxscores",
+    "sports_game_odds",
+    "team_social_posts",
+    "sports_game_plays",
+}
+_SEED_BY_TYPE = {
+    int: 1,
+    str: "x",
+    bool: False,
+    float: 0.0,
+    datetime: datetime(2026, 4, 10, tzinfo=UTC),
+    date: date(2026, 4, 10),
+    dict: {},
+    list: [],
+}
+
+
+def _seed_row(table) -> dict:
+    """One row per table, every foreign key pointing at id 1."""
+    row = {}
+    for column in table.columns:
+        if column.primary_key or column.foreign_keys:
+            row[column.name] = 1
+        elif not column.nullable:
+            row[column.name] = _SEED_BY_TYPE[column.type.python_type]
+    if table.name == "team_social_posts":
+        row["mapping_status"] = "mapped"
+    return row
+
+
+@pytest.fixture(scope="module")
+def detail_engine():
+    names = {rel.mapper.local_table.name for rel in SportsGame.__mapper__.relationships}
+    tables = [Base.metadata.tables[n] for n in sorted(names | _SHARED_TABLES)]
+    # Postgres server defaults ('{}'::jsonb, now()) do not parse in SQLite
+    defaults = {c: c.server_default for t in tables for c in t.columns if c.server_default}
+    engine = create_engine("sqlite://")
+    try:
+        for column in defaults:
+            column.server_default = None
+        Base.metadata.create_all(engine, tables=tables)
+    finally:
+        for column, default in defaults.items():
+            column.server_default = default
+    with engine.begin() as conn:
+        for table in tables:
+            conn.execute(table.insert().values(_seed_row(table)))
+    yield engine
+    engine.dispose()
+
+
+def _load_detail(engine, league_code):
+    statements: list[str] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        session = Session(engine)
+        game = session.execute(
+            select(SportsGame)
+            .options(*game_detail._detail_load_options(league_code))
+            .where(SportsGame.id == 1)
+        ).scalar_one()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return game, statements
+
+
+def _tables(statement: str) -> list[str]:
+    return re.findall(r"(?:FROM|JOIN) (\w+)", statement)
+
+
+class TestDetailLoadStatements:
+    @pytest.mark.parametrize(
+        "league_code,sport_tables",
+        [
+            (None, set()),
+            ("NBA", {"nba_game_advanced_stats", "nba_player_advanced_stats"}),
+            ("NCAAB", {"ncaab_game_advanced_stats", "ncaab_player_advanced_stats"}),
+            ("NFL", {"nfl_game_advanced_stats", "nfl_player_advanced_stats"}),
+            (
+                "NHL",
+                {
+                    "nhl_game_advanced_stats",
+                    "nhl_skater_advanced_stats",
+                    "nhl_goalie_advanced_stats",
+                },
+            ),
+            (
+                "MLB",
+                {
+                    "mlb_game_advanced_stats",
+                    "mlb_player_advanced_stats",
+                    "mlb_pitcher_game_stats",
+                    "mlb_player_fielding_stats",
+                },
+            ),
+        ],
+    )
+    def test_queries_only_rendered_sections(self, detail_engine, league_code, sport_tables):
+        _, statements = _load_detail(detail_engine, league_code)
+        assert {t for s in statements for t in _tables(s)} == _SHARED_TABLES | sport_tables
+
+    def test_unrendered_sections_raise_instead_of_loading(self, detail_engine):
+        game, _ = _load_detail(detail_engine, "NBA")
+        assert len(game.nba_advanced_stats) == 1
+        for attr in ("nhl_advanced_stats", "pitcher_game_stats", "timeline_artifacts"):
+            with pytest.raises(InvalidRequestError):
+                getattr(game, attr)
+
+    def test_shared_sections_skip_unserialized_columns(self, detail_engine):
+        _, statements = _load_detail(detail_engine, None)
+        # Keyed by the loaded table; the social-post load joins from sports_games
+        by_table = {_tables(s)[-1]: s for s in statements}
+        assert "sports_game_plays.raw_data" in by_table["sports_game_plays"]
+        assert "sports_game_plays.player_ref_id" not in by_table["sports_game_plays"]
+        assert "sports_game_odds.source_key" not in by_table["sports_game_odds"]
+        assert "team_social_posts.external_post_id" not in by_table["team_social_posts"]
+        for table in ("sports_game_plays", "sports_game_odds", "sports_player_boxscores"):
+            assert f"{table}.created_at" not in by_table[table]
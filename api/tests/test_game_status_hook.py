@@ -129,8 +129,8 @@ class TestDispatchFinalGameTasks:
         mock_celery.send_task.assert_called_once_with(
             "trigger_flow_for_game",
             args=[99],
-            queue="sports-scraper",
-            routing_key="sports-scraper",
+            queue="sports-flow",
+            routing_key="sports-flow",
             countdown=300,
             expires=3600,
         )
@@ -197,3 +197,50 @@ class TestClearPendingOnRollback:
     def test_no_error_on_empty_list(self):
         hooks._clear_pending_on_rollback(MagicMock())
         assert hooks._get_pending() == []
+
+
+class TestNotifyStatusChanges:
+    def _session(self, dirty, dialect="postgresql"):
+        session = _session_with(dirty)
+        session.connection.return_value.dialect.name = dialect
+        return session
+
+    def test_notifies_each_status_change(self):
+        game, inspected = _make_game(7, "pregame", "live")
+        session = self._session([game])
+        with patch("app.db.hooks.inspect", return_value=inspected):
+            hooks._notify_status_changes(session, None)
+
+        execute = session.connection.return_value.execute
+        execute.assert_called_once()
+        assert execute.call_args.args[1] == {"p": '{"game_id": 7, "event_type": "game_score_update"}'}
+
+    def test_skips_unchanged_status(self):
+        game, inspected = _make_game(7, "live", "live")
+        inspected.attrs.status.history.has_changes.return_value = False
+        session = self._session([game])
+        with patch("app.db.hooks.inspect", return_value=inspected):
+            hooks._notify_status_changes(session, None)
+        session.connection.assert_not_called()
+
+    def test_skips_non_postgres(self):
+        game, inspected = _make_game(7, "pregame", "live")
+        session = self._session([game], dialect="sqlite")
+        with patch("app.db.hooks.inspect", return_value=inspected):
+            hooks._notify_status_changes(session, None)
+        session.connection.return_value.execute.assert_not_called()
+
+    def test_notify_runs_in_savepoint(self):
+        game, inspected = _make_game(7, "pregame", "live")
+        session = self._session([game])
+        with patch("app.db.hooks.inspect", return_value=inspected):
+            hooks._notify_status_changes(session, None)
+        session.connection.return_value.begin_nested.assert_called_once()
+
+    def test_notify_failure_is_logged_not_raised(self, caplog):
+        game, inspected = _make_game(7, "pregame", "live")
+        session = self._session([game])
+        session.connection.return_value.execute.side_effect = RuntimeError("notify failed")
+        with patch("app.db.hooks.inspect", return_value=inspected), caplog.at_level("WARNING"):
+            hooks._notify_status_changes(session, None)
+        assert "game_status_notify_failed" in caplog.text
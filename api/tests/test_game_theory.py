@@ -6,8 +6,10 @@ and Minimax / Regret Matching — both unit logic and API routes.
 
 from __future__ import annotations
 
+import random
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
@@ -31,6 +33,12 @@ from app.analytics.game_theory.nash import (
     solve_zero_sum,
 )
 from app.analytics.game_theory.portfolio import optimize_portfolio
+from app.analytics.game_theory.solvers import (
+    exploitability,
+    fictitious_play,
+    regret_matching_solve,
+    solve_lp,
+)
 from app.db import get_db
 
 
@@ -538,3 +546,100 @@ class TestRegretMatchingConvergence:
             for regret in action_regrets.values():
                 # Regrets should be meaningful numbers, not just raw payoffs copied
                 assert isinstance(regret, float)
+
+
+class TestEquilibriumSolvers:
+    """NumPy solver engine: exact LP path, early stopping, reported gap."""
+
+    RPS = [[0, -1, 1], [1, 0, -1], [-1, 1, 0]]
+
+    @staticmethod
+    def _random_matrix(m: int, n: int, seed: int = 3) -> list[list[float]]:
+        rng = random.Random(seed)
+        return [[rng.uniform(0.2, 0.4) for _ in range(n)] for _ in range(m)]
+
+    def test_lp_is_exact_for_rps(self):
+        result = solve_zero_sum(self.RPS)
+        assert result.method == "lp"
+        assert result.row_strategy == pytest.approx([1 / 3] * 3, abs=1e-6)
+        assert result.col_strategy == pytest.approx([1 / 3] * 3, abs=1e-6)
+        assert result.exploitability == pytest.approx(0.0, abs=1e-9)
+
+    def test_lp_column_strategy_is_minimax(self):
+        a = np.array(self._random_matrix(8, 6))
+        result = solve_lp(a)
+        # Neither player can gain by deviating; both sides agree on the value
+        assert result.exploitability < 1e-9
+        assert np.max(a @ result.col_strategy) == pytest.approx(result.game_value, abs=1e-9)
+        assert np.min(result.row_strategy @ a) == pytest.approx(result.game_value, abs=1e-9)
+
+    def test_fictitious_play_stops_early(self):
+        a = np.array([[5.0, 5.0], [1.0, 1.0]])
+        result = fictitious_play(a, max_iterations=10_000, tolerance=0.01)
+        assert result.iterations < 10_000
+        assert result.exploitability <= 0.01 * 4
+
+    def test_fictitious_play_runs_to_cap_without_tolerance_hit(self):
+        result = fictitious_play(np.array(self.RPS, dtype=float), max_iterations=50, tolerance=1e-9)
+        assert result.iterations == 50
+        assert result.exploitability > 0
+
+    def test_fictitious_play_matches_lp_value(self):
+        matrix = self._random_matrix(9, 9)
+        exact = solve_zero_sum(matrix, method="lp")
+        approx = solve_zero_sum(matrix, method="fictitious_play")
+        assert approx.method == "fictitious_play"
+        assert approx.game_value == pytest.approx(exact.game_value, abs=1e-3)
+
+    def test_auto_falls_back_when_lp_unavailable(self, monkeypatch):
+        from app.analytics.game_theory import nash
+
+        monkeypatch.setattr(nash, "solve_lp", lambda a: None)
+        result = solve_zero_sum([[5, 5], [1, 1]])
+        assert result.method == "fictitious_play"
+        assert result.row_strategy[0] > 0.9
+
+    def test_unknown_method_rejected(self):
+        with pytest.raises(ValueError, match="Unknown method"):
+            solve_zero_sum([[1]], method="simplex")
+
+    def test_regret_matching_reports_iterations_and_gap(self):
+        result = regret_matching(self._random_matrix(30, 30), iterations=10_000)
+        assert 0 < result.iterations < 10_000
+        assert result.exploitability <= 1e-3 * 0.2
+
+    def test_regret_matching_converges_to_lp_value(self):
+        a = np.array(self._random_matrix(12, 10))
+        state = regret_matching_solve(a, iterations=20_000, tolerance=1e-4)
+        exact = solve_lp(a)
+        assert state.result.game_value == pytest.approx(exact.game_value, abs=1e-3)
+
+    @pytest.mark.parametrize("size", [5, 8])
+    def test_regret_matching_converges_well_under_cap(self, size):
+        for a in ([[3, 1], [2, 4]], self._random_matrix(size, size, seed=size)):
+            state = regret_matching_solve(np.array(a, dtype=float))
+            assert state.result.iterations <= 1_000
+            assert state.result.exploitability <= 1e-3 * np.ptp(a)
+
+    def test_regret_matching_non_rectangular_raises(self):
+        with pytest.raises(ValueError, match="Non-rectangular"):
+            regret_matching([[1, 2], [3]])
+
+    def test_exploitability_zero_only_at_equilibrium(self):
+        a = np.array(self.RPS, dtype=float)
+        uniform = np.full(3, 1 / 3)
+        assert exploitability(a, uniform, uniform) == pytest.approx(0.0)
+        assert exploitability(a, np.array([1.0, 0, 0]), uniform) > 0
+
+    def test_nash_route_accepts_method(self):
+        client = _make_client()
+        resp = client.post("/api/analytics/game-theory/nash", json={
+            "payoff_matrix": [[1, -1], [-1, 1]],
+            "method": "fictitious_play",
+            "tolerance": 0.01,
+        })
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["method"] == "fictitious_play"
+        assert data["iterations"] < 10_000
+        assert "exploitability" in data
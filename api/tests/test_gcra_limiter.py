@@ -0,0 +1,215 @@
+"""Tests for the GCRA rate limiter and its Redis/local backends."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+
+import pytest
+
+from app.middleware.rate_limit import RateLimitMiddleware
+from app.services import gcra_limiter
+from app.services.circuit_breaker_registry import registry as cb_registry
+from app.services.gcra_limiter import LocalGCRA, MemoryGCRA, RedisGCRA
+
+
+class _FakeRedisScript:
+    """Python twin of the Lua script over a dict shared by "replicas"."""
+
+    def __init__(self, store: dict[str, float], clock: list[float]) -> None:
+        self.store = store
+        self.clock = clock
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        emission, window = float(args[0]), float(args[1])
+        now = self.clock[0] * 1000
+        tat = max(self.store.get(keys[0], now), now)
+        new_tat = tat + emission
+        allow_at = new_tat - window
+        if allow_at - now > 0.001:
+            return [0, math.ceil(allow_at - now)]
+        self.store[keys[0]] = new_tat
+        return [1, 0]
+
+
+class _BrokenScript:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        raise ConnectionError("redis down")
+
+
+class TestLocalGCRA:
+    def test_burst_then_exact_retry_after(self) -> None:
+        gcra = LocalGCRA()
+
+        allowed = [gcra.check("k", 10, 60, now=100.0).allowed for _ in range(10)]
+        denied = gcra.check("k", 10, 60, now=100.0)
+
+        assert all(allowed)
+        assert not denied.allowed
+        assert denied.retry_after == pytest.approx(6.0)
+
+    def test_refills_one_request_per_emission_interval(self) -> None:
+        gcra = LocalGCRA()
+        for _ in range(10):
+            gcra.check("k", 10, 60, now=100.0)
+
+        assert gcra.check("k", 10, 60, now=106.0).allowed
+        assert not gcra.check("k", 10, 60, now=106.0).allowed
+
+    def test_uneven_emission_interval_allows_full_burst(self) -> None:
+        gcra = LocalGCRA()
+
+        assert all(gcra.check("k", 7, 60, now=0.0).allowed for _ in range(7))
+
+    def test_denied_requests_do_not_extend_the_wait(self) -> None:
+        gcra = LocalGCRA()
+        gcra.check("k", 1, 60, now=0.0)
+        for _ in range(5):
+            gcra.check("k", 1, 60, now=1.0)
+
+        assert gcra.check("k", 1, 60, now=60.0).allowed
+
+    def test_expired_keys_are_pruned(self, monkeypatch) -> None:
+        monkeypatch.setattr(gcra_limiter, "_PRUNE_EVERY", 100)
+        gcra = LocalGCRA()
+        for i in range(99):
+            gcra.check(f"ip-{i}", 10, 60, now=0.0)
+        assert len(gcra) == 99
+
+        gcra.check("late", 10, 60, now=1000.0)
+
+        assert len(gcra) == 1
+
+
+class TestRedisGCRA:
+    def test_replicas_share_one_budget(self) -> None:
+        store: dict[str, float] = {}
+        clock = [1000.0]
+        replicas = [RedisGCRA("redis://unused"), RedisGCRA("redis://unused")]
+        for replica in replicas:
+            replica._script = _FakeRedisScript(store, clock)
+
+        async def run() -> list[bool]:
+            results = []
+            for i in range(6):
+                decision = await replicas[i % 2].check("ip:1.2.3.4", 4, 60)
+                results.append(decision.allowed)
+            return results
+
+        assert asyncio.run(run()) == [True, True, True, True, False, False]
+        assert list(store) == ["ratelimit:gcra:ip:1.2.3.4"]
+
+    def test_retry_after_comes_from_script(self) -> None:
+        limiter = RedisGCRA("redis://unused")
+        limiter._script = _FakeRedisScript({}, [0.0])
+
+        async def run():
+            await limiter.check("k", 1, 30)
+            return await limiter.check("k", 1, 30)
+
+        decision = asyncio.run(run())
+        assert not decision.allowed
+        assert decision.retry_after == 30.0
+        assert decision.retry_after_header == "30"
+
+    def test_outage_falls_back_to_local_and_opens_circuit(self) -> None:
+        limiter = RedisGCRA("redis://unused")
+        broken = _BrokenScript()
+        limiter._script = broken
+
+        async def run() -> list[bool]:
+            return [(await limiter.check("k", 2, 60)).allowed for _ in range(3)]
+
+        assert asyncio.run(run()) == [True, True, False]
+        # Only the first call reaches Redis; the circuit skips it afterwards
+        assert broken.calls == 1
+        assert cb_registry.get("rate_limit_redis").is_open
+
+    def test_recovery_resets_circuit(self) -> None:
+        limiter = RedisGCRA("redis://unused")
+        limiter._script = _BrokenScript()
+        asyncio.run(limiter.check("k", 5, 60))
+
+        limiter._error_until = time.monotonic() - 1
+        limiter._script = _FakeRedisScript({}, [0.0])
+        decision = asyncio.run(limiter.check("k", 5, 60))
+
+        assert decision.allowed
+        assert not cb_registry.get("rate_limit_redis").is_open
+
+
+class _RecordingLimiter(MemoryGCRA):
+    def __init__(self) -> None:
+        super().__init__()
+        self.keys: list[str] = []
+
+    async def check(self, key, limit, window):
+        self.keys.append(key)
+        return await super().check(key, limit, window)
+
+
+def _call(middleware, path: str, headers: list | None = None) -> dict:
+    response: dict = {}
+
+    async def app(scope, receive, send):
+        response["status"] = 200
+
+    async def receive():
+        return {"type": "http.request", "body": b""}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = dict(message["headers"])
+
+    middleware.app = app
+    scope = {
+        "type": "http",
+        "path": path,
+        "query_string": b"",
+        "headers": headers or [],
+        "server": ("localhost", 8000),
+        "client": ("9.9.9.9", 1234),
+    }
+    asyncio.run(middleware(scope, receive, send))
+    return response
+
+
+class TestMiddleware:
+    def test_retry_after_is_time_until_next_slot(self) -> None:
+        middleware = RateLimitMiddleware(None, limiter=MemoryGCRA())
+        for _ in range(10):
+            _call(middleware, "/auth/login")
+
+        response = _call(middleware, "/auth/login")
+
+        assert response["status"] == 429
+        # 10 per 60s refills every 6s, not after a whole window
+        assert int(response["headers"][b"retry-after"]) in (5, 6)
+
+    def test_api_key_is_hashed_in_bucket_key(self) -> None:
+        limiter = _RecordingLimiter()
+        middleware = RateLimitMiddleware(None, limiter=limiter)
+
+        _call(middleware, "/api/v1/games", headers=[(b"x-api-key", b"secret-key-123")])
+
+        assert limiter.keys[0].startswith("key:")
+        assert "secret-key-123" not in limiter.keys[0]
+
+    def test_tiers_use_separate_buckets(self) -> None:
+        limiter = _RecordingLimiter()
+        middleware = RateLimitMiddleware(None, limiter=limiter)
+
+        for path in ("/auth/login", "/api/onboarding/club-claims", "/api/admin/x", "/api/v1/x"):
+            _call(middleware, path)
+
+        assert [k.split(":")[0] for k in limiter.keys] == [
+            "auth", "ip", "onboarding", "admin", "ip",
+        ]
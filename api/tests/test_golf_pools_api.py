@@ -9,7 +9,7 @@ Covers:
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import UTC, datetime
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -62,7 +62,6 @@ from app.services.golf_pool_scoring import (
     validate_picks,
 )
 
-
 # -----------------------------------------------------------------------
 # Helpers
 # -----------------------------------------------------------------------
@@ -77,15 +76,15 @@ def _pool_obj(**overrides):
         tournament_id=10,
         status="open",
         rules_json={"variant": "rvcc"},
-        entry_open_at=datetime(2026, 3, 1, tzinfo=timezone.utc),
-        entry_deadline=datetime(2026, 3, 15, tzinfo=timezone.utc),
+        entry_open_at=datetime(2026, 3, 1, tzinfo=UTC),
+        entry_deadline=datetime(2026, 3, 15, tzinfo=UTC),
         scoring_enabled=False,
         max_entries_per_email=3,
         require_upload=False,
         allow_self_service_entry=True,
         notes="some notes",
-        created_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
-        updated_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+        created_at=datetime(2026, 1, 1, tzinfo=UTC),
+        updated_at=datetime(2026, 2, 1, tzinfo=UTC),
     )
     defaults.update(overrides)
     return SimpleNamespace(**defaults)
@@ -101,8 +100,8 @@ def _entry_obj(**overrides):
         entry_number=1,
         status="submitted",
         source="self_service",
-        submitted_at=datetime(2026, 3, 10, tzinfo=timezone.utc),
-        created_at=datetime(2026, 3, 10, tzinfo=timezone.utc),
+        submitted_at=datetime(2026, 3, 10, tzinfo=UTC),
+        created_at=datetime(2026, 3, 10, tzinfo=UTC),
     )
     defaults.update(overrides)
     return SimpleNamespace(**defaults)
@@ -488,3 +487,83 @@ class TestPydanticModels:
     def test_pick_request_with_bucket(self):
         pr = PickRequest(dg_id=42, pick_slot=1, bucket_number=3)
         assert pr.bucket_number == 3
+
+
+class TestPoolLeaderboardEndpoint:
+    """get_pool_leaderboard serves the precomputed doc or one JOIN query."""
+
+    def _score(self, entry_id, rank, aggregate):
+        return SimpleNamespace(
+            entry_id=entry_id,
+            aggregate_score=aggregate,
+            qualified_golfers_count=5,
+            counted_golfers_count=5,
+            qualification_status="qualified",
+            is_complete=False,
+            rank=rank,
+            is_tied=False,
+            last_scored_at=datetime(2026, 4, 10, 15, 0, tzinfo=UTC),
+        )
+
+    def _player(self, dg_id, slot):
+        return SimpleNamespace(
+            dg_id=dg_id, player_name_snapshot=f"P{dg_id}", pick_slot=slot, bucket_number=None,
+            status_snapshot="active", position_snapshot=3, total_score_snapshot=-4, thru_snapshot=12,
+            r1=68, r2=None, r3=None, r4=None, made_cut_snapshot=True,
+            counts_toward_total=True, is_dropped=False,
+        )
+
+    @pytest.mark.asyncio
+    async def test_serves_precomputed_document(self):
+        from app.db.golf_pools import LEADERBOARD_DOC_FORMAT
+        from app.routers.golf.pools import get_pool_leaderboard
+
+        db = AsyncMock()
+        db.get.return_value = SimpleNamespace(
+            format_version=LEADERBOARD_DOC_FORMAT, leaderboard=[{"entry_id": 1}], entry_count=1, version=7,
+        )
+        with patch("app.routers.golf.pools.get_pool_or_404", new=AsyncMock()):
+            result = await get_pool_leaderboard(1, db)
+
+        assert result == {"pool_id": 1, "leaderboard": [{"entry_id": 1}], "count": 1, "version": 7}
+        db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_single_query(self):
+        from app.routers.golf.pools import get_pool_leaderboard
+
+        db = AsyncMock()
+        db.get.return_value = None
+        rows = [
+            (self._score(10, 1, -8), "a@example.com", "A", self._player(1, 1)),
+            (self._score(10, 1, -8), "a@example.com", "A", self._player(2, 2)),
+            (self._score(11, 2, -5), "b@example.com", "B", self._player(3, 1)),
+            (self._score(12, None, None), "c@example.com", "C", None),
+        ]
+        db.execute.return_value = MagicMock(all=MagicMock(return_value=rows))
+        with patch("app.routers.golf.pools.get_pool_or_404", new=AsyncMock()):
+            result = await get_pool_leaderboard(1, db)
+
+        db.execute.assert_awaited_once()
+        assert result["count"] == 3
+        assert result["version"] is None
+        assert [e["entry_id"] for e in result["leaderboard"]] == [10, 11, 12]
+        assert [p["dg_id"] for p in result["leaderboard"][0]["picks"]] == [1, 2]
+        assert result["leaderboard"][2]["picks"] == []
+        assert result["leaderboard"][0]["last_scored_at"] == "2026-04-10T15:00:00+00:00"
+
+    @pytest.mark.asyncio
+    async def test_ignores_document_in_older_format(self):
+        from app.db.golf_pools import LEADERBOARD_DOC_FORMAT
+        from app.routers.golf.pools import get_pool_leaderboard
+
+        db = AsyncMock()
+        db.get.return_value = SimpleNamespace(
+            format_version=LEADERBOARD_DOC_FORMAT - 1, leaderboard=[], entry_count=0, version=3,
+        )
+        db.execute.return_value = MagicMock(all=MagicMock(return_value=[]))
+        with patch("app.routers.golf.pools.get_pool_or_404", new=AsyncMock()):
+            result = await get_pool_leaderboard(1, db)
+
+        db.execute.assert_awaited_once()
+        assert result["version"] is None
@@ -0,0 +1,187 @@
+"""Tests for the bounded InferenceCache and batched model inference."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from app.analytics.inference.inference_cache import InferenceCache
+from app.analytics.inference.model_inference_engine import ModelInferenceEngine
+from app.analytics.models.core.artifact_signing import sign_artifact
+from app.analytics.models.core.model_registry import ModelRegistry
+from app.analytics.probabilities.probability_provider import MLProvider
+from app.analytics.probabilities.probability_resolver import ProbabilityResolver
+
+_EVENTS = ["strikeout", "walk_or_hbp", "single", "double", "triple", "home_run", "ball_in_play_out"]
+_FEATURES = ["batter_contact_rate", "batter_power_index", "pitcher_contact_rate"]
+
+
+def _artifact(tmp_path: Path, name: str, **dump_kwargs) -> str:
+    rng = np.random.default_rng(0)
+    X = rng.uniform(0.5, 1.2, size=(140, len(_FEATURES)))
+    y = [_EVENTS[i % len(_EVENTS)] for i in range(len(X))]
+    model = LogisticRegression(max_iter=500).fit(X, y)
+    model._training_feature_names = _FEATURES
+    path = str(tmp_path / name)
+    joblib.dump(model, path, **dump_kwargs)
+    sign_artifact(path)
+    return path
+
+
+def _profiles(contact: float, power: float) -> dict:
+    return {
+        "batter_profile": {"metrics": {"contact_rate": contact, "power_index": power}},
+        "pitcher_profile": {"metrics": {"contact_rate": 0.7}},
+    }
+
+
+class TestByteBudget:
+    def test_least_recently_used_is_evicted(self, tmp_path: Path) -> None:
+        paths = [_artifact(tmp_path, f"{n}.pkl") for n in "abc"]
+        cache = InferenceCache(max_bytes=2 * os.path.getsize(paths[0]), mmap_min_bytes=None)
+
+        cache.get_model(paths[0])
+        cache.get_model(paths[1])
+        cache.get_model(paths[0])  # a is now most recent
+        cache.get_model(paths[2])
+
+        assert cache.is_cached(paths[0])
+        assert not cache.is_cached(paths[1])
+        assert cache.is_cached(paths[2])
+        assert cache.stats().evictions == 1
+
+    def test_oversized_model_is_still_kept(self, tmp_path: Path) -> None:
+        path = _artifact(tmp_path, "big.pkl")
+        cache = InferenceCache(max_bytes=1, mmap_min_bytes=None)
+
+        first = cache.get_model(path)
+
+        assert cache.get_model(path) is first
+        assert cache.size == 1
+
+    def test_stats_track_hits_and_load_time(self, tmp_path: Path) -> None:
+        path = _artifact(tmp_path, "m.pkl")
+        cache = InferenceCache()
+
+        for _ in range(4):
+            cache.get_model(path)
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.loads) == (3, 1, 1)
+        assert stats.hit_rate == 0.75
+        assert stats.avg_load_ms > 0
+        assert stats.bytes == os.path.getsize(path)
+
+    def test_invalidate_releases_bytes(self, tmp_path: Path) -> None:
+        path = _artifact(tmp_path, "m.pkl")
+        cache = InferenceCache()
+        cache.get_model(path)
+
+        cache.invalidate(path)
+
+        assert cache.stats().bytes == 0
+
+
+class TestMemoryMapping:
+    def test_large_artifact_arrays_are_mapped(self, tmp_path: Path) -> None:
+        path = _artifact(tmp_path, "m.pkl")
+        cache = InferenceCache(mmap_min_bytes=0)
+
+        model = cache.get_model(path)
+
+        assert isinstance(model.coef_, np.memmap)
+        assert model.predict_proba([[0.8, 1.0, 0.7]]).shape == (1, len(_EVENTS))
+
+    def test_compressed_artifact_loads_unmapped(self, tmp_path: Path) -> None:
+        path = _artifact(tmp_path, "m.pkl", compress=3)
+        cache = InferenceCache(mmap_min_bytes=0)
+
+        model = cache.get_model(path)
+
+        assert not isinstance(model.coef_, np.memmap)
+
+    def test_small_artifact_is_not_mapped(self, tmp_path: Path) -> None:
+        path = _artifact(tmp_path, "m.pkl")
+
+        model = InferenceCache().get_model(path)
+
+        assert not isinstance(model.coef_, np.memmap)
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> ModelInferenceEngine:
+    path = _artifact(tmp_path, "pa.pkl")
+    registry = ModelRegistry(registry_path=None)
+    registry.register_model("mlb", "plate_appearance", "pa_v1", path, version=1)
+    registry.activate_model("mlb", "plate_appearance", "pa_v1")
+    return ModelInferenceEngine(registry=registry, cache=InferenceCache())
+
+
+class TestBatchPrediction:
+    def test_batch_matches_single_predictions(self, engine) -> None:
+        profiles = [_profiles(0.6 + 0.1 * i, 0.9 + 0.05 * i) for i in range(5)]
+
+        batch = engine.predict_proba_batch("mlb", "plate_appearance", profiles)
+
+        assert batch == [engine.predict_proba("mlb", "plate_appearance", p) for p in profiles]
+        assert len({tuple(sorted(p.items())) for p in batch}) > 1
+
+    def test_batch_makes_one_model_call(self, engine, tmp_path: Path) -> None:
+        model = engine._cache.get_model(str(tmp_path / "pa.pkl"))
+        calls = []
+        original = model.predict_proba
+        model.predict_proba = lambda rows: calls.append(len(rows)) or original(rows)
+
+        engine.predict_proba_batch(
+            "mlb", "plate_appearance", [_profiles(0.7, 1.0)] * 12,
+        )
+
+        assert calls == [12]
+
+    def test_no_model_returns_empty_dicts(self) -> None:
+        engine = ModelInferenceEngine(registry=ModelRegistry(registry_path=None))
+
+        assert engine.predict_proba_batch("mlb", "unknown_type", [{}, {}]) == [{}, {}]
+
+    def test_model_switch_invalidates_only_previous_artifact(self, engine, tmp_path) -> None:
+        registry = engine._registry
+        v1 = str(tmp_path / "pa.pkl")
+        v2 = _artifact(tmp_path, "pa_v2.pkl")
+        other = _artifact(tmp_path, "other.pkl")
+        registry.register_model("mlb", "plate_appearance", "pa_v2", v2, version=2)
+        engine.predict_proba("mlb", "plate_appearance", _profiles(0.7, 1.0))
+        engine._cache.get_model(other)
+
+        registry.activate_model("mlb", "plate_appearance", "pa_v2")
+        engine.predict_proba("mlb", "plate_appearance", _profiles(0.7, 1.0))
+
+        assert not engine._cache.is_cached(v1)
+        assert engine._cache.is_cached(v2)
+        assert engine._cache.is_cached(other)
+
+
+class TestProviderBatch:
+    def test_ml_provider_batch_matches_single(self, engine) -> None:
+        provider = MLProvider()
+        provider._engine = engine
+        contexts = [_profiles(0.6, 0.9), _profiles(0.9, 1.2)]
+
+        batch = provider.get_event_probabilities_batch("mlb", contexts)
+
+        assert batch == [provider.get_event_probabilities("mlb", c) for c in contexts]
+
+    def test_resolver_batch_attaches_meta_to_each(self) -> None:
+        resolver = ProbabilityResolver(config={"probability_mode": "rule_based"})
+
+        results = resolver.get_probabilities_batch_with_meta(
+            "mlb", "plate_appearance", [_profiles(0.6, 0.9), _profiles(0.9, 1.2)],
+        )
+
+        assert len(results) == 2
+        assert all(r["_meta"]["executed_mode"] == "rule_based" for r in results)
+        assert results[0]["_meta"] is not results[1]["_meta"]
@@ -200,6 +200,6 @@ class TestTaskRegistryUpdated:
     def test_new_tasks_on_correct_queue(self):
         from app.routers.admin.task_control import TASK_REGISTRY
 
-        assert TASK_REGISTRY["live_orchestrator_tick"].queue == "sports-scraper"
-        assert TASK_REGISTRY["poll_live_odds_mainline"].queue == "sports-scraper"
-        assert TASK_REGISTRY["poll_live_odds_props"].queue == "sports-scraper"
+        assert TASK_REGISTRY["live_orchestrator_tick"].queue == "sports-live"
+        assert TASK_REGISTRY["poll_live_odds_mainline"].queue == "sports-odds"
+        assert TASK_REGISTRY["poll_live_odds_props"].queue == "sports-odds"
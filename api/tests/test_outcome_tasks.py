@@ -0,0 +1,132 @@
+"""Tests for set-based outcome recording and degradation checks."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+
+from app.tasks import outcome_tasks
+
+
+@pytest.fixture
+def task_db(monkeypatch) -> AsyncMock:
+    """Route the task's sessions to one AsyncMock session."""
+    db = AsyncMock()
+    db.add = MagicMock()
+    sf = MagicMock()
+    sf.return_value.__aenter__.return_value = db
+
+    @asynccontextmanager
+    async def fake_task_db():
+        yield sf
+
+    monkeypatch.setattr(outcome_tasks, "_task_db", fake_task_db)
+    monkeypatch.setattr(outcome_tasks, "_start_job_run", AsyncMock(return_value=1))
+    monkeypatch.setattr(outcome_tasks, "_complete_job_run", AsyncMock())
+    return db
+
+
+class TestRecordOutcomes:
+    def test_single_joined_update(self, task_db) -> None:
+        task_db.execute.return_value.rowcount = 7
+        task_db.scalar.return_value = 3
+
+        result = asyncio.run(outcome_tasks._run_record_outcomes())
+
+        assert result == {"recorded": 7, "skipped": 3, "pending": 10}
+        task_db.execute.assert_awaited_once()
+        sql = str(task_db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE analytics_prediction_outcomes SET")
+        assert "FROM sports_games" in sql
+        assert "analytics_prediction_outcomes.outcome_recorded_at IS NULL" in sql
+        task_db.commit.assert_awaited_once()
+        outcome_tasks._complete_job_run.assert_awaited_once()
+
+
+def _windows(baseline: tuple, recent: tuple) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(recent=False, n=baseline[0], brier=baseline[1], accuracy=baseline[2]),
+        SimpleNamespace(recent=True, n=recent[0], brier=recent[1], accuracy=recent[2]),
+    ]
+
+
+class TestDegradationCheck:
+    def test_insufficient_data(self, task_db) -> None:
+        task_db.execute.return_value = _windows((5, 0.2, 0.6), (6, 0.2, 0.6))
+
+        result = asyncio.run(outcome_tasks._run_degradation_check("mlb"))
+
+        assert result == {"status": "insufficient_data", "total": 11, "required": 20}
+
+    def test_healthy(self, task_db) -> None:
+        task_db.execute.return_value = _windows((50, 0.21, 0.6), (50, 0.22, 0.58))
+
+        result = asyncio.run(outcome_tasks._run_degradation_check("mlb"))
+
+        assert result["status"] == "healthy"
+        assert result["baseline_count"] == result["recent_count"] == 50
+        task_db.add.assert_not_called()
+
+    def test_critical_alert_uses_window_summaries(self, task_db) -> None:
+        task_db.execute.return_value = _windows((50, 0.20, 0.62), (51, 0.28, 0.50))
+
+        result = asyncio.run(outcome_tasks._run_degradation_check("mlb"))
+
+        assert result["status"] == "alert_created"
+        assert result["severity"] == "critical"
+        alert = task_db.add.call_args.args[0]
+        assert (alert.baseline_count, alert.recent_count) == (50, 51)
+        assert alert.delta_brier == pytest.approx(0.08)
+        assert alert.delta_accuracy == pytest.approx(-0.12)
+
+
+class TestDegradationWindowsQuery:
+    def test_matches_python_split(self) -> None:
+        """The SQL halves agree with splitting the ordered outcomes in Python."""
+        engine = create_engine("sqlite://")
+        start = datetime(2026, 4, 1, tzinfo=UTC)
+        rows = [
+            {
+                "id": i,
+                "sport": "mlb" if i % 5 else "nba",
+                "recorded": start + timedelta(hours=(i * 7) % 23),
+                "brier": round(((i * 37) % 100) / 400, 6),
+                "correct": None if i % 11 == 0 else i % 3 != 0,
+            }
+            for i in range(1, 60)
+        ]
+        with engine.begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE analytics_prediction_outcomes ("
+                "id INTEGER PRIMARY KEY, sport TEXT, outcome_recorded_at TIMESTAMP, "
+                "brier_score FLOAT, correct_winner BOOLEAN)"
+            ))
+            conn.execute(
+                text(
+                    "INSERT INTO analytics_prediction_outcomes VALUES "
+                    "(:id, :sport, :recorded, :brier, :correct)"
+                ),
+                rows,
+            )
+            windows = {
+                r.recent: r for r in conn.execute(outcome_tasks._degradation_windows_stmt("mlb"))
+            }
+
+        mlb = sorted(
+            (r for r in rows if r["sport"] == "mlb"), key=lambda r: (r["recorded"], r["id"])
+        )
+        midpoint = len(mlb) // 2
+        for flag, half in ((False, mlb[:midpoint]), (True, mlb[midpoint:])):
+            window = windows[flag]
+            assert window.n == len(half)
+            assert window.brier == pytest.approx(sum(r["brier"] for r in half) / len(half))
+            assert window.accuracy == pytest.approx(
+                sum(1 for r in half if r["correct"]) / len(half)
+            )
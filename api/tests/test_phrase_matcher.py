@@ -0,0 +1,90 @@
+"""Tests for the phrase matcher (substring scan and Aho-Corasick paths)."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from app.utils import phrase_matcher
+from app.utils.phrase_matcher import SCAN_MAX_PHRASES, PhraseMatch, PhraseMatcher
+
+
+@pytest.fixture(params=["scan", "automaton"])
+def strategy(request, monkeypatch) -> str:
+    """Run every test against both matching strategies."""
+    if request.param == "automaton":
+        monkeypatch.setattr(phrase_matcher, "SCAN_MAX_PHRASES", 0)
+    return request.param
+
+
+@pytest.mark.usefixtures("strategy")
+class TestPhraseMatcher:
+    def test_strategy_follows_list_size(self, strategy: str) -> None:
+        assert PhraseMatcher(["a", "b"]).uses_automaton is (strategy == "automaton")
+
+    def test_same_end_longest_first(self) -> None:
+        matcher = PhraseMatcher(["run", "late run"])
+        assert matcher.find_all("a late run") == [
+            PhraseMatch(2, 10, "late run"),
+            PhraseMatch(7, 10, "run"),
+        ]
+
+    def test_positions_and_overlaps(self) -> None:
+        matcher = PhraseMatcher(["he", "she", "his", "hers"])
+        assert matcher.find_all("ushers") == [
+            PhraseMatch(1, 4, "she"),
+            PhraseMatch(2, 4, "he"),
+            PhraseMatch(2, 6, "hers"),
+        ]
+
+    def test_case_insensitive(self) -> None:
+        matcher = PhraseMatcher(["Down The Stretch"])
+        assert matcher.matched("DOWN the stretch they came") == ["down the stretch"]
+
+    def test_counts_repeat_occurrences(self) -> None:
+        matcher = PhraseMatcher(["a run", "late"])
+        text = "A run, then late, then a run again late. Late."
+        assert matcher.counts(text) == {"a run": 2, "late": 3}
+
+    def test_matched_in_phrase_list_order(self) -> None:
+        matcher = PhraseMatcher(["zeta", "alpha", "alpha"])
+        assert matcher.phrases == ("zeta", "alpha")
+        assert matcher.matched("alpha then zeta") == ["zeta", "alpha"]
+
+    def test_empty_inputs(self) -> None:
+        assert PhraseMatcher([]).find_all("anything") == []
+        assert PhraseMatcher(["", "x"]).phrases == ("x",)
+        assert PhraseMatcher(["x"]).counts("") == {}
+
+    def test_phrase_spanning_punctuation(self) -> None:
+        matcher = PhraseMatcher(["in conclusion,"])
+        assert matcher.matched("In conclusion, the home team won") == ["in conclusion,"]
+        assert matcher.matched("In conclusion the home team won") == []
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_matches_naive_substring_scan(self, seed: int) -> None:
+        rng = random.Random(seed)
+        for _ in range(300):
+            phrases = [
+                "".join(rng.choice("ab c") for _ in range(rng.randint(1, 5)))
+                for _ in range(rng.randint(1, 10))
+            ]
+            text = "".join(rng.choice("abcAB ") for _ in range(rng.randint(0, 40)))
+            matcher = PhraseMatcher(phrases)
+            lower = text.lower()
+
+            assert matcher.matched(text) == [p for p in matcher.phrases if p in lower]
+            expected = sorted(
+                (i, i + len(p), p)
+                for p in matcher.phrases
+                for i in range(len(lower))
+                if lower.startswith(p, i)
+            )
+            assert sorted(matcher.find_all(text)) == expected
+
+
+def test_long_lists_compile_the_automaton() -> None:
+    phrases = [f"phrase {i}" for i in range(SCAN_MAX_PHRASES + 1)]
+    assert PhraseMatcher(phrases).uses_automaton
+    assert not PhraseMatcher(phrases[:SCAN_MAX_PHRASES]).uses_automaton
@@ -0,0 +1,227 @@
+"""Tests for per-stage pipeline profiling and its aggregation."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.util import greenlet_spawn
+
+from app.db import get_db
+from app.routers.admin.pipeline import status_endpoints
+from app.services.pipeline.executor import PipelineExecutor
+from app.services.pipeline.models import PipelineStage, StageOutput
+from app.services.pipeline.profiling import (
+    PROFILE_METRICS,
+    completion_timer,
+    format_profile_report,
+    payload_bytes,
+    profile_stage,
+    summarize_stage_profiles,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+class TestProfileStage:
+    def test_counts_db_statements_in_context_only(self, engine) -> None:
+        with engine.connect() as conn:
+            conn.execute(text("select 1"))
+            with profile_stage() as profile:
+                conn.execute(text("select 1"))
+                conn.execute(text("select 2"))
+            conn.execute(text("select 3"))
+
+        assert profile.db_queries == 2
+        assert profile.db_ms > 0
+        assert profile.wall_ms >= profile.db_ms
+
+    @pytest.mark.asyncio
+    async def test_db_time_attributed_through_async_bridge(self, engine) -> None:
+        # AsyncSession runs cursor calls inside greenlet_spawn; the active
+        # profile must still be visible there.
+        with engine.connect() as conn, profile_stage() as profile:
+            await greenlet_spawn(conn.execute, text("select 1"))
+
+        assert profile.db_queries == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_completions_each_add_their_time(self) -> None:
+        async def call() -> None:
+            with completion_timer():
+                await asyncio.sleep(0.02)
+
+        with profile_stage() as profile:
+            await asyncio.gather(call(), call(), call())
+
+        assert profile.completion_calls == 3
+        # Summed across overlapping calls, so it exceeds the stage's wall time
+        assert profile.completion_ms > profile.wall_ms
+
+    @pytest.mark.asyncio
+    async def test_threaded_completion_is_attributed(self) -> None:
+        with profile_stage() as profile, completion_timer():
+            await asyncio.to_thread(time.sleep, 0.01)
+
+        assert profile.completion_calls == 1
+
+    def test_completion_timer_without_active_profile_is_noop(self) -> None:
+        with completion_timer():
+            pass
+
+    def test_as_dict_has_every_metric(self) -> None:
+        with profile_stage() as profile:
+            profile.input_bytes = 10
+
+        assert set(profile.as_dict()) == set(PROFILE_METRICS)
+
+
+def test_payload_bytes_is_compact_json() -> None:
+    assert payload_bytes(None) == 0
+    assert payload_bytes({"a": [1, 2]}) == len('{"a":[1,2]}')
+
+
+def _profile(wall: float, db: float = 0, llm: float = 0, out: int = 0) -> dict:
+    return {
+        "wall_ms": wall,
+        "db_ms": db,
+        "db_queries": 1,
+        "completion_ms": llm,
+        "completion_calls": 1 if llm else 0,
+        "input_bytes": 0,
+        "output_bytes": out,
+    }
+
+
+class TestSummarize:
+    def test_percentiles_and_dominant_ordering(self) -> None:
+        rows = [("RENDER_BLOCKS", _profile(w, llm=w * 0.9)) for w in range(100, 1100, 100)]
+        rows += [("NORMALIZE_PBP", _profile(50, db=40))] * 10
+
+        summaries = summarize_stage_profiles(rows)
+
+        assert [s.stage for s in summaries] == ["RENDER_BLOCKS", "NORMALIZE_PBP"]
+        render = summaries[0]
+        assert render.runs == 10
+        assert render.metrics["wall_ms"].p50 == 550.0
+        assert render.metrics["wall_ms"].p90 == 910.0
+        assert render.metrics["wall_ms"].max == 1000.0
+        assert render.wall_share == pytest.approx(5500 / 6000, abs=1e-4)
+
+    def test_missing_metrics_count_as_zero(self) -> None:
+        summaries = summarize_stage_profiles([("GROUP_BLOCKS", {"wall_ms": 5})])
+
+        assert summaries[0].metrics["db_ms"].p50 == 0
+
+    def test_report_names_dominant_stage_and_cause(self) -> None:
+        rows = [("RENDER_BLOCKS", _profile(1000, db=20, llm=900, out=4096))]
+        rows += [("NORMALIZE_PBP", _profile(100, db=90))]
+
+        report = format_profile_report(summarize_stage_profiles(rows))
+
+        assert report.splitlines()[2].startswith("RENDER_BLOCKS")
+        assert "4.0KB" in report
+        assert "Dominant stage: RENDER_BLOCKS (90.9%" in report
+        assert "mostly external completions" in report
+
+    def test_report_empty_window(self) -> None:
+        assert "No profiled" in format_profile_report([])
+
+
+class TestExecutorRecordsProfile:
+    def _records(self):
+        run = SimpleNamespace(
+            id=1,
+            game_id=5,
+            status="pending",
+            current_stage=None,
+            started_at=None,
+            finished_at=None,
+            auto_chain=True,
+            stages=[],
+            run_uuid="uuid",
+        )
+        stage_record = SimpleNamespace(
+            status="pending",
+            started_at=None,
+            finished_at=None,
+            output_json=None,
+            logs_json=None,
+            error_details=None,
+            profile_json=None,
+        )
+        return run, stage_record
+
+    def _executor(self, run, stage_record) -> PipelineExecutor:
+        executor = PipelineExecutor(AsyncMock())
+        executor._get_run = AsyncMock(return_value=run)
+        executor._get_stage_record = AsyncMock(return_value=stage_record)
+        executor._get_game_context = AsyncMock(return_value={"sport": "NBA"})
+        return executor
+
+    @pytest.mark.asyncio
+    async def test_success_stores_profile(self) -> None:
+        run, stage_record = self._records()
+        executor = self._executor(run, stage_record)
+        output = StageOutput(data={"pbp_events": [1, 2, 3]})
+
+        with patch.object(executor, "_dispatch_stage", AsyncMock(return_value=output)):
+            result = await executor.execute_stage(1, PipelineStage.NORMALIZE_PBP)
+
+        assert result.success
+        profile = stage_record.profile_json
+        assert profile["output_bytes"] == payload_bytes(output.data)
+        assert profile["input_bytes"] == payload_bytes({})
+        assert profile["wall_ms"] >= 0
+
+    @pytest.mark.asyncio
+    async def test_failure_still_stores_profile(self) -> None:
+        run, stage_record = self._records()
+        executor = self._executor(run, stage_record)
+
+        with patch.object(
+            executor, "_dispatch_stage", AsyncMock(side_effect=RuntimeError("boom"))
+        ):
+            result = await executor.execute_stage(1, PipelineStage.NORMALIZE_PBP)
+
+        assert not result.success
+        assert result.error == "boom"
+        assert stage_record.status == "failed"
+        assert stage_record.profile_json["output_bytes"] == 0
+
+
+class TestProfileEndpoint:
+    def test_returns_stages_ordered_by_wall_time(self) -> None:
+        rows = [("RENDER_BLOCKS", _profile(900, llm=800))] * 3
+        rows += [("NORMALIZE_PBP", _profile(100, db=80))] * 3
+
+        async def _get_db():
+            yield AsyncMock()
+
+        app = FastAPI()
+        app.dependency_overrides[get_db] = _get_db
+        app.include_router(status_endpoints.router)
+        with patch.object(
+            status_endpoints, "load_stage_profiles", AsyncMock(return_value=rows)
+        ) as load:
+            resp = TestClient(app).get("/pipeline/profile?days=3&league=nba")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["dominantStage"] == "RENDER_BLOCKS"
+        assert data["league"] == "NBA"
+        assert [s["stage"] for s in data["stages"]] == ["RENDER_BLOCKS", "NORMALIZE_PBP"]
+        assert data["stages"][0]["metrics"]["completion_ms"]["p50"] == 800.0
+        assert data["stages"][0]["wallShare"] == 0.9
+        assert load.await_args.args[2] == "nba"
@@ -240,3 +240,178 @@ class TestPitcherRollingProfile:
         # Only 3 valid games, which meets the threshold of 3
         result = await get_pitcher_rolling_profile("pitcher456", 1, db=db)
         assert result is not None
+
+
+def _result(rows):
+    result_mock = MagicMock()
+    result_mock.all.return_value = rows
+    return result_mock
+
+
+def _pitcher_stats(ref, **overrides):
+    fields = {
+        "batters_faced": 25, "strikeouts": 6, "walks": 2, "home_runs_allowed": 1,
+        "k_rate": None, "bb_rate": None, "hr_rate": None, "whiff_rate": 0.28,
+        "z_contact_pct": 0.82, "chase_rate": 0.30, "avg_exit_velo_against": 88.5,
+        "hard_hit_pct_against": 0.36, "barrel_pct_against": 0.07,
+    }
+    fields.update(overrides)
+    return MagicMock(player_external_ref=ref, **fields)
+
+
+class TestLoadMLBRollingProfiles:
+    """Tests for the set-based load_mlb_rolling_profiles."""
+
+    @pytest.mark.asyncio
+    async def test_matches_per_player_profiles(self):
+        """Batch output equals get_player/get_pitcher_rolling_profile on the same rows."""
+        from app.analytics.services.mlb_player_profiles import load_mlb_rolling_profiles
+
+        dates = [datetime(2026, 4, d, tzinfo=UTC) for d in range(20, 0, -1)]
+        batter_a = [
+            (_make_mock_stats(player_external_ref="a", barrel_pct=0.05 + 0.01 * i), d)
+            for i, d in enumerate(dates[:12])
+        ]
+        batter_b = [
+            (_make_mock_stats(player_external_ref="b", z_contact_pct=0.7 + 0.02 * i), d)
+            for i, d in enumerate(dates[:8])
+        ]
+        pitcher = [
+            (_pitcher_stats("p", strikeouts=4 + i % 3), d) for i, d in enumerate(dates[:6])
+        ]
+
+        db = AsyncMock()
+        db.execute.side_effect = [_result(batter_a + batter_b), _result(pitcher)]
+        batch = await load_mlb_rolling_profiles(
+            db, batters={"a": 1, "b": 1}, pitchers=["p"],
+        )
+        assert db.execute.await_count == 2
+
+        single_db = AsyncMock()
+        single_db.execute.side_effect = [
+            _result(batter_a), _result(batter_b), _result(pitcher),
+        ]
+        assert batch.batters["a"] == await get_player_rolling_profile("a", 1, db=single_db)
+        assert batch.batters["b"] == await get_player_rolling_profile("b", 1, db=single_db)
+        assert batch.pitchers["p"] == await get_pitcher_rolling_profile("p", 1, db=single_db)
+
+    @pytest.mark.asyncio
+    async def test_low_sample_batters_share_one_team_lookup(self):
+        """Sparse batters on the same team blend with one team profile fetch."""
+        from app.analytics.services.mlb_player_profiles import load_mlb_rolling_profiles
+        from app.analytics.services.profile_service import ProfileResult
+
+        game_date = datetime(2026, 4, 1, tzinfo=UTC)
+        rows = [
+            (_make_mock_stats(player_external_ref=ref), game_date)
+            for ref in ("a", "a", "b")
+        ]
+        team_result = MagicMock()
+        team_result.scalars.return_value.all.return_value = [
+            MagicMock(id=7, abbreviation="NYY"),
+        ]
+        db = AsyncMock()
+        db.execute.side_effect = [_result(rows), team_result]
+
+        team_profile = ProfileResult(
+            metrics={"contact_rate": 0.9}, games_used=30, date_range=("", ""),
+        )
+        with patch(
+            "app.analytics.services.profile_service.get_team_rolling_profile",
+            new_callable=AsyncMock, return_value=team_profile,
+        ) as team_mock:
+            batch = await load_mlb_rolling_profiles(db, batters={"a": 7, "b": 7})
+
+        team_mock.assert_awaited_once()
+        assert db.execute.await_count == 2
+        assert set(batch.batters) == {"a", "b"}
+        assert batch.batters["a"]["contact_rate"] != batch.batters["b"]["contact_rate"]
+
+    @pytest.mark.asyncio
+    async def test_boxscore_fallback_only_for_missing_pitchers(self):
+        """Pitchers with < 3 Statcast games fall back to one boxscore query."""
+        from app.analytics.services.mlb_player_profiles import load_mlb_rolling_profiles
+
+        game_date = datetime(2026, 4, 1, tzinfo=UTC)
+        statcast = [(_pitcher_stats("sc"), game_date) for _ in range(4)]
+        statcast.append((_pitcher_stats("box"), game_date))
+        box_stats = {"strike_outs": 8, "base_on_balls": 2, "home_runs": 1, "hits": 5}
+        boxscore = [
+            (MagicMock(player_external_ref="box", stats=box_stats), game_date)
+            for _ in range(3)
+        ]
+        db = AsyncMock()
+        db.execute.side_effect = [_result(statcast), _result(boxscore)]
+
+        batch = await load_mlb_rolling_profiles(
+            db, batters={}, pitchers=["sc", "box", "none"],
+        )
+
+        assert set(batch.pitchers) == {"sc", "box"}
+        assert "whiff_rate" in batch.pitchers["sc"]
+        assert batch.pitchers["box"]["strikeout_rate"] == pytest.approx(0.5)
+
+    @pytest.mark.asyncio
+    async def test_one_windowed_query_per_table(self):
+        """Rows are ranked per player and cut at the window in SQL."""
+        from sqlalchemy.dialects import postgresql
+
+        from app.analytics.services.mlb_player_profiles import load_mlb_rolling_profiles
+
+        db = AsyncMock()
+        db.execute.return_value = _result([])
+        await load_mlb_rolling_profiles(
+            db, batters={"a": 1, "b": 2}, rolling_window=15, exclude_playoffs=True,
+        )
+
+        sql = str(db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "row_number() OVER (PARTITION BY mlb_player_advanced_stats.player_external_ref" in sql
+        assert "season_type" in sql
+        assert db.execute.await_count == 1
+
+
+class TestSlateLineupPrefetch:
+    """Batch sim resolves a whole MLB slate's profiles up front."""
+
+    @pytest.mark.asyncio
+    async def test_weights_built_without_per_batter_queries(self):
+        from app.analytics.services.mlb_player_profiles import MLBProfileBatch
+        from app.tasks import _batch_sim_weights
+
+        games = [
+            MagicMock(id=gid, home_team_id=2 * gid, away_team_id=2 * gid + 1)
+            for gid in (1, 2)
+        ]
+        inputs = {
+            "home_batters": [{"external_ref": f"h{i}", "name": ""} for i in range(9)],
+            "away_batters": [{"external_ref": f"a{i}", "name": ""} for i in range(9)],
+            "home_sp_info": {"external_ref": "hp", "name": "H"},
+            "away_sp_info": None,
+        }
+        batch = MLBProfileBatch(
+            batters={"h0": {"contact_rate": 0.8}}, pitchers={"hp": {"strikeout_rate": 0.3}},
+        )
+        db = AsyncMock()
+        with patch.object(
+            _batch_sim_weights, "resolve_lineup_inputs",
+            new_callable=AsyncMock, side_effect=[inputs, None],
+        ), patch(
+            "app.analytics.services.mlb_player_profiles.load_mlb_rolling_profiles",
+            new_callable=AsyncMock, return_value=batch,
+        ) as load_mock:
+            lineups, profiles = await _batch_sim_weights.prefetch_mlb_lineups(db, games, 30)
+
+        load_mock.assert_awaited_once()
+        assert load_mock.await_args.kwargs["pitchers"] == ["hp"]
+        assert len(load_mock.await_args.kwargs["batters"]) == 18
+        assert list(lineups) == [1]
+
+        game_context: dict = {}
+        meta = await _batch_sim_weights.try_build_lineup_weights(
+            db, games[0], game_context, None, None, 30,
+            inputs=lineups[1], profiles=profiles,
+        )
+
+        db.execute.assert_not_awaited()
+        assert meta is not None
+        assert len(game_context["home_lineup_weights"]) == 9
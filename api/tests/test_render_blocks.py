@@ -6,6 +6,7 @@ from app.services.pipeline.stages.block_types import (
     MAX_WORDS_PER_BLOCK,
     SemanticRole,
 )
+from app.services.pipeline.stages.render_blocks import _block_batches
 from app.services.pipeline.stages.render_helpers import (
     check_overtime_mention,
     detect_overtime_info,
@@ -183,6 +184,51 @@ class TestBuildBlockPrompt:
         assert "[]" not in prompt
 
 
+class TestBlockBatches:
+    """Tests for splitting blocks into concurrent render batches."""
+
+    @staticmethod
+    def _blocks(n: int) -> list[dict]:
+        return [{"block_index": i} for i in range(n)]
+
+    def test_small_game_is_one_batch(self) -> None:
+        assert _block_batches(self._blocks(4), 4) == [[0, 1, 2, 3]]
+
+    def test_batches_are_balanced(self) -> None:
+        assert _block_batches(self._blocks(5), 4) == [[0, 1, 2], [3, 4]]
+        assert _block_batches(self._blocks(7), 3) == [[0, 1, 2], [3, 4], [5, 6]]
+
+    def test_zero_disables_batching(self) -> None:
+        assert _block_batches(self._blocks(7), 0) == [list(range(7))]
+
+
+class TestBuildBlockPromptRenderIndices:
+    """Batch prompts list only their blocks but keep game-level context."""
+
+    def test_only_selected_blocks_listed(self) -> None:
+        blocks = [
+            {
+                "block_index": i,
+                "role": role,
+                "score_before": [i * 10, i * 10],
+                "score_after": [(i + 1) * 10, (i + 1) * 10],
+                "key_play_ids": [],
+                "period_start": i + 1,
+            }
+            for i, role in enumerate(["SETUP", "RESPONSE", "RESOLUTION"])
+        ]
+        game_context = {"home_team_name": "Lakers", "away_team_name": "Celtics"}
+
+        full = build_block_prompt(blocks, game_context, [])
+        batch = build_block_prompt(blocks, game_context, [], render_indices={1, 2})
+
+        assert "Block 0 (" in full
+        assert "Block 0 (" not in batch
+        assert "Block 1 (" in batch and "Block 2 (" in batch
+        # Everything before the block listing is shared across batches
+        assert full.split("BLOCKS:")[0] == batch.split("BLOCKS:")[0]
+
+
 class TestValidateBlockNarrative:
     """Tests for block narrative validation."""
 
@@ -0,0 +1,333 @@
+"""Tests for the concurrent RENDER_BLOCKS engine against a fake completion server.
+
+A ThreadingHTTPServer on localhost speaks the ``/v1/chat/completions``
+protocol: it answers every ``Block N (`` line in the prompt with a
+narrative, holds each request briefly, and records peak concurrency so
+in-flight limits can be asserted end to end through the real OpenAI SDK.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.config import get_settings
+from app.services.openai_client import SYSTEM_PROMPT, OpenAIClient
+from app.services.pipeline.models import StageInput
+from app.services.pipeline.stages import render_blocks, render_engine
+from app.services.pipeline.stages.cache_helpers import get_prompt_cache_key
+from app.services.pipeline.stages.render_engine import (
+    RenderRequest,
+    request_params,
+    run_render_requests,
+    store_render_responses,
+)
+
+_BLOCK_LINE = re.compile(r"^Block (\d+) \(", re.MULTILINE)
+_NARRATIVE = (
+    "The home side opened with steady half-court execution and timely stops. "
+    "The visitors answered with transition baskets to stay within reach. "
+    "Both teams traded possessions as the period wound down."
+)
+
+
+class FakeCompletionServer:
+    """Minimal OpenAI-compatible chat completions endpoint."""
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.requests: list[dict] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args) -> None:  # quiet test output
+                pass
+
+            def do_POST(self) -> None:
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                content = server.handle(body)
+                payload = json.dumps(
+                    {
+                        "id": "chatcmpl-fake",
+                        "object": "chat.completion",
+                        "created": 0,
+                        "model": body["model"],
+                        "choices": [
+                            {
+                                "index": 0,
+                                "finish_reason": "stop",
+                                "message": {"role": "assistant", "content": content},
+                            }
+                        ],
+                    }
+                ).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}/v1"
+
+    def handle(self, body: dict) -> str:
+        with self._lock:
+            self.requests.append(body)
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            prompt = body["messages"][-1]["content"]
+            if "MALFORMED" in prompt:
+                return "{not json"
+            indices = [int(i) for i in _BLOCK_LINE.findall(prompt)]
+            return json.dumps({"blocks": [{"i": i, "n": _NARRATIVE} for i in indices]})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    def __enter__(self) -> FakeCompletionServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def fake_server():
+    with FakeCompletionServer() as server:
+        yield server
+
+
+@pytest.fixture
+def client(fake_server) -> OpenAIClient:
+    return OpenAIClient(api_key="test-key", model="gpt-test", base_url=fake_server.base_url)
+
+
+def _requests(n: int) -> list[RenderRequest]:
+    return [RenderRequest(prompt=f"Block {i} (SETUP, Q1):", temperature=0.5, max_tokens=200) for i in range(n)]
+
+
+def _cache_session(hits: dict[str, dict] | None = None) -> MagicMock:
+    session = MagicMock()
+    lookup = MagicMock()
+    lookup.all.return_value = list((hits or {}).items())
+    session.execute = AsyncMock(side_effect=[lookup, MagicMock()])
+    session.begin_nested.return_value.__aenter__ = AsyncMock()
+    session.begin_nested.return_value.__aexit__ = AsyncMock(return_value=False)
+    return session
+
+
+class TestAsyncClient:
+    @pytest.mark.asyncio
+    async def test_agenerate_sends_full_request(self, fake_server, client) -> None:
+        content = await client.agenerate("Block 3 (SETUP, Q1):", temperature=0.3, max_tokens=50)
+
+        assert json.loads(content)["blocks"][0]["i"] == 3
+        sent = fake_server.requests[0]
+        assert sent["model"] == "gpt-test"
+        assert sent["messages"][0] == {"role": "system", "content": SYSTEM_PROMPT}
+        assert sent["temperature"] == 0.3
+        assert sent["max_tokens"] == 50
+        assert sent["response_format"] == {"type": "json_object"}
+
+    @pytest.mark.asyncio
+    async def test_agenerate_retries_malformed_json(self, fake_server, client) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            await client.agenerate("MALFORMED", max_retries=2)
+        assert len(fake_server.requests) == 2
+
+
+class TestRunRenderRequests:
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("limit", [1, 3])
+    async def test_in_flight_limit(self, fake_server, client, limit) -> None:
+        results, stats = await run_render_requests(client, _requests(6), max_in_flight=limit)
+
+        assert [r["blocks"][0]["i"] for r in results] == list(range(6))
+        assert stats.openai_calls == 6
+        assert fake_server.peak_in_flight == limit
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_sent_once(self, fake_server, client) -> None:
+        requests = _requests(1) * 3
+        results, stats = await run_render_requests(client, requests, max_in_flight=3)
+
+        assert len(results) == 3
+        assert stats.openai_calls == 1
+        assert len(fake_server.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_returned_per_request(self, fake_server, client) -> None:
+        requests = [*_requests(1), RenderRequest(prompt="MALFORMED", temperature=0.5, max_tokens=10)]
+        results, _ = await run_render_requests(client, requests, max_in_flight=2)
+
+        assert results[0]["blocks"][0]["i"] == 0
+        assert isinstance(results[1], json.JSONDecodeError)
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_skip_server_and_misses_are_stored(self, fake_server, client) -> None:
+        requests = _requests(3)
+        hit_key = get_prompt_cache_key(request_params(client, requests[1]))
+        session = _cache_session({hit_key: {"blocks": [{"i": 1, "n": "cached"}]}})
+
+        results, stats = await run_render_requests(
+            client, requests, max_in_flight=3, session=session, game_id=9
+        )
+
+        assert results[1] == {"blocks": [{"i": 1, "n": "cached"}]}
+        assert stats.cache_hits == 1
+        assert stats.openai_calls == 2
+        assert len(fake_server.requests) == 2
+        # Nothing is written until the caller has validated the responses
+        assert session.execute.await_count == 1
+
+        await store_render_responses(session, 9, stats.fresh)
+
+        store_stmt = session.execute.await_args_list[1].args[0]
+        params = store_stmt.compile(dialect=postgresql.dialect()).params
+        stored_keys = {v for k, v in params.items() if k.startswith("batch_key")}
+        assert hit_key not in stored_keys
+        assert len(stored_keys) == 2
+
+    @pytest.mark.asyncio
+    async def test_changed_prompt_misses(self, fake_server, client) -> None:
+        original = _requests(1)[0]
+        key = get_prompt_cache_key(request_params(client, original))
+        session = _cache_session({key: {"blocks": [{"i": 0, "n": "stale"}]}})
+        changed = RenderRequest(prompt=original.prompt + "\nRegen feedback", temperature=0.5, max_tokens=200)
+
+        results, stats = await run_render_requests(
+            client, [changed], max_in_flight=1, session=session, game_id=9
+        )
+
+        assert results[0]["blocks"][0]["n"] != "stale"
+        assert stats.cache_hits == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_store_failure_is_swallowed(self, fake_server, client) -> None:
+        session = _cache_session()
+        session.execute.side_effect = [MagicMock(all=MagicMock(return_value=[])), RuntimeError("boom")]
+
+        results, stats = await run_render_requests(
+            client, _requests(1), max_in_flight=1, session=session, game_id=9
+        )
+        await store_render_responses(session, 9, stats.fresh)
+
+        assert stats.openai_calls == 1
+        assert results[0]["blocks"][0]["i"] == 0
+
+
+def _blocks(n: int) -> list[dict]:
+    roles = ["SETUP"] + ["RESPONSE"] * (n - 2) + ["RESOLUTION"]
+    return [
+        {
+            "block_index": i,
+            "role": roles[i],
+            "moment_indices": [i],
+            "period_start": i + 1,
+            "period_end": i + 1,
+            "score_before": [i * 20, i * 20],
+            "score_after": [(i + 1) * 20, (i + 1) * 20 - 2],
+            "play_ids": [i],
+            "key_play_ids": [],
+        }
+        for i in range(n)
+    ]
+
+
+class TestExecuteRenderBlocks:
+    @pytest.mark.asyncio
+    async def test_batches_render_concurrently(self, fake_server, client, monkeypatch) -> None:
+        settings = get_settings()
+        monkeypatch.setattr(settings, "render_blocks_batch_size", 2)
+        monkeypatch.setattr(settings, "render_blocks_max_in_flight", 4)
+        monkeypatch.setattr(render_blocks, "get_openai_client", lambda: client)
+
+        stage_input = StageInput(
+            game_id=1,
+            run_id=1,
+            previous_output={"blocks_grouped": True, "blocks": _blocks(5), "pbp_events": []},
+            game_context={"home_team_name": "Home", "away_team_name": "Away", "sport": "NBA"},
+        )
+        output = await render_blocks.execute_render_blocks(stage_input)
+
+        # 5 blocks -> batches of 2/2/1 sent together, then one flow pass
+        assert output.data["openai_calls"] == 4
+        assert fake_server.peak_in_flight == 3
+        render_prompts = [r["messages"][-1]["content"] for r in fake_server.requests[:3]]
+        assert sorted(len(_BLOCK_LINE.findall(p)) for p in render_prompts) == [1, 2, 2]
+        assert all(b["narrative"] for b in output.data["blocks"])
+
+
+class _ScriptedClient:
+    """Plain ``generate`` client answering each call with the next narrative."""
+
+    model = "gpt-test"
+
+    def __init__(self, narratives: list[str]) -> None:
+        self.narratives = list(narratives)
+        self.calls = 0
+
+    def generate(self, prompt: str, temperature: float, max_tokens: int) -> str:
+        self.calls += 1
+        narrative = self.narratives.pop(0)
+        indices = [int(i) for i in _BLOCK_LINE.findall(prompt)]
+        return json.dumps({"blocks": [{"i": i, "n": narrative} for i in indices]})
+
+
+class TestRenderCacheValidation:
+    @pytest.mark.asyncio
+    async def test_response_failing_validation_is_not_cached(self, monkeypatch) -> None:
+        cache: dict[str, dict] = {}
+
+        async def get_cached(session, game_id, keys):
+            return {k: cache[k] for k in keys if k in cache}
+
+        async def store_cached(session, game_id, entries):
+            cache.update({e.key: e.response_data for e in entries})
+
+        monkeypatch.setattr(render_engine, "get_cached_responses", get_cached)
+        monkeypatch.setattr(render_engine, "store_cached_responses", store_cached)
+        client = _ScriptedClient(["", _NARRATIVE])
+        monkeypatch.setattr(render_blocks, "get_openai_client", lambda: client)
+        session = _cache_session()
+
+        def stage_input() -> StageInput:
+            return StageInput(
+                game_id=1,
+                run_id=1,
+                previous_output={"blocks_grouped": True, "blocks": _blocks(1), "pbp_events": []},
+                game_context={"home_team_name": "Home", "away_team_name": "Away", "sport": "NBA"},
+            )
+
+        with pytest.raises(ValueError, match="No narrative from AI"):
+            await render_blocks.execute_render_blocks(stage_input(), session=session)
+        assert cache == {}
+
+        # The retry misses the cache, gets a good response, and caches that one
+        output = await render_blocks.execute_render_blocks(stage_input(), session=session)
+        assert client.calls == 2
+        assert output.data["openai_cache_hits"] == 0
+        assert output.data["blocks"][0]["narrative"]
+        assert len(cache) == 1
+
+        cached = await render_blocks.execute_render_blocks(stage_input(), session=session)
+        assert client.calls == 2
+        assert cached.data["openai_cache_hits"] == 1
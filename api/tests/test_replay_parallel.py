@@ -0,0 +1,205 @@
+"""Tests for parallel historical replay and point-in-time profiles."""
+
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.tasks import replay_tasks
+from app.tasks._training_helpers import build_point_in_time_profiles, build_rolling_profile
+
+
+def _stats(i: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        z_contact_pct=0.80 + i * 0.001,
+        o_contact_pct=0.60,
+        avg_exit_velo=88.0 + i % 5,
+        barrel_pct=0.08,
+        hard_hit_pct=0.38,
+        z_swing_pct=0.70,
+        o_swing_pct=0.30,
+        zone_swings=50 + i,
+        outside_swings=30,
+        zone_contact=40,
+        outside_contact=18 + i % 3,
+        total_pitches=145,
+        balls_in_play=30,
+        outside_pitches=80,
+        zone_pitches=65,
+        hard_hit_count=10 + i % 4,
+        barrel_count=2,
+    )
+
+
+def _history(n: int) -> list[tuple[str, SimpleNamespace]]:
+    # Two games share each date (doubleheaders) to exercise the strict cutoff
+    return [(f"2025-05-{1 + i // 2:02d}", _stats(i)) for i in range(n)]
+
+
+class TestPointInTimeProfiles:
+    @pytest.mark.parametrize("window,min_games", [(5, 3), (30, 3), (4, 5)])
+    def test_matches_rolling_profile_per_cutoff(self, window, min_games) -> None:
+        history = _history(24)
+        cutoffs = ["2025-05-12", "2025-05-01", "2025-05-03", "2025-05-07", "2025-06-01", "2025-05-03"]
+
+        profiles = build_point_in_time_profiles(
+            history, cutoffs, window=window, min_games=min_games,
+        )
+
+        for cutoff in cutoffs:
+            assert profiles[cutoff] == build_rolling_profile(
+                history, before_date=cutoff, window=window, min_games=min_games,
+            )
+
+    def test_empty_history(self) -> None:
+        assert build_point_in_time_profiles([], ["2025-05-01"], window=30) == {"2025-05-01": None}
+
+
+def _tasks(n: int) -> list[tuple[int, dict]]:
+    return [
+        (
+            game_id,
+            {"home_team": "H", "away_team": "A", "probability_mode": "rule_based"},
+        )
+        for game_id in range(1, n + 1)
+    ]
+
+
+async def _collect(tasks: list[tuple[int, dict]]) -> dict[int, dict]:
+    return {gid: sim async for gid, sim in replay_tasks._simulate_all("mlb", tasks, 40)}
+
+
+def _collect_into(tasks: list[tuple[int, dict]], results) -> None:
+    results.put((os.getpid(), asyncio.run(_collect(tasks))))
+
+
+def _pid_game(sport: str, game_id: int, game_context: dict, iterations: int) -> tuple[int, dict]:
+    return game_id, {"pid": os.getpid()}
+
+
+def _raising_game(sport: str, game_id: int, game_context: dict, iterations: int) -> tuple[int, dict]:
+    raise RuntimeError("worker lost")
+
+
+class TestSimulateAll:
+    def test_pool_matches_inline(self, monkeypatch) -> None:
+        tasks = _tasks(4)
+
+        monkeypatch.setattr(replay_tasks.settings, "replay_workers", 1)
+        inline = asyncio.run(_collect(tasks))
+        monkeypatch.setattr(replay_tasks.settings, "replay_workers", 2)
+        pooled = asyncio.run(_collect(tasks))
+
+        assert set(pooled) == {1, 2, 3, 4}
+        for gid in inline:
+            assert pooled[gid]["home_win_probability"] == inline[gid]["home_win_probability"]
+            assert pooled[gid]["average_home_score"] == inline[gid]["average_home_score"]
+
+    def test_daemonic_worker_fans_out(self, monkeypatch) -> None:
+        """Celery prefork children are daemonic; the pool must still start there."""
+        monkeypatch.setattr(replay_tasks.settings, "replay_workers", 2)
+        monkeypatch.setattr(replay_tasks, "_simulate_game", _pid_game)
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+        proc = ctx.Process(target=_collect_into, args=(_tasks(6), results), daemon=True)
+        proc.start()
+        task_pid, collected = results.get(timeout=60)
+        proc.join(timeout=10)
+
+        assert proc.exitcode == 0
+        assert sorted(collected) == [1, 2, 3, 4, 5, 6]
+        assert task_pid not in {sim["pid"] for sim in collected.values()}
+
+    def test_pool_error_becomes_game_error(self, monkeypatch) -> None:
+        monkeypatch.setattr(replay_tasks.settings, "replay_workers", 2)
+        monkeypatch.setattr(replay_tasks, "_simulate_game", _raising_game)
+
+        results = asyncio.run(_collect(_tasks(2)))
+
+        assert results == {1: {"error": "worker lost"}, 2: {"error": "worker lost"}}
+
+    def test_failed_game_becomes_error(self, monkeypatch) -> None:
+        monkeypatch.setattr(replay_tasks.settings, "replay_workers", 1)
+        monkeypatch.setattr(replay_tasks, "_worker_engine", None)
+        broken = MagicMock(sport="mlb")
+        broken.run_simulation.side_effect = ValueError("bad context")
+        monkeypatch.setattr(
+            "app.analytics.core.simulation_engine.SimulationEngine", lambda sport: broken,
+        )
+
+        results = asyncio.run(_collect(_tasks(1)))
+
+        assert results == {1: {"error": "bad context"}}
+
+
+def _game(game_id: int, home: int, away: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=game_id, game_date="2025-05-01 23:05:00+00:00", home_score=home, away_score=away,
+    )
+
+
+_CONTEXT = {"home_team": "H", "away_team": "A"}
+
+
+class TestReplayEntries:
+    def test_entry_scores_prediction(self) -> None:
+        sim = {
+            "home_win_probability": 0.6,
+            "away_win_probability": 0.4,
+            "average_home_score": 4.567,
+            "average_away_score": 3.2,
+        }
+
+        entry = replay_tasks._replay_entry(_game(7, 5, 3), _CONTEXT, sim)
+
+        assert entry["game_date"] == "2025-05-01"
+        assert entry["predicted_home_score"] == 4.57
+        assert entry["correct_winner"] is True
+        assert entry["brier_score"] == pytest.approx(0.16)
+
+    def test_error_entry(self) -> None:
+        entry = replay_tasks._replay_entry(_game(7, 5, 3), _CONTEXT, {"error": "boom"})
+
+        assert entry == {
+            "game_id": 7, "game_date": "2025-05-01",
+            "home_team": "H", "away_team": "A", "error": "boom",
+        }
+
+    def test_metrics_from_entries(self) -> None:
+        sims = [
+            {"home_win_probability": 0.7, "average_home_score": 5.0, "average_away_score": 3.0},
+            {"home_win_probability": 0.6, "average_home_score": 4.0, "average_away_score": 4.0},
+        ]
+        entries = [
+            replay_tasks._replay_entry(_game(1, 6, 2), _CONTEXT, sims[0]),
+            replay_tasks._replay_entry(_game(2, 1, 3), _CONTEXT, sims[1]),
+            replay_tasks._replay_entry(_game(3, 1, 3), _CONTEXT, {"error": "x"}),
+        ]
+
+        metrics = replay_tasks._replay_metrics(entries)
+
+        assert metrics["game_count"] == 3
+        assert metrics["valid_count"] == 2
+        assert metrics["winner_accuracy"] == 0.5
+        assert metrics["avg_brier_score"] == pytest.approx((0.09 + 0.36) / 2)
+        assert metrics["avg_score_mae"] == pytest.approx(((1 + 1) / 2 + (3 + 1) / 2) / 2)
+
+
+class TestAppendResults:
+    def test_batch_is_appended_and_committed(self) -> None:
+        session = AsyncMock()
+        sf = MagicMock()
+        sf.return_value.__aenter__.return_value = session
+        batch = [{"game_id": 1}, {"game_id": 2}]
+
+        asyncio.run(replay_tasks._append_results(sf, 9, batch))
+
+        stmt, params = session.execute.call_args.args
+        assert "|| :batch" in str(stmt)
+        assert params == {"batch": batch, "n": 2, "job_id": 9}
+        session.commit.assert_awaited_once()
@@ -0,0 +1,126 @@
+"""Tests for batched timeline artifact generation."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.services import timeline_generator
+from app.services.timeline_generator import generate_timeline_artifacts
+
+GAME_START = datetime(2026, 1, 15, 0, 0, tzinfo=UTC)
+
+
+def _game(game_id: int, status: str = "final") -> SimpleNamespace:
+    return SimpleNamespace(id=game_id, game_date=GAME_START, status=status, league_code="NBA")
+
+
+def _plays(game_id: int, count: int = 40) -> list[SimpleNamespace]:
+    plays = []
+    for i in range(count):
+        quarter = 1 + i * 4 // count
+        seconds = 720 - (i % (count // 4)) * 30
+        plays.append(SimpleNamespace(
+            game_id=game_id,
+            play_index=i,
+            quarter=quarter,
+            game_clock=f"{seconds // 60}:{seconds % 60:02d}",
+            description=f"Play {i}",
+            play_type="shot",
+            player_name="Player",
+            home_score=i,
+            away_score=i,
+            team_abbreviation="BOS" if i % 2 else "NYK",
+        ))
+    return plays
+
+
+def _post(game_id: int, minutes: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        game_id=game_id,
+        id=minutes,
+        posted_at=GAME_START + timedelta(minutes=minutes),
+        tweet_text="Tip-off!",
+        source_handle="celtics",
+        media_type=None,
+    )
+
+
+def _session(games, plays, posts=(), odds=()) -> AsyncMock:
+    session = AsyncMock()
+    session.execute.side_effect = [list(games), list(plays), list(posts), list(odds), None]
+    return session
+
+
+class TestGenerateTimelineArtifacts:
+    def test_chunk_uses_one_query_per_source_and_one_write(self) -> None:
+        session = _session(
+            games=[_game(1), _game(2)],
+            plays=_plays(1) + _plays(2),
+        )
+
+        result = asyncio.run(generate_timeline_artifacts(session, [1, 2]))
+
+        assert [a.game_id for a in result.artifacts] == [1, 2]
+        assert result.failures == {}
+        # games, plays, posts, odds, artifact upsert
+        assert session.execute.await_count == 5
+        upsert = session.execute.await_args_list[-1].args[0]
+        assert "ON CONFLICT ON CONSTRAINT uq_game_timeline_artifact_version" in str(
+            upsert.compile(dialect=postgresql.dialect())
+        )
+        events = result.artifacts[0].timeline
+        assert {e["team_abbreviation"] for e in events if e["event_type"] == "pbp"} == {"BOS", "NYK"}
+
+    def test_projected_queries_skip_wide_columns(self) -> None:
+        session = _session(games=[_game(1)], plays=_plays(1))
+
+        asyncio.run(generate_timeline_artifacts(session, [1]))
+
+        plays_sql = str(session.execute.await_args_list[1].args[0])
+        odds_sql = str(session.execute.await_args_list[3].args[0])
+        assert "raw_data" not in plays_sql
+        assert "raw_payload" not in odds_sql
+
+    def test_unbuildable_games_are_reported_not_raised(self) -> None:
+        session = _session(
+            games=[_game(1), _game(2, status="live"), _game(3)],
+            plays=_plays(1),
+        )
+
+        result = asyncio.run(generate_timeline_artifacts(session, [1, 2, 3, 4]))
+
+        assert [a.game_id for a in result.artifacts] == [1]
+        assert result.failures == {
+            2: "Game is not final",
+            3: "Missing play-by-play data",
+            4: "Game not found",
+        }
+
+    def test_posts_outside_social_window_are_dropped(self) -> None:
+        session = _session(
+            games=[_game(1)],
+            plays=_plays(1),
+            posts=[_post(1, -600), _post(1, 5)],
+        )
+
+        result = asyncio.run(generate_timeline_artifacts(session, [1]))
+
+        tweets = [e for e in result.artifacts[0].timeline if e["event_type"] == "tweet"]
+        assert len(tweets) == 1
+
+    def test_games_are_chunked(self, monkeypatch) -> None:
+        calls: list[list[int]] = []
+
+        async def fake_chunk(session, game_ids, result, *args):
+            calls.append(game_ids)
+
+        monkeypatch.setattr(timeline_generator, "_generate_chunk", fake_chunk)
+
+        asyncio.run(generate_timeline_artifacts(AsyncMock(), [1, 2, 3, 2, 4, 5], batch_size=2))
+
+        assert calls == [[1, 2], [3, 4], [5]]
@@ -0,0 +1,152 @@
+"""Tests for the on-disk training dataset cache."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from app.tasks import _training_dataset_cache as cache
+
+_RECORDS = [
+    {
+        "home_profile": {"metrics": {"contact_rate": 0.81, "barrel_pct": 0.07}},
+        "home_starter_profile": {"metrics": {"era": 3.2, "whip": None}},
+        "market_profile": {"metrics": {"home_wp": 0.55}},
+        "home_win": 1,
+        "home_score": 5,
+    },
+    {
+        "home_profile": {"metrics": {"contact_rate": 0.78}},
+        "home_starter_profile": {"metrics": {}},
+        "market_profile": {"metrics": {"home_wp": 0.5}},
+        "home_win": 0,
+        "home_score": 2,
+        "outcome": "strikeout",
+        "flag": True,
+    },
+]
+
+
+class TestColumnarRoundTrip:
+    def test_records_round_trip_exactly(self, tmp_path: Path) -> None:
+        cache.write_dataset(tmp_path / "ds", _RECORDS)
+
+        assert cache.read_dataset(tmp_path / "ds") == _RECORDS
+
+    def test_value_types_round_trip(self, tmp_path: Path) -> None:
+        records = [
+            {"home_score": 5, "line": -1, "spread": 1.5, "flag": True},
+            {"home_score": 2, "line": -1.5, "spread": 3, "flag": False},
+        ]
+        cache.write_dataset(tmp_path / "ds", records)
+
+        restored = cache.read_dataset(tmp_path / "ds")
+
+        assert [{k: type(v) for k, v in r.items()} for r in restored] == [
+            {k: type(v) for k, v in r.items()} for r in records
+        ]
+        assert restored == records
+
+    def test_int_columns_stored_as_int64(self, tmp_path: Path) -> None:
+        cache.write_dataset(tmp_path / "ds", [{"home_score": 5}, {"home_score": 2}])
+
+        assert np.load(tmp_path / "ds" / "c0.npy").dtype == np.int64
+
+    def test_columns_are_memory_mapped(self, tmp_path: Path) -> None:
+        cache.write_dataset(tmp_path / "ds", _RECORDS)
+
+        column = np.load(tmp_path / "ds" / "c0.npy", mmap_mode="r")
+
+        assert isinstance(column, np.memmap)
+        assert column.dtype == np.float64
+
+    def test_empty_dataset(self, tmp_path: Path) -> None:
+        cache.write_dataset(tmp_path / "ds", [])
+
+        assert cache.read_dataset(tmp_path / "ds") == []
+
+    def test_unsupported_values_are_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(cache._UnsupportedRecords):
+            cache.write_dataset(tmp_path / "ds", [{"lineup": [1, 2, 3]}])
+
+        assert not (tmp_path / "ds").exists()
+        assert list(tmp_path.iterdir()) == []
+
+    def test_ints_beyond_int64_are_rejected(self, tmp_path: Path) -> None:
+        with pytest.raises(cache._UnsupportedRecords):
+            cache.write_dataset(tmp_path / "ds", [{"game_id": 2**70}])
+
+
+class TestLoadTrainingRecords:
+    @pytest.fixture
+    def loader(self, monkeypatch, tmp_path: Path) -> list[dict]:
+        calls: list[dict] = []
+
+        async def fake_loader(**kwargs):
+            calls.append(kwargs)
+            return [dict(r) for r in _RECORDS]
+
+        monkeypatch.setattr(cache, "load_training_data_from_db", fake_loader)
+        monkeypatch.setattr(cache.settings, "training_dataset_cache_dir", str(tmp_path))
+        monkeypatch.setattr(cache.settings, "training_dataset_cache_ttl_seconds", 3600)
+        return calls
+
+    @staticmethod
+    def _load(**overrides) -> list[dict]:
+        params = {
+            "sport": "mlb", "model_type": "game",
+            "date_start": "2025-04-01", "date_end": "2025-09-30", "rolling_window": 30,
+        }
+        params.update(overrides)
+        return asyncio.run(cache.load_training_records(**params))
+
+    def test_same_slice_loads_database_once(self, loader) -> None:
+        results = [self._load() for _ in range(3)]
+
+        assert len(loader) == 1
+        assert all(r == _RECORDS for r in results)
+
+    def test_different_parameters_miss(self, loader) -> None:
+        self._load()
+        self._load(rolling_window=15)
+        self._load(model_type="plate_appearance")
+
+        assert len(loader) == 3
+
+    def test_expired_entry_reloads(self, loader, tmp_path: Path) -> None:
+        self._load()
+        key = cache.dataset_key(
+            sport="mlb", model_type="game",
+            date_start="2025-04-01", date_end="2025-09-30", rolling_window=30,
+        )
+        stale = time.time() - 7200
+        os.utime(tmp_path / key / "manifest.json", (stale, stale))
+
+        self._load()
+
+        assert len(loader) == 2
+
+    def test_zero_ttl_bypasses_cache(self, loader, monkeypatch, tmp_path: Path) -> None:
+        monkeypatch.setattr(cache.settings, "training_dataset_cache_ttl_seconds", 0)
+
+        self._load()
+        self._load()
+
+        assert len(loader) == 2
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unsupported_records_are_returned_uncached(self, loader, monkeypatch) -> None:
+        async def odd_loader(**kwargs):
+            loader.append(kwargs)
+            return [{"lineup": [1, 2]}]
+
+        monkeypatch.setattr(cache, "load_training_data_from_db", odd_loader)
+
+        assert self._load() == [{"lineup": [1, 2]}]
+        assert self._load() == [{"lineup": [1, 2]}]
+        assert len(loader) == 2
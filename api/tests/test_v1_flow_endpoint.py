@@ -4,22 +4,44 @@ Verifies:
 - Consumer response shape omits validationPassed / validationErrors
 - RECAP_PENDING, non-final status, and 404 paths work correctly
 - Auth: missing/invalid API key returns 401
+- Compiled documents: strong ETag, If-None-Match → 304, stored bytes served
 """
 
 from __future__ import annotations
 
+import hashlib
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import Depends, FastAPI
 from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.sql.util import find_tables
 
 from app.db import get_db
 from app.db.sports import GameStatus
 from app.dependencies.consumer_auth import verify_consumer_api_key
+from app.routers.sports.game_timeline import FLOW_VERSION
+from app.routers.v1 import games as v1_games
 from app.routers.v1 import router as v1_router
 from app.routers.v1.games import router
+from app.services.flow_docs import (
+    FLOW_DOC_FORMAT,
+    CompiledFlow,
+    _fingerprint,
+    etag_matches,
+)
+
+# sports_games.flow_sources_changed_at as stamped by the source triggers
+STAMP = datetime(2026, 1, 1, 12, tzinfo=UTC)
+
+
+@pytest.fixture(autouse=True)
+def _store_flow_doc(monkeypatch) -> AsyncMock:
+    store = AsyncMock()
+    monkeypatch.setattr(v1_games, "store_flow_doc", store)
+    return store
 
 
 # ---------------------------------------------------------------------------
@@ -31,6 +53,7 @@ def _make_client(mock_db: AsyncMock | None = None) -> tuple[TestClient, AsyncMoc
     if mock_db is None:
         mock_db = AsyncMock()
         result_mock = MagicMock()
+        result_mock.first.return_value = None
         result_mock.scalar_one_or_none.return_value = None
         result_mock.scalars.return_value.all.return_value = []
         mock_db.execute.return_value = result_mock
@@ -49,6 +72,38 @@ def _make_client(mock_db: AsyncMock | None = None) -> tuple[TestClient, AsyncMoc
     return TestClient(app), mock_db
 
 
+def _probe_result(row: tuple | None) -> MagicMock:
+    result = MagicMock()
+    result.first.return_value = row
+    return result
+
+
+def _probe_row(
+    document: CompiledFlow | None = None,
+    *,
+    flow_id: int = 7,
+    fingerprint: str | None = None,
+    stamp: datetime | None = STAMP,
+) -> tuple:
+    """Row shape of probe_flow_doc: the game's stamp, then the stored document."""
+    if document is None:
+        return (stamp, None, None, None, None, None)
+    return (
+        stamp,
+        flow_id,
+        FLOW_DOC_FORMAT,
+        fingerprint or _fingerprint(7, FLOW_VERSION, STAMP),
+        document.content_hash,
+        document.body,
+    )
+
+
+def _flow_result(flow: MagicMock | None) -> MagicMock:
+    result = MagicMock()
+    result.scalar_one_or_none.return_value = flow
+    return result
+
+
 def _mock_team(team_name: str, abbr: str) -> MagicMock:
     t = MagicMock()
     t.name = team_name
@@ -77,6 +132,7 @@ def _mock_game(
 
 def _mock_flow(game_id: int = 42) -> MagicMock:
     flow = MagicMock()
+    flow.id = 7
     flow.game_id = game_id
     flow.moments_json = []
     flow.blocks_json = [
@@ -112,8 +168,7 @@ class TestConsumerResponseShape:
     def test_returns_flow_without_validation_fields(self) -> None:
         mock_db = AsyncMock()
 
-        flow_result = MagicMock()
-        flow_result.scalar_one_or_none.return_value = _mock_flow()
+        probe = _probe_result(_probe_row())
 
         game_result = MagicMock()
         game_result.scalar_one_or_none.return_value = _mock_game()
@@ -121,7 +176,7 @@ class TestConsumerResponseShape:
         plays_result = MagicMock()
         plays_result.scalars.return_value.all.return_value = []
 
-        mock_db.execute.side_effect = [flow_result, game_result, plays_result]
+        mock_db.execute.side_effect = [probe, _flow_result(_mock_flow()), game_result, plays_result]
 
         client, _ = _make_client(mock_db)
         resp = client.get("/api/v1/games/42/flow")
@@ -142,8 +197,7 @@ class TestConsumerResponseShape:
     def test_score_is_score_object(self) -> None:
         mock_db = AsyncMock()
 
-        flow_result = MagicMock()
-        flow_result.scalar_one_or_none.return_value = _mock_flow()
+        probe = _probe_result(_probe_row())
 
         game_result = MagicMock()
         game_result.scalar_one_or_none.return_value = _mock_game()
@@ -151,7 +205,7 @@ class TestConsumerResponseShape:
         plays_result = MagicMock()
         plays_result.scalars.return_value.all.return_value = []
 
-        mock_db.execute.side_effect = [flow_result, game_result, plays_result]
+        mock_db.execute.side_effect = [probe, _flow_result(_mock_flow()), game_result, plays_result]
 
         client, _ = _make_client(mock_db)
         resp = client.get("/api/v1/games/42/flow")
@@ -165,8 +219,7 @@ class TestConsumerResponseShape:
     def test_includes_team_metadata(self) -> None:
         mock_db = AsyncMock()
 
-        flow_result = MagicMock()
-        flow_result.scalar_one_or_none.return_value = _mock_flow()
+        probe = _probe_result(_probe_row())
 
         game_result = MagicMock()
         game_result.scalar_one_or_none.return_value = _mock_game()
@@ -174,7 +227,7 @@ class TestConsumerResponseShape:
         plays_result = MagicMock()
         plays_result.scalars.return_value.all.return_value = []
 
-        mock_db.execute.side_effect = [flow_result, game_result, plays_result]
+        mock_db.execute.side_effect = [probe, _flow_result(_mock_flow()), game_result, plays_result]
 
         client, _ = _make_client(mock_db)
         resp = client.get("/api/v1/games/42/flow")
@@ -197,15 +250,10 @@ class TestRecapPendingStatus:
     def test_final_no_flow_returns_recap_pending(self) -> None:
         mock_db = AsyncMock()
 
-        no_flow = MagicMock()
-        no_flow.scalar_one_or_none.return_value = None
-
-        game_result = MagicMock()
-        game_result.scalar_one_or_none.return_value = _mock_game(
+        mock_db.execute.side_effect = [_probe_result(_probe_row()), _flow_result(None)]
+        mock_db.get.return_value = _mock_game(
             end_time=datetime.now(UTC) - timedelta(minutes=5)
         )
-
-        mock_db.execute.side_effect = [no_flow, game_result]
         client, _ = _make_client(mock_db)
 
         resp = client.get("/api/v1/games/42/flow")
@@ -218,15 +266,10 @@ class TestRecapPendingStatus:
     def test_eta_zero_when_overdue(self) -> None:
         mock_db = AsyncMock()
 
-        no_flow = MagicMock()
-        no_flow.scalar_one_or_none.return_value = None
-
-        game_result = MagicMock()
-        game_result.scalar_one_or_none.return_value = _mock_game(
+        mock_db.execute.side_effect = [_probe_result(_probe_row()), _flow_result(None)]
+        mock_db.get.return_value = _mock_game(
             end_time=datetime.now(UTC) - timedelta(minutes=30)
         )
-
-        mock_db.execute.side_effect = [no_flow, game_result]
         client, _ = _make_client(mock_db)
 
         resp = client.get("/api/v1/games/42/flow")
@@ -249,13 +292,8 @@ class TestNonFinalStatus:
     def test_status_mapping(self, game_status: str, expected: str) -> None:
         mock_db = AsyncMock()
 
-        no_flow = MagicMock()
-        no_flow.scalar_one_or_none.return_value = None
-
-        game_result = MagicMock()
-        game_result.scalar_one_or_none.return_value = _mock_game(status=game_status)
-
-        mock_db.execute.side_effect = [no_flow, game_result]
+        mock_db.execute.side_effect = [_probe_result(_probe_row()), _flow_result(None)]
+        mock_db.get.return_value = _mock_game(status=game_status)
         client, _ = _make_client(mock_db)
 
         resp = client.get("/api/v1/games/42/flow")
@@ -269,16 +307,12 @@ class TestNotFound:
     def test_missing_game_is_404(self) -> None:
         mock_db = AsyncMock()
 
-        no_flow = MagicMock()
-        no_flow.scalar_one_or_none.return_value = None
-        no_game = MagicMock()
-        no_game.scalar_one_or_none.return_value = None
-
-        mock_db.execute.side_effect = [no_flow, no_game]
+        mock_db.execute.side_effect = [_probe_result(None)]
         client, _ = _make_client(mock_db)
 
         resp = client.get("/api/v1/games/99/flow")
         assert resp.status_code == 404
+        assert mock_db.execute.await_count == 1
 
 
 # ---------------------------------------------------------------------------
@@ -318,3 +352,127 @@ class TestConsumerAuth:
         client = self._make_auth_client(monkeypatch)
         resp = client.get("/api/v1/games/42/flow", headers={"X-API-Key": "wrong-key"})
         assert resp.status_code == 401
+
+
+# ---------------------------------------------------------------------------
+# Compiled documents and ETags
+# ---------------------------------------------------------------------------
+
+
+def _compiled(body: bytes = b'{"gameId":42,"plays":[],"blocks":[]}') -> CompiledFlow:
+    return CompiledFlow(body=body, content_hash=hashlib.sha256(body).hexdigest())
+
+
+def _miss_side_effect(probe_row: tuple) -> list[MagicMock]:
+    game_result = MagicMock()
+    game_result.scalar_one_or_none.return_value = _mock_game()
+    plays_result = MagicMock()
+    plays_result.scalars.return_value.all.return_value = []
+    return [_probe_result(probe_row), _flow_result(_mock_flow()), game_result, plays_result]
+
+
+class TestCompiledFlowDocument:
+    def test_miss_compiles_and_stores(self, _store_flow_doc) -> None:
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = _miss_side_effect(_probe_row())
+
+        client, _ = _make_client(mock_db)
+        resp = client.get("/api/v1/games/42/flow")
+
+        assert resp.status_code == 200
+        _store_flow_doc.assert_awaited_once()
+        _, game_id, flow_id, probe, compiled = _store_flow_doc.await_args.args
+        assert (game_id, flow_id) == (42, 7)
+        assert probe.fingerprint(flow_id) == _fingerprint(7, FLOW_VERSION, STAMP)
+        assert resp.content == compiled.body
+        assert resp.headers["etag"] == f'"{compiled.content_hash}"'
+        assert resp.headers["content-type"] == "application/json"
+
+    def test_hit_serves_stored_bytes_with_one_query(self, _store_flow_doc) -> None:
+        doc = _compiled()
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = [_probe_result(_probe_row(doc))]
+
+        client, _ = _make_client(mock_db)
+        resp = client.get("/api/v1/games/42/flow")
+
+        assert resp.status_code == 200
+        assert resp.content == doc.body
+        assert resp.headers["etag"] == doc.etag
+        assert mock_db.execute.await_count == 1
+        mock_db.get.assert_not_called()
+        _store_flow_doc.assert_not_awaited()
+
+    def test_probe_is_a_primary_key_lookup(self) -> None:
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = [_probe_result(_probe_row(_compiled()))]
+
+        client, _ = _make_client(mock_db)
+        client.get("/api/v1/games/42/flow")
+
+        stmt = mock_db.execute.await_args_list[0].args[0]
+        tables = {t.name for t in find_tables(stmt, include_joins=True)}
+        assert tables == {"sports_games", "sports_game_flow_docs"}
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "max(" not in sql
+        assert "sports_games.id = %(id_1)s" in sql
+
+    def test_if_none_match_returns_304(self) -> None:
+        doc = _compiled()
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = [_probe_result(_probe_row(doc))]
+
+        client, _ = _make_client(mock_db)
+        resp = client.get("/api/v1/games/42/flow", headers={"If-None-Match": doc.etag})
+
+        assert resp.status_code == 304
+        assert resp.content == b""
+        assert resp.headers["etag"] == doc.etag
+
+    def test_stale_etag_gets_body(self) -> None:
+        doc = _compiled()
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = [_probe_result(_probe_row(doc))]
+
+        client, _ = _make_client(mock_db)
+        resp = client.get("/api/v1/games/42/flow", headers={"If-None-Match": '"stale"'})
+
+        assert resp.status_code == 200
+        assert resp.content == doc.body
+
+    @pytest.mark.parametrize(
+        "stale",
+        [
+            {"stamp": datetime(2026, 2, 1, tzinfo=UTC)},
+            {"stamp": None},
+            {"flow_id": 8},
+            {"fingerprint": _fingerprint(7, "v1-old", STAMP)},
+        ],
+        ids=["sources_stamped", "stamp_cleared", "new_flow_row", "story_version"],
+    )
+    def test_stale_document_recompiles(self, _store_flow_doc, stale: dict) -> None:
+        mock_db = AsyncMock()
+        mock_db.execute.side_effect = _miss_side_effect(_probe_row(_compiled(), **stale))
+
+        client, _ = _make_client(mock_db)
+        resp = client.get("/api/v1/games/42/flow")
+
+        assert resp.status_code == 200
+        assert resp.json()["homeTeam"] == "Home Team"
+        _store_flow_doc.assert_awaited_once()
+
+
+class TestEtagMatches:
+    @pytest.mark.parametrize(
+        "header,expected",
+        [
+            (None, False),
+            ('"abc"', True),
+            ('W/"abc"', True),
+            ('"x", "abc"', True),
+            ("*", True),
+            ('"abcd"', False),
+        ],
+    )
+    def test_match(self, header: str | None, expected: bool) -> None:
+        assert etag_matches(header, '"abc"') is expected
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark generic-phrase matching throughput (blocks/sec) as the list grows.
+
+Builds synthetic ~80-word narrative blocks, then for each phrase-list size
+times:
+
+  scan        one ``phrase in text.lower()`` check per phrase, so cost
+              grows with the list
+  automaton   an Aho-Corasick PhraseMatcher, one pass over each block
+  matcher     PhraseMatcher as shipped (scan up to SCAN_MAX_PHRASES
+              phrases, automaton above)
+
+The production generic-phrase list is always the first entries; larger
+lists are padded with synthetic phrases. All paths must report the same
+matched phrases for every block.
+
+Usage:
+    python scripts/bench_phrase_matcher.py
+    python scripts/bench_phrase_matcher.py --sizes 38,500,5000 --blocks 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+script_dir = Path(__file__).resolve().parent
+scraper_dir = script_dir.parent
+sys.path.insert(0, str(scraper_dir))
+sys.path.insert(0, str(scraper_dir.parent / "api"))
+
+from app.utils import phrase_matcher  # noqa: E402
+from app.utils.phrase_matcher import PhraseMatcher  # noqa: E402
+
+from sports_scraper.pipeline.grader_rules.generic_phrases import GENERIC_PHRASES  # noqa: E402
+
+_WORDS = [
+    "the", "home", "side", "opened", "a", "lead", "in", "the", "paint", "while",
+    "visitors", "answered", "from", "deep", "before", "a", "late", "run", "closed",
+    "the", "quarter", "with", "free", "throws", "and", "a", "stop", "on", "defense",
+]
+
+
+def _phrases(size: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    phrases = list(GENERIC_PHRASES[:size])
+    while len(phrases) < size:
+        phrases.append(" ".join(rng.choice(_WORDS) + rng.choice("xyzq") for _ in range(rng.randint(2, 4))))
+    return phrases
+
+
+def _blocks(n: int, seed: int) -> list[str]:
+    rng = random.Random(seed + 1)
+    blocks = []
+    for _ in range(n):
+        words = [rng.choice(_WORDS) for _ in range(80)]
+        # Roughly one real generic phrase per block
+        words.insert(rng.randrange(len(words)), rng.choice(GENERIC_PHRASES))
+        blocks.append(" ".join(words))
+    return blocks
+
+
+def _scan(phrases, blocks):
+    out = []
+    for text in blocks:
+        lower = text.lower()
+        out.append([p for p in phrases if p in lower])
+    return out
+
+
+def _matched(matcher, blocks):
+    return [matcher.matched(text) for text in blocks]
+
+
+def _build_automaton(phrases):
+    saved = phrase_matcher.SCAN_MAX_PHRASES
+    phrase_matcher.SCAN_MAX_PHRASES = 0
+    try:
+        return PhraseMatcher(phrases)
+    finally:
+        phrase_matcher.SCAN_MAX_PHRASES = saved
+
+
+def _time(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Phrase matcher throughput benchmark")
+    parser.add_argument("--sizes", default=f"{len(GENERIC_PHRASES)},100,500,2000,10000")
+    parser.add_argument("--blocks", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    blocks = _blocks(args.blocks, args.seed)
+    print(f"blocks={len(blocks)} avg_chars={sum(map(len, blocks)) // len(blocks)}")
+    print(
+        f"{'phrases':>8} {'build ms':>9} {'scan blk/s':>12} {'automaton blk/s':>16} "
+        f"{'matcher blk/s':>14} {'uses':>10}"
+    )
+
+    for size in (int(s) for s in args.sizes.split(",")):
+        phrases = _phrases(size, args.seed)
+        automaton, t_build = _time(_build_automaton, phrases)
+        matcher = PhraseMatcher(phrases)
+        n = len(blocks)
+        naive, t_naive = _time(_scan, list(automaton.phrases), blocks)
+        via_automaton, t_automaton = _time(_matched, automaton, blocks)
+        shipped, t_matcher = _time(_matched, matcher, blocks)
+        uses = "automaton" if matcher.uses_automaton else "scan"
+        print(
+            f"{size:>8} {t_build * 1000:>9.1f} {n / t_naive:>12,.0f} "
+            f"{n / t_automaton:>16,.0f} {n / t_matcher:>14,.0f} {uses:>10}"
+        )
+        for name, result in (("automaton", via_automaton), ("matcher", shipped)):
+            if result != naive:
+                mismatched = [i for i, (a, b) in enumerate(zip(result, naive, strict=True)) if a != b]
+                print(f"MISMATCH ({name}) on {len(mismatched)} blocks, e.g. {mismatched[:5]}")
+                sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
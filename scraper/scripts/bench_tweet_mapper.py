@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""Benchmark tweet-to-game assignment throughput (tweets/sec).
+
+Builds a synthetic season of games and a day-shaped stream of team posts,
+then times:
+
+  per-tweet   the previous algorithm — filter candidate games by team and
+              ET search dates for every tweet, then compute each candidate's
+              window (stands in for one SQL query per tweet, minus the
+              network round trip, so it understates the old cost)
+  index       GameWindowIndex built once, one bisect lookup per tweet
+
+No database is touched; both paths must agree on every assignment.
+
+Usage:
+    python scripts/bench_tweet_mapper.py
+    python scripts/bench_tweet_mapper.py --teams 30 --days 30 --tweets 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+script_dir = Path(__file__).resolve().parent
+scraper_dir = script_dir.parent
+sys.path.insert(0, str(scraper_dir))
+
+from sports_scraper.social.tweet_mapper import (  # noqa: E402
+    GameWindowIndex,
+    _search_dates_for_tweet,
+    classify_game_phase,
+    get_game_window,
+)
+
+
+def _games(teams: int, days: int, league: str, seed: int) -> list[SimpleNamespace]:
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 6, tzinfo=UTC)
+    games = []
+    game_id = 1
+    for day in range(days):
+        team_ids = list(range(1, teams + 1))
+        rng.shuffle(team_ids)
+        # Roughly half the league plays each night, 7-10:30 PM ET tips.
+        for home, away in zip(team_ids[: teams // 2 : 2], team_ids[1 : teams // 2 : 2], strict=False):
+            tip = start + timedelta(days=day, hours=24 + rng.choice([0, 0.5, 1, 1.5, 2, 3, 3.5]))
+            games.append(
+                SimpleNamespace(
+                    id=game_id,
+                    home_team_id=home,
+                    away_team_id=away,
+                    game_date=tip,
+                    end_time=None,
+                    league_code=league,
+                )
+            )
+            game_id += 1
+    return games
+
+
+def _tweets(n: int, teams: int, days: int, seed: int) -> list[tuple[int, int, datetime]]:
+    rng = random.Random(seed + 1)
+    start = datetime(2025, 1, 6, 10, tzinfo=UTC)
+    span = days * 86400
+    return [
+        (i, rng.randint(1, teams), start + timedelta(seconds=rng.randrange(span)))
+        for i in range(1, n + 1)
+    ]
+
+
+def _per_tweet(games, tweets):
+    out = {}
+    for tweet_id, team_id, posted_at in tweets:
+        search_start, search_end = _search_dates_for_tweet(posted_at)
+        for game in games:
+            if team_id not in (game.home_team_id, game.away_team_id):
+                continue
+            if not (search_start <= game.game_date <= search_end + timedelta(days=1)):
+                continue
+            window_start, window_end = get_game_window(game)
+            if window_start <= posted_at <= window_end:
+                out[tweet_id] = (game.id, classify_game_phase(posted_at, game))
+                break
+    return out
+
+
+def _indexed(games, tweets):
+    index = GameWindowIndex(games)
+    out = {}
+    for tweet_id, team_id, posted_at in tweets:
+        match = index.lookup(team_id, posted_at)
+        if match:
+            out[tweet_id] = match
+    return out
+
+
+def _time(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tweet mapper throughput benchmark")
+    parser.add_argument("--teams", type=int, default=30)
+    parser.add_argument("--days", type=int, default=14)
+    parser.add_argument("--tweets", type=int, default=20000)
+    parser.add_argument("--league", default="NBA")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-per-tweet", action="store_true", help="Only time the indexed path")
+    args = parser.parse_args()
+
+    games = _games(args.teams, args.days, args.league, args.seed)
+    tweets = _tweets(args.tweets, args.teams, args.days, args.seed)
+    print(f"games={len(games)} tweets={len(tweets)}")
+
+    indexed, t_index = _time(_indexed, games, tweets)
+    print(f"index       {len(tweets) / t_index:>12,.0f} tweets/sec  ({t_index:.3f}s, mapped={len(indexed)})")
+
+    if not args.skip_per_tweet:
+        naive, t_naive = _time(_per_tweet, games, tweets)
+        print(f"per-tweet   {len(tweets) / t_naive:>12,.0f} tweets/sec  ({t_naive:.3f}s, mapped={len(naive)})")
+        print(f"speedup     {t_naive / t_index:>12.1f}x")
+        mismatched = [k for k in naive.keys() | indexed.keys() if naive.get(k) != indexed.get(k)]
+        if mismatched:
+            print(f"MISMATCH on {len(mismatched)} tweets, e.g. {mismatched[:5]}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
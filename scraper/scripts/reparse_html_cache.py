@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""Re-derive boxscores and play-by-play from the local Sports Reference HTML cache.
+
+Runs entirely offline: pages are read from SCRAPER_HTML_CACHE_DIR, parsed
+across a process pool, and written back in batches. Use after fixing a
+parser bug to rebuild historical data without re-scraping.
+
+Usage:
+    python scripts/reparse_html_cache.py --league NBA                  # boxscores + PBP
+    python scripts/reparse_html_cache.py --league NBA --pbp-only
+    python scripts/reparse_html_cache.py --league NCAAB --start 2024-11-01 --end 2025-04-10
+    python scripts/reparse_html_cache.py --league NBA --workers 8 --batch-size 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import date
+from pathlib import Path
+
+script_dir = Path(__file__).resolve().parent
+scraper_dir = script_dir.parent
+sys.path.insert(0, str(scraper_dir))
+
+api_dir = scraper_dir.parent / "api"
+if str(api_dir) not in sys.path:
+    sys.path.append(str(api_dir))
+
+from sports_scraper.db import get_session  # noqa: E402
+from sports_scraper.services.html_reparse import (  # noqa: E402
+    PBP_LEAGUES,
+    reparse_boxscores,
+    reparse_pbp,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline re-parse of the HTML cache")
+    parser.add_argument("--league", required=True, help="League code (NBA, NCAAB)")
+    parser.add_argument("--start", type=date.fromisoformat, help="First scoreboard date (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, help="Last scoreboard date (YYYY-MM-DD)")
+    parser.add_argument("--workers", type=int, default=None, help="Parser processes (default: all cores)")
+    parser.add_argument("--batch-size", type=int, default=50, help="Games written per commit")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--boxscores-only", action="store_true", help="Skip play-by-play")
+    group.add_argument("--pbp-only", action="store_true", help="Skip boxscores")
+    args = parser.parse_args()
+
+    league = args.league.upper()
+    results = {}
+
+    with get_session() as session:
+        if not args.pbp_only:
+            stats = reparse_boxscores(
+                session,
+                league,
+                start=args.start,
+                end=args.end,
+                workers=args.workers,
+                batch_size=args.batch_size,
+            )
+            results["boxscores"] = stats.as_dict()
+
+        if not args.boxscores_only and league in PBP_LEAGUES:
+            stats = reparse_pbp(
+                session,
+                league,
+                workers=args.workers,
+                batch_size=args.batch_size,
+            )
+            results["pbp"] = stats.as_dict()
+
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from .config import settings
 from .db import db_models, get_session
 from .logging import logger
 from .odds.metrics import init_odds_metrics
+from .queue_metrics import record_queue_latency, stamp_enqueue_time
 from .telemetry import init_telemetry
 from .utils.datetime_utils import now_utc
 
@@ -36,10 +37,82 @@ def _is_held() -> bool:
         return False
 
 # Canonical queue names — import these instead of using string literals
-DEFAULT_QUEUE = "sports-scraper"
+DEFAULT_QUEUE = "sports-scraper"  # ingestion-bulk lane (scrape jobs, sweeps, backfills)
+LIVE_QUEUE = "sports-live"  # live game state + PBP polling
+ODDS_QUEUE = "sports-odds"  # pregame + in-game odds polling
+FLOW_QUEUE = "sports-flow"  # flow generation + LLM grading
 SOCIAL_QUEUE = "social-scraper"
 SOCIAL_BULK_QUEUE = "social-bulk"
 
+# Queue lanes: each lane is a queue with its own worker pool (see
+# infra/docker-compose.yml), so a multi-hour backfill on the ingestion lane
+# can never hold a 5-second live odds tick past its ``expires``.
+# Routing is by task name; tasks not listed fall back to DEFAULT_QUEUE.
+TASK_LANES: dict[str, tuple[str, ...]] = {
+    LIVE_QUEUE: (
+        "live_orchestrator_tick",
+        "update_game_states",
+        "poll_live_pbp",
+    ),
+    ODDS_QUEUE: (
+        "poll_live_odds_mainline",
+        "poll_live_odds_props",
+        "sync_mainline_odds",
+        "sync_prop_odds",
+    ),
+    FLOW_QUEUE: (
+        "trigger_flow_for_game",
+        "sweep_missing_flows",
+        "backfill_missing_flows",
+        "regen_flow_task",
+        "grade_flow_task",
+        "run_scheduled_flow_generation",
+        "run_scheduled_nba_flow_generation",
+        "run_scheduled_nhl_flow_generation",
+        "run_scheduled_ncaab_flow_generation",
+        "run_scheduled_mlb_flow_generation",
+        "run_scheduled_nfl_flow_generation",
+    ),
+    DEFAULT_QUEUE: (
+        "run_scrape_job",
+        "run_daily_sweep",
+        "ingest_mlb_advanced_stats",
+        "backfill_mlb_game_lineups",
+        # Social error callback runs on the ingestion lane (DB writes only)
+        "handle_social_task_failure",
+    ),
+    # All X scraping on one queue — single Playwright session, no parallel X hits
+    SOCIAL_QUEUE: (
+        "collect_social_for_league",
+        "collect_team_social",
+        "collect_game_social",
+        # Session health probe — shares the same IP/session as collection
+        "check_playwright_session_health",
+    ),
+    SOCIAL_BULK_QUEUE: ("map_social_to_games",),
+}
+
+# Lane labels for queue-latency metrics (celery.queue.latency{lane=...}).
+QUEUE_LANES: dict[str, str] = {
+    LIVE_QUEUE: "live",
+    ODDS_QUEUE: "odds",
+    FLOW_QUEUE: "flow",
+    DEFAULT_QUEUE: "ingestion",
+    SOCIAL_QUEUE: "social",
+    SOCIAL_BULK_QUEUE: "social-bulk",
+}
+
+# Enqueue→start budgets; exceeding one logs queue_latency_over_budget.
+QUEUE_LATENCY_BUDGET_SECONDS: dict[str, float] = {
+    LIVE_QUEUE: 1.0,
+    ODDS_QUEUE: 1.0,
+}
+
+
+def _route(queue: str) -> dict[str, str]:
+    return {"queue": queue, "routing_key": queue}
+
+
 celery_config = {
     "task_serializer": "json",
     "accept_content": ["json"],
@@ -116,33 +189,7 @@ app.Task = _HoldAwareTask
 app.conf.update(**celery_config)
 app.conf.task_acks_late = True
 app.conf.task_routes = {
-    "run_scrape_job": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    # All X scraping on one queue — single Playwright session, no parallel X hits
-    "collect_social_for_league": {"queue": SOCIAL_QUEUE, "routing_key": SOCIAL_QUEUE},
-    "collect_team_social": {"queue": SOCIAL_QUEUE, "routing_key": SOCIAL_QUEUE},
-    "map_social_to_games": {"queue": SOCIAL_BULK_QUEUE, "routing_key": SOCIAL_BULK_QUEUE},
-    # Social error callback runs on main scraper queue (DB writes only)
-    "handle_social_task_failure": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    # Game-state-machine polling tasks
-    "update_game_states": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    "poll_live_pbp": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    "sync_mainline_odds": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    "sync_prop_odds": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    "trigger_flow_for_game": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    "sweep_missing_flows": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    "run_daily_sweep": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    # Game social collection every 30 min (odds-gated + staleness targeting)
-    "collect_game_social": {"queue": SOCIAL_QUEUE, "routing_key": SOCIAL_QUEUE},
-    # Session health probe — runs on social-scraper to share the same IP/session
-    "check_playwright_session_health": {"queue": SOCIAL_QUEUE, "routing_key": SOCIAL_QUEUE},
-    # MLB advanced stats (Statcast-derived, post-game)
-    "ingest_mlb_advanced_stats": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    # Live orchestrator + live odds polling
-    "live_orchestrator_tick": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    "poll_live_odds_mainline": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    "poll_live_odds_props": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
-    # Narrative quality grader (dispatched by API finalize_moments stage)
-    "grade_flow_task": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
+    task_name: _route(queue) for queue, task_names in TASK_LANES.items() for task_name in task_names
 }
 # Daily pipeline schedule (all times US Eastern / UTC during EST):
 #
@@ -171,22 +218,22 @@ _polling_schedule = {
     "game-state-updater-every-60s": {
         "task": "update_game_states",
         "schedule": crontab(minute="*/1", hour="0-7,16-23"),
-        "options": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE, "countdown": 0, "expires": 55},
+        "options": {**_route(LIVE_QUEUE), "countdown": 0, "expires": 55},
     },
     "live-pbp-poll-every-60s": {
         "task": "poll_live_pbp",
         "schedule": crontab(minute="*/1", hour="0-7,16-23"),
-        "options": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE, "countdown": 15, "expires": 55},
+        "options": {**_route(LIVE_QUEUE), "countdown": 15, "expires": 55},
     },
     "mainline-odds-sync-every-3m": {
         "task": "sync_mainline_odds",
         "schedule": crontab(minute="*/3"),
-        "options": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE, "countdown": 30, "expires": 170},
+        "options": {**_route(ODDS_QUEUE), "countdown": 30, "expires": 170},
     },
     "prop-odds-sync-every-15m": {
         "task": "sync_prop_odds",
         "schedule": crontab(minute="*/15"),
-        "options": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE, "countdown": 45, "expires": 870},
+        "options": {**_route(ODDS_QUEUE), "countdown": 45, "expires": 870},
     },
     # Live orchestrator: runs every 5 seconds to dynamically dispatch
     # per-game polling at sport-appropriate cadences (PBP, stats, odds).
@@ -194,7 +241,7 @@ _polling_schedule = {
     "live-orchestrator-every-5s": {
         "task": "live_orchestrator_tick",
         "schedule": 5.0,  # Every 5 seconds (numeric = seconds interval)
-        "options": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE, "expires": 4},
+        "options": {**_route(LIVE_QUEUE), "expires": 4},
     },
     # Calendar poll: creates game stubs from league schedule APIs every 15 min.
     # Catches postseason matchups, schedule changes, and late-added games
@@ -268,7 +315,7 @@ _scheduled_tasks = {
     "flow-missing-sweep-7am-eastern": {
         "task": "sweep_missing_flows",
         "schedule": crontab(minute=0, hour=12),  # 7:00 AM EST = 12:00 UTC
-        "options": {"queue": DEFAULT_QUEUE, "routing_key": DEFAULT_QUEUE},
+        "options": _route(FLOW_QUEUE),
     },
     # === Analytics: outcome recording + batch sims (noon–3 AM ET = 17–08 UTC) ===
     # Runs every 30 min during active sports hours. Dispatches to the API
@@ -404,6 +451,24 @@ def mark_stale_runs_interrupted():
         logger.exception("failed_to_mark_stale_runs", error=str(exc))
 
 
+@signals.before_task_publish.connect(dispatch_uid="stamp_enqueue_time")
+def on_before_task_publish(sender=None, headers=None, **kwargs):
+    """Stamp publish time so workers can report per-lane queue latency."""
+    stamp_enqueue_time(headers)
+
+
+@signals.task_prerun.connect
+def on_task_prerun(sender=None, task=None, **kwargs):
+    """Record enqueue→start latency for the task's lane."""
+    task = task or sender
+    if task is None:
+        return
+    try:
+        record_queue_latency(task.name, task.request, QUEUE_LANES, QUEUE_LATENCY_BUDGET_SECONDS)
+    except Exception:
+        logger.debug("queue_latency_record_failed", exc_info=True)
+
+
 # Hold enforcement is handled by _HoldAwareTask.__call__() (line 54).
 # A previous task_prerun signal handler also raised Ignore() as a backup,
 # but Celery logs signal-raised exceptions as ERROR level, creating noisy
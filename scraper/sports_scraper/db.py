@@ -40,6 +40,7 @@ try:
     from app.db.quality_review import QualityReviewQueue  # type: ignore
     from app.db.mlb_advanced import (  # type: ignore
         MLBGameAdvancedStats,
+        MLBGameLineup,
         MLBPitcherGameStats,
         MLBPlayerAdvancedStats,
         MLBPlayerFieldingStats,
@@ -152,6 +153,7 @@ try:
         MLBPlayerAdvancedStats=MLBPlayerAdvancedStats,
         MLBPitcherGameStats=MLBPitcherGameStats,
         MLBPlayerFieldingStats=MLBPlayerFieldingStats,
+        MLBGameLineup=MLBGameLineup,
         # NBA advanced stats
         NBAGameAdvancedStats=NBAGameAdvancedStats,
         NBAPlayerAdvancedStats=NBAPlayerAdvancedStats,
@@ -7,6 +7,20 @@ This is a lightweight DB-backed scoring pipeline that:
 4. Loads live leaderboard data from ``golf_leaderboard``
 5. Runs the pure scoring engine (ported from ``api.app.services.golf_pool_scoring``)
 6. Upserts materialized results to ``golf_pool_entry_scores`` / ``golf_pool_entry_score_players``
+7. Rewrites the precomputed ranking document in ``golf_pool_leaderboards``,
+   which the public leaderboard endpoint serves as-is
+
+Incremental rescoring:
+    Each run stores a fingerprint of every golfer's leaderboard row in Redis
+    (``golf:pool_scoring:lb:{pool_id}``) after the pool commits. The next run
+    diffs the live leaderboard against it and walks a dg_id -> entries
+    inverted index, so only entries holding a golfer whose score moved are
+    rescored. The pool is re-ranked using the stored aggregates of untouched
+    entries, and only rows whose values changed are written, with multi-row
+    upserts. A pool is fully rescored when no fingerprint exists, the pool
+    row changed since it was last scored (rules edits, activation), or on a
+    manual rescore; entries added or edited since their last score are
+    always rescored.
 
 Auto-activation:
     Pools store ``scoring_starts_at`` in ``rules_json``.  When the current
@@ -31,9 +45,11 @@ Column naming conventions (from the Alembic migration):
 
 from __future__ import annotations
 
+import json
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any
 
+from app.db.golf_pools import LEADERBOARD_DOC_FORMAT
 from sqlalchemy import text
 
 from ..logging import logger
@@ -54,6 +70,13 @@ _PRE_LOCK_STATUSES = ("draft", "open")
 # Statuses eligible for auto-activation (scoring_starts_at passed)
 _PRE_LIVE_STATUSES = ("draft", "open", "locked")
 
+# Previous-run leaderboard fingerprints, one Redis hash per pool
+_LB_STATE_KEY = "golf:pool_scoring:lb:{pool_id}"
+_LB_STATE_TTL_S = 7 * 86400
+
+# Rows per multi-row INSERT statement (18 params/row stays well under 65535)
+_UPSERT_CHUNK = 500
+
 
 # ---------------------------------------------------------------------------
 # Auto-activation helpers
@@ -171,68 +194,61 @@ def _auto_activate_pools(session: Session) -> list[dict[str, Any]]:
 # Data loading helpers
 # ---------------------------------------------------------------------------
 
+def _pool_from_row(r) -> dict[str, Any]:
+    return {
+        "id": r[0],
+        "club_code": r[1],
+        "tournament_id": r[2],
+        "rules_json": r[3],
+        "status": r[4],
+        "updated_at": r[5],
+    }
+
+
 def _load_live_pools(session: Session) -> list[dict[str, Any]]:
     """Load all pools with status='live' and scoring_enabled=True."""
     rows = session.execute(
         text("""
-            SELECT id, club_code, tournament_id, rules_json, status
+            SELECT id, club_code, tournament_id, rules_json, status, updated_at
             FROM golf_pools
             WHERE status = 'live' AND scoring_enabled = TRUE
         """)
     ).fetchall()
 
-    return [
-        {
-            "id": r[0],
-            "club_code": r[1],
-            "tournament_id": r[2],
-            "rules_json": r[3],
-            "status": r[4],
-        }
-        for r in rows
-    ]
+    return [_pool_from_row(r) for r in rows]
 
 
 def _load_entries_and_picks(session: Session, pool_id: int) -> list[dict[str, Any]]:
-    """Load all entries and their picks for a pool."""
-    entry_rows = session.execute(
+    """Load all entries and their picks for a pool in one query."""
+    rows = session.execute(
         text("""
-            SELECT id, email, entry_name
-            FROM golf_pool_entries
-            WHERE pool_id = :pool_id
+            SELECT e.id, e.email, e.entry_name, e.updated_at,
+                   p.dg_id, p.player_name_snapshot, p.pick_slot, p.bucket_number
+            FROM golf_pool_entries e
+            LEFT JOIN golf_pool_entry_picks p ON p.entry_id = e.id
+            WHERE e.pool_id = :pool_id
+            ORDER BY e.id, p.pick_slot
         """),
         {"pool_id": pool_id},
     ).fetchall()
 
-    entries = []
-    for er in entry_rows:
-        entry_id = er[0]
-        pick_rows = session.execute(
-            text("""
-                SELECT dg_id, player_name_snapshot, pick_slot, bucket_number
-                FROM golf_pool_entry_picks
-                WHERE entry_id = :entry_id
-                ORDER BY pick_slot
-            """),
-            {"entry_id": entry_id},
-        ).fetchall()
-
-        picks = [
-            {
-                "dg_id": pr[0],
-                "player_name": pr[1],
-                "pick_slot": pr[2],
-                "bucket_number": pr[3],
-            }
-            for pr in pick_rows
-        ]
-
-        entries.append({
-            "entry_id": entry_id,
-            "email": er[1],
-            "entry_name": er[2],
-            "picks": picks,
-        })
+    entries: list[dict[str, Any]] = []
+    for r in rows:
+        if not entries or entries[-1]["entry_id"] != r[0]:
+            entries.append({
+                "entry_id": r[0],
+                "email": r[1],
+                "entry_name": r[2],
+                "updated_at": r[3],
+                "picks": [],
+            })
+        if r[4] is not None:
+            entries[-1]["picks"].append({
+                "dg_id": r[4],
+                "player_name": r[5],
+                "pick_slot": r[6],
+                "bucket_number": r[7],
+            })
 
     return entries
 
@@ -266,6 +282,138 @@ def _load_leaderboard(session: Session, tournament_id: int) -> dict[int, dict[st
     }
 
 
+def _load_entry_scores(session: Session, pool_id: int) -> dict[int, dict[str, Any]]:
+    """Load the previously materialized entry scores for a pool, keyed by entry_id."""
+    rows = session.execute(
+        text("""
+            SELECT entry_id, aggregate_score, qualified_golfers_count,
+                   counted_golfers_count, qualification_status, is_complete,
+                   rank, is_tied, last_scored_at
+            FROM golf_pool_entry_scores
+            WHERE pool_id = :pool_id
+        """),
+        {"pool_id": pool_id},
+    ).fetchall()
+
+    return {
+        r[0]: {
+            "entry_id": r[0],
+            "aggregate_score": r[1],
+            "qualified_golfers_count": r[2],
+            "counted_golfers_count": r[3],
+            "qualification_status": r[4],
+            "is_complete": r[5],
+            "rank": r[6],
+            "is_tied": r[7],
+            "last_scored_at": r[8],
+        }
+        for r in rows
+    }
+
+
+# ---------------------------------------------------------------------------
+# Leaderboard diff + inverted index
+# ---------------------------------------------------------------------------
+
+def _get_redis():  # noqa: ANN202
+    """Return a Redis client (import deferred to avoid circular deps)."""
+    import redis as redis_lib
+
+    from ..config import settings
+
+    return redis_lib.from_url(settings.redis_url, decode_responses=True)
+
+
+def _fingerprint(gs: dict[str, Any]) -> str:
+    """Serialize the leaderboard fields that feed ``_score_entry``."""
+    return json.dumps([
+        gs["status"], gs["position"], gs["total_score"], gs["thru"],
+        gs.get("r1"), gs.get("r2"), gs.get("r3"), gs.get("r4"),
+    ])
+
+
+def _load_previous_fingerprints(pool_id: int) -> dict[int, str] | None:
+    """Return the leaderboard fingerprints stored by the last run, or None."""
+    try:
+        stored = _get_redis().hgetall(_LB_STATE_KEY.format(pool_id=pool_id))
+    except Exception as exc:
+        logger.warning("golf_pool_scoring_state_read_failed", pool_id=pool_id, error=str(exc))
+        return None
+    if not stored:
+        return None
+    return {int(dg_id): fp for dg_id, fp in stored.items()}
+
+
+def _save_fingerprints(pool_id: int, fingerprints: dict[int, str]) -> None:
+    """Store this run's fingerprints. Call only after the pool's results commit."""
+    key = _LB_STATE_KEY.format(pool_id=pool_id)
+    try:
+        pipe = _get_redis().pipeline()
+        pipe.delete(key)
+        if fingerprints:
+            pipe.hset(key, mapping={str(k): v for k, v in fingerprints.items()})
+            pipe.expire(key, _LB_STATE_TTL_S)
+        pipe.execute()
+    except Exception as exc:
+        # Next run finds stale or missing state and rescores more, never less.
+        logger.warning("golf_pool_scoring_state_write_failed", pool_id=pool_id, error=str(exc))
+
+
+def _changed_golfers(current: dict[int, str], previous: dict[int, str]) -> set[int]:
+    """dg_ids whose leaderboard row was added, removed, or changed since the last run."""
+    return {
+        dg_id
+        for dg_id in current.keys() | previous.keys()
+        if current.get(dg_id) != previous.get(dg_id)
+    }
+
+
+def _build_pick_index(entries: list[dict[str, Any]]) -> dict[int, set[int]]:
+    """Inverted index: dg_id -> entry_ids that picked that golfer."""
+    index: dict[int, set[int]] = {}
+    for entry in entries:
+        for pick in entry["picks"]:
+            index.setdefault(pick["dg_id"], set()).add(entry["entry_id"])
+    return index
+
+
+def _is_after(later: datetime | None, earlier: datetime | None) -> bool:
+    return later is not None and earlier is not None and later > earlier
+
+
+def _entries_to_rescore(
+    pool: dict[str, Any],
+    entries: list[dict[str, Any]],
+    prior_scores: dict[int, dict[str, Any]],
+    changed: set[int] | None,
+) -> set[int]:
+    """Return the entry_ids whose score may have moved since the last run.
+
+    ``changed=None`` means no usable previous state — rescore everything.
+    """
+    all_ids = {e["entry_id"] for e in entries}
+    if changed is None or not prior_scores:
+        return all_ids
+
+    oldest_score = min(
+        (p["last_scored_at"] for p in prior_scores.values() if p["last_scored_at"] is not None),
+        default=None,
+    )
+    if _is_after(pool.get("updated_at"), oldest_score):
+        return all_ids
+
+    affected: set[int] = set()
+    index = _build_pick_index(entries)
+    for dg_id in changed:
+        affected |= index.get(dg_id, set())
+
+    for entry in entries:
+        prior = prior_scores.get(entry["entry_id"])
+        if prior is None or _is_after(entry.get("updated_at"), prior["last_scored_at"]):
+            affected.add(entry["entry_id"])
+    return affected
+
+
 # ---------------------------------------------------------------------------
 # Pure scoring logic (lightweight port from api scoring engine)
 # ---------------------------------------------------------------------------
@@ -435,121 +583,305 @@ def _rank_entries(entries: list[dict[str, Any]]) -> list[dict[str, Any]]:
 # Materialized result persistence
 # ---------------------------------------------------------------------------
 
-def _upsert_entry_score(session: Session, pool_id: int, scored: dict[str, Any]) -> None:
-    """Upsert a single materialized entry score row.
+_ENTRY_SCORE_COLUMNS = (
+    "pool_id", "entry_id", "rank", "is_tied", "aggregate_score",
+    "qualified_golfers_count", "counted_golfers_count",
+    "qualification_status", "is_complete",
+)
+
+_SCORE_PLAYER_COLUMNS = (
+    "pool_id", "entry_id", "dg_id", "player_name_snapshot", "pick_slot",
+    "bucket_number", "status_snapshot", "position_snapshot",
+    "total_score_snapshot", "thru_snapshot",
+    "r1", "r2", "r3", "r4",
+    "made_cut_snapshot", "counts_toward_total", "is_dropped",
+    "sort_score",
+)
+
+
+def _execute_upsert(
+    session: Session,
+    table: str,
+    columns: tuple[str, ...],
+    rows: list[dict[str, Any]],
+    conflict: str,
+    update_sql: str,
+) -> None:
+    """Execute a multi-row ``INSERT ... ON CONFLICT`` in chunks of ``_UPSERT_CHUNK``.
+
+    Each row dict is keyed by column name; ``last_scored_at`` and
+    ``updated_at`` are always set to ``NOW()``.
+    """
+    for start in range(0, len(rows), _UPSERT_CHUNK):
+        chunk = rows[start:start + _UPSERT_CHUNK]
+        params: dict[str, Any] = {}
+        values: list[str] = []
+        for i, row in enumerate(chunk):
+            placeholders = []
+            for col in columns:
+                params[f"{col}_{i}"] = row[col]
+                placeholders.append(f":{col}_{i}")
+            values.append(f"({', '.join(placeholders)}, NOW(), NOW())")
+
+        session.execute(
+            text(
+                f"INSERT INTO {table} ({', '.join(columns)}, last_scored_at, updated_at) "
+                f"VALUES {', '.join(values)} "
+                f"ON CONFLICT ({conflict}) DO UPDATE SET {update_sql}"
+            ),
+            params,
+        )
+
+
+def _upsert_entry_scores(session: Session, pool_id: int, scored: list[dict[str, Any]]) -> None:
+    """Upsert materialized entry score rows.
 
     Unique constraint: ``entry_id`` (not ``pool_id, entry_id``).
     """
-    session.execute(
-        text("""
-            INSERT INTO golf_pool_entry_scores
-                (pool_id, entry_id, rank, is_tied, aggregate_score,
-                 qualified_golfers_count, counted_golfers_count,
-                 qualification_status, is_complete, last_scored_at,
-                 updated_at)
-            VALUES
-                (:pool_id, :entry_id, :rank, :is_tied, :aggregate_score,
-                 :qualified_golfers_count, :counted_golfers_count,
-                 :qualification_status, :is_complete, NOW(), NOW())
-            ON CONFLICT (entry_id) DO UPDATE SET
-                pool_id                 = EXCLUDED.pool_id,
-                rank                    = EXCLUDED.rank,
-                is_tied                 = EXCLUDED.is_tied,
-                aggregate_score         = EXCLUDED.aggregate_score,
-                qualified_golfers_count = EXCLUDED.qualified_golfers_count,
-                counted_golfers_count   = EXCLUDED.counted_golfers_count,
-                qualification_status    = EXCLUDED.qualification_status,
-                is_complete             = EXCLUDED.is_complete,
-                last_scored_at          = NOW(),
-                updated_at              = NOW()
-        """),
-        {
-            "pool_id": pool_id,
-            "entry_id": scored["entry_id"],
-            "rank": scored["rank"],
-            "is_tied": scored["is_tied"],
-            "aggregate_score": scored["aggregate_score"],
-            "qualified_golfers_count": scored["qualified_golfers_count"],
-            "counted_golfers_count": scored["counted_golfers_count"],
-            "qualification_status": scored["qualification_status"],
-            "is_complete": scored["is_complete"],
-        },
+    rows = [{"pool_id": pool_id, **{c: s[c] for c in _ENTRY_SCORE_COLUMNS[1:]}} for s in scored]
+    _execute_upsert(
+        session,
+        "golf_pool_entry_scores",
+        _ENTRY_SCORE_COLUMNS,
+        rows,
+        "entry_id",
+        """
+            pool_id                 = EXCLUDED.pool_id,
+            rank                    = EXCLUDED.rank,
+            is_tied                 = EXCLUDED.is_tied,
+            aggregate_score         = EXCLUDED.aggregate_score,
+            qualified_golfers_count = EXCLUDED.qualified_golfers_count,
+            counted_golfers_count   = EXCLUDED.counted_golfers_count,
+            qualification_status    = EXCLUDED.qualification_status,
+            is_complete             = EXCLUDED.is_complete,
+            last_scored_at          = NOW(),
+            updated_at              = NOW()
+        """,
     )
 
 
 def _upsert_score_players(
     session: Session,
     pool_id: int,
-    entry_id: int,
-    picks: list[dict[str, Any]],
+    scored: list[dict[str, Any]],
 ) -> None:
-    """Upsert per-golfer score detail rows.
+    """Upsert per-golfer score detail rows for the given scored entries.
 
     Column names use ``_snapshot`` suffix where the migration defines them:
     ``player_name_snapshot``, ``status_snapshot``, ``position_snapshot``,
     ``thru_snapshot``, ``total_score_snapshot``, ``made_cut_snapshot``.
     Round columns ``r1``-``r4`` have no suffix.
 
-    Unique constraint: ``(entry_id, dg_id)``
+    Unique constraint: ``(entry_id, dg_id)``. Picks are unique per
+    ``(entry_id, pick_slot)`` only, so a golfer picked in two slots is
+    collapsed to one row before the multi-row insert, which cannot touch
+    the same conflict key twice. The later slot wins, as it did when
+    each pick was upserted on its own.
     """
-    for pick in picks:
-        session.execute(
-            text("""
-                INSERT INTO golf_pool_entry_score_players
-                    (pool_id, entry_id, dg_id, player_name_snapshot, pick_slot,
-                     bucket_number, status_snapshot, position_snapshot,
-                     total_score_snapshot, thru_snapshot,
-                     r1, r2, r3, r4,
-                     made_cut_snapshot, counts_toward_total, is_dropped,
-                     sort_score, last_scored_at, updated_at)
-                VALUES
-                    (:pool_id, :entry_id, :dg_id, :player_name, :pick_slot,
-                     :bucket_number, :status, :position,
-                     :total_score, :thru,
-                     :r1, :r2, :r3, :r4,
-                     :made_cut, :counts_toward_total, :is_dropped,
-                     :sort_score, NOW(), NOW())
-                ON CONFLICT (entry_id, dg_id) DO UPDATE SET
-                    pool_id                 = EXCLUDED.pool_id,
-                    player_name_snapshot    = EXCLUDED.player_name_snapshot,
-                    pick_slot               = EXCLUDED.pick_slot,
-                    bucket_number           = EXCLUDED.bucket_number,
-                    status_snapshot         = EXCLUDED.status_snapshot,
-                    position_snapshot       = EXCLUDED.position_snapshot,
-                    total_score_snapshot    = EXCLUDED.total_score_snapshot,
-                    thru_snapshot           = EXCLUDED.thru_snapshot,
-                    r1                      = EXCLUDED.r1,
-                    r2                      = EXCLUDED.r2,
-                    r3                      = EXCLUDED.r3,
-                    r4                      = EXCLUDED.r4,
-                    made_cut_snapshot       = EXCLUDED.made_cut_snapshot,
-                    counts_toward_total     = EXCLUDED.counts_toward_total,
-                    is_dropped              = EXCLUDED.is_dropped,
-                    sort_score              = EXCLUDED.sort_score,
-                    last_scored_at          = NOW(),
-                    updated_at              = NOW()
-            """),
-            {
-                "pool_id": pool_id,
-                "entry_id": entry_id,
-                "dg_id": pick["dg_id"],
-                "player_name": pick["player_name"],
-                "pick_slot": pick["pick_slot"],
-                "bucket_number": pick.get("bucket_number"),
-                "status": pick["status"],
-                "position": pick.get("position"),
-                "total_score": pick.get("total_score"),
-                "thru": pick.get("thru"),
-                "r1": pick.get("r1"),
-                "r2": pick.get("r2"),
-                "r3": pick.get("r3"),
-                "r4": pick.get("r4"),
-                "made_cut": pick["made_cut"],
-                "counts_toward_total": pick["counts_toward_total"],
-                "is_dropped": pick["is_dropped"],
-                "sort_score": pick.get("sort_score"),
-            },
+    rows = {
+        (entry["entry_id"], pick["dg_id"]): {
+            "pool_id": pool_id,
+            "entry_id": entry["entry_id"],
+            "dg_id": pick["dg_id"],
+            "player_name_snapshot": pick["player_name"],
+            "pick_slot": pick["pick_slot"],
+            "bucket_number": pick.get("bucket_number"),
+            "status_snapshot": pick["status"],
+            "position_snapshot": pick.get("position"),
+            "total_score_snapshot": pick.get("total_score"),
+            "thru_snapshot": pick.get("thru"),
+            "r1": pick.get("r1"),
+            "r2": pick.get("r2"),
+            "r3": pick.get("r3"),
+            "r4": pick.get("r4"),
+            "made_cut_snapshot": pick["made_cut"],
+            "counts_toward_total": pick["counts_toward_total"],
+            "is_dropped": pick["is_dropped"],
+            "sort_score": pick.get("sort_score"),
+        }
+        for entry in scored
+        for pick in entry["picks"]
+    }
+    _execute_upsert(
+        session,
+        "golf_pool_entry_score_players",
+        _SCORE_PLAYER_COLUMNS,
+        list(rows.values()),
+        "entry_id, dg_id",
+        """
+            pool_id                 = EXCLUDED.pool_id,
+            player_name_snapshot    = EXCLUDED.player_name_snapshot,
+            pick_slot               = EXCLUDED.pick_slot,
+            bucket_number           = EXCLUDED.bucket_number,
+            status_snapshot         = EXCLUDED.status_snapshot,
+            position_snapshot       = EXCLUDED.position_snapshot,
+            total_score_snapshot    = EXCLUDED.total_score_snapshot,
+            thru_snapshot           = EXCLUDED.thru_snapshot,
+            r1                      = EXCLUDED.r1,
+            r2                      = EXCLUDED.r2,
+            r3                      = EXCLUDED.r3,
+            r4                      = EXCLUDED.r4,
+            made_cut_snapshot       = EXCLUDED.made_cut_snapshot,
+            counts_toward_total     = EXCLUDED.counts_toward_total,
+            is_dropped              = EXCLUDED.is_dropped,
+            sort_score              = EXCLUDED.sort_score,
+            last_scored_at          = NOW(),
+            updated_at              = NOW()
+        """,
+    )
+
+
+def _leaderboard_doc_exists(session: Session, pool_id: int) -> bool:
+    row = session.execute(
+        text("SELECT 1 FROM golf_pool_leaderboards WHERE pool_id = :pool_id"),
+        {"pool_id": pool_id},
+    ).fetchone()
+    return row is not None
+
+
+def _write_leaderboard_doc(session: Session, pool_id: int) -> int:
+    """Rebuild the pool's ranking document from the score tables.
+
+    Reads entry scores and score players in one query (after this run's
+    upserts, same transaction) and bumps the document ``version``.
+    Returns the number of entries in the document.
+    """
+    rows = session.execute(
+        text("""
+            SELECT s.entry_id, e.email, e.entry_name, s.aggregate_score,
+                   s.qualified_golfers_count, s.counted_golfers_count,
+                   s.qualification_status, s.is_complete, s.rank, s.is_tied,
+                   s.last_scored_at,
+                   sp.dg_id, sp.player_name_snapshot, sp.pick_slot, sp.bucket_number,
+                   sp.status_snapshot, sp.position_snapshot, sp.total_score_snapshot,
+                   sp.thru_snapshot, sp.r1, sp.r2, sp.r3, sp.r4,
+                   sp.made_cut_snapshot, sp.counts_toward_total, sp.is_dropped
+            FROM golf_pool_entry_scores s
+            JOIN golf_pool_entries e ON e.id = s.entry_id
+            LEFT JOIN golf_pool_entry_score_players sp
+                   ON sp.entry_id = s.entry_id AND sp.pool_id = s.pool_id
+            WHERE s.pool_id = :pool_id
+            ORDER BY s.rank ASC NULLS LAST, s.aggregate_score ASC NULLS LAST,
+                     s.entry_id, sp.pick_slot
+        """),
+        {"pool_id": pool_id},
+    ).fetchall()
+
+    leaderboard: list[dict[str, Any]] = []
+    for r in rows:
+        if not leaderboard or leaderboard[-1]["entry_id"] != r[0]:
+            leaderboard.append({
+                "entry_id": r[0],
+                "email": r[1],
+                "entry_name": r[2],
+                "aggregate_score": r[3],
+                "qualified_golfers_count": r[4],
+                "counted_golfers_count": r[5],
+                "qualification_status": r[6],
+                "is_complete": r[7],
+                "rank": r[8],
+                "is_tied": r[9],
+                "last_scored_at": r[10].isoformat() if r[10] else None,
+                "picks": [],
+            })
+        if r[11] is not None:
+            leaderboard[-1]["picks"].append({
+                "dg_id": r[11],
+                "player_name": r[12],
+                "pick_slot": r[13],
+                "bucket_number": r[14],
+                "status": r[15],
+                "position": r[16],
+                "total_score": r[17],
+                "thru": r[18],
+                "r1": r[19],
+                "r2": r[20],
+                "r3": r[21],
+                "r4": r[22],
+                "made_cut": r[23],
+                "counts_toward_total": r[24],
+                "is_dropped": r[25],
+            })
+
+    session.execute(
+        text("""
+            INSERT INTO golf_pool_leaderboards
+                (pool_id, version, format_version, entry_count, leaderboard,
+                 scored_at, updated_at)
+            VALUES
+                (:pool_id, 1, :format_version, :entry_count,
+                 CAST(:leaderboard AS JSONB), NOW(), NOW())
+            ON CONFLICT (pool_id) DO UPDATE SET
+                version        = golf_pool_leaderboards.version + 1,
+                format_version = EXCLUDED.format_version,
+                entry_count    = EXCLUDED.entry_count,
+                leaderboard    = EXCLUDED.leaderboard,
+                scored_at      = NOW(),
+                updated_at     = NOW()
+        """),
+        {
+            "pool_id": pool_id,
+            "format_version": LEADERBOARD_DOC_FORMAT,
+            "entry_count": len(leaderboard),
+            "leaderboard": json.dumps(leaderboard),
+        },
+    )
+    return len(leaderboard)
+
+
+def _score_pool(
+    session: Session,
+    pool: dict[str, Any],
+    entries: list[dict[str, Any]],
+    leaderboard: dict[int, dict[str, Any]],
+    *,
+    full: bool = False,
+) -> tuple[int, dict[int, str]]:
+    """Rescore affected entries, re-rank the pool, and write changed rows.
+
+    The ranking document is rewritten whenever any score row changed, or
+    when it is missing (first run, or an admin deleted an entry). Does not
+    commit. Returns ``(entries_rescored, fingerprints)``; the
+    caller stores the fingerprints once the transaction has committed.
+    """
+    pool_id = pool["id"]
+    fingerprints = {dg_id: _fingerprint(gs) for dg_id, gs in leaderboard.items()}
+
+    prior_scores: dict[int, dict[str, Any]] = {}
+    changed: set[int] | None = None
+    if not full:
+        previous = _load_previous_fingerprints(pool_id)
+        if previous is not None:
+            changed = _changed_golfers(fingerprints, previous)
+            prior_scores = _load_entry_scores(session, pool_id)
+
+    to_rescore = _entries_to_rescore(pool, entries, prior_scores, changed)
+    rules = _parse_rules(pool.get("rules_json"))
+
+    scored_entries: list[dict[str, Any]] = []
+    for entry in entries:
+        if entry["entry_id"] in to_rescore:
+            scored_entries.append(_score_entry(entry, leaderboard, rules))
+        else:
+            # Untouched entries keep their stored aggregate; rank is recomputed.
+            scored_entries.append({**prior_scores[entry["entry_id"]], "rank": None, "is_tied": False})
+
+    ranked = _rank_entries(scored_entries)
+
+    entry_rows = [
+        s for s in ranked
+        if s["entry_id"] in to_rescore
+        or (s["rank"], s["is_tied"]) != (
+            prior_scores[s["entry_id"]]["rank"], prior_scores[s["entry_id"]]["is_tied"],
         )
+    ]
+    rescored = [s for s in ranked if s["entry_id"] in to_rescore]
+
+    _upsert_entry_scores(session, pool_id, entry_rows)
+    _upsert_score_players(session, pool_id, rescored)
+    if entry_rows or not _leaderboard_doc_exists(session, pool_id):
+        _write_leaderboard_doc(session, pool_id)
+    return len(rescored), fingerprints
 
 
 # ---------------------------------------------------------------------------
@@ -572,10 +904,11 @@ def score_all_live_pools(session: Session) -> dict[str, Any]:
 
     if not pools:
         logger.info("golf_pool_scoring_no_live_pools")
-        return {"pools_scored": 0, "total_entries": 0}
+        return {"pools_scored": 0, "total_entries": 0, "entries_rescored": 0}
 
     total_entries = 0
     pools_scored = 0
+    entries_rescored = 0
 
     for pool in pools:
         pool_id = pool["id"]
@@ -592,25 +925,21 @@ def score_all_live_pools(session: Session) -> dict[str, Any]:
                 logger.debug("golf_pool_scoring_no_leaderboard", pool_id=pool_id, tournament_id=tournament_id)
                 continue
 
-            rules = _parse_rules(pool.get("rules_json"))
-
-            scored_entries = [_score_entry(e, leaderboard, rules) for e in entries]
-            ranked = _rank_entries(scored_entries)
-
-            for scored in ranked:
-                _upsert_entry_score(session, pool_id, scored)
-                _upsert_score_players(session, pool_id, scored["entry_id"], scored["picks"])
+            rescored, fingerprints = _score_pool(session, pool, entries, leaderboard)
 
             session.commit()
+            _save_fingerprints(pool_id, fingerprints)
 
-            total_entries += len(ranked)
+            total_entries += len(entries)
+            entries_rescored += rescored
             pools_scored += 1
 
             logger.info(
                 "golf_pool_scored",
                 pool_id=pool_id,
                 club_code=pool["club_code"],
-                entries=len(ranked),
+                entries=len(entries),
+                entries_rescored=rescored,
             )
 
         except Exception as exc:
@@ -621,7 +950,11 @@ def score_all_live_pools(session: Session) -> dict[str, Any]:
                 error=str(exc),
             )
 
-    result: dict[str, Any] = {"pools_scored": pools_scored, "total_entries": total_entries}
+    result: dict[str, Any] = {
+        "pools_scored": pools_scored,
+        "total_entries": total_entries,
+        "entries_rescored": entries_rescored,
+    }
     if activation_events:
         result["activations"] = activation_events
     return result
@@ -630,11 +963,11 @@ def score_all_live_pools(session: Session) -> dict[str, Any]:
 def score_single_pool(session: Session, pool_id: int) -> dict[str, Any]:
     """Score a single pool by ID, regardless of status/scoring_enabled.
 
-    Used by the manual rescore admin action.
+    Used by the manual rescore admin action. Always rescores every entry.
     """
     row = session.execute(
         text("""
-            SELECT id, club_code, tournament_id, rules_json, status
+            SELECT id, club_code, tournament_id, rules_json, status, updated_at
             FROM golf_pools
             WHERE id = :pool_id
         """),
@@ -645,13 +978,7 @@ def score_single_pool(session: Session, pool_id: int) -> dict[str, Any]:
         logger.warning("golf_pool_rescore_not_found", pool_id=pool_id)
         return {"error": "pool_not_found", "pool_id": pool_id}
 
-    pool = {
-        "id": row[0],
-        "club_code": row[1],
-        "tournament_id": row[2],
-        "rules_json": row[3],
-        "status": row[4],
-    }
+    pool = _pool_from_row(row)
 
     entries = _load_entries_and_picks(session, pool_id)
     if not entries:
@@ -667,20 +994,15 @@ def score_single_pool(session: Session, pool_id: int) -> dict[str, Any]:
         )
         return {"pool_id": pool_id, "entries_scored": 0, "reason": "no_leaderboard"}
 
-    rules = _parse_rules(pool.get("rules_json"))
-    scored_entries = [_score_entry(e, leaderboard, rules) for e in entries]
-    ranked = _rank_entries(scored_entries)
-
-    for scored in ranked:
-        _upsert_entry_score(session, pool_id, scored)
-        _upsert_score_players(session, pool_id, scored["entry_id"], scored["picks"])
+    rescored, fingerprints = _score_pool(session, pool, entries, leaderboard, full=True)
 
     session.commit()
+    _save_fingerprints(pool_id, fingerprints)
 
     logger.info(
         "golf_pool_rescored",
         pool_id=pool_id,
         club_code=pool["club_code"],
-        entries=len(ranked),
+        entries=rescored,
     )
-    return {"pool_id": pool_id, "entries_scored": len(ranked)}
+    return {"pool_id": pool_id, "entries_scored": rescored}
@@ -9,6 +9,10 @@ State machine:
   RECAP_PENDING → RECAP_READY   (on pipeline success)
   RECAP_PENDING → RECAP_FAILED  (on error; eligible for sweep retry)
 
+Once the game settles at RECAP_READY, the task requests the game-detail
+endpoint once so the API materializes the final response document
+(``sports_game_detail_docs``) before readers arrive.
+
 sweep_missing_flows() is the safety-net: a daily task that finds any
 FINAL or RECAP_FAILED games from the past 24 h with no flow artifact
 and re-enqueues trigger_flow_for_game for each.
@@ -129,6 +133,7 @@ def trigger_flow_for_game(game_id: int) -> dict:
                     summary_data={"game_id": game_id, "skipped": "immutable"},
                 )
                 _set_game_status(game_id, db_models.GameStatus.recap_ready.value)
+                _warm_game_detail(game_id)
                 release_redis_lock(lock_name, lock_token)
                 return {"game_id": game_id, "status": "skipped", "reason": "immutable"}
 
@@ -145,6 +150,7 @@ def trigger_flow_for_game(game_id: int) -> dict:
             error_summary=result.get("error"),
         )
         _set_game_status(game_id, db_models.GameStatus.recap_ready.value)
+        _warm_game_detail(game_id)
         # Release only on success; on failure TTL expiry is the safety net
         release_redis_lock(lock_name, lock_token)
         return result
@@ -154,6 +160,24 @@ def trigger_flow_for_game(game_id: int) -> dict:
         raise
 
 
+def _warm_game_detail(game_id: int) -> None:
+    """Fetch the game detail once so the API stores its materialized document.
+
+    Best-effort: a miss here only means the first reader builds it instead.
+    """
+    import httpx
+
+    from ..api_client import get_api_headers
+    from ..config import settings
+
+    try:
+        with httpx.Client(timeout=30.0, headers=get_api_headers()) as client:
+            response = client.get(f"{settings.api_internal_url}/api/admin/sports/games/{game_id}")
+            response.raise_for_status()
+    except Exception as exc:
+        logger.warning("game_detail_warm_failed", game_id=game_id, error=str(exc))
+
+
 def _call_pipeline_api(game_id: int, league_code: str) -> dict:
     """Call the internal API to generate flows for a single game."""
     import httpx
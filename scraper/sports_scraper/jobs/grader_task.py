@@ -11,7 +11,7 @@ import logging
 
 from celery import shared_task
 
-from ..celery_app import DEFAULT_QUEUE
+from ..celery_app import FLOW_QUEUE
 from ..logging import logger as scraper_logger
 
 logger = logging.getLogger(__name__)
@@ -20,7 +20,7 @@ logger = logging.getLogger(__name__)
 @shared_task(
     name="grade_flow_task",
     bind=True,
-    queue=DEFAULT_QUEUE,
+    queue=FLOW_QUEUE,
     max_retries=2,
     default_retry_delay=60,
 )
@@ -28,7 +28,7 @@ def poll_live_odds_mainline(league_code: str, game_ids: list[int]) -> dict:
     snapshot so the API can compute fair-bet / +EV across books.
     """
     from ..config import settings
-    from ..live_odds.closing_lines import capture_closing_lines
+    from ..live_odds.closing_lines import capture_closing_lines_batch
     from ..live_odds.redis_store import write_live_snapshot
     from ..odds.client import MARKET_TYPES, OddsAPIClient
     from ..utils.odds_quota import is_quota_exceeded, record_usage
@@ -76,17 +76,18 @@ def poll_live_odds_mainline(league_code: str, game_ids: list[int]) -> dict:
                     "away_team_name": team_name_map.get(g.away_team_id, ""),
                 }
 
-        # Ensure closing lines captured for games transitioning to live
-        for gid, info in game_info.items():
-            if info["status"] == "live":
-                try:
-                    capture_closing_lines(gid, league_code)
-                except Exception as exc:
-                    logger.warning(
-                        "closing_lines_capture_error",
-                        game_id=gid,
-                        error=str(exc),
-                    )
+        # Ensure closing lines captured for games transitioning to live —
+        # one statement for the whole slate, however many games just started
+        live_ids = [gid for gid, info in game_info.items() if info["status"] == "live"]
+        if live_ids:
+            try:
+                capture_closing_lines_batch(live_ids)
+            except Exception as exc:
+                logger.warning(
+                    "closing_lines_capture_error",
+                    game_ids=live_ids,
+                    error=str(exc),
+                )
 
         # Check weekly quota before making the API call
         if is_quota_exceeded():
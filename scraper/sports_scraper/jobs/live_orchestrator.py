@@ -3,11 +3,14 @@
 Runs every 5 seconds. Discovers live games by league and dispatches
 per-game polling tasks at sport-appropriate cadences with jitter.
 
-Scheduling keys tracked in Redis:
-  sched:pbp:{league}:{game_id}
-  sched:stats:{league}:{game_id}
-  sched:odds:mainline:{league}:{game_id}
-  sched:odds:props:{league}:{game_id}
+Live games come from the NOTIFY-maintained Redis index in
+``services.live_game_index`` rather than a per-tick SQL scan.
+
+Cadence state is one Redis hash of next-due timestamps:
+  sched:live_orchestrator  {odds:mainline:{league}: ts, odds:props:{league}: ts}
+
+Every (category, league) lane is checked and claimed in a single Lua call,
+so tick overhead does not grow with the number of live games or leagues.
 """
 
 from __future__ import annotations
@@ -17,9 +20,9 @@ import time
 
 from celery import shared_task
 
-from ..celery_app import DEFAULT_QUEUE
-from ..db import db_models, get_session
+from ..celery_app import ODDS_QUEUE
 from ..logging import logger
+from ..services.live_game_index import get_live_games
 from ..utils.redis_lock import LOCK_TIMEOUT_5MIN, acquire_redis_lock, release_redis_lock
 
 # ---------------------------------------------------------------------------
@@ -36,26 +39,45 @@ JITTER_FRACTION = 0.2
 # Orchestrator tick interval — Beat fires every 5 seconds
 TICK_INTERVAL_S = 5
 
+SCHEDULE_KEY = "sched:live_orchestrator"
+SCHEDULE_TTL_S = 3600
+
+# Lua script: claim every due lane in one round trip.
+# KEYS[1] = schedule hash
+# ARGV[1] = now, ARGV[2] = hash TTL, then (field, interval) pairs.
+# A field is due when its stored next-due time is missing or <= now;
+# due fields are advanced to now + interval and returned.
+_CLAIM_DUE_SCRIPT = """
+local now = tonumber(ARGV[1])
+local due = {}
+for i = 3, #ARGV, 2 do
+    local next_due = tonumber(redis.call("hget", KEYS[1], ARGV[i]))
+    if next_due == nil or next_due <= now then
+        redis.call("hset", KEYS[1], ARGV[i], tostring(now + tonumber(ARGV[i + 1])))
+        due[#due + 1] = ARGV[i]
+    end
+end
+redis.call("expire", KEYS[1], ARGV[2])
+return due
+"""
+
+_redis_client = None
 
-def _sched_key(category: str, league: str, game_id: int) -> str:
-    return f"sched:{category}:{league}:{game_id}"
 
+def _get_redis():
+    """Return a process-wide Redis client (connection pool reused across ticks)."""
+    global _redis_client
+    if _redis_client is None:
+        import redis as redis_lib
 
-def _is_due(r, key: str, cadence_s: float) -> bool:
-    """Check if a scheduling key is due (elapsed >= cadence)."""
-    last = r.get(key)
-    if last is None:
-        return True
-    try:
-        elapsed = time.time() - float(last)
-        return elapsed >= cadence_s
-    except (ValueError, TypeError):
-        return True
+        from ..config import settings
+
+        _redis_client = redis_lib.from_url(settings.redis_url, decode_responses=True)
+    return _redis_client
 
 
-def _mark_scheduled(r, key: str) -> None:
-    """Mark a scheduling key as just-fired with 1-hour TTL."""
-    r.set(key, str(time.time()), ex=3600)
+def _sched_field(category: str, league: str) -> str:
+    return f"{category}:{league}"
 
 
 def _jitter(cadence: float) -> float:
@@ -63,37 +85,31 @@ def _jitter(cadence: float) -> float:
     return cadence + random.uniform(0, cadence * JITTER_FRACTION)
 
 
+def _claim_due(r, intervals: dict[str, float], now: float | None = None) -> set[str]:
+    """Atomically return the schedule fields that are due and advance them."""
+    if not intervals:
+        return set()
+    argv: list = [time.time() if now is None else now, SCHEDULE_TTL_S]
+    for field, interval in intervals.items():
+        argv.extend((field, interval))
+    return set(r.eval(_CLAIM_DUE_SCRIPT, 1, SCHEDULE_KEY, *argv))
+
+
 @shared_task(name="live_orchestrator_tick")
 def live_orchestrator_tick() -> dict:
     """Discover live games and dispatch per-game tasks at appropriate cadences."""
-    import redis as redis_lib
-
-    from ..config import settings
-
     lock_token = acquire_redis_lock("lock:live_orchestrator", timeout=LOCK_TIMEOUT_5MIN)
     if not lock_token:
         return {"skipped": True, "reason": "locked"}
 
     try:
-        r = redis_lib.from_url(settings.redis_url, decode_responses=True)
-
-        with get_session() as session:
-            # Only poll live odds for games actually in progress.
-            # Pregame odds are handled by the Beat-scheduled sync_mainline_odds
-            # task.  Including pregame here would write pregame lines into the
-            # live Redis keys and pollute the live odds view.
-            live_games = (
-                session.query(
-                    db_models.SportsGame.id,
-                    db_models.SportsGame.status,
-                    db_models.SportsLeague.code,
-                )
-                .join(db_models.SportsLeague)
-                .filter(
-                    db_models.SportsGame.status == "live",
-                )
-                .all()
-            )
+        r = _get_redis()
+
+        # Only poll live odds for games actually in progress.
+        # Pregame odds are handled by the Beat-scheduled sync_mainline_odds
+        # task.  Including pregame here would write pregame lines into the
+        # live Redis keys and pollute the live odds view.
+        live_games = get_live_games(r)
 
         if not live_games:
             return {"live_games": 0, "dispatched": 0}
@@ -101,7 +117,7 @@ def live_orchestrator_tick() -> dict:
         dispatched = 0
         games_by_league: dict[str, list[int]] = {}
 
-        for game_id, _status, league_code in live_games:
+        for game_id, league_code in sorted(live_games.items()):
             games_by_league.setdefault(league_code, []).append(game_id)
 
             # PBP and boxscore polling are handled by the Beat-scheduled
@@ -109,28 +125,30 @@ def live_orchestrator_tick() -> dict:
             # live odds dispatch, which requires sport-specific cadences.
 
         # --- Live odds (league-batched) ---
+        intervals: dict[str, float] = {}
+        for league_code in games_by_league:
+            intervals[_sched_field("odds:mainline", league_code)] = _jitter(ODDS_MAINLINE_CADENCE)
+            intervals[_sched_field("odds:props", league_code)] = _jitter(ODDS_PROPS_CADENCE)
+        due = _claim_due(r, intervals)
+
         for league_code, game_ids in games_by_league.items():
-            ml_key = _sched_key("odds:mainline", league_code, 0)
-            if _is_due(r, ml_key, _jitter(ODDS_MAINLINE_CADENCE)):
-                _mark_scheduled(r, ml_key)
+            if _sched_field("odds:mainline", league_code) in due:
                 try:
                     from .live_odds_tasks import poll_live_odds_mainline
                     poll_live_odds_mainline.apply_async(
                         args=[league_code, game_ids],
-                        queue=DEFAULT_QUEUE,
+                        queue=ODDS_QUEUE,
                     )
                     dispatched += 1
                 except Exception as exc:
                     logger.warning("orchestrator_dispatch_odds_error", error=str(exc))
 
-            props_key = _sched_key("odds:props", league_code, 0)
-            if _is_due(r, props_key, _jitter(ODDS_PROPS_CADENCE)):
-                _mark_scheduled(r, props_key)
+            if _sched_field("odds:props", league_code) in due:
                 try:
                     from .live_odds_tasks import poll_live_odds_props
                     poll_live_odds_props.apply_async(
                         args=[league_code, game_ids],
-                        queue=DEFAULT_QUEUE,
+                        queue=ODDS_QUEUE,
                     )
                     dispatched += 1
                 except Exception as exc:
@@ -1,4 +1,4 @@
-"""Celery task for ingesting MLB Statcast-derived advanced stats."""
+"""Celery tasks for MLB Statcast-derived advanced stats and lineups."""
 
 from __future__ import annotations
 
@@ -42,3 +42,28 @@ def ingest_mlb_advanced_stats(game_id: int) -> dict:
     except Exception as exc:
         complete_job_run(job_run_id, status="error", error_summary=str(exc)[:500])
         raise
+
+
+@shared_task(name="backfill_mlb_game_lineups")
+def backfill_mlb_game_lineups(limit: int = 500) -> dict:
+    """Materialize lineups for final MLB games finalized before the table existed.
+
+    Args:
+        limit: Maximum games to process in this run (most recent first).
+
+    Returns:
+        Dict with games processed and lineups written.
+    """
+    from ..services.job_runs import complete_job_run, start_job_run
+    from ..services.mlb_lineup_materialization import backfill_game_lineups
+
+    job_run_id = start_job_run("backfill_mlb_game_lineups", [])
+    try:
+        with get_session() as session:
+            result = backfill_game_lineups(session, limit=limit)
+
+        complete_job_run(job_run_id, status="success", summary_data=result)
+        return result
+    except Exception as exc:
+        complete_job_run(job_run_id, status="error", error_summary=str(exc)[:500])
+        raise
@@ -14,7 +14,7 @@ import logging
 
 from celery import shared_task
 
-from ..celery_app import DEFAULT_QUEUE
+from ..celery_app import FLOW_QUEUE
 from ..logging import logger as scraper_logger
 
 logger = logging.getLogger(__name__)
@@ -23,7 +23,7 @@ logger = logging.getLogger(__name__)
 @shared_task(
     name="regen_flow_task",
     bind=True,
-    queue=DEFAULT_QUEUE,
+    queue=FLOW_QUEUE,
     max_retries=1,
     default_retry_delay=60,
     autoretry_for=(Exception,),
@@ -9,87 +9,109 @@ Rules:
 
 from __future__ import annotations
 
+from collections import Counter
+from collections.abc import Iterable
 from datetime import UTC, datetime
 
-from sqlalchemy import select
+from sqlalchemy import exists, func, literal, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ..db import db_models, get_session
 from ..logging import logger
 
+_CLOSING_LINE_COLUMNS = (
+    "game_id",
+    "league",
+    "market_key",
+    "selection",
+    "line_value",
+    "price_american",
+    "provider",
+    "captured_at",
+    "source_type",
+)
+
+
+def capture_closing_lines_batch(game_ids: Iterable[int]) -> dict[int, int]:
+    """Capture closing lines for many games with one ``INSERT ... SELECT``.
+
+    Snapshots the mainline ``is_closing_line`` odds of every game that
+    has no closing lines yet, so a slate of games going live together
+    costs one statement instead of three round trips plus one insert
+    per odds row for each game. The league code comes from the game
+    itself.
+
+    Returns:
+        Rows inserted per requested game (0 when the game was already
+        captured or has no pregame odds).
+    """
+    ids = sorted(set(game_ids))
+    if not ids:
+        return {}
+
+    odds = db_models.SportsGameOdds
+    closing = db_models.ClosingLine
+    source = (
+        select(
+            odds.game_id,
+            db_models.SportsLeague.code,
+            func.coalesce(func.nullif(odds.source_key, ""), odds.market_type),
+            func.coalesce(odds.side, ""),
+            odds.line,
+            func.coalesce(odds.price, 0),
+            odds.book,
+            literal(datetime.now(UTC)),
+            literal("closing"),
+        )
+        .join(db_models.SportsGame, db_models.SportsGame.id == odds.game_id)
+        .join(db_models.SportsLeague, db_models.SportsLeague.id == db_models.SportsGame.league_id)
+        .where(
+            odds.game_id.in_(ids),
+            odds.is_closing_line.is_(True),
+            odds.market_category == "mainline",
+            # Capture once per game
+            ~exists().where(closing.game_id == odds.game_id),
+        )
+    )
+    stmt = (
+        pg_insert(closing)
+        .from_select(list(_CLOSING_LINE_COLUMNS), source)
+        .on_conflict_do_nothing(
+            index_elements=["game_id", "provider", "market_key", "selection", "line_value"]
+        )
+        .returning(closing.game_id)
+    )
+
+    with get_session() as session:
+        inserted = Counter(session.execute(stmt).scalars())
+        session.commit()
+
+    counts = {game_id: inserted.get(game_id, 0) for game_id in ids}
+    logger.info(
+        "closing_lines_captured_batch",
+        games=len(ids),
+        games_captured=sum(1 for n in counts.values() if n),
+        rows_inserted=sum(counts.values()),
+    )
+    return counts
+
 
 def capture_closing_lines(game_id: int, league_code: str) -> int:
     """Capture closing lines for a game from existing pregame odds.
 
     Returns the number of closing line rows inserted.
     """
-    with get_session() as session:
-        # Check if we already have closing lines for this game
-        existing = session.execute(
-            select(db_models.ClosingLine.id)
-            .where(db_models.ClosingLine.game_id == game_id)
-            .limit(1)
-        ).scalar_one_or_none()
-
-        if existing is not None:
-            logger.debug("closing_lines_already_captured", game_id=game_id)
-            return 0
-
-        # Pull latest pregame odds from SportsGameOdds (is_closing_line=True)
-        stmt = (
-            select(db_models.SportsGameOdds)
-            .where(
-                db_models.SportsGameOdds.game_id == game_id,
-                db_models.SportsGameOdds.is_closing_line.is_(True),
-                db_models.SportsGameOdds.market_category == "mainline",
-            )
-        )
-        odds_rows = session.execute(stmt).scalars().all()
-
-        if not odds_rows:
-            logger.warning(
-                "closing_lines_no_pregame_odds",
-                game_id=game_id,
-                league=league_code,
-            )
-            return 0
-
-        now = datetime.now(UTC)
-        inserted = 0
-
-        for row in odds_rows:
-            values = {
-                "game_id": game_id,
-                "league": league_code,
-                "market_key": row.source_key or row.market_type,
-                "selection": row.side or "",
-                "line_value": row.line,
-                "price_american": row.price or 0,
-                "provider": row.book,
-                "captured_at": now,
-                "source_type": "closing",
-            }
-
-            ins = pg_insert(db_models.ClosingLine).values(**values)
-            ins = ins.on_conflict_do_nothing(
-                index_elements=[
-                    "game_id", "provider", "market_key", "selection", "line_value"
-                ]
-            )
-            result = session.execute(ins)
-            if result.rowcount > 0:
-                inserted += 1
-
-        session.commit()
-
+    inserted = capture_closing_lines_batch([game_id]).get(game_id, 0)
+    if inserted:
         logger.info(
             "closing_lines_captured",
             game_id=game_id,
             league=league_code,
             rows_inserted=inserted,
-            odds_available=len(odds_rows),
         )
-        return inserted
+    else:
+        logger.debug("closing_lines_not_captured", game_id=game_id, league=league_code)
+    return inserted
 
 
 def capture_closing_lines_from_provider(
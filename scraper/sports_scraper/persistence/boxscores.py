@@ -5,15 +5,20 @@ Handles team and player boxscore upserts and game payload persistence.
 
 from __future__ import annotations
 
+from collections import defaultdict
 from collections.abc import Sequence
 
-from sqlalchemy import literal
-from sqlalchemy.dialects.postgresql import JSONB, insert
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from ..db import db_models
 from ..logging import logger
-from ..models import NormalizedGame, NormalizedPlayerBoxscore, NormalizedTeamBoxscore
+from ..models import (
+    NormalizedGame,
+    NormalizedPlayerBoxscore,
+    NormalizedTeamBoxscore,
+    TeamIdentity,
+)
 from ..utils.datetime_utils import now_utc, to_et_date
 from ..utils.db_queries import get_league_id
 from .boxscore_helpers import (
@@ -31,6 +36,7 @@ __all__ = [
     "GamePersistResult",
     "PlayerBoxscoreStats",
     "upsert_player",
+    "upsert_players",
     "upsert_team_boxscores",
     "upsert_player_boxscores",
     "persist_game_payload",
@@ -83,42 +89,117 @@ def upsert_player(
     return player.id if player else 0
 
 
+def upsert_players(
+    session: Session,
+    league_id: int,
+    players: Sequence[dict],
+) -> dict[str, int]:
+    """Upsert many players of one league with a single multi-row statement.
+
+    Each dict carries ``external_id``, ``name`` and optionally
+    ``position``, ``sweater_number`` and ``team_id``. A repeated
+    ``external_id`` keeps its last row, matching sequential upserts.
+
+    Returns:
+        Mapping of external_id to the player's internal ID.
+    """
+    rows = {
+        p["external_id"]: {
+            "league_id": league_id,
+            "external_id": p["external_id"],
+            "name": p["name"],
+            "position": p.get("position"),
+            "sweater_number": p.get("sweater_number"),
+            "team_id": p.get("team_id"),
+        }
+        for p in players
+    }
+    if not rows:
+        return {}
+
+    stmt = insert(db_models.SportsPlayer).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["league_id", "external_id"],
+        set_={
+            "name": stmt.excluded.name,
+            "position": stmt.excluded.position,
+            "sweater_number": stmt.excluded.sweater_number,
+            "team_id": stmt.excluded.team_id,
+            "updated_at": now_utc(),
+        },
+    ).returning(db_models.SportsPlayer.id, db_models.SportsPlayer.external_id)
+    return {external_id: player_id for player_id, external_id in session.execute(stmt)}
+
+
+def _team_key(team: TeamIdentity) -> tuple:
+    return (team.league_code, team.name, team.short_name, team.abbreviation, team.external_ref)
+
+
+def _resolve_teams(
+    session: Session,
+    teams: Sequence[TeamIdentity],
+) -> dict[tuple, tuple[int, int] | Exception]:
+    """Resolve each distinct team once to ``(league_id, team_id)``.
+
+    A team that fails to resolve maps to its exception so callers can
+    count its rows as errors without aborting the rest of the game.
+    """
+    resolved: dict[tuple, tuple[int, int] | Exception] = {}
+    league_ids: dict[str, int] = {}
+    for team in teams:
+        key = _team_key(team)
+        if key in resolved:
+            continue
+        try:
+            if team.league_code not in league_ids:
+                league_ids[team.league_code] = get_league_id(session, team.league_code)
+            league_id = league_ids[team.league_code]
+            resolved[key] = (league_id, _upsert_team(session, league_id, team))
+        except Exception as exc:
+            resolved[key] = exc
+    return resolved
+
+
+def _touch_game(session: Session, game_id: int) -> None:
+    session.query(db_models.SportsGame).filter(db_models.SportsGame.id == game_id).update(
+        {db_models.SportsGame.last_ingested_at: now_utc()}
+    )
+
+
 def upsert_team_boxscores(
     session: Session,
     game_id: int,
     payloads: Sequence[NormalizedTeamBoxscore],
     source: str = "sports_reference",
 ) -> None:
-    """Upsert team boxscores for a game."""
-    updated = False
+    """Upsert team boxscores for a game in one statement."""
+    teams = _resolve_teams(session, [p.team for p in payloads])
+    rows: dict[int, dict] = {}
     for payload in payloads:
-        league_id = get_league_id(session, payload.team.league_code)
-        team_id = _upsert_team(session, league_id, payload.team)
-        stats = _build_team_stats(payload)
-        # Use literal() for proper parameter binding (avoids SQL injection with apostrophes)
-        stats_json = literal(stats, type_=JSONB)
-        stmt = insert(db_models.SportsTeamBoxscore).values(
-            game_id=game_id,
-            team_id=team_id,
-            is_home=payload.is_home,
-            raw_stats_json=stats,
-            source=source,
-        )
-        stmt = stmt.on_conflict_do_update(
-            constraint="uq_team_boxscore_game_team",
-            set_={
-                "raw_stats_json": stats_json,
-                "updated_at": now_utc(),
-            },
-            where=stmt.excluded.raw_stats_json.is_distinct_from(db_models.SportsTeamBoxscore.stats),
-        )
-        result = session.execute(stmt)
-        if result.rowcount:
-            updated = True
-    if updated:
-        session.query(db_models.SportsGame).filter(db_models.SportsGame.id == game_id).update(
-            {db_models.SportsGame.last_ingested_at: now_utc()}
-        )
+        team = teams[_team_key(payload.team)]
+        if isinstance(team, Exception):
+            raise team
+        rows[team[1]] = {
+            "game_id": game_id,
+            "team_id": team[1],
+            "is_home": payload.is_home,
+            "raw_stats_json": _build_team_stats(payload),
+            "source": source,
+        }
+    if not rows:
+        return
+
+    stmt = insert(db_models.SportsTeamBoxscore).values(list(rows.values()))
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_team_boxscore_game_team",
+        set_={
+            "raw_stats_json": stmt.excluded.raw_stats_json,
+            "updated_at": now_utc(),
+        },
+        where=stmt.excluded.raw_stats_json.is_distinct_from(db_models.SportsTeamBoxscore.stats),
+    )
+    if session.execute(stmt).rowcount:
+        _touch_game(session, game_id)
 
 
 def upsert_player_boxscores(
@@ -129,8 +210,10 @@ def upsert_player_boxscores(
 ) -> PlayerBoxscoreStats:
     """Upsert player boxscores for a game.
 
-    Handles errors per player and logs summary statistics.
-    NHL rows are validated before insertion - invalid rows are rejected and logged.
+    Rows are validated and their stats built in memory first (NHL rows
+    failing validation are rejected). Each team is resolved once, all
+    players go to ``sports_players`` in one multi-row upsert, and all
+    boxscores are written with one set-based upsert.
 
     Returns:
         PlayerBoxscoreStats with counts of inserted, rejected, and errored players.
@@ -138,81 +221,95 @@ def upsert_player_boxscores(
     if not payloads:
         return PlayerBoxscoreStats()
 
-    inserted_count = 0
     rejected_count = 0
     error_count = 0
 
-    updated = False
+    valid: list[NormalizedPlayerBoxscore] = []
     for payload in payloads:
         # Pre-insert validation for NHL (rejects broken rows before DB)
-        rejection_reason = _validate_nhl_player_boxscore(payload, game_id)
-        if rejection_reason:
+        if _validate_nhl_player_boxscore(payload, game_id):
             rejected_count += 1
-            continue  # Skip invalid row
-
-        try:
-            league_id = get_league_id(session, payload.team.league_code)
-            team_id = _upsert_team(session, league_id, payload.team)
-
-            # Upsert to sports_players master table (for linking PBP events)
-            if payload.player_id and payload.player_name:
-                upsert_player(
-                    session,
-                    league_id=league_id,
-                    external_id=payload.player_id,
-                    name=payload.player_name,
-                    position=payload.position,
-                    sweater_number=payload.sweater_number,
-                    team_id=team_id,
-                )
-
-            stats = _build_player_stats(payload)
-            # Use literal() for proper parameter binding (avoids SQL injection with apostrophes)
-            stats_json = literal(stats, type_=JSONB)
-            stmt = insert(db_models.SportsPlayerBoxscore).values(
+        else:
+            valid.append(payload)
+
+    teams = _resolve_teams(session, [p.team for p in valid])
+    players_by_league: dict[int, list[dict]] = defaultdict(list)
+    # Keyed by the boxscore identity so a repeated player keeps its last row
+    rows: dict[tuple[int, str], dict] = {}
+    for payload in valid:
+        team = teams[_team_key(payload.team)]
+        if isinstance(team, Exception):
+            logger.error(
+                "player_boxscore_upsert_failed",
                 game_id=game_id,
-                team_id=team_id,
-                player_external_ref=payload.player_id,
                 player_name=payload.player_name,
-                raw_stats_json=stats,
-                source=source,
+                error=str(team),
             )
+            error_count += 1
+            continue
+        league_id, team_id = team
+
+        # sports_players master table (for linking PBP events)
+        if payload.player_id and payload.player_name:
+            players_by_league[league_id].append({
+                "external_id": payload.player_id,
+                "name": payload.player_name,
+                "position": payload.position,
+                "sweater_number": payload.sweater_number,
+                "team_id": team_id,
+            })
+        rows[(team_id, payload.player_id)] = {
+            "game_id": game_id,
+            "team_id": team_id,
+            "player_external_ref": payload.player_id,
+            "player_name": payload.player_name,
+            "raw_stats_json": _build_player_stats(payload),
+            "source": source,
+        }
+
+    # Repeated players collapse to one row, so count rows, not payloads
+    written = len(rows)
+    updated = False
+    if rows:
+        try:
+            for league_id, players in players_by_league.items():
+                upsert_players(session, league_id, players)
+
+            stmt = insert(db_models.SportsPlayerBoxscore).values(list(rows.values()))
             stmt = stmt.on_conflict_do_update(
                 constraint="uq_player_boxscore_identity",
                 set_={
-                    "raw_stats_json": stats_json,
+                    "raw_stats_json": stmt.excluded.raw_stats_json,
                     "updated_at": now_utc(),
                 },
-                where=stmt.excluded.raw_stats_json.is_distinct_from(db_models.SportsPlayerBoxscore.stats),
+                where=stmt.excluded.raw_stats_json.is_distinct_from(
+                    db_models.SportsPlayerBoxscore.stats
+                ),
             )
-            result = session.execute(stmt)
-            if result.rowcount:
-                updated = True
-            inserted_count += 1
+            updated = bool(session.execute(stmt).rowcount)
         except Exception as exc:
             logger.error(
                 "player_boxscore_upsert_failed",
                 game_id=game_id,
-                player_name=payload.player_name,
+                rows=written,
                 error=str(exc),
                 exc_info=True,
             )
-            error_count += 1
+            error_count += written
+            written = 0
 
     logger.info(
         "player_boxscores_upsert_complete",
         game_id=game_id,
-        inserted_count=inserted_count,
+        inserted_count=written,
         rejected_count=rejected_count,
         error_count=error_count,
     )
     if updated:
-        session.query(db_models.SportsGame).filter(db_models.SportsGame.id == game_id).update(
-            {db_models.SportsGame.last_ingested_at: now_utc()}
-        )
+        _touch_game(session, game_id)
 
     return PlayerBoxscoreStats(
-        inserted=inserted_count,
+        inserted=written,
         rejected=rejected_count,
         errors=error_count,
     )
@@ -33,6 +33,8 @@ import logging
 import re
 from dataclasses import dataclass, field
 
+from app.utils.phrase_matcher import PhraseMatcher
+
 from .grader_rules.generic_phrases import (
     DENSITY_THRESHOLD,
     GENERIC_PHRASE_WEIGHT,
@@ -91,6 +93,7 @@ FORBIDDEN_PHRASES: list[str] = [
     "played really well",
     "showed up to play",
 ]
+_FORBIDDEN_MATCHER = PhraseMatcher(FORBIDDEN_PHRASES)
 
 # ── LLM rubric prompt ─────────────────────────────────────────────────────────
 
@@ -277,7 +280,7 @@ def grade_tier1(blocks: list[dict], game_data: dict) -> TierOneResult:
 
     # 4. Forbidden phrases
     combined_lower = combined.lower()
-    found: list[str] = [p for p in FORBIDDEN_PHRASES if p in combined_lower]
+    found: list[str] = _FORBIDDEN_MATCHER.matched(combined_lower)
     ok = len(found) == 0
     checks["forbidden_phrases"] = ok
     if not ok:
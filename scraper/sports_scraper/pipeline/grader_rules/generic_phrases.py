@@ -10,6 +10,8 @@ import logging
 import tomllib
 from pathlib import Path
 
+from app.utils.phrase_matcher import PhraseMatch, PhraseMatcher
+
 logger = logging.getLogger(__name__)
 
 _PHRASES_FILE = Path(__file__).parent / "generic_phrases.toml"
@@ -38,17 +40,22 @@ GENERIC_PHRASES: list[str]
 GENERIC_PHRASE_WEIGHT: float
 DENSITY_THRESHOLD: float
 GENERIC_PHRASES, GENERIC_PHRASE_WEIGHT, DENSITY_THRESHOLD = _load()
+GENERIC_PHRASE_MATCHER = PhraseMatcher(GENERIC_PHRASES)
 
 
 def detect_per_block(text: str) -> list[str]:
     """Return every generic phrase found in text (case-insensitive, in order).
 
-    Performs a simple substring scan against all known phrases. The text is
-    lowercased once; phrase list is pre-lowercased at import time. This runs
-    across sentence boundaries naturally because we match on the full block text.
+    One pass of the compiled phrase automaton over the full block text, so
+    matches span sentence boundaries naturally. Each phrase is reported once,
+    in phrase-list order.
     """
-    lower = text.lower()
-    return [p for p in GENERIC_PHRASES if p in lower]
+    return GENERIC_PHRASE_MATCHER.matched(text)
+
+
+def find_occurrences(text: str) -> list[PhraseMatch]:
+    """Return every generic-phrase occurrence in text with its position."""
+    return GENERIC_PHRASE_MATCHER.find_all(text)
 
 
 def phrase_density(text: str) -> float:
@@ -0,0 +1,136 @@
+"""Per-lane Celery queue latency (enqueue → start).
+
+``stamp_enqueue_time`` runs on ``before_task_publish`` and records the wall
+clock time in the message headers. ``record_queue_latency`` runs on
+``task_prerun`` and reports how long the message sat in its queue, tagged
+by lane. Tasks published with a countdown/ETA are measured from the ETA,
+not from publish time, so scheduled stagger offsets do not read as lag.
+
+The histogram is lazily initialized from the global MeterProvider. When
+opentelemetry-sdk is not installed or no endpoint is configured the
+instrument is a no-op; the over-budget warning log is always emitted.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any
+
+from .logging import logger
+
+_logger = logging.getLogger(__name__)
+
+ENQUEUED_AT_HEADER = "enqueued_at"
+
+_initialized = False
+_latency_histogram: Any = None
+
+
+class _Noop:
+    """Minimal no-op stand-in for an OTel Histogram."""
+
+    def record(self, *args, **kwargs) -> None:  # noqa: ANN002
+        pass
+
+
+_NOOP = _Noop()
+
+
+def _instruments():
+    global _initialized, _latency_histogram
+    if _initialized:
+        return _latency_histogram
+
+    _initialized = True
+    try:
+        from opentelemetry import metrics
+
+        meter = metrics.get_meter("celery.queue", version="1.0")
+        _latency_histogram = meter.create_histogram(
+            name="celery.queue.latency",
+            description="Seconds between task publish (or ETA) and worker start, by lane",
+            unit="s",
+        )
+    except ImportError:
+        _logger.debug("opentelemetry not available — queue metrics are no-ops")
+        _latency_histogram = _NOOP
+
+    return _latency_histogram
+
+
+def stamp_enqueue_time(headers: dict | None) -> None:
+    """Add the publish timestamp to outgoing message headers (idempotent)."""
+    if headers is not None:
+        headers.setdefault(ENQUEUED_AT_HEADER, time.time())
+
+
+def _enqueued_at(request: Any) -> float | None:
+    value = getattr(request, ENQUEUED_AT_HEADER, None)
+    if value is None:
+        headers = getattr(request, "headers", None) or {}
+        value = headers.get(ENQUEUED_AT_HEADER)
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _eta_timestamp(request: Any) -> float | None:
+    eta = getattr(request, "eta", None)
+    if not eta:
+        return None
+    try:
+        return datetime.fromisoformat(str(eta)).timestamp()
+    except ValueError:
+        return None
+
+
+def record_queue_latency(
+    task_name: str,
+    request: Any,
+    lanes: Mapping[str, str],
+    budgets: Mapping[str, float],
+    *,
+    now: float | None = None,
+) -> float | None:
+    """Record enqueue→start latency for a task that is about to run.
+
+    Args:
+        task_name: Celery task name.
+        request: The task's ``request`` context (headers, eta, delivery_info).
+        lanes: Queue name → lane label.
+        budgets: Queue name → latency budget in seconds; exceeding it logs a
+            ``queue_latency_over_budget`` warning.
+        now: Override for the current time (tests).
+
+    Returns:
+        Latency in seconds, or None when the message carried no timestamp
+        (e.g. published by a producer without the publish hook).
+    """
+    enqueued_at = _enqueued_at(request)
+    if enqueued_at is None:
+        return None
+
+    started = time.time() if now is None else now
+    ready_at = max(enqueued_at, _eta_timestamp(request) or 0.0)
+    latency = max(0.0, started - ready_at)
+
+    delivery_info = getattr(request, "delivery_info", None) or {}
+    queue = delivery_info.get("routing_key") or "unknown"
+    lane = lanes.get(queue, "other")
+
+    _instruments().record(latency, attributes={"lane": lane, "queue": queue, "task": task_name})
+
+    budget = budgets.get(queue)
+    if budget is not None and latency > budget:
+        logger.warning(
+            "queue_latency_over_budget",
+            task=task_name,
+            lane=lane,
+            queue=queue,
+            latency_seconds=round(latency, 3),
+            budget_seconds=budget,
+        )
+    return latency
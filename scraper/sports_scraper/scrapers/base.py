@@ -17,6 +17,7 @@ from ..models import NormalizedGame, NormalizedPlayByPlay, TeamIdentity
 from ..normalization import normalize_team_name
 from ..utils.cache import HTMLCache
 from ..utils.date_utils import season_from_date
+from ..utils.html_parsing import parse_html_subset
 from ..utils.parsing import parse_int
 
 
@@ -31,8 +32,26 @@ class NoGamesFoundError(ScraperError):
     """
 
 
+class CacheMissError(ScraperError):
+    """Raised in offline mode when a page is not present in the HTML cache."""
+
+
 # HTMLCache moved to utils/cache.py
 
+# XPath selections for targeted parsing during offline re-parse. Sports
+# Reference pages are 300-800KB, but each parse only needs a handful of
+# subtrees. PBP_XPATH mirrors parse_pbp_table's own lookup, including its
+# case-insensitive "any table whose id mentions pbp" fallback.
+SCOREBOARD_XPATH = "//div[contains(concat(' ', normalize-space(@class), ' '), ' game_summary ')]"
+BOXSCORE_XPATH = (
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' scorebox ')]"
+    " | //table[starts-with(@id, 'box-')]"
+)
+PBP_XPATH = (
+    "//*[@id='all_pbp'] | //table[contains("
+    "translate(@id, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'pbp')]"
+)
+
 
 class BaseSportsReferenceScraper:
     """Shared utilities for scraping Sports Reference scoreboards.
@@ -41,13 +60,18 @@ class BaseSportsReferenceScraper:
     - Local HTML cache (only fetch each page once)
     - Polite scraping (5-9 second random delays)
     - Automatic retry with exponential backoff
+    - Offline mode (cache only, never touches the network) for re-parsing
+
+    Pass an ``only`` XPath to ``fetch_html`` to build the BeautifulSoup tree
+    from just the matching subtrees instead of the whole page.
     """
 
     sport: str  # e.g., "nba" or "cbb"
     league_code: str
     base_url: str
 
-    def __init__(self, timeout_seconds: int | None = None) -> None:
+    def __init__(self, timeout_seconds: int | None = None, *, offline: bool = False) -> None:
+        self.offline = offline
         timeout = timeout_seconds or settings.scraper_config.request_timeout_seconds
         self.client = httpx.Client(
             timeout=timeout,
@@ -126,18 +150,34 @@ class BaseSportsReferenceScraper:
 
         return response.text
 
-    def fetch_html(self, url: str, game_date: date | None = None) -> BeautifulSoup:
+    def fetch_html(
+        self, url: str, game_date: date | None = None, *, only: str | None = None
+    ) -> BeautifulSoup:
         """Fetch HTML, using cache if available.
 
         1. Check local cache first
         2. If not cached, fetch from network (with polite delay)
         3. Save to cache for future use
         4. Return parsed BeautifulSoup
+
+        In offline mode the cache is read as-is and a missing page raises
+        CacheMissError instead of going to the network.
+
+        Args:
+            url: Page URL (also the cache key)
+            game_date: Game date, used by the cache freshness policy
+            only: Optional XPath; when given, only matching subtrees are parsed
         """
+        if self.offline:
+            html = self._cache.read(url)
+            if html is None:
+                raise CacheMissError(f"Not in HTML cache: {url}")
+            return self._parse(html, only)
+
         # Check cache first
         cached_html = self._cache.get(url, game_date)
         if cached_html:
-            return BeautifulSoup(cached_html, "lxml")
+            return self._parse(cached_html, only)
 
         # Fetch from network
         html = self._fetch_from_network(url)
@@ -145,6 +185,12 @@ class BaseSportsReferenceScraper:
         # Save to cache
         self._cache.put(url, html, game_date)
 
+        return self._parse(html, only)
+
+    @staticmethod
+    def _parse(html: str, only: str | None) -> BeautifulSoup:
+        if only:
+            return parse_html_subset(html, only)
         return BeautifulSoup(html, "lxml")
 
     def fetch_games_for_date(self, day: date) -> Sequence[NormalizedGame]:
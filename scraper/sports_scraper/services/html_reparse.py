@@ -0,0 +1,462 @@
+"""Offline re-parse of the Sports Reference HTML cache.
+
+When a parser bug is fixed we want to re-derive boxscores and play-by-play
+from years of cached pages without touching the network. This module fans
+parsing out across a process pool and keeps persistence in the parent:
+
+- The cache directory is streamed with ``os.scandir`` (scoreboard files
+  drive boxscore re-parse, ``pbp_*.html`` files drive PBP re-parse).
+- Workers run the normal scrapers in offline mode, so parsing logic is
+  exactly the production logic, but each page is parsed through an XPath
+  subset (see ``utils.html_parsing.parse_html_subset``) instead of a full
+  BeautifulSoup tree. Subset parsing lives only here; live scrapes always
+  parse whole pages.
+- A boxscore missing from the cache skips that game, not its whole day.
+- The parent writes results in batches and commits once per batch.
+
+Re-parse only enriches games that already exist — it never creates games.
+Progress and the final summary are logged with a pages/sec rate.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TypeVar
+
+from bs4 import BeautifulSoup
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ..config import settings
+from ..db import db_models
+from ..logging import logger
+from ..models import NormalizedGame, NormalizedPlay
+from ..persistence.boxscores import persist_game_payload
+from ..persistence.plays import upsert_plays
+from ..scrapers.base import (
+    BOXSCORE_XPATH,
+    PBP_XPATH,
+    SCOREBOARD_XPATH,
+    BaseSportsReferenceScraper,
+    CacheMissError,
+    NoGamesFoundError,
+)
+from ..scrapers.nba_bref import NBABasketballReferenceScraper
+from ..scrapers.ncaab_sportsref import NCAABSportsReferenceScraper
+from ..utils.cache import HTMLCache
+from ..utils.db_queries import get_league_id
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def _subset_xpath(url: str) -> str | None:
+    """XPath subset needed to parse a Sports Reference page, by URL shape."""
+    if "?" in url:
+        return SCOREBOARD_XPATH
+    if "/boxscores/pbp/" in url:
+        return PBP_XPATH
+    if "/boxscores/" in url:
+        return BOXSCORE_XPATH
+    return None
+
+
+def _page_key(url: str) -> str:
+    return url.rsplit("/", 1)[-1].removesuffix(".html")
+
+
+class _ReparseScraper(BaseSportsReferenceScraper):
+    """Offline scraper behaviour used only by re-parse workers.
+
+    Mixed in ahead of a league scraper. Pages are parsed through the XPath subset for their URL, and a boxscore
+    missing from the cache yields an empty page while its key is recorded in
+    ``missing_boxscores`` so the caller can drop just that game.
+    """
+
+    def __init__(self, timeout_seconds: int | None = None, *, offline: bool = True) -> None:
+        super().__init__(timeout_seconds, offline=offline)
+        self.missing_boxscores: set[str] = set()
+
+    def fetch_html(
+        self, url: str, game_date: date | None = None, *, only: str | None = None
+    ) -> BeautifulSoup:
+        xpath = only or _subset_xpath(url)
+        try:
+            return super().fetch_html(url, game_date, only=xpath)
+        except CacheMissError:
+            if xpath != BOXSCORE_XPATH:
+                raise
+            self.missing_boxscores.add(_page_key(url))
+            return BeautifulSoup("", "lxml")
+
+
+class _ReparseNBAScraper(_ReparseScraper, NBABasketballReferenceScraper):
+    pass
+
+
+class _ReparseNCAABScraper(_ReparseScraper, NCAABSportsReferenceScraper):
+    pass
+
+
+# League → (offline scraper class, play/boxscore source label)
+_REPARSE_SCRAPERS: dict[str, tuple[type[_ReparseScraper], str]] = {
+    "NBA": (_ReparseNBAScraper, "basketball_reference"),
+    "NCAAB": (_ReparseNCAABScraper, "sports_reference"),
+}
+
+# Only NBA has a separate Sports Reference PBP page.
+PBP_LEAGUES = frozenset({"NBA"})
+
+_SCOREBOARD_FILE = re.compile(r"^scoreboard_month(\d+)_day(\d+)_year(\d+)\.html$")
+_PBP_FILE_PREFIX = "pbp_"
+
+# Futures in flight per worker — enough to keep every core busy without
+# materializing the whole cache listing as pending work.
+_IN_FLIGHT_PER_WORKER = 4
+
+
+@dataclass
+class ReparseStats:
+    """Counters for one re-parse run."""
+
+    league_code: str
+    kind: str
+    pages: int = 0
+    games: int = 0
+    plays: int = 0
+    persisted: int = 0
+    cache_misses: int = 0
+    failures: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def pages_per_sec(self) -> float:
+        return self.pages / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+    def tick(self) -> None:
+        self.elapsed_seconds = time.monotonic() - self.started_at
+
+    def as_dict(self) -> dict:
+        return {
+            "league": self.league_code,
+            "kind": self.kind,
+            "pages": self.pages,
+            "games": self.games,
+            "plays": self.plays,
+            "persisted": self.persisted,
+            "cache_misses": self.cache_misses,
+            "failures": self.failures,
+            "elapsed_seconds": round(self.elapsed_seconds, 2),
+            "pages_per_sec": round(self.pages_per_sec, 1),
+        }
+
+
+@dataclass
+class _DayResult:
+    day: date
+    pages: int
+    games: list[NormalizedGame]
+    cache_miss: bool = False
+    missing_boxscores: int = 0
+    error: str | None = None
+
+
+@dataclass
+class _PbpResult:
+    source_game_key: str
+    plays: list[NormalizedPlay]
+    error: str | None = None
+
+
+# ---------------------------------------------------------------------------
+# Cache discovery (parent process)
+# ---------------------------------------------------------------------------
+
+
+def _html_cache(league_code: str) -> HTMLCache:
+    return HTMLCache(settings.scraper_config.html_cache_dir, league_code)
+
+
+def iter_cached_scoreboard_dates(
+    league_code: str,
+    start: date | None = None,
+    end: date | None = None,
+) -> Iterator[date]:
+    """Yield dates that have a cached scoreboard page, optionally bounded."""
+    for path in _html_cache(league_code).iter_cached_files("scoreboard_"):
+        match = _SCOREBOARD_FILE.match(path.name)
+        if not match:
+            continue
+        month, day, year = (int(g) for g in match.groups())
+        try:
+            game_day = date(year, month, day)
+        except ValueError:
+            continue
+        if start and game_day < start:
+            continue
+        if end and game_day > end:
+            continue
+        yield game_day
+
+
+def iter_cached_pbp_keys(league_code: str) -> Iterator[str]:
+    """Yield source game keys that have a cached play-by-play page."""
+    for path in _html_cache(league_code).iter_cached_files(_PBP_FILE_PREFIX):
+        yield path.name[len(_PBP_FILE_PREFIX):-len(".html")]
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+# One offline scraper per worker process, reused across tasks.
+_worker_scrapers: dict[str, _ReparseScraper] = {}
+
+
+def _offline_scraper(league_code: str) -> _ReparseScraper:
+    scraper = _worker_scrapers.get(league_code)
+    if scraper is None:
+        scraper_cls, _ = _REPARSE_SCRAPERS[league_code]
+        scraper = scraper_cls(offline=True)
+        _worker_scrapers[league_code] = scraper
+    return scraper
+
+
+def reparse_day(league_code: str, day: date) -> _DayResult:
+    """Re-parse one cached scoreboard and the boxscores it links to.
+
+    Games whose boxscore page is not cached are logged and skipped; the
+    rest of the day is still returned.
+    """
+    scraper = _offline_scraper(league_code)
+    scraper.missing_boxscores.clear()
+    try:
+        games = list(scraper.fetch_games_for_date(day))
+    except NoGamesFoundError:
+        return _DayResult(day=day, pages=1, games=[])
+    except CacheMissError as exc:
+        return _DayResult(day=day, pages=0, games=[], cache_miss=True, error=str(exc))
+    except Exception as exc:
+        return _DayResult(day=day, pages=0, games=[], error=str(exc))
+
+    missing = set(scraper.missing_boxscores)
+    if missing:
+        for key in sorted(missing):
+            logger.warning("html_reparse_boxscore_missing", day=str(day), game_key=key)
+        games = [g for g in games if g.identity.source_game_key not in missing]
+    # Scoreboard page plus one boxscore page per parsed game
+    return _DayResult(
+        day=day, pages=1 + len(games), games=games, missing_boxscores=len(missing)
+    )
+
+
+def reparse_pbp_page(league_code: str, source_game_key: str) -> _PbpResult:
+    """Re-parse one cached play-by-play page."""
+    scraper = _offline_scraper(league_code)
+    try:
+        # game_date only feeds the online cache freshness policy
+        pbp = scraper.fetch_play_by_play(source_game_key, date.min)
+    except Exception as exc:
+        return _PbpResult(source_game_key=source_game_key, plays=[], error=str(exc))
+    return _PbpResult(source_game_key=source_game_key, plays=list(pbp.plays))
+
+
+# ---------------------------------------------------------------------------
+# Fan-out
+# ---------------------------------------------------------------------------
+
+
+def _imap_bounded(
+    executor: Executor,
+    fn: Callable[..., R],
+    args: Iterable[tuple],
+    max_in_flight: int,
+) -> Iterator[R]:
+    """Submit ``fn(*a)`` for each ``a`` with at most ``max_in_flight`` pending.
+
+    Results are yielded in completion order. Unlike ``Executor.map`` the
+    input iterable is consumed lazily, so streaming a large cache directory
+    never queues the whole listing up front.
+    """
+    pending: set[Future[R]] = set()
+    for item in args:
+        pending.add(executor.submit(fn, *item))
+        if len(pending) >= max_in_flight:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+
+def _batched(items: Iterable[T], size: int) -> Iterator[list[T]]:
+    batch: list[T] = []
+    for item in items:
+        batch.append(item)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _log_progress(stats: ReparseStats) -> None:
+    stats.tick()
+    logger.info("html_reparse_progress", **stats.as_dict())
+
+
+# ---------------------------------------------------------------------------
+# Public entry points (parent process)
+# ---------------------------------------------------------------------------
+
+
+def reparse_boxscores(
+    session: Session,
+    league_code: str,
+    *,
+    start: date | None = None,
+    end: date | None = None,
+    workers: int | None = None,
+    batch_size: int = 50,
+    executor: Executor | None = None,
+) -> ReparseStats:
+    """Re-derive boxscores for every cached scoreboard date in range.
+
+    Args:
+        session: Database session (parent process only)
+        league_code: NBA or NCAAB
+        start: Optional first date (inclusive)
+        end: Optional last date (inclusive)
+        workers: Process count (defaults to all cores)
+        batch_size: Games persisted per commit
+        executor: Optional pre-built executor (tests inject a thread pool)
+
+    Returns:
+        ReparseStats with page and game counts and pages/sec.
+    """
+    league_code = league_code.upper()
+    if league_code not in _REPARSE_SCRAPERS:
+        raise ValueError(f"Offline re-parse not supported for {league_code}")
+    _, source = _REPARSE_SCRAPERS[league_code]
+
+    stats = ReparseStats(league_code=league_code, kind="boxscores")
+    workers = workers or os.cpu_count() or 1
+    owns_executor = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+
+    def _games() -> Iterator[NormalizedGame]:
+        days = ((league_code, day) for day in iter_cached_scoreboard_dates(league_code, start, end))
+        for result in _imap_bounded(pool, reparse_day, days, workers * _IN_FLIGHT_PER_WORKER):
+            stats.pages += result.pages
+            stats.cache_misses += result.missing_boxscores
+            if result.cache_miss:
+                stats.cache_misses += 1
+            elif result.error:
+                stats.failures += 1
+                logger.warning("html_reparse_day_failed", day=str(result.day), error=result.error)
+            stats.games += len(result.games)
+            yield from result.games
+
+    try:
+        for batch in _batched(_games(), batch_size):
+            for game in batch:
+                try:
+                    with session.begin_nested():
+                        outcome = persist_game_payload(session, game)
+                    if outcome.game_id is not None:
+                        stats.persisted += 1
+                except Exception as exc:
+                    stats.failures += 1
+                    logger.warning(
+                        "html_reparse_game_failed",
+                        game_key=game.identity.source_game_key,
+                        error=str(exc),
+                    )
+            session.commit()
+            _log_progress(stats)
+    finally:
+        if owns_executor:
+            pool.shutdown()
+
+    stats.tick()
+    logger.info("html_reparse_complete", source=source, **stats.as_dict())
+    return stats
+
+
+def reparse_pbp(
+    session: Session,
+    league_code: str,
+    *,
+    workers: int | None = None,
+    batch_size: int = 50,
+    executor: Executor | None = None,
+) -> ReparseStats:
+    """Re-derive play-by-play for every cached PBP page of a league.
+
+    Parsed pages are matched to existing games by ``source_game_key`` with
+    one lookup per batch; pages without a matching game are skipped. Each
+    game's plays are written in a savepoint, so a failing game is counted
+    in ``failures`` without losing the rest of the batch.
+    """
+    league_code = league_code.upper()
+    if league_code not in PBP_LEAGUES:
+        raise ValueError(f"Offline PBP re-parse not supported for {league_code}")
+    _, source = _REPARSE_SCRAPERS[league_code]
+
+    stats = ReparseStats(league_code=league_code, kind="pbp")
+    workers = workers or os.cpu_count() or 1
+    league_id = get_league_id(session, league_code)
+    owns_executor = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers=workers)
+
+    keys = ((league_code, key) for key in iter_cached_pbp_keys(league_code))
+    results = _imap_bounded(pool, reparse_pbp_page, keys, workers * _IN_FLIGHT_PER_WORKER)
+
+    try:
+        for batch in _batched(results, batch_size):
+            stats.pages += len(batch)
+            parsed = {r.source_game_key: r.plays for r in batch if not r.error and r.plays}
+            for r in batch:
+                if r.error:
+                    stats.failures += 1
+                    logger.warning("html_reparse_pbp_failed", game_key=r.source_game_key, error=r.error)
+
+            game_ids = dict(
+                session.execute(
+                    select(db_models.SportsGame.source_game_key, db_models.SportsGame.id).where(
+                        db_models.SportsGame.league_id == league_id,
+                        db_models.SportsGame.source_game_key.in_(list(parsed)),
+                    )
+                ).all()
+            ) if parsed else {}
+
+            for key, plays in parsed.items():
+                game_id = game_ids.get(key)
+                if game_id is None:
+                    continue
+                stats.games += 1
+                try:
+                    with session.begin_nested():
+                        stats.plays += upsert_plays(session, game_id, plays, source=source)
+                    stats.persisted += 1
+                except Exception as exc:
+                    stats.failures += 1
+                    logger.warning("html_reparse_game_failed", game_key=key, error=str(exc))
+            session.commit()
+            _log_progress(stats)
+    finally:
+        if owns_executor:
+            pool.shutdown()
+
+    stats.tick()
+    logger.info("html_reparse_complete", source=source, **stats.as_dict())
+    return stats
@@ -0,0 +1,180 @@
+"""Redis index of live games, kept current by ``game_score_update`` NOTIFY.
+
+The live orchestrator ticks every 5 seconds. Rather than re-querying every
+live game from Postgres on each tick, it reads a Redis hash
+(``live_games``: game_id -> league code) and only touches the database for
+games that changed since the last tick.
+
+``SportsGame.status`` changes flushed through the ORM emit
+``pg_notify('game_score_update')`` (see ``app.db.hooks``). Each worker
+process holds one LISTEN connection and drains it without blocking at the
+start of a tick; notified game IDs are re-read with a single primary-key
+query and applied to the hash.
+
+A full SQL reconcile runs when the ``live_games:synced`` marker has expired
+(every ``RECONCILE_INTERVAL_S``) or when this process (re)opens its LISTEN
+connection, so notifications missed while no listener was connected, and
+status writes made with Core ``update()`` or raw SQL (which never notify),
+are never lost for more than one interval.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+from collections.abc import Callable, Iterable
+
+from ..db import db_models, engine, get_session
+from ..logging import logger
+
+LIVE_GAMES_KEY = "live_games"
+LIVE_GAMES_SYNCED_KEY = "live_games:synced"
+NOTIFY_CHANNEL = "game_score_update"
+
+# Safety-net full reconcile interval (seconds)
+RECONCILE_INTERVAL_S = 300
+
+
+class NotifyListener:
+    """Per-process LISTEN connection drained without blocking."""
+
+    def __init__(self, dsn: str | None = None, channel: str = NOTIFY_CHANNEL) -> None:
+        self._dsn = dsn
+        self._channel = channel
+        self._conn = None
+
+    def _connect(self) -> None:
+        import psycopg
+
+        dsn = self._dsn or engine.url.set(drivername="postgresql").render_as_string(
+            hide_password=False
+        )
+        conn = psycopg.connect(dsn, autocommit=True)
+        conn.execute(f"LISTEN {self._channel}")
+        self._conn = conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            with contextlib.suppress(Exception):
+                self._conn.close()
+        self._conn = None
+
+    def drain(self) -> set[int] | None:
+        """Return game IDs notified since the previous drain.
+
+        Returns None when the connection was just (re)opened or failed —
+        the caller cannot know what it missed and must reconcile from SQL.
+        """
+        if self._conn is None or self._conn.closed:
+            try:
+                self._connect()
+            except Exception as exc:
+                logger.warning("live_game_index_listen_failed", error=str(exc))
+                self.close()
+            return None
+
+        game_ids: set[int] = set()
+        try:
+            for notify in self._conn.notifies(timeout=0):
+                game_id = _payload_game_id(notify.payload)
+                if game_id is not None:
+                    game_ids.add(game_id)
+        except Exception as exc:
+            logger.warning("live_game_index_drain_failed", error=str(exc))
+            self.close()
+            return None
+        return game_ids
+
+
+def _payload_game_id(payload: str) -> int | None:
+    try:
+        return int(json.loads(payload)["game_id"])
+    except (ValueError, TypeError, KeyError):
+        return None
+
+
+_listener: NotifyListener | None = None
+
+
+def _get_listener() -> NotifyListener:
+    global _listener
+    if _listener is None:
+        _listener = NotifyListener()
+    return _listener
+
+
+def _query_live_games(session, game_ids: Iterable[int] | None = None) -> list[tuple[int, str, str]]:
+    query = session.query(
+        db_models.SportsGame.id,
+        db_models.SportsGame.status,
+        db_models.SportsLeague.code,
+    ).join(db_models.SportsLeague)
+    if game_ids is None:
+        query = query.filter(db_models.SportsGame.status == db_models.GameStatus.live.value)
+    else:
+        query = query.filter(db_models.SportsGame.id.in_(list(game_ids)))
+    return query.all()
+
+
+def _reconcile(r, session_factory: Callable) -> dict[int, str]:
+    with session_factory() as session:
+        rows = _query_live_games(session)
+    live = {game_id: league for game_id, _status, league in rows}
+
+    pipe = r.pipeline()
+    pipe.delete(LIVE_GAMES_KEY)
+    if live:
+        pipe.hset(LIVE_GAMES_KEY, mapping={str(k): v for k, v in live.items()})
+    pipe.set(LIVE_GAMES_SYNCED_KEY, "1", ex=RECONCILE_INTERVAL_S)
+    pipe.execute()
+
+    logger.info("live_game_index_reconciled", live_games=len(live))
+    return live
+
+
+def _apply_changes(r, session_factory: Callable, game_ids: set[int], live: dict[int, str]) -> None:
+    with session_factory() as session:
+        rows = _query_live_games(session, game_ids)
+    now_live = {game_id: league for game_id, status, league in rows if status == db_models.GameStatus.live.value}
+    gone = [str(gid) for gid in game_ids if gid not in now_live and gid in live]
+
+    if not now_live and not gone:
+        return
+    pipe = r.pipeline()
+    if now_live:
+        pipe.hset(LIVE_GAMES_KEY, mapping={str(k): v for k, v in now_live.items()})
+    if gone:
+        pipe.hdel(LIVE_GAMES_KEY, *gone)
+    pipe.execute()
+
+    live.update(now_live)
+    for gid in gone:
+        live.pop(int(gid), None)
+
+
+def get_live_games(
+    r,
+    *,
+    listener: NotifyListener | None = None,
+    session_factory: Callable = get_session,
+) -> dict[int, str]:
+    """Return ``{game_id: league_code}`` for every live game.
+
+    Steady state costs one Redis round trip; the database is only queried
+    for games named in a NOTIFY since the last call, or for a full
+    reconcile when the sync marker expired or the listener reconnected.
+    """
+    notified = (listener or _get_listener()).drain()
+
+    pipe = r.pipeline(transaction=False)
+    pipe.exists(LIVE_GAMES_SYNCED_KEY)
+    pipe.hgetall(LIVE_GAMES_KEY)
+    synced, cached = pipe.execute()
+
+    if notified is None or not synced:
+        return _reconcile(r, session_factory)
+
+    live = {int(k): v for k, v in cached.items()}
+    if notified:
+        _apply_changes(r, session_factory, notified, live)
+    return live
@@ -133,7 +133,8 @@ def ingest_advanced_stats_for_game(session: Session, game_id: int) -> dict:
     2. Fetch aggregated Statcast data via MLBLiveFeedClient
     3. Compute derived percentages
     4. Upsert 2 rows (home + away) via INSERT...ON CONFLICT DO UPDATE
-    5. Set game.last_advanced_stats_at
+    5. Materialize both teams' lineups into mlb_game_lineups
+    6. Set game.last_advanced_stats_at
 
     Returns:
         Dict with ingestion result status.
@@ -366,6 +367,16 @@ def ingest_advanced_stats_for_game(session: Session, game_id: int) -> dict:
         except Exception as exc:
             logger.warning("mlb_fielding_stats_error", game_id=game_id, error=str(exc))
 
+    # Materialize lineups now that pitcher stats (starter) are in place
+    lineups_materialized = 0
+    try:
+        from .mlb_lineup_materialization import materialize_game_lineups
+
+        with session.begin_nested():
+            lineups_materialized = materialize_game_lineups(session, game)
+    except Exception as exc:
+        logger.warning("mlb_lineup_materialization_error", game_id=game_id, error=str(exc))
+
     game.last_advanced_stats_at = datetime.now(UTC)
     session.flush()
 
@@ -377,6 +388,7 @@ def ingest_advanced_stats_for_game(session: Session, game_id: int) -> dict:
         player_rows_upserted=player_upserted,
         pitcher_rows_upserted=pitcher_upserted,
         fielding_rows_upserted=fielding_upserted,
+        lineups_materialized=lineups_materialized,
     )
 
     return {
@@ -386,4 +398,5 @@ def ingest_advanced_stats_for_game(session: Session, game_id: int) -> dict:
         "player_rows_upserted": player_upserted,
         "pitcher_rows_upserted": pitcher_upserted,
         "fielding_rows_upserted": fielding_upserted,
+        "lineups_materialized": lineups_materialized,
     }
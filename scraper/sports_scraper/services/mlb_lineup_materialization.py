@@ -0,0 +1,188 @@
+"""Materialize MLB batting orders and starting pitchers per final game.
+
+Consensus lineups for upcoming games look at each team's last several
+lineups. Reconstructing those from play-by-play means loading every
+play of every recent game on every simulation, so the result is stored
+once per (game, team) in ``mlb_game_lineups`` instead: when the game's
+advanced stats are ingested, and by ``backfill_game_lineups`` for games
+finalized before the table existed.
+
+The derivation is shared with the API's on-the-fly reconstruction
+(``app.analytics.services.lineup_reconstruction``), so stored and
+reconstructed lineups are identical. A team whose lineup cannot be
+derived gets a marker row (``lineup_source = "none"``, no batters), so
+the backfill stops reselecting the game and readers skip the rebuild.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from ..db import db_models
+from ..logging import logger
+
+# lineup_source of the marker row for a team with no derivable lineup
+NO_LINEUP_SOURCE = "none"
+
+
+def _team_lineup_row(session: Session, game, team_id: int) -> dict | None:
+    """Upsert values for one team's lineup, or ``None`` if underivable."""
+    from app.analytics.services.lineup_reconstruction import (  # type: ignore
+        lineup_from_boxscore_rows,
+        lineup_from_plays,
+        starting_pitcher_from_rows,
+    )
+
+    plays = session.execute(
+        select(db_models.SportsGamePlay)
+        .where(
+            db_models.SportsGamePlay.game_id == game.id,
+            db_models.SportsGamePlay.team_id == team_id,
+        )
+        .order_by(db_models.SportsGamePlay.play_index.asc())
+    ).scalars().all()
+    box_rows = session.execute(
+        select(db_models.SportsPlayerBoxscore).where(
+            db_models.SportsPlayerBoxscore.game_id == game.id,
+            db_models.SportsPlayerBoxscore.team_id == team_id,
+        )
+    ).scalars().all()
+
+    batters = lineup_from_plays(plays)
+    source = "pbp"
+    if len(batters) < 3:
+        batters = lineup_from_boxscore_rows(box_rows)
+        source = "boxscore"
+    if len(batters) < 3:
+        return None
+
+    pitcher_rows = session.execute(
+        select(db_models.MLBPitcherGameStats).where(
+            db_models.MLBPitcherGameStats.game_id == game.id,
+            db_models.MLBPitcherGameStats.team_id == team_id,
+        )
+    ).scalars().all()
+    starter = starting_pitcher_from_rows(pitcher_rows, box_rows)
+
+    return {
+        "game_id": game.id,
+        "team_id": team_id,
+        "game_date": game.game_date,
+        "batters": batters,
+        "lineup_source": source,
+        "starter_external_ref": starter["external_ref"] if starter else None,
+        "starter_name": starter["name"] if starter else None,
+        "starter_innings_pitched": starter["avg_ip"] if starter else None,
+        "updated_at": datetime.now(UTC),
+    }
+
+
+def _no_lineup_row(game, team_id: int) -> dict:
+    """Marker values for a team whose lineup could not be derived."""
+    return {
+        "game_id": game.id,
+        "team_id": team_id,
+        "game_date": game.game_date,
+        "batters": [],
+        "lineup_source": NO_LINEUP_SOURCE,
+        "starter_external_ref": None,
+        "starter_name": None,
+        "starter_innings_pitched": None,
+        "updated_at": datetime.now(UTC),
+    }
+
+
+def materialize_game_lineups(session: Session, game) -> int:
+    """Upsert both teams' lineups for a final MLB game.
+
+    Idempotent: re-running after late PBP or stat corrections replaces
+    the stored rows, including no-lineup markers. Returns the number of
+    team lineups written; markers are not counted.
+    """
+    written = 0
+    for team_id in (game.home_team_id, game.away_team_id):
+        row = _team_lineup_row(session, game, team_id)
+        marker = row is None
+        if marker:
+            logger.info("mlb_lineup_not_derivable", game_id=game.id, team_id=team_id)
+            row = _no_lineup_row(game, team_id)
+        stmt = pg_insert(db_models.MLBGameLineup).values(**row)
+        stmt = stmt.on_conflict_do_update(
+            constraint="uq_mlb_game_lineups_game_team",
+            set_={
+                col: stmt.excluded[col]
+                for col in row
+                if col not in ("game_id", "team_id")
+            },
+            # A marker never replaces a lineup that was derived earlier
+            where=(db_models.MLBGameLineup.lineup_source == NO_LINEUP_SOURCE) if marker else None,
+        )
+        session.execute(stmt)
+        if not marker:
+            written += 1
+    return written
+
+
+def backfill_game_lineups(session: Session, *, limit: int = 500) -> dict:
+    """Materialize lineups for final MLB games that have none yet.
+
+    Only games with play-by-play or player boxscores are candidates, and
+    a game is attempted once: teams with nothing derivable are stored as
+    no-lineup markers, which count as present here.
+
+    Processes up to ``limit`` games, most recent first (those are the
+    ones consensus lineups read), committing after each game.
+    """
+    _COMPLETED = {db_models.GameStatus.final.value, db_models.GameStatus.archived.value}
+    league_id = session.execute(
+        select(db_models.SportsLeague.id).where(db_models.SportsLeague.code == "MLB")
+    ).scalar_one_or_none()
+    if league_id is None:
+        return {"status": "skipped", "reason": "no_mlb_league"}
+
+    has_lineup = (
+        select(db_models.MLBGameLineup.id)
+        .where(db_models.MLBGameLineup.game_id == db_models.SportsGame.id)
+        .exists()
+    )
+    # Games with neither PBP nor boxscores can't produce a lineup; selecting
+    # them would fill every batch with the same underivable games forever.
+    has_plays = (
+        select(db_models.SportsGamePlay.id)
+        .where(db_models.SportsGamePlay.game_id == db_models.SportsGame.id)
+        .exists()
+    )
+    has_boxscore = (
+        select(db_models.SportsPlayerBoxscore.id)
+        .where(db_models.SportsPlayerBoxscore.game_id == db_models.SportsGame.id)
+        .exists()
+    )
+    games = session.execute(
+        select(db_models.SportsGame)
+        .where(
+            db_models.SportsGame.league_id == league_id,
+            db_models.SportsGame.status.in_(_COMPLETED),
+            ~has_lineup,
+            has_plays | has_boxscore,
+        )
+        .order_by(db_models.SportsGame.game_date.desc())
+        .limit(limit)
+    ).scalars().all()
+
+    games_done = 0
+    lineups_written = 0
+    for game in games:
+        lineups_written += materialize_game_lineups(session, game)
+        session.commit()
+        games_done += 1
+
+    logger.info(
+        "mlb_lineup_backfill_complete",
+        games=games_done,
+        lineups_written=lineups_written,
+    )
+    return {"status": "success", "games": games_done, "lineups_written": lineups_written}
@@ -6,7 +6,6 @@ and triggers timeline generation via the API's timeline generator.
 
 from __future__ import annotations
 
-import time
 from collections.abc import Sequence
 from datetime import datetime, timedelta
 
@@ -26,6 +25,9 @@ SCHEDULED_DAYS_BACK = 4  # 96 hours back
 # Must match api/app/services/timeline_types.py DEFAULT_TIMELINE_VERSION
 TIMELINE_VERSION = "v1"
 
+# Game IDs per /timelines/generate-games request (API accepts up to 500)
+TIMELINE_BATCH_SIZE = 100
+
 
 def find_games_missing_timelines(
     session: Session,
@@ -326,6 +328,78 @@ def generate_timeline_for_game(
         return False
 
 
+def generate_timelines_for_games(
+    game_ids: Sequence[int],
+    timeline_version: str = TIMELINE_VERSION,
+    api_base_url: str | None = None,
+    reason: str = "scheduled",
+) -> list[int]:
+    """
+    Generate timeline artifacts for many games via the batch API endpoint.
+
+    Sends ``TIMELINE_BATCH_SIZE`` game IDs per request; the API builds
+    each chunk with a handful of queries and one bulk artifact write.
+
+    Args:
+        game_ids: Game IDs to generate timelines for
+        timeline_version: Timeline version identifier
+        api_base_url: Base URL for API (defaults to settings)
+        reason: Generation reason recorded on the artifacts
+
+    Returns:
+        IDs of games whose timeline could not be generated
+    """
+    if api_base_url is None:
+        api_base_url = getattr(settings, "api_internal_url", "http://localhost:8000")
+
+    url = f"{api_base_url}/api/admin/sports/timelines/generate-games"
+    failed: list[int] = []
+
+    with httpx.Client(timeout=600.0, headers=get_api_headers()) as client:
+        for offset in range(0, len(game_ids), TIMELINE_BATCH_SIZE):
+            chunk = list(game_ids[offset:offset + TIMELINE_BATCH_SIZE])
+            try:
+                response = client.post(
+                    url,
+                    json={
+                        "game_ids": chunk,
+                        "timeline_version": timeline_version,
+                        "generation_reason": reason,
+                    },
+                )
+                response.raise_for_status()
+                result = response.json()
+            except httpx.HTTPStatusError as exc:
+                logger.error(
+                    "timeline_gen_batch_http_error",
+                    games=len(chunk),
+                    status_code=exc.response.status_code,
+                    error=str(exc),
+                )
+                failed.extend(chunk)
+                continue
+            except Exception as exc:
+                logger.exception(
+                    "timeline_gen_batch_error",
+                    games=len(chunk),
+                    error=str(exc),
+                )
+                failed.extend(chunk)
+                continue
+
+            chunk_failed = result.get("failedGameIds", [])
+            failed.extend(chunk_failed)
+            logger.info(
+                "timeline_gen_batch_success",
+                timeline_version=timeline_version,
+                reason=reason,
+                games=len(chunk),
+                failed=len(chunk_failed),
+            )
+
+    return failed
+
+
 def generate_missing_timelines(
     league_code: str,
     days_back: int | None = None,
@@ -366,24 +440,11 @@ def generate_missing_timelines(
     # Limit number of games if specified
     games_to_process = games[:max_games] if max_games else games
 
-    successful = 0
-    failed = 0
-
-    for game_id, game_date, home_team, away_team in games_to_process:
-        logger.info(
-            "timeline_gen_processing",
-            game_id=game_id,
-            game_date=str(game_date),
-            matchup=f"{away_team} @ {home_team}",
-        )
-
-        if generate_timeline_for_game(game_id, timeline_version):
-            successful += 1
-        else:
-            failed += 1
-
-        # Throttle requests to stay under rate limit (120 req/60s = 2/sec)
-        time.sleep(0.6)
+    failed_ids = generate_timelines_for_games(
+        [game_id for game_id, *_ in games_to_process], timeline_version, reason="missing"
+    )
+    failed = len(failed_ids)
+    successful = len(games_to_process) - failed
 
     summary = {
         "games_found": len(games),
@@ -447,25 +508,15 @@ def generate_all_needed_timelines(
     # Limit number of games if specified
     games_to_process = games[:max_games] if max_games else games
 
-    successful = 0
-    failed = 0
-
-    for game_id, game_date, home_team, away_team, reason in games_to_process:
-        logger.info(
-            "timeline_gen_processing",
-            game_id=game_id,
-            game_date=str(game_date),
-            matchup=f"{away_team} @ {home_team}",
-            reason=reason,
-        )
+    # One batch run per reason so each artifact records why it was (re)built
+    by_reason: dict[str, list[int]] = {}
+    for game_id, _game_date, _home, _away, reason in games_to_process:
+        by_reason.setdefault(reason, []).append(game_id)
 
-        if generate_timeline_for_game(game_id, timeline_version, reason=reason):
-            successful += 1
-        else:
-            failed += 1
-
-        # Throttle requests to stay under rate limit (120 req/60s = 2/sec)
-        time.sleep(0.6)
+    failed = 0
+    for reason, game_ids in by_reason.items():
+        failed += len(generate_timelines_for_games(game_ids, timeline_version, reason=reason))
+    successful = len(games_to_process) - failed
 
     summary = {
         "games_found": len(games),
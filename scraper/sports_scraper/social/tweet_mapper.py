@@ -12,6 +12,8 @@ See team_collector.py for collecting team tweets.
 
 from __future__ import annotations
 
+import time
+from bisect import bisect_right
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 from zoneinfo import ZoneInfo
@@ -127,6 +129,14 @@ def get_game_window(
     return window_start, window_end
 
 
+def _phase_for(posted_at: datetime, game_start: datetime, game_end: datetime) -> str:
+    if posted_at < game_start:
+        return "pregame"
+    if posted_at <= game_end:
+        return "in_game"
+    return "postgame"
+
+
 def classify_game_phase(
     posted_at: datetime,
     game,
@@ -141,13 +151,7 @@ def classify_game_phase(
     Uses sport-specific game duration when end_time is unavailable.
     """
     game_start = _get_game_start(game)
-    game_end = _get_game_end(game, game_start)
-
-    if posted_at < game_start:
-        return "pregame"
-    if posted_at <= game_end:
-        return "in_game"
-    return "postgame"
+    return _phase_for(posted_at, game_start, _get_game_end(game, game_start))
 
 
 def _search_dates_for_tweet(posted_at: datetime) -> tuple[datetime, datetime]:
@@ -176,6 +180,175 @@ def _search_dates_for_tweet(posted_at: datetime) -> tuple[datetime, datetime]:
     return search_start, search_end
 
 
+class GameWindowIndex:
+    """Per-team interval index over game tweet windows.
+
+    Built once per batch from every candidate game. Each team's windows are
+    sorted by start, so a lookup is a bisect plus a short backwards scan
+    bounded by the longest window — O(log n) per tweet instead of a query.
+    """
+
+    def __init__(self, games) -> None:
+        by_team: dict[int, list[tuple[datetime, datetime, datetime, datetime, int]]] = {}
+        max_span = timedelta(0)
+        for game in games:
+            window_start, window_end = get_game_window(game)
+            game_start = _get_game_start(game)
+            entry = (window_start, window_end, game_start, _get_game_end(game, game_start), game.id)
+            max_span = max(max_span, window_end - window_start)
+            for team_id in {game.home_team_id, game.away_team_id}:
+                by_team.setdefault(team_id, []).append(entry)
+
+        self._entries = {team_id: sorted(entries) for team_id, entries in by_team.items()}
+        self._starts = {team_id: [e[0] for e in entries] for team_id, entries in self._entries.items()}
+        self._max_span = max_span
+
+    def lookup(self, team_id: int, posted_at: datetime) -> tuple[int, str] | None:
+        """Return (game_id, game_phase) for the team's game whose window covers posted_at.
+
+        When windows overlap (doubleheaders), the game whose start is
+        closest to posted_at wins.
+        """
+        entries = self._entries.get(team_id)
+        if not entries:
+            return None
+
+        earliest_start = posted_at - self._max_span
+        best = None
+        best_distance = None
+        i = bisect_right(self._starts[team_id], posted_at) - 1
+        while i >= 0 and entries[i][0] >= earliest_start:
+            _window_start, window_end, game_start, game_end, game_id = entries[i]
+            if posted_at <= window_end:
+                distance = abs(posted_at - game_start)
+                if best_distance is None or distance < best_distance:
+                    best = (game_id, _phase_for(posted_at, game_start, game_end))
+                    best_distance = distance
+            i -= 1
+        return best
+
+
+def _as_utc(posted_at: datetime) -> datetime:
+    return posted_at.replace(tzinfo=UTC) if posted_at.tzinfo is None else posted_at
+
+
+def _normalize_tweets(tweets: list, errors: list[str]) -> list[tuple[int, int, datetime]]:
+    """Return (id, team_id, posted_at UTC) rows; unusable tweets go to ``errors`` and stay unmapped."""
+    rows = []
+    for tweet in tweets:
+        try:
+            rows.append((tweet.id, tweet.team_id, _as_utc(tweet.posted_at)))
+        except Exception as exc:
+            errors.append(f"Tweet {tweet.id}: {str(exc)}")
+            logger.exception("tweet_mapper_error", tweet_id=tweet.id, error=str(exc))
+    return rows
+
+
+def _load_window_index(
+    session: Session,
+    rows: list[tuple[int, int, datetime]],
+    team_ids: set[int],
+) -> GameWindowIndex:
+    """Load every candidate game for a batch of tweets in one query."""
+    from sqlalchemy import or_
+
+    from ..db import db_models
+
+    # Same per-tweet search range as before (ET date and the previous day),
+    # widened to the end of the last ET date so games stored with a real
+    # tip time on the tweet's own date are candidates too.
+    ranges = [_search_dates_for_tweet(posted_at) for _id, _team_id, posted_at in rows]
+    search_start = min(r[0] for r in ranges)
+    search_end = max(r[1] for r in ranges) + timedelta(days=1)
+
+    games = (
+        session.query(
+            db_models.SportsGame.id,
+            db_models.SportsGame.home_team_id,
+            db_models.SportsGame.away_team_id,
+            db_models.SportsGame.game_date,
+            db_models.SportsGame.end_time,
+            db_models.SportsLeague.code.label("league_code"),
+        )
+        .join(db_models.SportsLeague, db_models.SportsGame.league_id == db_models.SportsLeague.id)
+        .filter(
+            or_(
+                db_models.SportsGame.home_team_id.in_(team_ids),
+                db_models.SportsGame.away_team_id.in_(team_ids),
+            ),
+            db_models.SportsGame.game_date >= search_start,
+            db_models.SportsGame.game_date < search_end,
+        )
+        .all()
+    )
+    return GameWindowIndex(games)
+
+
+def _assign_tweets(
+    rows: list[tuple[int, int, datetime]],
+    index: GameWindowIndex,
+) -> tuple[list[dict], int, int]:
+    """Resolve a batch of tweets against the index in one pass.
+
+    Returns (update rows for a bulk UPDATE by primary key, mapped, no_game).
+    """
+    updated_at = now_utc()
+    updates: list[dict] = []
+    mapped_count = 0
+    no_game_count = 0
+
+    for tweet_id, team_id, posted_at in rows:
+        match = index.lookup(team_id, posted_at)
+        if match:
+            game_id, game_phase = match
+            updates.append({
+                "id": tweet_id,
+                "game_id": game_id,
+                "mapping_status": "mapped",
+                "game_phase": game_phase,
+                "updated_at": updated_at,
+            })
+            mapped_count += 1
+        else:
+            updates.append({
+                "id": tweet_id,
+                "mapping_status": "no_game",
+                "game_phase": GamePhase.unknown,
+                "updated_at": updated_at,
+            })
+            no_game_count += 1
+
+    return updates, mapped_count, no_game_count
+
+
+def _map_batch(session: Session, tweets: list, errors: list[str]) -> tuple[int, int]:
+    """Map one batch of tweets: one games query, one pass, one bulk UPDATE."""
+    rows = _normalize_tweets(tweets, errors)
+    if not rows:
+        return 0, 0
+    index = _load_window_index(session, rows, {team_id for _id, team_id, _posted_at in rows})
+    updates, mapped_count, no_game_count = _assign_tweets(rows, index)
+    _write_mappings(session, updates)
+    return mapped_count, no_game_count
+
+
+def _write_mappings(session: Session, updates: list[dict]) -> None:
+    """Write a batch of mappings as one executemany UPDATE keyed on id."""
+    if not updates:
+        return
+    from sqlalchemy import update
+
+    from ..db import db_models
+
+    # Mapped and no_game rows carry different column sets; group so each
+    # executemany statement has a uniform parameter shape.
+    mapped = [u for u in updates if "game_id" in u]
+    no_game = [u for u in updates if "game_id" not in u]
+    for rows in (mapped, no_game):
+        if rows:
+            session.execute(update(db_models.TeamSocialPost), rows)
+
+
 def map_unmapped_tweets(
     session: Session,
     batch_size: int = 1000,
@@ -183,11 +356,11 @@ def map_unmapped_tweets(
     """
     Assign unmapped tweets to games.
 
-    For each unmapped tweet:
-    1. Convert posted_at to ET to determine the calendar date
-    2. Search for games on that ET date and the previous day
-    3. Check if posted_at falls within a game's window (5 AM ET → end + 3h)
-    4. Set game_id and mapping_status='mapped', or 'no_game' if no match
+    Per batch of unmapped tweets (keyset-paginated by id):
+    1. Load every candidate game for the batch's teams and ET dates in one query
+    2. Build a per-team interval index of game windows (5 AM ET → end + postgame)
+    3. Resolve each tweet against the index in one pass
+    4. Write game_id/mapping_status/game_phase with one bulk UPDATE
 
     Args:
         session: Database session
@@ -196,8 +369,6 @@ def map_unmapped_tweets(
     Returns:
         Summary stats dict with mapped, no_game, errors counts
     """
-    from sqlalchemy import or_
-
     from ..db import db_models
 
     # Counters
@@ -205,15 +376,23 @@ def map_unmapped_tweets(
     mapped_count = 0
     no_game_count = 0
     errors: list[str] = []
+    last_id = 0
+    started = time.perf_counter()
 
     logger.info("tweet_mapper_start", batch_size=batch_size)
 
-    # Process in batches to avoid memory issues
     while True:
-        # Get batch of unmapped tweets
         unmapped_tweets = (
-            session.query(db_models.TeamSocialPost)
-            .filter(db_models.TeamSocialPost.mapping_status == "unmapped")
+            session.query(
+                db_models.TeamSocialPost.id,
+                db_models.TeamSocialPost.team_id,
+                db_models.TeamSocialPost.posted_at,
+            )
+            .filter(
+                db_models.TeamSocialPost.mapping_status == "unmapped",
+                db_models.TeamSocialPost.id > last_id,
+            )
+            .order_by(db_models.TeamSocialPost.id)
             .limit(batch_size)
             .all()
         )
@@ -222,73 +401,12 @@ def map_unmapped_tweets(
             break
 
         logger.debug("tweet_mapper_batch", batch_count=len(unmapped_tweets))
+        last_id = unmapped_tweets[-1].id
+        total_processed += len(unmapped_tweets)
 
-        for tweet in unmapped_tweets:
-            total_processed += 1
-
-            try:
-                # Ensure posted_at is timezone-aware
-                posted_at = tweet.posted_at
-                if posted_at.tzinfo is None:
-                    posted_at = posted_at.replace(tzinfo=UTC)
-
-                # Search for games on the tweet's ET date and previous day
-                search_start, search_end = _search_dates_for_tweet(posted_at)
-
-                potential_games = (
-                    session.query(db_models.SportsGame)
-                    .filter(
-                        or_(
-                            db_models.SportsGame.home_team_id == tweet.team_id,
-                            db_models.SportsGame.away_team_id == tweet.team_id,
-                        ),
-                        db_models.SportsGame.game_date >= search_start,
-                        db_models.SportsGame.game_date <= search_end,
-                    )
-                    .all()
-                )
-
-                # Check each potential game's window
-                matched_game = None
-                for game in potential_games:
-                    window_start, window_end = get_game_window(game)
-                    if window_start <= posted_at <= window_end:
-                        matched_game = game
-                        break
-
-                if matched_game:
-                    tweet.game_id = matched_game.id
-                    tweet.mapping_status = "mapped"
-                    tweet.game_phase = classify_game_phase(posted_at, matched_game)
-                    tweet.updated_at = now_utc()
-                    mapped_count += 1
-                    logger.debug(
-                        "tweet_mapper_matched",
-                        tweet_id=tweet.id,
-                        game_id=matched_game.id,
-                        posted_at=str(posted_at),
-                        game_phase=tweet.game_phase,
-                    )
-                else:
-                    tweet.mapping_status = "no_game"
-                    tweet.game_phase = GamePhase.unknown
-                    tweet.updated_at = now_utc()
-                    no_game_count += 1
-                    logger.debug(
-                        "tweet_mapper_no_match",
-                        tweet_id=tweet.id,
-                        team_id=tweet.team_id,
-                        posted_at=str(posted_at),
-                    )
-
-            except Exception as exc:
-                error_msg = f"Tweet {tweet.id}: {str(exc)}"
-                errors.append(error_msg)
-                logger.exception(
-                    "tweet_mapper_error",
-                    tweet_id=tweet.id,
-                    error=str(exc),
-                )
+        mapped, no_game = _map_batch(session, unmapped_tweets, errors)
+        mapped_count += mapped
+        no_game_count += no_game
 
         # Commit batch
         session.commit()
@@ -300,12 +418,14 @@ def map_unmapped_tweets(
             no_game=no_game_count,
         )
 
+    elapsed = time.perf_counter() - started
     logger.info(
         "tweet_mapper_complete",
         total_processed=total_processed,
         mapped=mapped_count,
         no_game=no_game_count,
         errors_count=len(errors),
+        tweets_per_sec=round(total_processed / elapsed, 1) if elapsed > 0 else None,
     )
 
     return {
@@ -336,7 +456,11 @@ def map_tweets_for_team(
 
     # Get unmapped tweets for this team
     unmapped_tweets = (
-        session.query(db_models.TeamSocialPost)
+        session.query(
+            db_models.TeamSocialPost.id,
+            db_models.TeamSocialPost.team_id,
+            db_models.TeamSocialPost.posted_at,
+        )
         .filter(
             db_models.TeamSocialPost.team_id == team_id,
             db_models.TeamSocialPost.mapping_status == "unmapped",
@@ -348,53 +472,8 @@ def map_tweets_for_team(
         logger.info("tweet_mapper_team_no_unmapped", team_id=team_id)
         return {"team_id": team_id, "processed": 0, "mapped": 0, "no_game": 0}
 
-    # Process each tweet
-    mapped_count = 0
-    no_game_count = 0
-
-    for tweet in unmapped_tweets:
-        posted_at = tweet.posted_at
-        if posted_at.tzinfo is None:
-            posted_at = posted_at.replace(tzinfo=UTC)
-
-        # Search for games on the tweet's ET date and previous day
-        search_start, search_end = _search_dates_for_tweet(posted_at)
-
-        potential_games = (
-            session.query(db_models.SportsGame)
-            .filter(
-                db_models.SportsGame.home_team_id == team_id,
-                db_models.SportsGame.game_date >= search_start,
-                db_models.SportsGame.game_date <= search_end,
-            )
-            .union(
-                session.query(db_models.SportsGame).filter(
-                    db_models.SportsGame.away_team_id == team_id,
-                    db_models.SportsGame.game_date >= search_start,
-                    db_models.SportsGame.game_date <= search_end,
-                )
-            )
-            .all()
-        )
-
-        matched_game = None
-        for game in potential_games:
-            window_start, window_end = get_game_window(game)
-            if window_start <= posted_at <= window_end:
-                matched_game = game
-                break
-
-        if matched_game:
-            tweet.game_id = matched_game.id
-            tweet.mapping_status = "mapped"
-            tweet.game_phase = classify_game_phase(posted_at, matched_game)
-            tweet.updated_at = now_utc()
-            mapped_count += 1
-        else:
-            tweet.mapping_status = "no_game"
-            tweet.game_phase = GamePhase.unknown
-            tweet.updated_at = now_utc()
-            no_game_count += 1
+    errors: list[str] = []
+    mapped_count, no_game_count = _map_batch(session, unmapped_tweets, errors)
 
     session.commit()
 
@@ -4,7 +4,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import time
+from collections.abc import Iterator
 from datetime import date, timedelta
 from pathlib import Path
 from typing import Any
@@ -176,6 +178,33 @@ class HTMLCache:
         logger.debug("cache_miss", url=url, path=str(cache_path), league=self.league_code)
         return None
 
+    def read(self, url: str) -> str | None:
+        """Load cached HTML exactly as stored, or None if the page was never cached.
+
+        Unlike ``get`` this applies no freshness or size heuristics — it is
+        the read path for offline re-parsing, where the cache is the only
+        source and a stale page is still better than no page.
+        """
+        cache_path = self._get_cache_path(url)
+        try:
+            return cache_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def iter_cached_files(self, prefix: str = "") -> Iterator[Path]:
+        """Stream cached HTML files for this league whose names start with ``prefix``.
+
+        Uses ``os.scandir`` so multi-season cache directories are walked
+        lazily rather than materialized as one large listing.
+        """
+        league_cache_dir = self.cache_dir / self.league_code
+        if not league_cache_dir.is_dir():
+            return
+        with os.scandir(league_cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".html") and entry.name.startswith(prefix):
+                    yield Path(entry.path)
+
     def put(self, url: str, html: str, game_date: date | None = None) -> Path | None:
         """Save HTML to cache.
 
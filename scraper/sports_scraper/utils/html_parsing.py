@@ -7,10 +7,16 @@ Generic data-type conversion (ints, floats) should live in parsing.py.
 
 from __future__ import annotations
 
+import re
+
+import lxml.html
 from bs4 import BeautifulSoup, Tag
 
 from ..logging import logger
 
+# Sports Reference ships many secondary tables inside HTML comments.
+_HTML_COMMENT = re.compile(r"<!--([\s\S]*?)-->")
+
 
 def get_stat_from_row(row: Tag, stat_name: str) -> str | None:
     """
@@ -126,3 +132,43 @@ def get_table_ids_on_page(soup: BeautifulSoup, limit: int = 15) -> list[str]:
     all_tables = soup.find_all("table")
     return [t.get("id", "no-id") for t in all_tables[:limit]]
 
+
+def uncomment_tables(html: str) -> str:
+    """Strip comment markers around commented-out tables.
+
+    Sports Reference wraps some boxscore tables in ``<!-- ... -->`` so they
+    are rendered client-side. Uncommenting them in the raw markup lets a
+    targeted parse find them without walking Comment nodes afterwards.
+    """
+
+    def _replace(match: re.Match[str]) -> str:
+        body = match.group(1)
+        return body if "<table" in body else match.group(0)
+
+    return _HTML_COMMENT.sub(_replace, html)
+
+
+def parse_html_subset(html: str, xpath: str) -> BeautifulSoup:
+    """Parse only the elements matched by ``xpath`` into a BeautifulSoup tree.
+
+    lxml builds the full document tree in C and the XPath selects the
+    subtrees we care about (scoreboard summaries, boxscore tables, PBP
+    table). Only those fragments are handed to BeautifulSoup, so the
+    expensive Python-side tree is a small fraction of the page. Existing
+    helpers that take a ``BeautifulSoup`` work unchanged on the result.
+
+    Elements nested inside another matched element are emitted once, as
+    part of their outermost match.
+    """
+    if not html.strip():
+        return BeautifulSoup("", "lxml")
+
+    tree = lxml.html.fromstring(uncomment_tables(html))
+    matched = tree.xpath(xpath)
+    selected = set(matched)
+    fragments = [
+        lxml.html.tostring(element, encoding="unicode", with_tail=False)
+        for element in matched
+        if not any(ancestor in selected for ancestor in element.iterancestors())
+    ]
+    return BeautifulSoup("".join(fragments), "lxml")
@@ -200,8 +200,11 @@ def _db_session_ctx(game_status: str = "final", has_pbp=True, has_artifacts=Fals
     return ctx
 
 
-def _run_task(*, lock_token, db_ctx=None, pipeline_result=None, pipeline_exc=None):
-    """Invoke trigger_flow_for_game with controlled mocks; return (result, mocks)."""
+def _run_task(*, lock_token, db_ctx=None, pipeline_result=None, pipeline_exc=None, with_warm=False):
+    """Invoke trigger_flow_for_game with controlled mocks; return (result, mocks).
+
+    ``with_warm=True`` appends the game-detail warm-up mock to the tuple.
+    """
     if db_ctx is None:
         db_ctx = _db_session_ctx()
 
@@ -222,6 +225,7 @@ def _run_task(*, lock_token, db_ctx=None, pipeline_result=None, pipeline_exc=Non
         ) as m_pipeline,
         patch.object(job_runs_mod, "start_job_run", return_value=1),
         patch.object(job_runs_mod, "complete_job_run"),
+        patch.object(_task_mod, "_warm_game_detail") as m_warm,
     ):
         if pipeline_exc is not None:
             with pytest.raises(type(pipeline_exc)):
@@ -230,6 +234,8 @@ def _run_task(*, lock_token, db_ctx=None, pipeline_result=None, pipeline_exc=Non
         else:
             result = _task_mod.trigger_flow_for_game(GAME_ID)
 
+    if with_warm:
+        return result, m_acquire, m_release, m_pipeline, m_set_status, m_warm
     return result, m_acquire, m_release, m_pipeline, m_set_status
 
 
@@ -363,3 +369,20 @@ class TestStateMachineTransitions:
             c for c in m_set_status.call_args_list if c.args[1] == "recap_failed"
         ]
         assert not recap_failed_calls
+
+
+class TestGameDetailWarm:
+    def test_warms_after_recap_ready(self):
+        *_, m_warm = _run_task(lock_token="tok", with_warm=True)
+        m_warm.assert_called_once_with(GAME_ID)
+
+    def test_no_warm_on_error(self):
+        *_, m_warm = _run_task(lock_token="tok", pipeline_exc=RuntimeError("api down"), with_warm=True)
+        m_warm.assert_not_called()
+
+    def test_warm_failure_is_swallowed(self):
+        with patch("httpx.Client") as client:
+            client.return_value.__enter__.return_value.get.side_effect = OSError("refused")
+            _task_mod._warm_game_detail(GAME_ID)
+        url = client.return_value.__enter__.return_value.get.call_args.args[0]
+        assert url.endswith(f"/api/admin/sports/games/{GAME_ID}")
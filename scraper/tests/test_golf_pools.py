@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import date
+import json
+from datetime import UTC, date, datetime, timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, call
 
@@ -218,6 +219,49 @@ def _empty_fetchall():
     return MagicMock(fetchall=MagicMock(return_value=[]))
 
 
+def _rows(rows):
+    return MagicMock(fetchall=MagicMock(return_value=rows))
+
+
+def _redis(previous=None):
+    """Redis mock whose hgetall returns the stored leaderboard fingerprints."""
+    r = MagicMock()
+    r.hgetall.return_value = previous or {}
+    return r
+
+
+def _lb_row(dg_id, total_score, thru=18):
+    return (dg_id, f"Player {dg_id}", "active", dg_id, total_score, thru, 70, 70, 70, 70)
+
+
+def _entry_rows(entry_id, dg_ids, updated_at=None):
+    """Rows of the entries LEFT JOIN picks query for one entry."""
+    return [
+        (entry_id, f"e{entry_id}@example.com", f"Team {entry_id}", updated_at, dg_id, f"Player {dg_id}", slot, 1)
+        for slot, dg_id in enumerate(dg_ids, start=1)
+    ]
+
+
+class TestLoadEntriesAndPicks:
+    """_load_entries_and_picks groups the single JOIN query by entry."""
+
+    def test_groups_picks_by_entry(self):
+        from sports_scraper.golf.pool_scoring import _load_entries_and_picks
+
+        session = MagicMock()
+        session.execute.return_value = _rows(
+            _entry_rows(10, [1, 2]) + _entry_rows(11, [3])
+            + [(12, "x@example.com", "No Picks", None, None, None, None, None)]
+        )
+        entries = _load_entries_and_picks(session, 1)
+
+        session.execute.assert_called_once()
+        assert [e["entry_id"] for e in entries] == [10, 11, 12]
+        assert [p["dg_id"] for p in entries[0]["picks"]] == [1, 2]
+        assert entries[1]["picks"][0] == {"dg_id": 3, "player_name": "Player 3", "pick_slot": 1, "bucket_number": 1}
+        assert entries[2]["picks"] == []
+
+
 class TestScoreAllLivePools:
     """Integration-level tests for score_all_live_pools.
 
@@ -226,6 +270,12 @@ class TestScoreAllLivePools:
     auto-activate phase is a no-op.
     """
 
+    @pytest.fixture(autouse=True)
+    def redis(self):
+        r = _redis()
+        with patch("sports_scraper.golf.pool_scoring._get_redis", return_value=r):
+            yield r
+
     def test_no_live_pools(self):
         from sports_scraper.golf.pool_scoring import score_all_live_pools
 
@@ -233,70 +283,66 @@ class TestScoreAllLivePools:
         session.execute.return_value.fetchall.return_value = []
 
         result = score_all_live_pools(session)
-        assert result == {"pools_scored": 0, "total_entries": 0}
+        assert result == {"pools_scored": 0, "total_entries": 0, "entries_rescored": 0}
 
-    def test_pool_with_entries_and_leaderboard(self):
+    def test_pool_with_entries_and_leaderboard(self, redis):
         from sports_scraper.golf.pool_scoring import score_all_live_pools
 
         session = MagicMock()
 
-        pool_rows = [(1, "CLUB1", 100, None, "live")]
-        entry_rows = [(10, "test@example.com", "Team X")]
-        pick_rows = [
-            (i, f"Player {i}", i, 1)
-            for i in range(1, 8)
-        ]
-        lb_rows = [
-            (i, f"Player {i}", "active", i, -3 + i, 18, 70, 70, 70, 70)
-            for i in range(1, 8)
-        ]
+        pool_rows = [(1, "CLUB1", 100, None, "live", None)]
+        lb_rows = [_lb_row(i, -3 + i) for i in range(1, 8)]
 
-        call_results = [
+        session.execute.side_effect = [
             _empty_fetchall(),  # auto-lock query
             _empty_fetchall(),  # auto-activate query
-            MagicMock(fetchall=MagicMock(return_value=pool_rows)),      # live pools
-            MagicMock(fetchall=MagicMock(return_value=entry_rows)),      # entries
-            MagicMock(fetchall=MagicMock(return_value=pick_rows)),       # picks
-            MagicMock(fetchall=MagicMock(return_value=lb_rows)),         # leaderboard
+            _rows(pool_rows),                      # live pools
+            _rows(_entry_rows(10, range(1, 8))),   # entries + picks
+            _rows(lb_rows),                        # leaderboard
+            MagicMock(),                           # entry scores upsert
+            MagicMock(),                           # score players upsert
+            _rows([]),                             # leaderboard doc read
+            MagicMock(),                           # leaderboard doc upsert
         ]
-        for _ in range(20):
-            call_results.append(MagicMock())
-
-        session.execute.side_effect = call_results
 
         result = score_all_live_pools(session)
         assert result["pools_scored"] == 1
         assert result["total_entries"] == 1
+        assert result["entries_rescored"] == 1
+        session.commit.assert_called_once()
+        # Fingerprints are stored for the next run's diff
+        redis.pipeline.return_value.hset.assert_called_once()
+        assert set(redis.pipeline.return_value.hset.call_args.kwargs["mapping"]) == {str(i) for i in range(1, 8)}
 
-    def test_pool_scoring_exception_rolls_back(self):
+    def test_pool_scoring_exception_rolls_back(self, redis):
         from sports_scraper.golf.pool_scoring import score_all_live_pools
 
         session = MagicMock()
-        pool_rows = [(1, "CLUB1", 100, None, "live")]
+        pool_rows = [(1, "CLUB1", 100, None, "live", None)]
 
         session.execute.side_effect = [
             _empty_fetchall(),  # auto-lock query
             _empty_fetchall(),  # auto-activate query
-            MagicMock(fetchall=MagicMock(return_value=pool_rows)),
+            _rows(pool_rows),
             Exception("DB error"),
         ]
 
         result = score_all_live_pools(session)
         assert result["pools_scored"] == 0
         session.rollback.assert_called_once()
+        redis.pipeline.assert_not_called()
 
     def test_pool_with_no_entries_skipped(self):
         from sports_scraper.golf.pool_scoring import score_all_live_pools
 
         session = MagicMock()
-        pool_rows = [(1, "CLUB1", 100, None, "live")]
-        empty_entries = []
+        pool_rows = [(1, "CLUB1", 100, None, "live", None)]
 
         session.execute.side_effect = [
             _empty_fetchall(),  # auto-lock query
             _empty_fetchall(),  # auto-activate query
-            MagicMock(fetchall=MagicMock(return_value=pool_rows)),
-            MagicMock(fetchall=MagicMock(return_value=empty_entries)),
+            _rows(pool_rows),
+            _rows([]),
         ]
 
         result = score_all_live_pools(session)
@@ -307,33 +353,206 @@ class TestScoreAllLivePools:
         from sports_scraper.golf.pool_scoring import score_all_live_pools
 
         session = MagicMock()
-        pool_rows = [(1, "CLUB1", 100, None, "live")]
-        entry_rows = [(10, "a@b.com", "Team")]
-        pick_rows = [(1, "P1", 1, 1)]
-        empty_lb = []
+        pool_rows = [(1, "CLUB1", 100, None, "live", None)]
 
         session.execute.side_effect = [
             _empty_fetchall(),  # auto-lock query
             _empty_fetchall(),  # auto-activate query
-            MagicMock(fetchall=MagicMock(return_value=pool_rows)),
-            MagicMock(fetchall=MagicMock(return_value=entry_rows)),
-            MagicMock(fetchall=MagicMock(return_value=pick_rows)),
-            MagicMock(fetchall=MagicMock(return_value=empty_lb)),
+            _rows(pool_rows),
+            _rows(_entry_rows(10, [1])),
+            _rows([]),
         ]
 
         result = score_all_live_pools(session)
         assert result["pools_scored"] == 0
 
 
-class TestUpsertEntryScore:
-    """Test _upsert_entry_score calls session.execute."""
+class TestIncrementalScoring:
+    """_score_pool rescores only entries touched by leaderboard changes."""
+
+    SCORED_AT = datetime(2026, 4, 10, 15, 0, tzinfo=UTC)
+
+    def _pool(self, updated_at=None):
+        return {"id": 1, "club_code": "C", "tournament_id": 100, "rules_json": {"count_best": 1, "min_cuts_to_qualify": 1}, "status": "live", "updated_at": updated_at}
+
+    def _entries(self):
+        # Entry 10 picked golfer 1, entry 11 picked golfer 2, entry 12 picked golfer 3
+        from sports_scraper.golf.pool_scoring import _load_entries_and_picks
+
+        session = MagicMock()
+        session.execute.return_value = _rows(_entry_rows(10, [1]) + _entry_rows(11, [2]) + _entry_rows(12, [3]))
+        return _load_entries_and_picks(session, 1)
+
+    def _leaderboard(self, scores):
+        return {
+            dg_id: {"dg_id": dg_id, "player_name": f"P{dg_id}", "status": "active", "position": None,
+                    "total_score": score, "thru": 18, "r1": 70, "r2": 70, "r3": 70, "r4": 70}
+            for dg_id, score in scores.items()
+        }
+
+    def _prior_rows(self, ranks):
+        # entry_id, aggregate, qualified, counted, status, complete, rank, tied, last_scored_at
+        return [
+            (entry_id, score, 1, 1, "qualified", True, rank, False, self.SCORED_AT)
+            for entry_id, (score, rank) in ranks.items()
+        ]
+
+    def _run(self, leaderboard, previous_lb, prior, *, pool=None, entries=None):
+        from sports_scraper.golf.pool_scoring import _fingerprint, _score_pool
 
-    def test_upsert_calls_execute(self):
-        from sports_scraper.golf.pool_scoring import _upsert_entry_score
+        previous = {str(k): _fingerprint(v) for k, v in previous_lb.items()} if previous_lb else {}
+        session = MagicMock()
+        # prior scores, then up to: entry upsert, player upsert, doc read, doc upsert
+        session.execute.side_effect = [_rows(prior)] + [MagicMock() for _ in range(4)]
+        with patch("sports_scraper.golf.pool_scoring._get_redis", return_value=_redis(previous)):
+            rescored, _ = _score_pool(session, pool or self._pool(), entries or self._entries(), leaderboard)
+        return rescored, session
+
+    def _written_params(self, session, call_index):
+        return session.execute.call_args_list[call_index].args[1]
+
+    def test_only_entries_holding_changed_golfer_rescored(self):
+        before = self._leaderboard({1: -5, 2: -3, 3: -1})
+        after = self._leaderboard({1: -5, 2: -4, 3: -1})
+        prior = self._prior_rows({10: (-5, 1), 11: (-3, 2), 12: (-1, 3)})
+
+        rescored, session = self._run(after, before, prior)
+
+        assert rescored == 1
+        entry_params = self._written_params(session, 1)
+        assert entry_params["entry_id_0"] == 11
+        assert entry_params["aggregate_score_0"] == -4
+        assert "entry_id_1" not in entry_params
+        player_params = self._written_params(session, 2)
+        assert player_params["dg_id_0"] == 2
+        assert "dg_id_1" not in player_params
+
+    def test_rank_change_rewrites_untouched_entry_score_only(self):
+        before = self._leaderboard({1: -5, 2: -3, 3: -1})
+        after = self._leaderboard({1: -5, 2: -3, 3: -9})
+        prior = self._prior_rows({10: (-5, 1), 11: (-3, 2), 12: (-1, 3)})
+
+        rescored, session = self._run(after, before, prior)
+
+        assert rescored == 1
+        entry_params = self._written_params(session, 1)
+        written = {entry_params[f"entry_id_{i}"]: entry_params[f"rank_{i}"] for i in range(3)}
+        assert written == {12: 1, 10: 2, 11: 3}
+        # Player rows only for the rescored entry
+        assert self._written_params(session, 2)["entry_id_0"] == 12
+        assert "entry_id_1" not in self._written_params(session, 2)
+
+    def test_unchanged_leaderboard_writes_nothing(self):
+        lb = self._leaderboard({1: -5, 2: -3, 3: -1})
+        prior = self._prior_rows({10: (-5, 1), 11: (-3, 2), 12: (-1, 3)})
+
+        rescored, session = self._run(lb, lb, prior)
+
+        assert rescored == 0
+        # Prior scores load + ranking document existence check, no writes
+        assert session.execute.call_count == 2
 
+    def test_missing_state_rescores_everything(self):
+        lb = self._leaderboard({1: -5, 2: -3, 3: -1})
+        rescored, session = self._run(lb, None, [])
+        assert rescored == 3
+        # No previous state: prior scores are not even loaded
+        assert session.execute.call_count == 4
+
+    def test_pool_edited_since_last_score_rescores_everything(self):
+        lb = self._leaderboard({1: -5, 2: -3, 3: -1})
+        prior = self._prior_rows({10: (-5, 1), 11: (-3, 2), 12: (-1, 3)})
+        pool = self._pool(updated_at=self.SCORED_AT + timedelta(minutes=1))
+        rescored, _ = self._run(lb, lb, prior, pool=pool)
+        assert rescored == 3
+
+    def test_new_entry_rescored(self):
+        lb = self._leaderboard({1: -5, 2: -3, 3: -1})
+        prior = self._prior_rows({10: (-5, 1), 11: (-3, 2)})
+        rescored, session = self._run(lb, lb, prior)
+        assert rescored == 1
+        assert self._written_params(session, 2)["entry_id_0"] == 12
+
+    def test_redis_failure_falls_back_to_full_rescore(self):
+        from sports_scraper.golf.pool_scoring import _score_pool
+
+        lb = self._leaderboard({1: -5, 2: -3, 3: -1})
+        broken = MagicMock()
+        broken.hgetall.side_effect = ConnectionError("down")
         session = MagicMock()
-        scored = {
-            "entry_id": 10,
+        with patch("sports_scraper.golf.pool_scoring._get_redis", return_value=broken):
+            rescored, _ = _score_pool(session, self._pool(), self._entries(), lb)
+        assert rescored == 3
+
+    def test_changed_golfers_includes_added_and_removed(self):
+        from sports_scraper.golf.pool_scoring import _changed_golfers
+
+        assert _changed_golfers({1: "a", 2: "b", 4: "d"}, {1: "a", 2: "x", 3: "c"}) == {2, 3, 4}
+
+
+class TestLeaderboardDocument:
+    """The precomputed ranking document served by the leaderboard endpoint."""
+
+    def _doc_row(self, entry_id, rank, dg_id, slot):
+        scored_at = datetime(2026, 4, 10, 15, 0, tzinfo=UTC)
+        score = (entry_id, f"e{entry_id}@example.com", f"Team {entry_id}", -6, 5, 5, "qualified", False, rank, False, scored_at)
+        if dg_id is None:
+            return score + (None,) * 15
+        return score + (dg_id, f"P{dg_id}", slot, 1, "active", 2, -3, 14, 68, 69, None, None, True, True, False)
+
+    def test_builds_and_bumps_version(self):
+        from app.db.golf_pools import LEADERBOARD_DOC_FORMAT
+
+        from sports_scraper.golf.pool_scoring import _write_leaderboard_doc
+
+        session = MagicMock()
+        session.execute.side_effect = [
+            _rows([self._doc_row(10, 1, 1, 1), self._doc_row(10, 1, 2, 2), self._doc_row(11, 2, None, None)]),
+            MagicMock(),
+        ]
+        assert _write_leaderboard_doc(session, 1) == 2
+
+        sql, params = str(session.execute.call_args.args[0]), session.execute.call_args.args[1]
+        assert "version        = golf_pool_leaderboards.version + 1" in sql
+        assert params["format_version"] == LEADERBOARD_DOC_FORMAT
+        assert params["entry_count"] == 2
+        doc = json.loads(params["leaderboard"])
+        assert [e["entry_id"] for e in doc] == [10, 11]
+        assert [p["dg_id"] for p in doc[0]["picks"]] == [1, 2]
+        assert doc[0]["picks"][0]["made_cut"] is True
+        assert doc[0]["last_scored_at"] == "2026-04-10T15:00:00+00:00"
+        assert doc[1]["picks"] == []
+
+    def test_unchanged_pool_writes_missing_document(self):
+        from sports_scraper.golf.pool_scoring import _fingerprint, _score_pool
+
+        lb = {1: {"dg_id": 1, "player_name": "P1", "status": "active", "position": 1, "total_score": -2,
+                  "thru": 18, "r1": 70, "r2": 70, "r3": 70, "r4": 70}}
+        scored_at = datetime(2026, 4, 10, 15, 0, tzinfo=UTC)
+        session = MagicMock()
+        session.execute.side_effect = [
+            _rows([(10, -2, 1, 1, "qualified", True, 1, False, scored_at)]),  # prior scores
+            MagicMock(fetchone=MagicMock(return_value=None)),                  # no document yet
+            _rows([]),                                                          # document read
+            MagicMock(),                                                        # document upsert
+        ]
+        pool = {"id": 1, "club_code": "C", "tournament_id": 100, "rules_json": {"count_best": 1, "min_cuts_to_qualify": 1},
+                "status": "live", "updated_at": None}
+        entries = [{"entry_id": 10, "email": "x", "entry_name": "X", "updated_at": None,
+                    "picks": [{"dg_id": 1, "player_name": "P1", "pick_slot": 1, "bucket_number": 1}]}]
+        with patch("sports_scraper.golf.pool_scoring._get_redis", return_value=_redis({"1": _fingerprint(lb[1])})):
+            rescored, _ = _score_pool(session, pool, entries, lb)
+
+        assert rescored == 0
+        assert "golf_pool_leaderboards" in str(session.execute.call_args.args[0])
+
+
+class TestUpsertEntryScores:
+    """Test _upsert_entry_scores issues one multi-row statement per chunk."""
+
+    def _scored(self, entry_id):
+        return {
+            "entry_id": entry_id,
             "rank": 1,
             "is_tied": False,
             "aggregate_score": -10,
@@ -342,14 +561,39 @@ class TestUpsertEntryScore:
             "qualification_status": "qualified",
             "is_complete": True,
         }
-        _upsert_entry_score(session, 1, scored)
+
+    def test_upsert_calls_execute_once(self):
+        from sports_scraper.golf.pool_scoring import _upsert_entry_scores
+
+        session = MagicMock()
+        _upsert_entry_scores(session, 1, [self._scored(10), self._scored(11)])
         session.execute.assert_called_once()
+        sql, params = str(session.execute.call_args.args[0]), session.execute.call_args.args[1]
+        assert "ON CONFLICT (entry_id)" in sql
+        assert params["entry_id_0"] == 10
+        assert params["entry_id_1"] == 11
+        assert params["pool_id_1"] == 1
+
+    def test_chunks_large_batches(self):
+        from sports_scraper.golf import pool_scoring
+
+        session = MagicMock()
+        with patch.object(pool_scoring, "_UPSERT_CHUNK", 2):
+            pool_scoring._upsert_entry_scores(session, 1, [self._scored(i) for i in range(5)])
+        assert session.execute.call_count == 3
+
+    def test_empty_is_noop(self):
+        from sports_scraper.golf.pool_scoring import _upsert_entry_scores
+
+        session = MagicMock()
+        _upsert_entry_scores(session, 1, [])
+        session.execute.assert_not_called()
 
 
 class TestUpsertScorePlayers:
-    """Test _upsert_score_players calls session.execute per pick."""
+    """Test _upsert_score_players writes all picks in one statement."""
 
-    def test_upsert_per_pick(self):
+    def test_upsert_all_picks(self):
         from sports_scraper.golf.pool_scoring import _upsert_score_players
 
         session = MagicMock()
@@ -365,8 +609,56 @@ class TestUpsertScorePlayers:
                 "counts_toward_total": False, "is_dropped": True,
             },
         ]
-        _upsert_score_players(session, 1, 10, picks)
-        assert session.execute.call_count == 2
+        _upsert_score_players(session, 1, [{"entry_id": 10, "picks": picks}])
+        session.execute.assert_called_once()
+        sql, params = str(session.execute.call_args.args[0]), session.execute.call_args.args[1]
+        assert "ON CONFLICT (entry_id, dg_id)" in sql
+        assert params["dg_id_1"] == 2
+        assert params["player_name_snapshot_0"] == "P1"
+        assert params["entry_id_1"] == 10
+
+    def test_duplicate_golfer_collapses_to_one_row(self):
+        from sports_scraper.golf.pool_scoring import _upsert_score_players
+
+        session = MagicMock()
+        pick = {
+            "dg_id": 7, "player_name": "P7", "status": "active", "made_cut": True,
+            "counts_toward_total": True, "is_dropped": False,
+        }
+        picks = [{**pick, "pick_slot": 1}, {**pick, "pick_slot": 3}]
+        scored = [{"entry_id": 10, "picks": picks}, {"entry_id": 11, "picks": picks[:1]}]
+        _upsert_score_players(session, 1, scored)
+
+        session.execute.assert_called_once()
+        params = session.execute.call_args.args[1]
+        keys = {(params[f"entry_id_{i}"], params[f"dg_id_{i}"]) for i in range(2)}
+        assert keys == {(10, 7), (11, 7)}
+        assert "entry_id_2" not in params
+        assert params["pick_slot_0"] == 3
+
+
+class TestScoreSinglePool:
+    def test_always_full_rescore(self):
+        from sports_scraper.golf.pool_scoring import score_single_pool
+
+        session = MagicMock()
+        pool_row = (1, "CLUB1", 100, None, "live", None)
+        session.execute.side_effect = [
+            MagicMock(fetchone=MagicMock(return_value=pool_row)),
+            _rows(_entry_rows(10, [1]) + _entry_rows(11, [2])),
+            _rows([_lb_row(1, -2), _lb_row(2, -1)]),
+            MagicMock(),
+            MagicMock(),
+            _rows([]),
+            MagicMock(),
+        ]
+        r = _redis()
+        with patch("sports_scraper.golf.pool_scoring._get_redis", return_value=r):
+            result = score_single_pool(session, 1)
+
+        assert result == {"pool_id": 1, "entries_scored": 2}
+        r.hgetall.assert_not_called()
+        r.pipeline.return_value.execute.assert_called_once()
 
 
 # ============================================================================
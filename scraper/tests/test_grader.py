@@ -583,6 +583,14 @@ class TestGenericPhrasesModule:
         density = phrase_density(text)
         assert density > 0.0
 
+    def test_find_occurrences_reports_positions(self) -> None:
+        from sports_scraper.pipeline.grader_rules.generic_phrases import find_occurrences
+
+        text = "They gave it their all. Then they Gave It Their All again."
+        found = [m for m in find_occurrences(text) if m.phrase == "gave it their all"]
+        assert [text.lower()[m.start:m.end] for m in found] == ["gave it their all"] * 2
+        assert found[0].start == 5
+
 
 # ── Tier 1: resolution_specificity ───────────────────────────────────────────
 
@@ -0,0 +1,256 @@
+"""Tests for offline HTML cache re-parsing and targeted HTML parsing."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bs4 import BeautifulSoup
+
+from sports_scraper.scrapers.base import BOXSCORE_XPATH, PBP_XPATH, CacheMissError
+from sports_scraper.scrapers.nba_bref import NBABasketballReferenceScraper
+from sports_scraper.scrapers.nba_bref_helpers import parse_pbp_table
+from sports_scraper.services import html_reparse
+from sports_scraper.utils.cache import HTMLCache
+from sports_scraper.utils.html_parsing import parse_html_subset, uncomment_tables
+
+SCOREBOARD_HTML = """
+<html><body><div id="wrap"><div id="content">
+<div class="game_summary expanded nohover">
+  <table class="teams"><tbody>
+    <tr class="loser"><td><a href="/teams/BOS/2025.html">Boston Celtics</a></td><td class="right">101</td></tr>
+    <tr class="winner"><td><a href="/teams/NYK/2025.html">New York Knicks</a></td><td class="right">110</td></tr>
+  </tbody></table>
+  <p class="links"><a href="/boxscores/202410220NYK.html">Box Score</a></p>
+</div>
+<div class="filler">{filler}</div>
+</div></div></body></html>
+"""
+
+BOXSCORE_HTML = """
+<html><body><div id="wrap">
+<div class="scorebox">
+  <div><strong><a itemprop="name" href="/teams/BOS/2025.html">Boston Celtics</a></strong></div>
+  <div><strong><a itemprop="name" href="/teams/NYK/2025.html">New York Knicks</a></strong></div>
+</div>
+<table id="box-BOS-game-basic"><tbody>
+  <tr><th data-stat="player"><a href="/players/t/tatumja01.html">Jayson Tatum</a></th>
+      <td data-stat="mp">36:00</td><td data-stat="pts">30</td></tr>
+</tbody><tfoot><tr><th data-stat="player">Team Totals</th><td data-stat="pts">101</td></tr></tfoot></table>
+<div class="placeholder"></div>
+<!--
+<table id="box-NYK-game-basic"><tbody>
+  <tr><th data-stat="player"><a href="/players/b/brunsja01.html">Jalen Brunson</a></th>
+      <td data-stat="mp">38:00</td><td data-stat="pts">35</td></tr>
+</tbody><tfoot><tr><th data-stat="player">Team Totals</th><td data-stat="pts">110</td></tr></tfoot></table>
+-->
+<!-- a comment without tables -->
+</div></body></html>
+"""
+
+PBP_HTML = """
+<html><body><div id="all_pbp"><table id="pbp">
+<tr id="q1"><th colspan="6">1st Quarter</th></tr>
+<tr><td>12:00.0</td><td>Jump ball</td><td></td><td>0-0</td><td></td><td></td></tr>
+<tr><td>11:40.0</td><td>Tatum makes 2-pt jump shot</td><td></td><td>2-0</td><td></td><td></td></tr>
+</table></div></body></html>
+"""
+
+
+def _write_cache(tmp_path: Path) -> Path:
+    league_dir = tmp_path / "NBA"
+    league_dir.mkdir()
+    (league_dir / "scoreboard_month10_day22_year2024.html").write_text(
+        SCOREBOARD_HTML.format(filler="x" * 6000)
+    )
+    (league_dir / "scoreboard_month10_day23_year2024.html").write_text(
+        SCOREBOARD_HTML.format(filler="")
+    )
+    (league_dir / "202410220NYK.html").write_text(BOXSCORE_HTML)
+    (league_dir / "pbp_202410220NYK.html").write_text(PBP_HTML)
+    (league_dir / "notes.txt").write_text("ignored")
+    return tmp_path
+
+
+class TestTargetedParsing:
+    def test_uncomment_tables_only_touches_table_comments(self):
+        result = uncomment_tables(BOXSCORE_HTML)
+        assert "<!--\n<table" not in result
+        assert 'id="box-NYK-game-basic"' in result
+        assert "<!-- a comment without tables -->" in result
+
+    def test_subset_keeps_scorebox_and_commented_tables(self):
+        soup = parse_html_subset(BOXSCORE_HTML, BOXSCORE_XPATH)
+        assert soup.find("div", class_="scorebox") is not None
+        assert soup.find("table", id="box-BOS-game-basic") is not None
+        assert soup.find("table", id="box-NYK-game-basic") is not None
+        assert soup.find("div", id="wrap") is None
+
+    def test_subset_emits_nested_matches_once(self):
+        soup = parse_html_subset(PBP_HTML, PBP_XPATH)
+        assert len(soup.find_all("table", id="pbp")) == 1
+        assert len(parse_pbp_table(soup)) == 2
+
+    def test_pbp_subset_matches_parse_pbp_table_fallback(self):
+        html = PBP_HTML.replace('<div id="all_pbp">', "<div>").replace('id="pbp"', 'id="PBP_full"')
+        assert len(parse_pbp_table(parse_html_subset(html, PBP_XPATH))) == 2
+
+    def test_subset_of_empty_document(self):
+        assert parse_html_subset("", PBP_XPATH).find("table") is None
+
+
+class TestHTMLCacheOffline:
+    def test_read_ignores_freshness_policy(self, tmp_path):
+        _write_cache(tmp_path)
+        cache = HTMLCache(tmp_path, "NBA", force_refresh=True)
+        url = "https://www.basketball-reference.com/boxscores/202410220NYK.html"
+        assert cache.get(url) is None
+        assert "scorebox" in cache.read(url)
+
+    def test_read_missing(self, tmp_path):
+        cache = HTMLCache(tmp_path, "NBA")
+        assert cache.read("https://www.basketball-reference.com/boxscores/nope.html") is None
+
+    def test_iter_cached_files(self, tmp_path):
+        _write_cache(tmp_path)
+        cache = HTMLCache(tmp_path, "NBA")
+        names = sorted(p.name for p in cache.iter_cached_files("scoreboard_"))
+        assert names == [
+            "scoreboard_month10_day22_year2024.html",
+            "scoreboard_month10_day23_year2024.html",
+        ]
+        assert len(list(cache.iter_cached_files())) == 4
+        assert list(HTMLCache(tmp_path, "NHL").iter_cached_files()) == []
+
+
+@pytest.fixture
+def offline_cache(tmp_path):
+    _write_cache(tmp_path)
+    html_reparse._worker_scrapers.clear()
+    with patch.object(html_reparse.settings.scraper_config, "html_cache_dir", str(tmp_path)):
+        yield tmp_path
+    html_reparse._worker_scrapers.clear()
+
+
+class TestOfflineScraper:
+    def test_offline_fetch_raises_on_miss(self, offline_cache):
+        scraper = NBABasketballReferenceScraper(offline=True)
+        with pytest.raises(CacheMissError):
+            scraper.fetch_html("https://www.basketball-reference.com/boxscores/missing.html")
+
+    def test_offline_never_hits_network(self, offline_cache):
+        scraper = NBABasketballReferenceScraper(offline=True)
+        scraper._fetch_from_network = MagicMock()
+        games = scraper.fetch_games_for_date(date(2024, 10, 22))
+        scraper._fetch_from_network.assert_not_called()
+        assert len(games) == 1
+        game = games[0]
+        assert game.identity.source_game_key == "202410220NYK"
+        assert {p.player_name for p in game.player_boxscores} == {"Jayson Tatum", "Jalen Brunson"}
+
+
+class TestLiveScrapeParsesWholePages:
+    def test_live_fetch_does_not_use_subsets(self, offline_cache):
+        scraper = NBABasketballReferenceScraper()
+        scraper.fetch_html = MagicMock(side_effect=lambda url, **kw: BeautifulSoup(PBP_HTML, "lxml"))
+        scraper.fetch_play_by_play("202410220NYK", date(2024, 10, 22))
+        assert "only" not in scraper.fetch_html.call_args.kwargs
+
+
+class TestReparse:
+    def test_discovery(self, offline_cache):
+        days = list(html_reparse.iter_cached_scoreboard_dates("NBA", start=date(2024, 10, 23)))
+        assert days == [date(2024, 10, 23)]
+        assert list(html_reparse.iter_cached_pbp_keys("NBA")) == ["202410220NYK"]
+
+    def test_reparse_day_reports_pages(self, offline_cache):
+        result = html_reparse.reparse_day("NBA", date(2024, 10, 22))
+        assert result.error is None
+        assert result.pages == 2
+        assert len(result.games) == 1
+
+    def test_reparse_day_skips_game_with_uncached_boxscore(self, offline_cache):
+        missing = SCOREBOARD_HTML.format(filler="").replace("202410220NYK", "202410240LAL")
+        (offline_cache / "NBA" / "scoreboard_month10_day24_year2024.html").write_text(
+            SCOREBOARD_HTML.format(filler="") + missing
+        )
+        result = html_reparse.reparse_day("NBA", date(2024, 10, 24))
+        assert result.error is None
+        assert [g.identity.source_game_key for g in result.games] == ["202410220NYK"]
+        assert result.missing_boxscores == 1
+        assert result.pages == 2
+
+    def test_reparse_day_cache_miss(self, offline_cache):
+        result = html_reparse.reparse_day("NBA", date(2024, 1, 1))
+        assert result.cache_miss is True
+        assert result.games == []
+
+    def test_reparse_boxscores_batches_commits(self, offline_cache):
+        session = MagicMock()
+        persisted = MagicMock(return_value=MagicMock(game_id=7))
+        with patch.object(html_reparse, "persist_game_payload", persisted), ThreadPoolExecutor(2) as pool:
+            stats = html_reparse.reparse_boxscores(session, "NBA", executor=pool, batch_size=10)
+
+        assert stats.games == 2
+        assert stats.persisted == 2
+        assert stats.pages == 4
+        assert session.commit.call_count == 1
+        assert stats.pages_per_sec > 0
+        assert stats.as_dict()["kind"] == "boxscores"
+
+    def test_reparse_pbp_matches_keys_in_one_lookup(self, offline_cache):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [("202410220NYK", 42)]
+        upsert = MagicMock(return_value=2)
+        with (
+            patch.object(html_reparse, "get_league_id", return_value=1),
+            patch.object(html_reparse, "upsert_plays", upsert),
+            ThreadPoolExecutor(2) as pool,
+        ):
+            stats = html_reparse.reparse_pbp(session, "NBA", executor=pool)
+
+        assert session.execute.call_count == 1
+        assert upsert.call_args.args[1] == 42
+        assert stats.plays == 2
+        assert stats.pages == 1
+
+    def test_reparse_pbp_isolates_failing_game(self):
+        session = MagicMock()
+        session.execute.return_value.all.return_value = [("A", 1), ("B", 2)]
+
+        def page(league_code, key):
+            return html_reparse._PbpResult(source_game_key=key, plays=[MagicMock()])
+
+        def upsert(session, game_id, plays, source):
+            if game_id == 1:
+                raise RuntimeError("bad row")
+            return len(plays)
+
+        with (
+            patch.object(html_reparse, "get_league_id", return_value=1),
+            patch.object(html_reparse, "iter_cached_pbp_keys", return_value=["A", "B"]),
+            patch.object(html_reparse, "reparse_pbp_page", page),
+            patch.object(html_reparse, "upsert_plays", upsert),
+            ThreadPoolExecutor(2) as pool,
+        ):
+            stats = html_reparse.reparse_pbp(session, "NBA", executor=pool)
+
+        assert session.begin_nested.call_count == 2
+        assert stats.failures == 1
+        assert stats.persisted == 1
+        assert stats.plays == 1
+        session.commit.assert_called_once()
+
+    def test_unsupported_leagues(self):
+        with pytest.raises(ValueError):
+            html_reparse.reparse_boxscores(MagicMock(), "NHL")
+        with pytest.raises(ValueError):
+            html_reparse.reparse_pbp(MagicMock(), "NCAAB")
+
+    def test_imap_bounded_yields_everything(self):
+        with ThreadPoolExecutor(2) as pool:
+            out = sorted(html_reparse._imap_bounded(pool, lambda x: x * 2, ((i,) for i in range(10)), 3))
+        assert out == [i * 2 for i in range(10)]
@@ -165,67 +165,62 @@ class TestGetAllLiveKeys:
 
 from sports_scraper.live_odds.closing_lines import (
     capture_closing_lines,
+    capture_closing_lines_batch,
     capture_closing_lines_from_provider,
 )
 
 
 class TestCaptureClosingLines:
-    @patch("sports_scraper.live_odds.closing_lines.get_session")
-    def test_skips_when_already_captured(self, mock_get_session):
+    @staticmethod
+    def _session(mock_get_session, inserted_game_ids):
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
         mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
-        # Already captured
-        mock_session.execute.return_value.scalar_one_or_none.return_value = 1
+        mock_session.execute.return_value.scalars.return_value = inserted_game_ids
+        return mock_session
+
+    @patch("sports_scraper.live_odds.closing_lines.get_session")
+    def test_returns_zero_when_nothing_inserted(self, mock_get_session):
+        # Already captured, or no pregame odds: the INSERT ... SELECT yields no rows
+        self._session(mock_get_session, [])
 
         result = capture_closing_lines(42, "NBA")
         assert result == 0
 
     @patch("sports_scraper.live_odds.closing_lines.get_session")
-    def test_returns_zero_when_no_odds(self, mock_get_session):
-        mock_session = MagicMock()
-        mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
-        mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
-        # No existing closing lines
-        mock_session.execute.return_value.scalar_one_or_none.return_value = None
-        # No pregame odds
-        mock_session.execute.return_value.scalars.return_value.all.return_value = []
+    def test_inserts_closing_lines(self, mock_get_session):
+        mock_session = self._session(mock_get_session, [42])
 
         result = capture_closing_lines(42, "NBA")
-        assert result == 0
+        assert result == 1
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_called_once()
+
 
+class TestCaptureClosingLinesBatch:
     @patch("sports_scraper.live_odds.closing_lines.get_session")
-    def test_inserts_closing_lines(self, mock_get_session):
+    def test_single_statement_with_per_game_counts(self, mock_get_session):
+        from sqlalchemy.dialects import postgresql
+
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
         mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
+        mock_session.execute.return_value.scalars.return_value = [1, 1, 1, 2]
 
-        # First execute: no existing closing lines
-        # Second execute: has odds rows
-        mock_odds_row = MagicMock()
-        mock_odds_row.source_key = "spread"
-        mock_odds_row.market_type = "spread"
-        mock_odds_row.side = "home"
-        mock_odds_row.line = -3.5
-        mock_odds_row.price = -110
-        mock_odds_row.book = "FanDuel"
-
-        call_count = [0]
-        def side_effect(stmt):
-            call_count[0] += 1
-            result = MagicMock()
-            if call_count[0] == 1:
-                result.scalar_one_or_none.return_value = None
-            elif call_count[0] == 2:
-                result.scalars.return_value.all.return_value = [mock_odds_row]
-            else:
-                result.rowcount = 1
-            return result
-        mock_session.execute.side_effect = side_effect
+        result = capture_closing_lines_batch([3, 2, 1, 2])
 
-        result = capture_closing_lines(42, "NBA")
-        assert result == 1
+        assert result == {1: 3, 2: 1, 3: 0}
+        mock_session.execute.assert_called_once()
         mock_session.commit.assert_called_once()
+        sql = str(mock_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        assert "INSERT INTO closing_lines" in sql
+        assert "SELECT" in sql and "NOT (EXISTS" in sql
+        assert "ON CONFLICT" in sql and "RETURNING closing_lines.game_id" in sql
+
+    @patch("sports_scraper.live_odds.closing_lines.get_session")
+    def test_no_games_skips_database(self, mock_get_session):
+        assert capture_closing_lines_batch([]) == {}
+        mock_get_session.assert_not_called()
 
 
 class TestCaptureClosingLinesFromProvider:
@@ -0,0 +1,160 @@
+"""Tests for the live orchestrator's batched scheduling and live-game index."""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sports_scraper.jobs import live_orchestrator
+from sports_scraper.services import live_game_index
+from sports_scraper.services.live_game_index import (
+    LIVE_GAMES_KEY,
+    LIVE_GAMES_SYNCED_KEY,
+    NotifyListener,
+    get_live_games,
+)
+
+
+def _redis(synced=True, cached=None):
+    r = MagicMock()
+    r.pipeline.return_value.execute.return_value = [int(synced), cached or {}]
+    return r
+
+
+def _listener(result):
+    listener = MagicMock()
+    listener.drain.return_value = result
+    return listener
+
+
+def _session_factory(rows):
+    session = MagicMock()
+    query = session.query.return_value.join.return_value.filter.return_value
+    query.all.return_value = rows
+
+    @contextmanager
+    def factory():
+        yield session
+
+    factory.session = session
+    return factory
+
+
+class TestGetLiveGames:
+    def test_steady_state_reads_cache_only(self):
+        r = _redis(cached={"1": "NBA", "2": "NHL"})
+        factory = _session_factory([])
+        live = get_live_games(r, listener=_listener(set()), session_factory=factory)
+        assert live == {1: "NBA", 2: "NHL"}
+        factory.session.query.assert_not_called()
+
+    def test_reconciles_when_marker_expired(self):
+        r = _redis(synced=False)
+        factory = _session_factory([(5, "live", "NBA")])
+        live = get_live_games(r, listener=_listener(set()), session_factory=factory)
+        assert live == {5: "NBA"}
+        pipe = r.pipeline.return_value
+        pipe.delete.assert_called_with(LIVE_GAMES_KEY)
+        pipe.hset.assert_called_with(LIVE_GAMES_KEY, mapping={"5": "NBA"})
+        assert pipe.set.call_args.args[0] == LIVE_GAMES_SYNCED_KEY
+
+    def test_reconciles_when_listener_reconnected(self):
+        r = _redis(cached={"1": "NBA"})
+        factory = _session_factory([(9, "live", "MLB")])
+        assert get_live_games(r, listener=_listener(None), session_factory=factory) == {9: "MLB"}
+
+    def test_applies_notified_changes(self):
+        r = _redis(cached={"1": "NBA", "2": "NBA"})
+        # Game 2 went final, game 3 went live, game 4 is still pregame.
+        factory = _session_factory([(2, "final", "NBA"), (3, "live", "NHL"), (4, "pregame", "NHL")])
+        live = get_live_games(r, listener=_listener({2, 3, 4}), session_factory=factory)
+
+        assert live == {1: "NBA", 3: "NHL"}
+        pipe = r.pipeline.return_value
+        pipe.hset.assert_called_once_with(LIVE_GAMES_KEY, mapping={"3": "NHL"})
+        pipe.hdel.assert_called_once_with(LIVE_GAMES_KEY, "2")
+
+
+class TestNotifyListener:
+    def test_first_drain_connects_and_requests_reconcile(self):
+        listener = NotifyListener(dsn="postgresql://x")
+        with patch.object(listener, "_connect") as connect:
+            assert listener.drain() is None
+        connect.assert_called_once()
+
+    def test_drain_collects_game_ids(self):
+        listener = NotifyListener(dsn="postgresql://x")
+        conn = MagicMock(closed=False)
+        conn.notifies.return_value = iter(
+            [
+                SimpleNamespace(payload='{"game_id": 3, "event_type": "game_score_update"}'),
+                SimpleNamespace(payload='{"game_id": 3, "event_type": "game_score_update"}'),
+                SimpleNamespace(payload="not json"),
+            ]
+        )
+        listener._conn = conn
+        assert listener.drain() == {3}
+        conn.notifies.assert_called_once_with(timeout=0)
+
+    def test_drain_failure_forces_reconcile(self):
+        listener = NotifyListener(dsn="postgresql://x")
+        conn = MagicMock(closed=False)
+        conn.notifies.side_effect = OSError("connection lost")
+        listener._conn = conn
+        assert listener.drain() is None
+        assert listener._conn is None
+
+
+class TestOrchestratorTick:
+    def test_claim_due_is_one_call(self):
+        r = MagicMock()
+        r.eval.return_value = ["odds:mainline:NBA"]
+        due = live_orchestrator._claim_due(
+            r, {"odds:mainline:NBA": 15.0, "odds:props:NBA": 45.0}, now=100.0
+        )
+        assert due == {"odds:mainline:NBA"}
+        r.eval.assert_called_once()
+        args = r.eval.call_args.args
+        assert args[1:3] == (1, live_orchestrator.SCHEDULE_KEY)
+        assert args[3:] == (100.0, live_orchestrator.SCHEDULE_TTL_S, "odds:mainline:NBA", 15.0, "odds:props:NBA", 45.0)
+
+    def test_claim_due_empty(self):
+        r = MagicMock()
+        assert live_orchestrator._claim_due(r, {}) == set()
+        r.eval.assert_not_called()
+
+    def test_tick_dispatches_only_due_lanes(self):
+        r = MagicMock()
+        r.eval.return_value = ["odds:mainline:NBA", "odds:props:NHL"]
+        mainline, props = MagicMock(), MagicMock()
+        with (
+            patch.object(live_orchestrator, "acquire_redis_lock", return_value="tok"),
+            patch.object(live_orchestrator, "release_redis_lock"),
+            patch.object(live_orchestrator, "_get_redis", return_value=r),
+            patch.object(live_orchestrator, "get_live_games", return_value={2: "NBA", 1: "NBA", 3: "NHL"}),
+            patch("sports_scraper.jobs.live_odds_tasks.poll_live_odds_mainline", mainline),
+            patch("sports_scraper.jobs.live_odds_tasks.poll_live_odds_props", props),
+        ):
+            result = live_orchestrator.live_orchestrator_tick()
+
+        assert result["dispatched"] == 2
+        assert result["leagues"] == {"NBA": 2, "NHL": 1}
+        mainline.apply_async.assert_called_once()
+        assert mainline.apply_async.call_args.kwargs["args"] == ["NBA", [1, 2]]
+        assert props.apply_async.call_args.kwargs["args"] == ["NHL", [3]]
+        assert r.eval.call_count == 1
+
+    def test_tick_without_live_games(self):
+        with (
+            patch.object(live_orchestrator, "acquire_redis_lock", return_value="tok"),
+            patch.object(live_orchestrator, "release_redis_lock"),
+            patch.object(live_orchestrator, "_get_redis", return_value=MagicMock()),
+            patch.object(live_orchestrator, "get_live_games", return_value={}),
+        ):
+            assert live_orchestrator.live_orchestrator_tick() == {"live_games": 0, "dispatched": 0}
+
+    def test_module_listener_is_process_wide(self):
+        live_game_index._listener = None
+        assert live_game_index._get_listener() is live_game_index._get_listener()
+        live_game_index._listener = None
@@ -7,6 +7,8 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 SCRAPER_ROOT = REPO_ROOT / "scraper"
 if str(SCRAPER_ROOT) not in sys.path:
@@ -156,6 +158,15 @@ class TestExtractPitcherBoxscoreData:
 
 
 class TestIngestAdvancedStatsForGame:
+    @pytest.fixture(autouse=True)
+    def materialize_lineups(self):
+        """Lineup materialization has its own tests; keep execute counts here."""
+        with patch(
+            "sports_scraper.services.mlb_lineup_materialization.materialize_game_lineups",
+            return_value=2,
+        ) as mock_materialize:
+            yield mock_materialize
+
     @staticmethod
     def _make_game(
         status="final",
@@ -380,6 +391,7 @@ class TestIngestAdvancedStatsForGame:
         assert result["rows_upserted"] == 2
         assert result["player_rows_upserted"] == 2
         assert result["pitcher_rows_upserted"] == 2
+        assert result["lineups_materialized"] == 2
 
         # Verify the client was called with the right game_pk
         mock_client.fetch_statcast_aggregates.assert_called_once_with(12345, game_status="final")
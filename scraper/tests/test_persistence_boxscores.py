@@ -447,7 +447,7 @@ class TestUpsertTeamBoxscoresWithPayload:
 class TestUpsertPlayerBoxscoresWithPayload:
     """Tests for upsert_player_boxscores with actual payloads."""
 
-    @patch("sports_scraper.persistence.boxscores.upsert_player")
+    @patch("sports_scraper.persistence.boxscores.upsert_players")
     @patch("sports_scraper.persistence.boxscores._upsert_team")
     @patch("sports_scraper.persistence.boxscores.get_league_id")
     def test_upserts_player_boxscore(self, mock_get_league_id, mock_upsert_team, mock_upsert_player):
@@ -455,7 +455,7 @@ class TestUpsertPlayerBoxscoresWithPayload:
         mock_session = MagicMock()
         mock_get_league_id.return_value = 1
         mock_upsert_team.return_value = 10
-        mock_upsert_player.return_value = 100
+        mock_upsert_player.return_value = {"123": 100}
         mock_session.execute.return_value.rowcount = 1
 
         payload = NormalizedPlayerBoxscore(
@@ -473,6 +473,72 @@ class TestUpsertPlayerBoxscoresWithPayload:
         assert result.errors == 0
         mock_upsert_player.assert_called_once()
 
+    @patch("sports_scraper.persistence.boxscores._upsert_team")
+    @patch("sports_scraper.persistence.boxscores.get_league_id")
+    def test_whole_game_is_written_in_bulk(self, mock_get_league_id, mock_upsert_team):
+        """Teams resolve once; players and boxscores are one statement each."""
+        mock_session = MagicMock()
+        mock_get_league_id.return_value = 1
+        mock_upsert_team.side_effect = lambda session, league_id, team: {"BOS": 10, "NYK": 20}[team.abbreviation]
+        mock_session.execute.return_value.rowcount = 4
+        celtics = TeamIdentity(league_code="NBA", name="Celtics", abbreviation="BOS")
+        knicks = TeamIdentity(league_code="NBA", name="Knicks", abbreviation="NYK")
+        payloads = [
+            NormalizedPlayerBoxscore(player_id=str(i), player_name=f"P{i}", team=team, points=i)
+            for i, team in enumerate([celtics, celtics, knicks, knicks])
+        ]
+
+        result = upsert_player_boxscores(mock_session, game_id=1, payloads=payloads)
+
+        assert result.inserted == 4
+        assert mock_get_league_id.call_count == 1
+        assert mock_upsert_team.call_count == 2
+        # players upsert + boxscore upsert
+        assert mock_session.execute.call_count == 2
+        player_stmt, box_stmt = (c.args[0] for c in mock_session.execute.call_args_list)
+        assert len(player_stmt.compile().params) >= 4 * 6
+        box_params = box_stmt.compile().params
+        assert {box_params[f"team_id_m{i}"] for i in range(4)} == {10, 20}
+        mock_session.query.assert_called()
+
+    @patch("sports_scraper.persistence.boxscores._upsert_team")
+    @patch("sports_scraper.persistence.boxscores.get_league_id")
+    def test_repeated_player_keeps_last_row(self, mock_get_league_id, mock_upsert_team):
+        """A player listed twice is written once (one row per conflict key)."""
+        mock_session = MagicMock()
+        mock_get_league_id.return_value = 1
+        mock_upsert_team.return_value = 10
+        team = TeamIdentity(league_code="NBA", name="Celtics", abbreviation="BOS")
+        payloads = [
+            NormalizedPlayerBoxscore(player_id="7", player_name="Brown", team=team, points=p)
+            for p in (10, 31)
+        ]
+
+        result = upsert_player_boxscores(mock_session, game_id=1, payloads=payloads)
+
+        box_params = mock_session.execute.call_args_list[-1].args[0].compile().params
+        assert "player_external_ref_m1" not in box_params
+        assert box_params["raw_stats_json_m0"]["points"] == 31
+        assert result.inserted == 1
+
+    @patch("sports_scraper.persistence.boxscores._upsert_team")
+    @patch("sports_scraper.persistence.boxscores.get_league_id")
+    def test_bulk_write_failure_counts_every_row(self, mock_get_league_id, mock_upsert_team):
+        """A failed set-based write marks all of the game's rows as errors."""
+        mock_session = MagicMock()
+        mock_get_league_id.return_value = 1
+        mock_upsert_team.return_value = 10
+        mock_session.execute.side_effect = Exception("deadlock")
+        team = TeamIdentity(league_code="NBA", name="Celtics", abbreviation="BOS")
+        payloads = [
+            NormalizedPlayerBoxscore(player_id=str(i), player_name=f"P{i}", team=team)
+            for i in range(3)
+        ]
+
+        result = upsert_player_boxscores(mock_session, game_id=1, payloads=payloads)
+
+        assert (result.inserted, result.errors) == (0, 3)
+
     @patch("sports_scraper.persistence.boxscores._upsert_team")
     @patch("sports_scraper.persistence.boxscores.get_league_id")
     def test_rejects_invalid_nhl_boxscore(self, mock_get_league_id, mock_upsert_team):
@@ -601,3 +667,39 @@ class TestUpsertPlayer:
         )
 
         assert result == 0
+
+
+class TestUpsertPlayers:
+    """Tests for the bulk upsert_players function."""
+
+    def test_single_statement_returns_id_map(self):
+        """All players go out in one RETURNING upsert keyed by external_id."""
+        from sports_scraper.persistence.boxscores import upsert_players
+
+        mock_session = MagicMock()
+        mock_session.execute.return_value = [(100, "a"), (101, "b")]
+
+        result = upsert_players(
+            mock_session,
+            league_id=1,
+            players=[
+                {"external_id": "a", "name": "Old Name"},
+                {"external_id": "b", "name": "B", "team_id": 10},
+                {"external_id": "a", "name": "New Name", "position": "G"},
+            ],
+        )
+
+        assert result == {"a": 100, "b": 101}
+        mock_session.execute.assert_called_once()
+        params = mock_session.execute.call_args.args[0].compile().params
+        assert params["name_m0"] == "New Name"
+        assert "name_m2" not in params
+
+    def test_no_players_skips_statement(self):
+        """An empty batch issues no SQL."""
+        from sports_scraper.persistence.boxscores import upsert_players
+
+        mock_session = MagicMock()
+
+        assert upsert_players(mock_session, league_id=1, players=[]) == {}
+        mock_session.execute.assert_not_called()
@@ -0,0 +1,125 @@
+"""Tests for Celery queue lanes and per-lane queue latency metrics."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from sports_scraper import queue_metrics
+from sports_scraper.celery_app import (
+    DEFAULT_QUEUE,
+    FLOW_QUEUE,
+    LIVE_QUEUE,
+    ODDS_QUEUE,
+    QUEUE_LANES,
+    QUEUE_LATENCY_BUDGET_SECONDS,
+    app,
+)
+
+
+def _request(enqueued_at=None, *, queue=LIVE_QUEUE, eta=None, via_headers=False):
+    req = SimpleNamespace(delivery_info={"routing_key": queue}, eta=eta, headers=None)
+    if enqueued_at is not None:
+        if via_headers:
+            req.headers = {queue_metrics.ENQUEUED_AT_HEADER: enqueued_at}
+        else:
+            setattr(req, queue_metrics.ENQUEUED_AT_HEADER, enqueued_at)
+    return req
+
+
+class TestRouting:
+    def test_latency_critical_tasks_have_dedicated_lanes(self):
+        routes = app.conf.task_routes
+        assert routes["live_orchestrator_tick"]["queue"] == LIVE_QUEUE
+        assert routes["poll_live_pbp"]["queue"] == LIVE_QUEUE
+        assert routes["poll_live_odds_mainline"]["queue"] == ODDS_QUEUE
+        assert routes["sync_prop_odds"]["queue"] == ODDS_QUEUE
+        assert routes["trigger_flow_for_game"]["queue"] == FLOW_QUEUE
+        assert routes["run_scrape_job"]["queue"] == DEFAULT_QUEUE
+
+    def test_routing_key_matches_queue(self):
+        for route in app.conf.task_routes.values():
+            assert route["routing_key"] == route["queue"]
+
+    def test_beat_entries_follow_lane_routes(self):
+        routes = app.conf.task_routes
+        for entry in app.conf.beat_schedule.values():
+            queue = entry.get("options", {}).get("queue")
+            if queue and entry["task"] in routes:
+                assert queue == routes[entry["task"]]["queue"], entry["task"]
+
+    def test_every_routed_queue_has_a_lane_label(self):
+        for route in app.conf.task_routes.values():
+            assert route["queue"] in QUEUE_LANES
+
+
+class TestStampEnqueueTime:
+    def test_stamps_once(self):
+        headers = {}
+        with patch.object(queue_metrics.time, "time", return_value=100.0):
+            queue_metrics.stamp_enqueue_time(headers)
+        queue_metrics.stamp_enqueue_time(headers)
+        assert headers[queue_metrics.ENQUEUED_AT_HEADER] == 100.0
+
+    def test_none_headers(self):
+        queue_metrics.stamp_enqueue_time(None)
+
+
+class TestRecordQueueLatency:
+    def test_records_with_lane_attributes(self):
+        hist = MagicMock()
+        with patch.object(queue_metrics, "_instruments", return_value=hist):
+            latency = queue_metrics.record_queue_latency(
+                "poll_live_pbp", _request(100.0), QUEUE_LANES, {}, now=100.25
+            )
+        assert latency == 0.25
+        hist.record.assert_called_once_with(
+            0.25, attributes={"lane": "live", "queue": LIVE_QUEUE, "task": "poll_live_pbp"}
+        )
+
+    def test_reads_from_headers(self):
+        latency = queue_metrics.record_queue_latency(
+            "t", _request(10.0, via_headers=True), QUEUE_LANES, {}, now=12.0
+        )
+        assert latency == 2.0
+
+    def test_measures_from_eta(self):
+        eta = datetime.fromtimestamp(130.0, tz=UTC).isoformat()
+        latency = queue_metrics.record_queue_latency(
+            "t", _request(100.0, queue=ODDS_QUEUE, eta=eta), QUEUE_LANES, {}, now=130.5
+        )
+        assert latency == 0.5
+
+    def test_missing_timestamp(self):
+        assert queue_metrics.record_queue_latency("t", _request(), QUEUE_LANES, {}) is None
+
+    def test_over_budget_logs_warning(self):
+        with patch.object(queue_metrics, "logger") as log:
+            queue_metrics.record_queue_latency(
+                "t", _request(100.0), QUEUE_LANES, QUEUE_LATENCY_BUDGET_SECONDS, now=103.0
+            )
+            queue_metrics.record_queue_latency(
+                "t", _request(100.0, queue=DEFAULT_QUEUE), QUEUE_LANES, QUEUE_LATENCY_BUDGET_SECONDS, now=103.0
+            )
+        log.warning.assert_called_once()
+        assert log.warning.call_args.kwargs["lane"] == "live"
+
+    def test_unknown_queue(self):
+        hist = MagicMock()
+        with patch.object(queue_metrics, "_instruments", return_value=hist):
+            queue_metrics.record_queue_latency("t", _request(1.0, queue="weird"), QUEUE_LANES, {}, now=2.0)
+        assert hist.record.call_args.kwargs["attributes"]["lane"] == "other"
+
+
+def test_enqueue_stamp_receiver_is_connected_once():
+    from celery.signals import before_task_publish
+
+    from sports_scraper import celery_app
+
+    before_task_publish.connect(celery_app.on_before_task_publish, dispatch_uid="stamp_enqueue_time")
+    handlers = [
+        ref for _, ref in before_task_publish.receivers
+        if ref() is celery_app.on_before_task_publish
+    ]
+    assert len(handlers) == 1
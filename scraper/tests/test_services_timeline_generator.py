@@ -13,6 +13,7 @@ from sports_scraper.services.timeline_generator import (
     generate_all_needed_timelines,
     generate_missing_timelines,
     generate_timeline_for_game,
+    generate_timelines_for_games,
 )
 
 
@@ -255,6 +256,52 @@ class TestGenerateTimelineForGame:
         assert result is True
 
 
+class TestGenerateTimelinesForGames:
+    """Tests for generate_timelines_for_games function."""
+
+    @staticmethod
+    def _client(mock_client_class, responses):
+        mock_client = MagicMock()
+        mock_client.post.side_effect = responses
+        mock_client_class.return_value.__enter__ = MagicMock(return_value=mock_client)
+        mock_client_class.return_value.__exit__ = MagicMock(return_value=False)
+        return mock_client
+
+    @patch("sports_scraper.services.timeline_generator.TIMELINE_BATCH_SIZE", 2)
+    @patch("sports_scraper.services.timeline_generator.httpx.Client")
+    def test_posts_game_ids_in_chunks(self, mock_client_class):
+        """Sends one request per chunk and collects the API's failures."""
+        ok = MagicMock()
+        ok.json.return_value = {"failedGameIds": []}
+        partial = MagicMock()
+        partial.json.return_value = {"failedGameIds": [103]}
+        mock_client = self._client(mock_client_class, [ok, partial])
+
+        failed = generate_timelines_for_games(
+            [100, 101, 102, 103], api_base_url="http://api:8000", reason="missing"
+        )
+
+        assert failed == [103]
+        assert mock_client.post.call_count == 2
+        url = mock_client.post.call_args_list[0].args[0]
+        assert url == "http://api:8000/api/admin/sports/timelines/generate-games"
+        bodies = [c.kwargs["json"] for c in mock_client.post.call_args_list]
+        assert [b["game_ids"] for b in bodies] == [[100, 101], [102, 103]]
+        assert bodies[0]["generation_reason"] == "missing"
+
+    @patch("sports_scraper.services.timeline_generator.TIMELINE_BATCH_SIZE", 2)
+    @patch("sports_scraper.services.timeline_generator.httpx.Client")
+    def test_failed_request_fails_whole_chunk(self, mock_client_class):
+        """A request error marks its chunk failed and moves on."""
+        ok = MagicMock()
+        ok.json.return_value = {"failedGameIds": []}
+        self._client(mock_client_class, [Exception("Connection refused"), ok])
+
+        failed = generate_timelines_for_games([100, 101, 102])
+
+        assert failed == [100, 101]
+
+
 class TestGenerateMissingTimelines:
     """Tests for generate_missing_timelines function."""
 
@@ -274,11 +321,10 @@ class TestGenerateMissingTimelines:
         assert result["games_successful"] == 0
         assert result["games_failed"] == 0
 
-    @patch("sports_scraper.services.timeline_generator.time.sleep")
-    @patch("sports_scraper.services.timeline_generator.generate_timeline_for_game")
+    @patch("sports_scraper.services.timeline_generator.generate_timelines_for_games")
     @patch("sports_scraper.services.timeline_generator.get_session")
     @patch("sports_scraper.services.timeline_generator.find_games_missing_timelines")
-    def test_processes_found_games(self, mock_find, mock_get_session, mock_generate, mock_sleep):
+    def test_processes_found_games(self, mock_find, mock_get_session, mock_generate):
         """Processes found games and returns counts."""
         mock_find.return_value = [
             (100, datetime(2024, 1, 15), "Celtics", "Lakers"),
@@ -287,7 +333,7 @@ class TestGenerateMissingTimelines:
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
         mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
-        mock_generate.return_value = True
+        mock_generate.return_value = []
 
         result = generate_missing_timelines(league_code="NBA")
 
@@ -296,11 +342,10 @@ class TestGenerateMissingTimelines:
         assert result["games_successful"] == 2
         assert result["games_failed"] == 0
 
-    @patch("sports_scraper.services.timeline_generator.time.sleep")
-    @patch("sports_scraper.services.timeline_generator.generate_timeline_for_game")
+    @patch("sports_scraper.services.timeline_generator.generate_timelines_for_games")
     @patch("sports_scraper.services.timeline_generator.get_session")
     @patch("sports_scraper.services.timeline_generator.find_games_missing_timelines")
-    def test_respects_max_games_limit(self, mock_find, mock_get_session, mock_generate, mock_sleep):
+    def test_respects_max_games_limit(self, mock_find, mock_get_session, mock_generate):
         """Respects max_games limit."""
         mock_find.return_value = [
             (100, datetime(2024, 1, 15), "Celtics", "Lakers"),
@@ -310,18 +355,17 @@ class TestGenerateMissingTimelines:
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
         mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
-        mock_generate.return_value = True
+        mock_generate.return_value = []
 
         result = generate_missing_timelines(league_code="NBA", max_games=2)
 
         assert result["games_found"] == 3
         assert result["games_processed"] == 2
 
-    @patch("sports_scraper.services.timeline_generator.time.sleep")
-    @patch("sports_scraper.services.timeline_generator.generate_timeline_for_game")
+    @patch("sports_scraper.services.timeline_generator.generate_timelines_for_games")
     @patch("sports_scraper.services.timeline_generator.get_session")
     @patch("sports_scraper.services.timeline_generator.find_games_missing_timelines")
-    def test_counts_failed_games(self, mock_find, mock_get_session, mock_generate, mock_sleep):
+    def test_counts_failed_games(self, mock_find, mock_get_session, mock_generate):
         """Counts failed game generations."""
         mock_find.return_value = [
             (100, datetime(2024, 1, 15), "Celtics", "Lakers"),
@@ -330,7 +374,7 @@ class TestGenerateMissingTimelines:
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
         mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
-        mock_generate.side_effect = [True, False]  # First succeeds, second fails
+        mock_generate.return_value = [101]  # Second game fails
 
         result = generate_missing_timelines(league_code="NBA")
 
@@ -357,11 +401,10 @@ class TestGenerateAllNeededTimelines:
         assert result["games_stale"] == 0
         assert result["games_processed"] == 0
 
-    @patch("sports_scraper.services.timeline_generator.time.sleep")
-    @patch("sports_scraper.services.timeline_generator.generate_timeline_for_game")
+    @patch("sports_scraper.services.timeline_generator.generate_timelines_for_games")
     @patch("sports_scraper.services.timeline_generator.get_session")
     @patch("sports_scraper.services.timeline_generator.find_all_games_needing_timelines")
-    def test_processes_all_games(self, mock_find, mock_get_session, mock_generate, mock_sleep):
+    def test_processes_all_games(self, mock_find, mock_get_session, mock_generate):
         """Processes all found games."""
         mock_find.return_value = [
             (100, datetime(2024, 1, 15), "Celtics", "Lakers", "missing"),
@@ -370,21 +413,21 @@ class TestGenerateAllNeededTimelines:
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
         mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
-        mock_generate.return_value = True
+        mock_generate.return_value = []
 
         result = generate_all_needed_timelines(league_code="NBA")
 
+        assert [c.kwargs["reason"] for c in mock_generate.call_args_list] == ["missing", "pbp_updated"]
         assert result["games_found"] == 2
         assert result["games_missing"] == 1
         assert result["games_stale"] == 1
         assert result["games_processed"] == 2
         assert result["games_successful"] == 2
 
-    @patch("sports_scraper.services.timeline_generator.time.sleep")
-    @patch("sports_scraper.services.timeline_generator.generate_timeline_for_game")
+    @patch("sports_scraper.services.timeline_generator.generate_timelines_for_games")
     @patch("sports_scraper.services.timeline_generator.get_session")
     @patch("sports_scraper.services.timeline_generator.find_all_games_needing_timelines")
-    def test_respects_max_games(self, mock_find, mock_get_session, mock_generate, mock_sleep):
+    def test_respects_max_games(self, mock_find, mock_get_session, mock_generate):
         """Respects max_games limit."""
         mock_find.return_value = [
             (100, datetime(2024, 1, 15), "Celtics", "Lakers", "missing"),
@@ -394,7 +437,7 @@ class TestGenerateAllNeededTimelines:
         mock_session = MagicMock()
         mock_get_session.return_value.__enter__ = MagicMock(return_value=mock_session)
         mock_get_session.return_value.__exit__ = MagicMock(return_value=False)
-        mock_generate.return_value = True
+        mock_generate.return_value = []
 
         result = generate_all_needed_timelines(league_code="NBA", max_games=2)
 
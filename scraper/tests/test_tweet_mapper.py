@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 from sports_scraper.social.models import GamePhase
 from sports_scraper.social.tweet_mapper import (
+    GameWindowIndex,
     _game_duration_hours,
     _search_dates_for_tweet,
     classify_game_phase,
@@ -266,10 +267,35 @@ class TestClassifyGamePhase:
 # ---------------------------------------------------------------------------
 # map_unmapped_tweets
 # ---------------------------------------------------------------------------
+def _bulk_session(tweet_batches, games):
+    """Session mock for map_unmapped_tweets: keyset tweet batches + one games query per batch."""
+    session = MagicMock()
+    tweets_q = session.query.return_value.filter.return_value.order_by.return_value.limit.return_value
+    tweets_q.all.side_effect = list(tweet_batches) + [[]]
+    session.query.return_value.join.return_value.filter.return_value.all.return_value = games
+    return session
+
+
+def _team_session(tweets, games):
+    """Session mock for map_tweets_for_team."""
+    session = MagicMock()
+    session.query.return_value.filter.return_value.all.return_value = tweets
+    session.query.return_value.join.return_value.filter.return_value.all.return_value = games
+    return session
+
+
+def _written(session) -> dict[int, dict]:
+    """Collect rows passed to bulk UPDATE statements, keyed by tweet id."""
+    rows = {}
+    for call_ in session.execute.call_args_list:
+        for row in call_.args[1]:
+            rows[row["id"]] = row
+    return rows
+
+
 class TestMapUnmappedTweets:
     @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_maps_tweet_to_matching_game(self, mock_db, mock_now):
+    def test_maps_tweet_to_matching_game(self, mock_now):
         game = _make_game(
             id=10,
             game_date=_utc(2025, 6, 15, 19, 0),
@@ -279,98 +305,139 @@ class TestMapUnmappedTweets:
             team_id=100,
             posted_at=_utc(2025, 6, 15, 20, 0),
         )
+        session = _bulk_session([[tweet]], [game])
 
-        session = MagicMock()
-        # First call returns tweets, second call returns empty (end loop)
-        session.query.return_value.filter.return_value.limit.return_value.all.side_effect = [
-            [tweet], []
-        ]
-        session.query.return_value.filter.return_value.all.return_value = [game]
-
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            result = map_unmapped_tweets(session)
+        result = map_unmapped_tweets(session)
 
         assert result["mapped"] == 1
         assert result["no_game"] == 0
-        assert tweet.mapping_status == "mapped"
-        assert tweet.game_id == 10
+        row = _written(session)[tweet.id]
+        assert row["mapping_status"] == "mapped"
+        assert row["game_id"] == 10
+        assert row["game_phase"] == "in_game"
 
     @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_marks_no_game(self, mock_db, mock_now):
+    def test_marks_no_game(self, mock_now):
         tweet = _make_tweet(
             team_id=100,
             posted_at=_utc(2025, 6, 15, 20, 0),
         )
+        session = _bulk_session([[tweet]], [])
 
-        session = MagicMock()
-        session.query.return_value.filter.return_value.limit.return_value.all.side_effect = [
-            [tweet], []
-        ]
-        # No matching games
-        session.query.return_value.filter.return_value.all.return_value = []
-
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            result = map_unmapped_tweets(session)
+        result = map_unmapped_tweets(session)
 
         assert result["no_game"] == 1
-        assert tweet.mapping_status == "no_game"
-        assert tweet.game_phase == GamePhase.unknown
+        row = _written(session)[tweet.id]
+        assert row["mapping_status"] == "no_game"
+        assert row["game_phase"] == GamePhase.unknown
+        assert "game_id" not in row
 
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_empty_batch(self, mock_db):
-        session = MagicMock()
-        session.query.return_value.filter.return_value.limit.return_value.all.return_value = []
+    def test_empty_batch(self):
+        session = _bulk_session([], [])
 
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            result = map_unmapped_tweets(session)
+        result = map_unmapped_tweets(session)
 
         assert result["total_processed"] == 0
         assert result["mapped"] == 0
         assert result["no_game"] == 0
+        session.execute.assert_not_called()
 
     @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_exception_per_tweet_logged(self, mock_db, mock_now):
+    def test_exception_per_tweet_logged(self, mock_now):
         tweet = _make_tweet(team_id=100)
         # Force an exception by making posted_at.tzinfo raise
         tweet.posted_at = MagicMock()
         tweet.posted_at.tzinfo = None
         tweet.posted_at.replace.side_effect = RuntimeError("bad datetime")
+        session = _bulk_session([[tweet]], [])
 
-        session = MagicMock()
-        session.query.return_value.filter.return_value.limit.return_value.all.side_effect = [
-            [tweet], []
-        ]
-
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            result = map_unmapped_tweets(session)
+        result = map_unmapped_tweets(session)
 
         assert len(result["errors"]) == 1
         assert result["total_processed"] == 1
+        # The bad tweet stays unmapped and keyset pagination moves past it
+        assert _written(session) == {}
 
-    @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_returns_summary_stats(self, mock_db, mock_now):
-        session = MagicMock()
-        session.query.return_value.filter.return_value.limit.return_value.all.return_value = []
+    def test_returns_summary_stats(self):
+        session = _bulk_session([], [])
 
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            result = map_unmapped_tweets(session)
+        result = map_unmapped_tweets(session)
 
         assert "total_processed" in result
         assert "mapped" in result
         assert "no_game" in result
         assert "errors" in result
 
+    @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
+    def test_one_games_query_and_one_update_per_batch(self, mock_now):
+        game = _make_game(id=10, game_date=_utc(2025, 6, 15, 23, 0), home_team_id=100, away_team_id=200)
+        tweets = [
+            _make_tweet(id=i, team_id=100 if i % 2 else 200, posted_at=_utc(2025, 6, 15, 18 + i % 6, 0))
+            for i in range(1, 51)
+        ]
+        session = _bulk_session([tweets], [game])
+
+        result = map_unmapped_tweets(session)
+
+        assert result["mapped"] == 50
+        assert session.query.return_value.join.return_value.filter.return_value.all.call_count == 1
+        assert session.execute.call_count == 1
+        assert session.commit.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# GameWindowIndex
+# ---------------------------------------------------------------------------
+class TestGameWindowIndex:
+    def test_lookup_by_team(self):
+        game = _make_game(id=10, game_date=_utc(2025, 6, 15, 23, 0), home_team_id=100, away_team_id=200)
+        index = GameWindowIndex([game])
+        assert index.lookup(100, _utc(2025, 6, 15, 22, 0)) == (10, "pregame")
+        assert index.lookup(200, _utc(2025, 6, 16, 0, 0)) == (10, "in_game")
+        assert index.lookup(300, _utc(2025, 6, 16, 0, 0)) is None
+
+    def test_window_bounds_match_get_game_window(self):
+        game = _make_game(id=10, game_date=_utc(2025, 6, 15, 23, 0))
+        window_start, window_end = get_game_window(game)
+        index = GameWindowIndex([game])
+        assert index.lookup(100, window_start) is not None
+        assert index.lookup(100, window_end) == (10, "postgame")
+        assert index.lookup(100, window_start - timedelta(seconds=1)) is None
+        assert index.lookup(100, window_end + timedelta(seconds=1)) is None
+
+    def test_consecutive_days(self):
+        day1 = _make_game(id=1, game_date=_utc(2025, 6, 14, 23, 0))
+        day2 = _make_game(id=2, game_date=_utc(2025, 6, 15, 23, 0))
+        index = GameWindowIndex([day2, day1])
+        # 1 AM ET Jun 15 belongs to the Jun 14 game's postgame window
+        assert index.lookup(100, _utc(2025, 6, 15, 5, 0)) == (1, "postgame")
+        assert index.lookup(100, _utc(2025, 6, 15, 20, 0)) == (2, "pregame")
+
+    def test_doubleheader_prefers_nearest_start(self):
+        game1 = _make_game(id=1, game_date=_utc(2025, 6, 15, 17, 0), league_code="MLB")
+        game2 = _make_game(id=2, game_date=_utc(2025, 6, 15, 23, 0), league_code="MLB")
+        index = GameWindowIndex([game1, game2])
+        assert index.lookup(100, _utc(2025, 6, 15, 17, 30))[0] == 1
+        assert index.lookup(100, _utc(2025, 6, 15, 23, 30))[0] == 2
+
+    def test_same_day_real_tip_time_is_a_candidate(self):
+        """Games stored with a real tip time on the tweet's own ET date are loaded."""
+        game = _make_game(id=10, game_date=_utc(2025, 6, 15, 23, 0))
+        tweet = _make_tweet(team_id=100, posted_at=_utc(2025, 6, 15, 20, 0))
+        session = _bulk_session([[tweet]], [game])
+        map_unmapped_tweets(session)
+
+        filter_args = session.query.return_value.join.return_value.filter.call_args.args
+        upper = filter_args[2].right.value
+        assert upper > game.game_date
+
 
 # ---------------------------------------------------------------------------
 # map_tweets_for_team
 # ---------------------------------------------------------------------------
 class TestMapTweetsForTeam:
     @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_maps_for_specific_team(self, mock_db, mock_now):
+    def test_maps_for_specific_team(self, mock_now):
         game = _make_game(
             id=10,
             game_date=_utc(2025, 6, 15, 19, 0),
@@ -379,50 +446,36 @@ class TestMapTweetsForTeam:
             team_id=100,
             posted_at=_utc(2025, 6, 15, 20, 0),
         )
+        session = _team_session([tweet], [game])
 
-        session = MagicMock()
-        # Unmapped tweets query
-        session.query.return_value.filter.return_value.all.return_value = [tweet]
-        # Union query for potential games
-        session.query.return_value.filter.return_value.union.return_value.all.return_value = [game]
-
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            result = map_tweets_for_team(session, team_id=100)
+        result = map_tweets_for_team(session, team_id=100)
 
         assert result["mapped"] == 1
-        assert tweet.mapping_status == "mapped"
+        assert _written(session)[tweet.id]["mapping_status"] == "mapped"
 
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_zero_unmapped_early_return(self, mock_db):
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = []
+    def test_zero_unmapped_early_return(self):
+        session = _team_session([], [])
 
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            result = map_tweets_for_team(session, team_id=100)
+        result = map_tweets_for_team(session, team_id=100)
 
         assert result["processed"] == 0
         assert result["mapped"] == 0
         assert result["no_game"] == 0
 
     @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_no_matching_game_marks_no_game(self, mock_db, mock_now):
+    def test_no_matching_game_marks_no_game(self, mock_now):
         tweet = _make_tweet(
             team_id=100,
             posted_at=_utc(2025, 6, 15, 20, 0),
         )
+        session = _team_session([tweet], [])
 
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [tweet]
-        # No matching games from union query
-        session.query.return_value.filter.return_value.union.return_value.all.return_value = []
-
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            result = map_tweets_for_team(session, team_id=100)
+        result = map_tweets_for_team(session, team_id=100)
 
         assert result["no_game"] == 1
-        assert tweet.mapping_status == "no_game"
-        assert tweet.game_phase == GamePhase.unknown
+        row = _written(session)[tweet.id]
+        assert row["mapping_status"] == "no_game"
+        assert row["game_phase"] == GamePhase.unknown
 
 
 # ---------------------------------------------------------------------------
@@ -432,46 +485,37 @@ class TestGamePhaseUnknownForUnresolvablePosts:
     """Posts that cannot be matched to a game always get GamePhase.unknown."""
 
     @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_no_game_in_window_emits_unknown_via_map_unmapped(self, mock_db, mock_now):
+    def test_no_game_in_window_emits_unknown_via_map_unmapped(self, mock_now):
         """map_unmapped_tweets: tweet outside every game window → GamePhase.unknown, never None."""
         tweet = _make_tweet(
             team_id=100,
             posted_at=_utc(2025, 6, 15, 20, 0),
         )
-        session = MagicMock()
-        session.query.return_value.filter.return_value.limit.return_value.all.side_effect = [
-            [tweet], []
-        ]
-        session.query.return_value.filter.return_value.all.return_value = []
+        session = _bulk_session([[tweet]], [])
 
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            map_unmapped_tweets(session)
+        map_unmapped_tweets(session)
 
-        assert tweet.game_phase is not None
-        assert tweet.game_phase == GamePhase.unknown
+        phase = _written(session)[tweet.id]["game_phase"]
+        assert phase is not None
+        assert phase == GamePhase.unknown
 
     @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_no_game_in_window_emits_unknown_via_map_for_team(self, mock_db, mock_now):
+    def test_no_game_in_window_emits_unknown_via_map_for_team(self, mock_now):
         """map_tweets_for_team: tweet outside every game window → GamePhase.unknown, never None."""
         tweet = _make_tweet(
             team_id=100,
             posted_at=_utc(2025, 6, 15, 20, 0),
         )
-        session = MagicMock()
-        session.query.return_value.filter.return_value.all.return_value = [tweet]
-        session.query.return_value.filter.return_value.union.return_value.all.return_value = []
+        session = _team_session([tweet], [])
 
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            map_tweets_for_team(session, team_id=100)
+        map_tweets_for_team(session, team_id=100)
 
-        assert tweet.game_phase is not None
-        assert tweet.game_phase == GamePhase.unknown
+        phase = _written(session)[tweet.id]["game_phase"]
+        assert phase is not None
+        assert phase == GamePhase.unknown
 
     @patch("sports_scraper.social.tweet_mapper.now_utc", return_value=_utc(2025, 6, 15, 23, 0))
-    @patch("sports_scraper.social.tweet_mapper.db_models", create=True)
-    def test_tweet_outside_all_candidate_windows_emits_unknown(self, mock_db, mock_now):
+    def test_tweet_outside_all_candidate_windows_emits_unknown(self, mock_now):
         """Candidate games exist but tweet timestamp falls outside all windows → GamePhase.unknown."""
         # Game on Jun 14; tweet posted Jun 15 — outside the postgame window
         game = _make_game(
@@ -484,17 +528,13 @@ class TestGamePhaseUnknownForUnresolvablePosts:
             # 30 hours after tip — well past any postgame window
             posted_at=_utc(2025, 6, 16, 1, 0),
         )
-        session = MagicMock()
-        session.query.return_value.filter.return_value.limit.return_value.all.side_effect = [
-            [tweet], []
-        ]
-        session.query.return_value.filter.return_value.all.return_value = [game]
+        session = _bulk_session([[tweet]], [game])
 
-        with patch("sports_scraper.social.tweet_mapper.db_models", mock_db):
-            map_unmapped_tweets(session)
+        map_unmapped_tweets(session)
 
-        assert tweet.game_phase is not None
-        assert tweet.game_phase == GamePhase.unknown
+        phase = _written(session)[tweet.id]["game_phase"]
+        assert phase is not None
+        assert phase == GamePhase.unknown
 
 
 # ---------------------------------------------------------------------------